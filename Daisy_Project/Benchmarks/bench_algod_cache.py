@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+algod round trips per user-facing command, plain AlgodClient vs algod_cache.CachedAlgod.
+
+Runs what `prompt.py` does for one query (read app state, check the DAISY opt-in and balance,
+post the grouped fee transfer + post_query) and what `Refill/daisy_top_up.py` does
+(ALGO top-up, opt-in, DAISY transfer), `--repeat` times each, against fake_algod.
+
+Usage:
+  python Benchmarks/bench_algod_cache.py [--repeat 20]
+"""
+import argparse
+import logging
+import os
+import sys
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algosdk import transaction  # noqa: E402
+
+from algod_cache import CachedAlgod  # noqa: E402
+from client import DecentralizedAiContractClient  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from prompt import _ensure_user_opted_in_and_funded, post_query_via_prompt  # noqa: E402
+
+
+def _prompt_command(algorand, app_id: int, user) -> None:
+    app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id, default_sender=user.address,
+                                        default_signer=user.signer)
+    gs = app.state.global_state
+    token, fee = int(gs.token), int(gs.query_fee)
+    _ensure_user_opted_in_and_funded(algorand, user.address, user.private_key, token, fee)
+    res = post_query_via_prompt(algorand, app, user.address, user.signer, token, fee, "what is DAISY?")
+    transaction.wait_for_confirmation(algorand.client.algod, res.tx_id, 5)
+
+
+def _top_up_command(client, deployer, user, token_id: int) -> None:
+    def send(txn, sk):
+        txid = client.send_transaction(txn.sign(sk))
+        transaction.wait_for_confirmation(client, txid, 6)
+
+    send(transaction.PaymentTxn(deployer.address, client.suggested_params(), user.address, 100_000),
+         deployer.private_key)
+    info = client.account_info(user.address)
+    if not any(a.get("asset-id") == token_id for a in info.get("assets", [])):
+        send(transaction.AssetTransferTxn(user.address, client.suggested_params(), user.address, 0, token_id),
+             user.private_key)
+    send(transaction.AssetTransferTxn(deployer.address, client.suggested_params(), user.address, 10, token_id),
+         deployer.private_key)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    warnings.simplefilter("ignore", DeprecationWarning)  # txn.sign(sk), as the Refill scripts do
+
+    ledger = FakeAlgod()
+    setup = fake_algorand(ledger)
+    deployer, token_id, app = deploy_daisy(setup, ledger)
+    user = new_daisy_account(setup, ledger, deployer, token_id, daisy=10 * 2 * args.repeat)
+
+    print(f"{'command':<16} {'client':<12} {'requests/command':>17}")
+    for label, make in (("AlgodClient", lambda view: view), ("CachedAlgod", lambda view: CachedAlgod(inner=view))):
+        view = ledger.view()
+        algorand = fake_algorand(make(view))
+        for _ in range(args.repeat):
+            _prompt_command(algorand, app.app_id, user)
+        print(f"{'prompt.py':<16} {label:<12} {sum(view.calls.values()) / args.repeat:>17.1f}")
+
+        view = ledger.view()
+        client = make(view)
+        for _ in range(args.repeat):
+            _top_up_command(client, deployer, user, token_id)
+        print(f"{'daisy_top_up.py':<16} {label:<12} {sum(view.calls.values()) / args.repeat:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
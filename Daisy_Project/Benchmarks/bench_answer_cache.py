@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Hit rate and latency of answer_cache.AnswerCache with a stub model (no network).
+
+Queries are drawn from a Zipf-like popularity distribution over a fixed set of questions,
+each asked with random casing/punctuation/filler so normalization has work to do.
+
+Usage:
+  python Benchmarks/bench_answer_cache.py [--queries 2000] [--distinct 300] [--llm-ms 20] [--cache-size 256] [--db PATH]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from answer_cache import AnswerCache  # noqa: E402
+
+
+def variant(rng: random.Random, q: str) -> str:
+    q = q.upper() if rng.random() < 0.2 else q
+    q = rng.choice(["", "please ", "hey "]) + q
+    return q + rng.choice(["?", " ?", "??", "", "!"])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=2000)
+    ap.add_argument("--distinct", type=int, default=300)
+    ap.add_argument("--llm-ms", type=float, default=20)
+    ap.add_argument("--cache-size", type=int, default=256)
+    ap.add_argument("--db", default=None, help="optional SQLite file for the disk tier")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    questions = [f"how do i do thing number {i}" for i in range(args.distinct)]
+    weights = [1 / (i + 1) for i in range(args.distinct)]
+    stream = [variant(rng, q) for q in rng.choices(questions, weights, k=args.queries)]
+
+    llm_calls = 0
+
+    def stub_model(prompt: str) -> str:
+        nonlocal llm_calls
+        llm_calls += 1
+        time.sleep(args.llm_ms / 1000)
+        return f"answer: {prompt}"
+
+    uncached = args.queries * args.llm_ms / 1000
+
+    cache = AnswerCache(model="stub", template="{prompt}", max_entries=args.cache_size, db_path=args.db)
+    lat = []
+    t0 = time.perf_counter()
+    for q in stream:
+        s = time.perf_counter()
+        cache.get_or_compute(q, stub_model)
+        lat.append(time.perf_counter() - s)
+    elapsed = time.perf_counter() - t0
+    cache.close()
+
+    lat.sort()
+    print(f"queries {args.queries} | distinct {args.distinct} | cache size {args.cache_size}")
+    print(f"hit rate {cache.hit_rate():.1%} | LLM calls {llm_calls} | stats {cache.stats}")
+    print(f"latency mean {statistics.mean(lat) * 1000:.2f} ms | p50 {lat[len(lat) // 2] * 1000:.3f} ms | "
+          f"p99 {lat[int(len(lat) * 0.99)] * 1000:.2f} ms")
+    print(f"total {elapsed:.2f}s vs {uncached:.2f}s uncached ({uncached / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
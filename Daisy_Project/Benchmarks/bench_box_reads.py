@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Catch-up cost of reading a query backlog: one `get_value` per id vs `client_views.read_values`.
+
+Uses a stub box accessor with a fixed per-read latency in place of algod.
+
+Usage:
+  python Benchmarks/bench_box_reads.py [--queries 500] [--read-ms 10] [--workers 4,8,16,32]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client import Query, _MapState  # noqa: E402
+from client_views import read_range  # noqa: E402
+
+
+class StubBoxAccessor:
+    """Stands in for AppClient.state.box: every map read costs one simulated algod round trip."""
+
+    def __init__(self, n: int, read_s: float):
+        self.n = n
+        self.read_s = read_s
+
+    def get_map_value(self, map_name: str, key: int) -> dict:
+        time.sleep(self.read_s)
+        return {"submitter": "A" * 58, "query_text": f"question {key}", "provider": "B" * 58,
+                "response_text": "", "is_answered": False}
+
+    def get_map(self, map_name: str) -> dict:
+        return {k: self.get_map_value(map_name, k) for k in range(1, self.n + 1)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=500)
+    ap.add_argument("--read-ms", type=float, default=10)
+    ap.add_argument("--workers", default="4,8,16,32")
+    args = ap.parse_args()
+
+    queries = _MapState(StubBoxAccessor(args.queries, args.read_ms / 1000), "queries", Query)
+
+    t0 = time.perf_counter()
+    for qid in range(1, args.queries + 1):
+        queries.get_value(qid)
+    serial = time.perf_counter() - t0
+    print(f"{'one read per id':<18} {serial:7.2f}s")
+
+    for w in (int(x) for x in args.workers.split(",")):
+        t0 = time.perf_counter()
+        got = read_range(queries, 1, args.queries + 1, max_workers=w)
+        elapsed = time.perf_counter() - t0
+        assert len(got) == args.queries and all(isinstance(q, Query) for q in got.values())
+        print(f"{f'read_values x{w}':<18} {elapsed:7.2f}s  ({serial / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
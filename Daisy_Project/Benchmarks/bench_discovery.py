@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Time-to-discovery: block following (discovery.BlockDiscovery) vs the fixed POLL_SECONDS loop.
+
+Runs against fake_algod.FakeAlgod producing synthetic blocks, so no network is needed.
+
+Usage:
+  python Benchmarks/bench_discovery.py [--block-seconds 0.5] [--poll-seconds 1.5] [--rounds 10] [--per-block 3]
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discovery import BlockDiscovery  # noqa: E402
+from fake_algod import FakeAlgod, produce_blocks  # noqa: E402
+
+APP_ID = 1001
+
+
+def _report(name: str, created: dict, seen: dict, calls: int) -> None:
+    lat = [seen[q] - created[q] for q in created if q in seen]
+    missing = len(created) - len(lat)
+    print(f"{name:<16} mean {statistics.mean(lat) * 1000:8.1f} ms | max {max(lat) * 1000:8.1f} ms | "
+          f"algod calls {calls:5d} | missed {missing}")
+
+
+def bench_blocks(args) -> None:
+    algod = FakeAlgod(wait_timeout=args.block_seconds * 4)
+    created, seen = {}, {}
+    disc = BlockDiscovery(algod, APP_ID, on_query=lambda q: seen.setdefault(q, time.perf_counter())).start()
+    produce_blocks(algod, APP_ID, args.block_seconds, args.per_block, args.rounds, stamp=created)
+    time.sleep(args.block_seconds)
+    disc.stop(timeout=args.block_seconds * 5)
+    _report("block following", created, seen, sum(algod.calls.values()))
+
+
+def bench_poll(args) -> None:
+    algod = FakeAlgod()
+    created, seen = {}, {}
+    stop = threading.Event()
+
+    def poll_loop():
+        # Equivalent of reading global_state.next_query_id every POLL_SECONDS
+        next_seen = 1
+        calls = 0
+        while not stop.is_set():
+            calls += 1
+            next_qid = max(created, default=0) + 1
+            for qid in range(next_seen, next_qid):
+                seen[qid] = time.perf_counter()
+            next_seen = next_qid
+            stop.wait(args.poll_seconds)
+        poll_calls.append(calls)
+
+    poll_calls = []
+    t = threading.Thread(target=poll_loop)
+    t.start()
+    produce_blocks(algod, APP_ID, args.block_seconds, args.per_block, args.rounds, stamp=created)
+    time.sleep(args.poll_seconds)
+    stop.set()
+    t.join()
+    _report(f"poll every {args.poll_seconds}s", created, seen, poll_calls[0])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--block-seconds", type=float, default=0.5)
+    ap.add_argument("--poll-seconds", type=float, default=1.5)
+    ap.add_argument("--rounds", type=int, default=10)
+    ap.add_argument("--per-block", type=int, default=3)
+    args = ap.parse_args()
+    bench_blocks(args)
+    bench_poll(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Full post -> answer -> accept loop against fake_algod.FakeAlgod, with no network.
+
+Deploys DAISY through deploy.py, posts queries (DAISY fee transfer grouped with post_query),
+answers them one `submit_response` at a time or in groups of up to 16, has the user accept them
+(`accept_response`, same grouping) and checks that every query is answered and the provider was
+paid out of escrow. Two paths:
+
+- client: the node's own code (generated client, prompt.py, batch_submit.py) on AlgorandClient
+- raw:    pre-built algosdk groups sent straight to the fake, i.e. the ledger's own ceiling
+
+Usage:
+  python Benchmarks/bench_fake_chain.py [--queries 300] [--fee 10] [--group 1,16] [--path client,raw]
+"""
+import argparse
+import base64
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams  # noqa: E402
+from algosdk import transaction  # noqa: E402
+from algosdk.abi import ABIType, Method  # noqa: E402
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner  # noqa: E402
+
+from batch_submit import send_response_group  # noqa: E402
+from client import DecentralizedAiContractClient  # noqa: E402
+from client_views import read_values  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from prompt import accept_response_via_prompt, submit_response_via_prompt  # noqa: E402
+
+
+def _post(algorand, app, user, token_id: int, fee: int, text: str) -> int:
+    axfer = transaction.AssetTransferTxn(
+        sender=user.address, sp=algorand.client.algod.suggested_params(), receiver=app.app_address,
+        amt=fee, index=token_id,
+    )
+    res = app.send.post_query(
+        args=(text, TransactionWithSigner(axfer, user.signer)),
+        params=CommonAppCallParams(),
+        send_params=SendParams(populate_app_call_resources=True),
+    )
+    return res.abi_return
+
+
+_POST = Method.from_signature("post_query(string,axfer)uint64")
+_SUBMIT = Method.from_signature("submit_response(uint64,string)void")
+_ACCEPT = Method.from_signature("accept_response(uint64)void")
+_STRING = ABIType.from_string("string")
+
+
+def _send_raw(algod: FakeAlgod, acct, txns: list) -> list:
+    if len(txns) > 1:
+        transaction.assign_group_id(txns)
+    signed = AccountTransactionSigner(acct.private_key).sign_transactions(txns, list(range(len(txns))))
+    algod.send_transactions(signed)
+    return [algod.pending_transaction_info(t.get_txid()) for t in txns]
+
+
+def _raw_post(algod: FakeAlgod, app_id: int, app_address: str, user, token_id: int, fee: int, text: str) -> int:
+    sp = algod.suggested_params()
+    axfer = transaction.AssetTransferTxn(user.address, sp, app_address, fee, token_id)
+    call = transaction.ApplicationCallTxn(user.address, sp, app_id, transaction.OnComplete.NoOpOC,
+                                          app_args=[_POST.get_selector(), _STRING.encode(text)])
+    ret = _send_raw(algod, user, [axfer, call])[1]["logs"][-1]
+    return int.from_bytes(base64.b64decode(ret)[4:], "big")
+
+
+def _raw_answer(algod: FakeAlgod, app_id: int, provider, ids: list) -> None:
+    sp = algod.suggested_params()
+    _send_raw(algod, provider, [
+        transaction.ApplicationCallTxn(provider.address, sp, app_id, transaction.OnComplete.NoOpOC,
+                                       app_args=[_SUBMIT.get_selector(), qid.to_bytes(8, "big"),
+                                                 _STRING.encode(f"answer {qid}")])
+        for qid in ids
+    ])
+
+
+def _raw_accept(algod: FakeAlgod, app_id: int, user, ids: list) -> None:
+    sp = algod.suggested_params()
+    sp.flat_fee, sp.fee = True, 2 * sp.min_fee  # covers the inner DAISY payout
+    _send_raw(algod, user, [
+        transaction.ApplicationCallTxn(user.address, sp, app_id, transaction.OnComplete.NoOpOC,
+                                       app_args=[_ACCEPT.get_selector(), qid.to_bytes(8, "big")])
+        for qid in ids
+    ])
+
+
+def run(path: str, queries: int, fee: int, group: int) -> None:
+    algod = FakeAlgod()
+    algorand = fake_algorand(algod)
+    deployer, token_id, governor_app = deploy_daisy(algorand, algod, query_fee=fee)
+    user = new_daisy_account(algorand, algod, deployer, token_id, daisy=queries * fee)
+    provider = new_daisy_account(algorand, algod, deployer, token_id)
+    app_id = governor_app.app_id
+    user_app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id, default_sender=user.address,
+                                             default_signer=user.signer)
+    provider_app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id,
+                                                 default_sender=provider.address, default_signer=provider.signer)
+    algod.calls.clear()
+
+    t0 = time.perf_counter()
+    if path == "raw":
+        ids = [_raw_post(algod, app_id, governor_app.app_address, user, token_id, fee, f"question {i}")
+               for i in range(queries)]
+    else:
+        ids = [_post(algorand, user_app, user, token_id, fee, f"question {i}") for i in range(queries)]
+    posted = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    step = max(1, group)
+    for i in range(0, len(ids), step):
+        chunk = ids[i:i + step]
+        if path == "raw":
+            _raw_answer(algod, app_id, provider, chunk)
+        elif group <= 1:
+            submit_response_via_prompt(algorand, provider_app, chunk[0], f"answer {chunk[0]}")
+        else:
+            sent, rejected = send_response_group(provider_app, [(q, f"answer {q}") for q in chunk])
+            assert not rejected, rejected
+    answered = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(0, len(ids), step):
+        chunk = ids[i:i + step]
+        if path == "raw":
+            _raw_accept(algod, app_id, user, chunk)
+        elif group <= 1:
+            accept_response_via_prompt(algorand, user_app, chunk[0])
+        else:
+            accepts = user_app.new_group()
+            for q in chunk:
+                accepts.accept_response(args=(q,), params=CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000)))
+            accepts.send(SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=True))
+    accepted = time.perf_counter() - t0
+
+    boxes = read_values(provider_app.state.box.queries, ids, max_workers=1)
+    paid = algod.account_asset_info(provider.address, token_id)["asset-holding"]["amount"]
+    assert all(q.is_answered for q in boxes.values()) and paid == queries * fee, "settlement mismatch"
+
+    label = f"{path}, " + ("single" if group <= 1 else f"groups of {group}")
+    print(f"{label:<22} post {queries / posted:7.0f} q/s | answer {queries / answered:7.0f} q/s | "
+          f"accept {queries / accepted:7.0f} q/s | loop {queries / (posted + answered + accepted):7.0f} q/s | rounds {algod.last_round:5d}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=300)
+    ap.add_argument("--fee", type=int, default=10)
+    ap.add_argument("--group", default="1,16")
+    ap.add_argument("--path", default="client,raw")
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    for path in args.path.split(","):
+        for group in (int(x) for x in args.group.split(",")):
+            run(path, args.queries, args.fee, group)
+
+
+if __name__ == "__main__":
+    main()
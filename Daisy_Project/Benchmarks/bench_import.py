@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Start-up cost of the generated client and of prompt.py, each measured in a fresh interpreter.
+
+  interpreter         - `python -c pass`, the floor for every row below
+  import client       - the generated client, which imports algosdk / algokit_utils and parses
+                        its app spec
+  spec parse          - parsing the embedded ARC-56 JSON again once everything is imported
+  prompt usage        - `python prompt.py` with no arguments (prints usage and exits); prompt.py
+                        imports algosdk, algokit_utils and the client only on the paths that use them
+
+Each figure is the median of --runs subprocesses.
+
+Usage:
+  python Benchmarks/bench_import.py [--runs 7]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TIME_IMPORT = """
+import time
+t = time.perf_counter()
+import client
+print(time.perf_counter() - t)
+"""
+
+_TIME_SPEC = """
+import time
+import algokit_utils, client
+t = time.perf_counter()
+algokit_utils.Arc56Contract.from_json(client._APP_SPEC_JSON)
+print(time.perf_counter() - t)
+"""
+
+
+def _python(code: str, env: dict) -> float:
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True, capture_output=True, text=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def _wall(argv, env: dict) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *argv], cwd=ROOT, env=env, capture_output=True)
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--runs", type=int, default=7)
+    args = ap.parse_args()
+
+    env = {**os.environ, "APP_ID_2": "", "USER_MNEMONIC": ""}
+    rows = [
+        ("interpreter", lambda: _wall(["-c", "pass"], env)),
+        ("import client", lambda: _python(_TIME_IMPORT, env)),
+        ("spec parse", lambda: _python(_TIME_SPEC, env)),
+        ("prompt usage", lambda: _wall(["prompt.py"], env)),
+    ]
+    print(f"{'step':<16} {'median ms':>10} {'min ms':>8}")
+    for label, run in rows:
+        samples = [run() for _ in range(args.runs)]
+        print(f"{label:<16} {statistics.median(samples) * 1000:>10.1f} {min(samples) * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Pending-work box wrap-around: a late answer to an id that has left the window must not touch
+the bit of the newer id sharing its slot.
+
+Posts PENDING_CAPACITY + --extra queries on fake_algod in raw groups of 8 post_queries calls
+(48 queries per round, so the first query is still inside its answer window), then answers the
+oldest ones. Their slots now belong to the newest ids, which must stay open in the box and be
+reported open by `PendingWork`; answering the newest ids then clears them. Reports post and
+answer rates and the posting rounds used.
+
+Usage:
+  python Benchmarks/bench_pending_wrap.py [--extra 16]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algosdk import transaction  # noqa: E402
+
+from client import DecentralizedAiContractClient  # noqa: E402
+from client_views import ANSWER_WINDOW_ROUNDS, PENDING_CAPACITY, read_pending_work, read_values  # noqa: E402
+from fake_algod import (FakeAlgod, abi_call, abi_return, deploy_daisy, fake_algorand, new_daisy_account,  # noqa: E402
+                        send_group)
+from prompt import BATCH_MAX_QUERIES  # noqa: E402
+
+FEE = 10
+CALLS_PER_GROUP = 8  # axfer + post_queries pairs per 16-transaction group
+
+
+def _post_many(algod: FakeAlgod, app_id: int, app_address: str, user, token_id: int, count: int) -> int:
+    sp = algod.suggested_params()
+    txns = []
+    for start in range(0, count, BATCH_MAX_QUERIES):
+        texts = [f"question {start + i}" for i in range(min(BATCH_MAX_QUERIES, count - start))]
+        txns.append(transaction.AssetTransferTxn(user.address, sp, app_address, FEE * len(texts), token_id))
+        txns.append(abi_call(user.address, sp, app_id, "post_queries(string[],axfer)uint64", texts))
+    return int.from_bytes(abi_return(send_group(algod, user, txns)[1]), "big")
+
+
+def _answer(algod: FakeAlgod, app_id: int, provider, ids: list) -> None:
+    sp = algod.suggested_params()
+    send_group(algod, provider, [abi_call(provider.address, sp, app_id, "submit_response(uint64,string)void",
+                                          qid, f"answer {qid}") for qid in ids])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--extra", type=int, default=16, help="queries posted past PENDING_CAPACITY")
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    total = PENDING_CAPACITY + args.extra
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, app = deploy_daisy(algorand, ledger, query_fee=FEE, app_algos=10_000)
+    user = new_daisy_account(algorand, ledger, deployer, token_id, daisy=total * FEE, algos=1_000)
+    provider = new_daisy_account(algorand, ledger, deployer, token_id)
+    reader = DecentralizedAiContractClient(algorand=algorand, app_id=app.app_id, default_sender=provider.address,
+                                           default_signer=provider.signer)
+
+    per_group = CALLS_PER_GROUP * BATCH_MAX_QUERIES
+    first_round = ledger.last_round + 1
+    t0 = time.perf_counter()
+    posted = 0
+    while posted < total:
+        _post_many(ledger, app.app_id, app.app_address, user, token_id, min(per_group, total - posted))
+        posted += min(per_group, total - posted)
+    post_s = time.perf_counter() - t0
+    rounds = ledger.last_round - first_round + 1
+    assert rounds < ANSWER_WINDOW_ROUNDS, f"posting took {rounds} rounds; the oldest ids can no longer be answered"
+
+    # the oldest ids share their slots with the newest ones
+    old = list(range(1, args.extra + 1))
+    new = [qid + PENDING_CAPACITY for qid in old]
+    t0 = time.perf_counter()
+    for start in range(0, len(old), 16):
+        _answer(ledger, app.app_id, provider, old[start:start + 16])
+    answer_s = time.perf_counter() - t0
+
+    pending = read_pending_work(reader)
+    boxes = read_values(reader.state.box.queries, old + new, max_workers=1)
+    late = [qid for qid in new if not pending.is_open(qid) or boxes[qid].is_answered]
+    assert all(boxes[qid].is_answered for qid in old), "late answers were not recorded"
+    assert not late, f"answering ids {old[0]}..{old[-1]} cleared the pending bits of open ids {late}"
+    for start in range(0, len(new), 16):
+        _answer(ledger, app.app_id, provider, new[start:start + 16])
+    pending = read_pending_work(reader)
+    assert all(pending.is_answered(qid) for qid in new), "answering the newest ids did not clear their bits"
+
+    print(f"posted {total} queries in {rounds} rounds ({total / post_s:.0f} q/s) | "
+          f"answered {len(old)} ids outside the window ({len(old) / answer_s:.0f} q/s) | "
+          f"open bits of ids {new[0]}..{new[-1]} intact")
+
+
+if __name__ == "__main__":
+    main()
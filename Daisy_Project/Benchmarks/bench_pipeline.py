@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+End-to-end post -> answer benchmark (fees stay in escrow): concurrent users and ai_node workers on one fake chain.
+
+Every party talks to its own view of a shared fake_algod ledger, so algod calls are counted per
+side. Users post through prompt.post_query_via_prompt (DAISY transfer grouped with post_query);
+each node runs ai_node.run_node with the stub backend, sharded with sharding.ShardMap when there
+are several (--no-shard lets every node answer everything). Time to answer is measured from the
+block that committed a query to the block that committed its answer.
+
+Reports queries/s, p50/p95/p99 time to answer, algod calls per query (node and user side) and
+ALGO fees per query, writes them as JSON (--out) and compares them with a stored baseline
+(--baseline); exits 1 when a metric is worse than the baseline by more than --tolerance.
+Node settings come from ai_node's usual env vars (NODE_CONCURRENCY, SUBMIT_BATCH_SIZE, ...).
+
+Usage:
+  python Benchmarks/bench_pipeline.py [--users 8] [--queries-per-user 25] [--nodes 1] [--llm-ms 50]
+                                      [--ref] [--out results.json] [--update-baseline]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from algosdk import encoding  # noqa: E402
+from algosdk.abi import Method  # noqa: E402
+
+from backends import StubBackend  # noqa: E402
+from blob_store import CachedResolver, FileBlobStore  # noqa: E402
+from checkpoint import CheckpointStore  # noqa: E402
+from client import DecentralizedAiContractClient  # noqa: E402
+from discovery import POST_QUERY_SIGNATURES  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from metrics import STAGE_SECONDS  # noqa: E402
+from prompt import post_query_via_prompt  # noqa: E402
+from sharding import ShardMap  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(HERE, "baselines", "pipeline.json")
+MICRO = 1_000_000
+
+_POSTS = {Method.from_signature(s).get_selector() for s in POST_QUERY_SIGNATURES}
+_ANSWERS = {Method.from_signature(s).get_selector() for s in (
+    "submit_response(uint64,string)void",
+    "submit_response_ref(uint64,byte[32],uint64)void",
+)}
+
+# metric -> +1 if higher is better, -1 if lower is better
+DIRECTIONS = {
+    "throughput_qps": +1,
+    "tta_p50_ms": -1,
+    "tta_p95_ms": -1,
+    "tta_p99_ms": -1,
+    "node_algod_calls_per_query": -1,
+    "user_algod_calls_per_query": -1,
+    "fee_algo_per_query": -1,
+}
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+class _Recorder:
+    """Block listener: stamps each committed block; entries are decoded after the run."""
+
+    def __init__(self):
+        self.blocks = []
+
+    def __call__(self, block: dict) -> None:
+        self.blocks.append((time.perf_counter(), block))
+
+    def scan(self, app_id: int):
+        posted, answered, fees = {}, {}, {}
+        for stamp, block in self.blocks:
+            for entry in block["txns"]:
+                txn = entry["txn"]
+                sender = encoding.encode_address(txn["snd"])
+                fees[sender] = fees.get(sender, 0) + txn.get("fee", 0)
+                if txn.get("type") != "appl" or txn.get("apid") != app_id or not txn.get("apaa"):
+                    continue
+                selector = txn["apaa"][0]
+                if selector in _POSTS:
+                    posted[int.from_bytes(entry["dt"]["lg"][-1][4:], "big")] = stamp
+                elif selector in _ANSWERS:
+                    answered.setdefault(int.from_bytes(txn["apaa"][1], "big"), stamp)
+        return posted, answered, fees
+
+
+def _user(algod: FakeAlgod, app_id: int, acct, token_id: int, fee: int, count: int, think: float,
+          resolver, views: list, errors: list) -> None:
+    view = algod.view()
+    views.append(view)
+    algorand = fake_algorand(view)
+    app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id, default_sender=acct.address,
+                                        default_signer=acct.signer)
+    for i in range(count):
+        try:
+            post_query_via_prompt(algorand, app, acct.address, acct.signer, token_id, fee,
+                                  f"question {i} from {acct.address[:8]}", resolver)
+        except Exception as e:  # keep posting; the run reports how many made it
+            errors.append(repr(e))
+        if think:
+            time.sleep(think)
+
+
+def run(args) -> dict:
+    import ai_node  # reads its env config at import time
+
+    algod = FakeAlgod(wait_timeout=0.5)
+    algorand = fake_algorand(algod)
+    deployer, token_id, app = deploy_daisy(algorand, algod, query_fee=args.fee)
+    users = [new_daisy_account(algorand, algod, deployer, token_id, daisy=args.queries_per_user * args.fee)
+             for _ in range(args.users)]
+    providers = [new_daisy_account(algorand, algod, deployer, token_id) for _ in range(args.nodes)]
+    total = args.users * args.queries_per_user
+
+    tmp = tempfile.TemporaryDirectory(prefix="bench_pipeline_")
+    resolver = CachedResolver(FileBlobStore(os.path.join(tmp.name, "blobs"))) if args.ref else None
+    ai_node._resolver = resolver or CachedResolver(FileBlobStore(os.path.join(tmp.name, "blobs")))
+    backend = StubBackend(latency_ms=args.llm_ms, jitter_ms=args.llm_jitter_ms, seed=args.seed,
+                          max_concurrency=max(8, args.nodes * ai_node.NODE_CONCURRENCY))
+    ai_node._init_answering(backend)
+
+    recorder = _Recorder()
+    algod.block_listeners.append(recorder)
+    stop = threading.Event()
+    sharded = args.nodes > 1 and not args.no_shard
+    node_views, stores, threads = [], [], []
+    for i, provider in enumerate(providers):
+        view = algod.view()
+        node_views.append(view)
+        node_algorand = fake_algorand(view)
+        node_app = DecentralizedAiContractClient(algorand=node_algorand, app_id=app.app_id,
+                                                 default_sender=provider.address, default_signer=provider.signer)
+        store = CheckpointStore(os.path.join(tmp.name, f"node{i}.sqlite3"), app.app_id)
+        stores.append(store)
+        shard = ShardMap(app.app_id, [p.address for p in providers], provider.address,
+                         args.takeover_seconds) if sharded else None
+        threads.append(threading.Thread(target=ai_node.run_node, name=f"node{i}",
+                                        args=(node_algorand, node_app, store, stop, args.poll_seconds, shard)))
+    for t in threads:
+        t.start()
+
+    user_views, errors = [], []
+    posters = [threading.Thread(target=_user, args=(algod, app.app_id, u, token_id, args.fee,
+                                                     args.queries_per_user, args.think_ms / 1000, resolver,
+                                                     user_views, errors))
+               for u in users]
+    started = time.perf_counter()
+    for t in posters:
+        t.start()
+    for t in posters:
+        t.join()
+
+    deadline = started + args.timeout
+    while time.perf_counter() < deadline:
+        posted, answered, _ = recorder.scan(app.app_id)
+        if len(posted) + len(errors) >= total and len(answered) >= len(posted):
+            break
+        time.sleep(0.05)
+    stop.set()
+    for t in threads:
+        t.join()
+    for store in stores:
+        store.close()
+    tmp.cleanup()
+
+    posted, answered, fees = recorder.scan(app.app_id)
+    tta = [(answered[q] - posted[q]) * 1000 for q in posted if q in answered]
+    finished = max(answered.values(), default=started)
+    user_addrs = {u.address for u in users}
+    provider_addrs = {p.address for p in providers}
+    user_fees = sum(v for k, v in fees.items() if k in user_addrs)
+    node_fees = sum(v for k, v in fees.items() if k in provider_addrs)
+    paid = sum(algod.account_asset_info(p.address, token_id)["asset-holding"]["amount"] for p in providers)
+    # answered fees stay in escrow until the submitter accepts (nobody accepts here)
+    escrowed = algod.account_asset_info(app.app_address, token_id)["asset-holding"]["amount"]
+    n = max(1, len(answered))
+
+    metrics = {
+        "queries_posted": len(posted),
+        "queries_answered": len(answered),
+        "post_errors": len(errors),
+        "settled_daisy": paid,
+        "throughput_qps": round(len(answered) / max(1e-9, finished - started), 2),
+        "tta_p50_ms": round(_percentile(tta, 50), 1),
+        "tta_p95_ms": round(_percentile(tta, 95), 1),
+        "tta_p99_ms": round(_percentile(tta, 99), 1),
+        "tta_max_ms": round(max(tta, default=0.0), 1),
+        "node_algod_calls_per_query": round(sum(sum(v.calls.values()) for v in node_views) / n, 2),
+        "user_algod_calls_per_query": round(sum(sum(v.calls.values()) for v in user_views) / n, 2),
+        "fee_algo_per_query": round((user_fees + node_fees) / MICRO / n, 6),
+        "post_fee_algo_per_query": round(user_fees / MICRO / n, 6),
+        "answer_fee_algo_per_query": round(node_fees / MICRO / n, 6),
+        "llm_calls": backend.calls,
+        "stage_mean_ms": {
+            stage: round(STAGE_SECONDS.total(stage=stage) / STAGE_SECONDS.count(stage=stage) * 1000, 2)
+            for stage in ("discovery", "box_read", "llm", "build", "send")
+            if STAGE_SECONDS.count(stage=stage)
+        },
+    }
+    if paid + escrowed != len(posted) * args.fee:
+        logging.warning("Provider payouts (%s DAISY) and escrow (%s DAISY) do not match %s posts",
+                        paid, escrowed, len(posted))
+    return {
+        "config": {
+            "users": args.users, "queries_per_user": args.queries_per_user, "nodes": args.nodes,
+            "llm_ms": args.llm_ms, "llm_jitter_ms": args.llm_jitter_ms, "think_ms": args.think_ms,
+            "fee": args.fee, "ref": args.ref, "node_concurrency": ai_node.NODE_CONCURRENCY,
+            "submit_batch_size": ai_node.SUBMIT_BATCH_SIZE, "discovery": ai_node.DISCOVERY, "shard": sharded,
+        },
+        "metrics": metrics,
+        "env": {"python": platform.python_version(), "machine": platform.machine(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+    }
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    """Metrics that are worse than `baseline` by more than `tolerance` (relative)."""
+    regressions = []
+    for name, direction in DIRECTIONS.items():
+        old, new = baseline["metrics"].get(name), result["metrics"].get(name)
+        if old is None or new is None or old == 0:
+            continue
+        change = (new - old) / old * direction  # negative = worse
+        if change < -tolerance:
+            regressions.append((name, old, new))
+    return regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--users", type=int, default=8)
+    ap.add_argument("--queries-per-user", type=int, default=25)
+    ap.add_argument("--nodes", type=int, default=1)
+    ap.add_argument("--llm-ms", type=float, default=50.0, help="stub LLM latency per answer")
+    ap.add_argument("--llm-jitter-ms", type=float, default=20.0)
+    ap.add_argument("--think-ms", type=float, default=0.0, help="pause between one user's posts")
+    ap.add_argument("--fee", type=int, default=10, help="DAISY query fee")
+    ap.add_argument("--ref", action="store_true", help="post with post_query_ref (text in the blob store)")
+    ap.add_argument("--poll-seconds", type=float, default=0.2)
+    ap.add_argument("--no-shard", action="store_true", help="with --nodes > 1, let every node answer every query")
+    ap.add_argument("--takeover-seconds", type=float, default=5.0, help="sharding takeover delay per rank")
+    ap.add_argument("--timeout", type=float, default=120.0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", help="write the result JSON here")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE)
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    ap.add_argument("--update-baseline", action="store_true")
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    result = run(args)
+    m = result["metrics"]
+    print(f"answered {m['queries_answered']}/{m['queries_posted']} | {m['throughput_qps']:.1f} q/s | "
+          f"tta p50 {m['tta_p50_ms']:.0f} ms p95 {m['tta_p95_ms']:.0f} ms p99 {m['tta_p99_ms']:.0f} ms")
+    print(f"algod calls/query: node {m['node_algod_calls_per_query']:.2f} user {m['user_algod_calls_per_query']:.2f}"
+          f" | fees/query {m['fee_algo_per_query']:.4f} ALGO "
+          f"(post {m['post_fee_algo_per_query']:.4f}, answer {m['answer_fee_algo_per_query']:.4f})")
+    print("mean stage ms: " + ", ".join(f"{k} {v:.1f}" for k, v in m["stage_mean_ms"].items()))
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=2)
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare with (run with --update-baseline)")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["config"] != result["config"]:
+        print("baseline was recorded with a different config; not comparing")
+        return
+    regressions = compare(result, baseline, args.tolerance)
+    for name, old, new in regressions:
+        print(f"REGRESSION {name}: {old} -> {new}")
+    if regressions:
+        sys.exit(1)
+    print(f"within {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
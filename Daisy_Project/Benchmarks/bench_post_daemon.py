@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Posting --queries queries one prompt.py-style call at a time vs through a warm post_daemon.py.
+
+one-shot: for every query, what prompt.py main() does after its imports: build the
+          AlgorandClient and app client, read global state, check the opt-in, post, and wait
+          for confirmation (process start-up and imports are not counted; see bench_import.py)
+daemon:   one PostDaemon on the same fake_algod ledger, served on a local port; the frontend
+          posts the queries over HTTP and follows /events until every one is confirmed
+
+Reports posts/s, algod calls per query and ms from request to confirmed.
+
+Usage:
+  python Benchmarks/bench_post_daemon.py [--queries 200] [--frontends 4]
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algokit_utils import AlgorandClient  # noqa: E402
+from algosdk import transaction  # noqa: E402
+
+from client import DecentralizedAiContractClient  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from post_daemon import PostDaemon, PostDaemonClient, serve  # noqa: E402
+from prompt import _ensure_user_opted_in_and_funded, post_query_via_prompt  # noqa: E402
+
+
+def bench_one_shot(ledger: FakeAlgod, app_id: int, user, n: int) -> dict:
+    view = ledger.view()
+    latencies = []
+    start = time.perf_counter()
+    for k in range(n):
+        t0 = time.perf_counter()
+        algorand = AlgorandClient.from_clients(algod=view)
+        app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id, default_sender=user.address,
+                                            default_signer=user.signer)
+        gs = app.state.global_state
+        token, fee = int(gs.token), int(gs.query_fee)
+        _ensure_user_opted_in_and_funded(algorand, user.address, user.private_key, token, fee)
+        res = post_query_via_prompt(algorand, app, user.address, user.signer, token, fee, f"one-shot {k}")
+        transaction.wait_for_confirmation(view, res.tx_id, 5)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return {"posts_per_s": n / elapsed, "algod_calls_per_query": sum(view.calls.values()) / n,
+            "confirm_ms_p50": statistics.median(latencies) * 1000}
+
+
+def bench_daemon(ledger: FakeAlgod, app_id: int, user, n: int, frontends: int) -> dict:
+    view = ledger.view()
+    daemon = PostDaemon(view, app_id, user.private_key, answer_watch_seconds=0).start()
+    server = serve(daemon, 0)[0]
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    posted_at, confirmed_at = {}, {}
+    calls_before = sum(view.calls.values())
+
+    def follow():
+        for event in PostDaemonClient(url).events():
+            if event["event"] in ("confirmed", "failed"):
+                confirmed_at[event["ticket"]] = time.perf_counter()
+                if len(confirmed_at) == n:
+                    return
+
+    def post(i):
+        client = PostDaemonClient(url)
+        for k in range(i, n, frontends):
+            t0 = time.perf_counter()
+            posted_at[client.post(f"daemon {k}")["ticket"]] = t0
+
+    follower = threading.Thread(target=follow, daemon=True)
+    follower.start()
+    start = time.perf_counter()
+    posters = [threading.Thread(target=post, args=(i,)) for i in range(frontends)]
+    for t in posters:
+        t.start()
+    for t in posters:
+        t.join()
+    follower.join(60)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    daemon.stop(5)
+    failed = sum(1 for t in posted_at if daemon.status(t)["status"] != "confirmed")
+    if failed:
+        print(f"  {failed} daemon posts did not confirm")
+    return {"posts_per_s": n / elapsed, "algod_calls_per_query": (sum(view.calls.values()) - calls_before) / n,
+            "confirm_ms_p50": statistics.median(confirmed_at[t] - posted_at[t] for t in confirmed_at) * 1000}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--frontends", type=int, default=4, help="concurrent HTTP posters in daemon mode")
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, app = deploy_daisy(algorand, ledger, app_algos=10_000)
+    user = new_daisy_account(algorand, ledger, deployer, token_id, daisy=2 * args.queries * 10, algos=100)
+
+    print(f"{'mode':<9} {'posts/s':>9} {'algod calls/q':>14} {'confirm p50 ms':>15}")
+    for mode, run in (("one-shot", lambda: bench_one_shot(ledger, app.app_id, user, args.queries)),
+                      ("daemon", lambda: bench_daemon(ledger, app.app_id, user, args.queries, args.frontends))):
+        r = run()
+        print(f"{mode:<9} {r['posts_per_s']:>9.1f} {r['algod_calls_per_query']:>14.1f} {r['confirm_ms_p50']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Bulk posting: one post_query group per question vs post_queries batches under one DAISY payment.
+
+Posts --queries questions for one user against fake_algod both ways (prompt.post_query_via_prompt
+per question; prompt.batch_queries + post_queries_via_prompt), waiting for each send as prompt.py
+does. Reports posts/s, transactions and ALGO fees per query. fake_algod charges flat fees and
+does not model the opcode budget, so on a real network batches may also pay for an op-up call.
+
+Usage:
+  python Benchmarks/bench_post_queries.py [--queries 200]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client import DecentralizedAiContractClient  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from prompt import batch_queries, post_queries_via_prompt, post_query_via_prompt  # noqa: E402
+
+MICRO = 1_000_000
+
+
+def _run(ledger: FakeAlgod, algorand, app, user, texts, batched: bool) -> dict:
+    gs = app.state.global_state
+    token, fee = int(gs.token), int(gs.query_fee)
+    algos_before = ledger.account_info(user.address)["amount"]
+    txns = 0
+    start = time.perf_counter()
+    if batched:
+        for chunk in batch_queries(texts):
+            post_queries_via_prompt(algorand, app, user.address, user.signer, token, fee, chunk)
+            txns += 2
+    else:
+        for text in texts:
+            post_query_via_prompt(algorand, app, user.address, user.signer, token, fee, text)
+            txns += 2
+    elapsed = time.perf_counter() - start
+    spent = algos_before - ledger.account_info(user.address)["amount"]
+    return {"posts_per_s": len(texts) / elapsed, "txns_per_query": txns / len(texts),
+            "algo_per_query": spent / MICRO / len(texts)}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, app = deploy_daisy(algorand, ledger, app_algos=10_000)
+    user = new_daisy_account(algorand, ledger, deployer, token_id, daisy=2 * args.queries * 10, algos=100)
+    client = DecentralizedAiContractClient(algorand=algorand, app_id=app.app_id, default_sender=user.address,
+                                           default_signer=user.signer)
+    texts = [f"What is the weather like on day {i}?" for i in range(args.queries)]
+
+    print(f"{'mode':<13} {'posts/s':>9} {'txns/query':>11} {'ALGO/query':>11}")
+    for mode, batched in (("post_query", False), ("post_queries", True)):
+        r = _run(ledger, algorand, client, user, texts, batched)
+        print(f"{mode:<13} {r['posts_per_s']:>9.1f} {r['txns_per_query']:>11.2f} {r['algo_per_query']:>11.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Inline `Query` boxes vs fixed-width `QueryRef` boxes: MBR per query and decode throughput.
+
+MBR uses the protocol formula 2500 + 400 * (key bytes + value bytes) microAlgo per box.
+Decoding runs on locally ABI-encoded box values, so no network is involved.
+
+Usage:
+  python Benchmarks/bench_query_layout.py [--records 20000] [--query-chars 120] [--answer-chars 400]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import algosdk  # noqa: E402
+from algosdk.abi import ABIType  # noqa: E402
+
+from client import Query, QueryRef, _init_dataclass  # noqa: E402
+from client_views import QueryRefView  # noqa: E402
+
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+KEY_BYTES = 1 + 8  # one-byte map prefix + uint64 id
+
+QUERY_TYPE = ABIType.from_string("(address,string,address,string,bool,uint64,uint64,uint64,uint8)")
+QUERY_REF_TYPE = ABIType.from_string("(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)")
+
+
+def box_mbr(value_bytes: int) -> int:
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (KEY_BYTES + value_bytes)
+
+
+def _text(rng: random.Random, mean: int) -> str:
+    return "x" * max(1, int(rng.gauss(mean, mean / 4)))
+
+
+def make_records(n: int, query_chars: int, answer_chars: int, seed: int = 0):
+    rng = random.Random(seed)
+    addrs = [algosdk.account.generate_account()[1] for _ in range(8)]
+    legacy, compact = [], []
+    for i in range(n):
+        sub, prov = rng.choice(addrs), rng.choice(addrs)
+        q, a = _text(rng, query_chars), _text(rng, answer_chars)
+        legacy.append(QUERY_TYPE.encode([sub, q, prov, a, True, 10, 1_000 + i, 2_000 + i, 3]))
+        compact.append(QUERY_REF_TYPE.encode([
+            sub, prov, 10, 1_700_000_000 + i, 1_700_000_060 + i, len(q), len(a), 1,
+            list(rng.randbytes(32)), list(rng.randbytes(32)), 1_000 + i, 2_000 + i,
+        ]))
+    return legacy, compact
+
+
+def _names(cls) -> list:
+    return [f.name for f in cls.__dataclass_fields__.values()]
+
+
+def _flag_and_hash(raw: bytes):
+    view = QueryRefView(raw)
+    return view.is_answered, view.query_hash
+
+
+def _rate(label: str, fn, records: list) -> None:
+    t0 = time.perf_counter()
+    for raw in records:
+        fn(raw)
+    elapsed = time.perf_counter() - t0
+    print(f"{label:<34} {len(records) / elapsed:>12,.0f} rec/s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--records", type=int, default=20_000)
+    ap.add_argument("--query-chars", type=int, default=120)
+    ap.add_argument("--answer-chars", type=int, default=400)
+    args = ap.parse_args()
+
+    legacy, compact = make_records(args.records, args.query_chars, args.answer_chars)
+
+    legacy_mbr = sum(box_mbr(len(r)) for r in legacy) / len(legacy)
+    compact_mbr = box_mbr(QueryRefView.size)
+    print(f"{'layout':<10} {'value bytes':>12} {'MBR/query (uAlgo)':>18}")
+    print(f"{'Query':<10} {sum(map(len, legacy)) / len(legacy):>12.0f} {legacy_mbr:>18,.0f}")
+    print(f"{'QueryRef':<10} {QueryRefView.size:>12} {compact_mbr:>18,.0f}  ({legacy_mbr / compact_mbr:.1f}x less)")
+    print()
+
+    # What the node needs per id: the answered flag, plus the text pointer when unanswered
+    query_fields, ref_fields = _names(Query), _names(QueryRef)
+    _rate("Query ABI decode -> dataclass",
+          lambda raw: _init_dataclass(Query, dict(zip(query_fields, QUERY_TYPE.decode(raw)))), legacy)
+    _rate("QueryRef ABI decode -> dataclass",
+          lambda raw: _init_dataclass(QueryRef, dict(zip(ref_fields, QUERY_REF_TYPE.decode(raw)))), compact)
+    _rate("QueryRefView.to_struct()", lambda raw: QueryRefView(raw).to_struct(), compact)
+    _rate("QueryRefView is_answered+hash", _flag_and_hash, compact)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+App state growth with and without archiver.py reclaiming settled query boxes.
+
+Posts --queries questions (raw groups of 8 post_queries calls), answers them and accepts the
+answers (groups of 16 submit_response / accept_response calls; accepting settles them) on
+fake_algod; every --every queries it runs one archiver pass (archive + reclaim_queries) unless
+--no-reclaim is given. At each checkpoint it reports the query boxes left on chain,
+the app account's minimum balance, the time for a full `queries` map read
+(`app.state.box.queries.get_map()`) and the archive's box vs stored (zlib) bytes per query.
+
+Boxes are only reclaimed once they are RECLAIM_AFTER_QUERIES (8128) ids old, so the defaults
+(20000 queries, about 75 s) show the box count levelling off; --quick (9000 queries in
+checkpoints of 3000, about 30 s) is a short run that still crosses the window.
+
+Usage:
+  python Benchmarks/bench_reclaim.py [--queries 20000] [--every 4000] [--quick] [--no-reclaim]
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algosdk import transaction  # noqa: E402
+
+from archiver import QueryArchive, archive_and_reclaim  # noqa: E402
+from fake_algod import (FakeAlgod, abi_call, abi_return, deploy_daisy, fake_algorand, new_daisy_account,  # noqa: E402
+                        send_group)
+from prompt import BATCH_MAX_QUERIES  # noqa: E402
+
+MICRO = 1_000_000
+FEE = 10
+CALLS_PER_GROUP = 8  # axfer + post_queries pairs per 16-transaction group
+MAX_GROUP_SIZE = 16
+
+
+def _post(ledger: FakeAlgod, app, user, token_id: int, first_text: int, count: int) -> range:
+    sp = ledger.suggested_params()
+    txns = []
+    for start in range(0, count, BATCH_MAX_QUERIES):
+        texts = [f"What is the weather like on day {first_text + start + i}?"
+                 for i in range(min(BATCH_MAX_QUERIES, count - start))]
+        txns.append(transaction.AssetTransferTxn(user.address, sp, app.app_address, FEE * len(texts), token_id))
+        txns.append(abi_call(user.address, sp, app.app_id, "post_queries(string[],axfer)uint64", texts))
+    first = int.from_bytes(abi_return(send_group(ledger, user, txns)[1]), "big")
+    return range(first, first + count)
+
+
+def _answer_and_accept(ledger: FakeAlgod, app_id: int, user, provider, ids: range) -> None:
+    for start in range(0, len(ids), MAX_GROUP_SIZE):
+        chunk = ids[start:start + MAX_GROUP_SIZE]
+        sp = ledger.suggested_params()
+        send_group(ledger, provider, [abi_call(provider.address, sp, app_id, "submit_response(uint64,string)void",
+                                               qid, f"Sunny, day {qid}") for qid in chunk])
+        sp.flat_fee, sp.fee = True, 2 * sp.min_fee  # covers the inner DAISY payout
+        send_group(ledger, user, [abi_call(user.address, sp, app_id, "accept_response(uint64)void", qid)
+                                  for qid in chunk])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=20_000)
+    ap.add_argument("--every", type=int, default=4_000, help="queries between archiver passes / checkpoints")
+    ap.add_argument("--quick", action="store_true", help="shorthand for --queries 9000 --every 3000")
+    ap.add_argument("--no-reclaim", action="store_true")
+    args = ap.parse_args()
+    if args.quick:
+        args.queries, args.every = 9_000, 3_000
+    logging.getLogger().setLevel(logging.WARNING)
+
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, governor_app = deploy_daisy(algorand, ledger, query_fee=FEE, app_algos=100_000)
+    user = new_daisy_account(algorand, ledger, deployer, token_id, daisy=args.queries * FEE, algos=10_000)
+    provider = new_daisy_account(algorand, ledger, deployer, token_id, algos=10_000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = QueryArchive(os.path.join(tmp, "archive.sqlite3"), governor_app.app_id)
+        print(f"{'posted':>7} {'boxes':>6} {'reclaimed':>9} {'app MBR ALGO':>13} {'map read ms':>12} "
+              f"{'box B/q':>8} {'stored B/q':>11} {'pass s':>7}")
+        posted = 0
+        while posted < args.queries:
+            target = min(posted + args.every, args.queries)
+            while posted < target:
+                count = min(CALLS_PER_GROUP * BATCH_MAX_QUERIES, target - posted)
+                _answer_and_accept(ledger, governor_app.app_id, user, provider,
+                                   _post(ledger, governor_app, user, token_id, posted, count))
+                posted += count
+
+            pass_s = 0.0
+            reclaimed = 0
+            if not args.no_reclaim:
+                t = time.perf_counter()
+                reclaimed = archive_and_reclaim(governor_app, archive)["reclaimed"]
+                pass_s = time.perf_counter() - t
+            t = time.perf_counter()
+            boxes = len(governor_app.state.box.queries.get_map())
+            read_ms = (time.perf_counter() - t) * 1000
+            mbr = ledger.account_info(governor_app.app_address)["min-balance"] / MICRO
+            stats = archive.stats()
+            n = stats["archived"] or 1
+            print(f"{posted:>7} {boxes:>6} {reclaimed:>9} {mbr:>13.3f} {read_ms:>12.1f} {stats['box_bytes'] / n:>8.1f} "
+                  f"{stats['stored_bytes'] / n:>11.1f} {pass_s:>7.2f}")
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Query posting through relayer.py vs each user sending their own post_query group.
+
+Concurrent users post --queries-per-user queries each against one fake_algod ledger, either
+directly (prompt.post_query_via_prompt + wait for confirmation) or through a Relayer served on a
+local port (RelayerClient.post_query, then waiting for every ticket). Reports posts/s, user-side
+algod calls and ALGO spent per query, and what the relayer spent.
+
+Usage:
+  python Benchmarks/bench_relayer.py [--users 16] [--queries-per-user 25] [--sign-workers 1]
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algosdk import transaction  # noqa: E402
+
+from client import DecentralizedAiContractClient  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from prompt import post_query_via_prompt  # noqa: E402
+from relayer import Relayer, RelayerClient, serve  # noqa: E402
+
+MICRO = 1_000_000
+
+
+def _run_users(users, per_user: int, post) -> float:
+    start = time.perf_counter()
+    threads = [threading.Thread(target=post, args=(i, u, per_user)) for i, u in enumerate(users)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def _algos(ledger: FakeAlgod, accounts) -> int:
+    return sum(ledger.account_info(a.address)["amount"] for a in accounts)
+
+
+def bench_direct(ledger, app_id: int, users, per_user: int) -> dict:
+    views = [ledger.view() for _ in users]
+    before = _algos(ledger, users)
+
+    def post(i, user, n):
+        algorand = fake_algorand(views[i])
+        app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id, default_sender=user.address,
+                                            default_signer=user.signer)
+        gs = app.state.global_state
+        for k in range(n):
+            res = post_query_via_prompt(algorand, app, user.address, user.signer, int(gs.token),
+                                        int(gs.query_fee), f"direct {i}/{k}")
+            transaction.wait_for_confirmation(views[i], res.tx_id, 5)
+
+    elapsed = _run_users(users, per_user, post)
+    total = len(users) * per_user
+    return {"posts_per_s": total / elapsed, "user_algod_calls_per_query": sum(sum(v.calls.values()) for v in views) / total,
+            "user_algo_per_query": (before - _algos(ledger, users)) / MICRO / total, "relayer_algo_per_query": 0.0}
+
+
+def bench_relayed(ledger, app_id: int, users, per_user: int, sign_workers: int) -> dict:
+    relayer_acct = fake_algorand(ledger).account.random()
+    ledger.fund(relayer_acct.address, 1_000 * MICRO)
+    relayer = Relayer(ledger.view(), app_id, relayer_acct.private_key, sign_workers=sign_workers).start()
+    server = serve(relayer, 0)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    before, relayer_before = _algos(ledger, users), _algos(ledger, [relayer_acct])
+    failed = []
+
+    def post(i, user, n):
+        client = RelayerClient(url)
+        tickets = [client.post_query(user.address, user.signer, f"relayed {i}/{k}")["ticket"] for k in range(n)]
+        failed.extend(v for v in (client.wait(t) for t in tickets) if v["status"] != "confirmed")
+
+    try:
+        elapsed = _run_users(users, per_user, post)
+    finally:
+        server.shutdown()
+        relayer.stop(5)
+    total = len(users) * per_user
+    if failed:
+        print(f"  {len(failed)} relayed posts failed, e.g. {failed[0]}")
+    return {"posts_per_s": total / elapsed, "user_algod_calls_per_query": 0.0,
+            "user_algo_per_query": (before - _algos(ledger, users)) / MICRO / total,
+            "relayer_algo_per_query": (relayer_before - _algos(ledger, [relayer_acct])) / MICRO / total}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--users", type=int, default=16)
+    ap.add_argument("--queries-per-user", type=int, default=25)
+    ap.add_argument("--sign-workers", type=int, default=1)
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, app = deploy_daisy(algorand, ledger, app_algos=10_000)
+    daisy = 2 * args.queries_per_user * 10
+    users = [new_daisy_account(algorand, ledger, deployer, token_id, daisy=daisy, algos=10) for _ in range(args.users)]
+
+    print(f"{'mode':<8} {'posts/s':>9} {'user algod calls/q':>19} {'user ALGO/q':>12} {'relayer ALGO/q':>15}")
+    for mode, run in (("direct", lambda: bench_direct(ledger, app.app_id, users, args.queries_per_user)),
+                      ("relayed", lambda: bench_relayed(ledger, app.app_id, users, args.queries_per_user,
+                                                        args.sign_workers))):
+        r = run()
+        print(f"{mode:<8} {r['posts_per_s']:>9.1f} {r['user_algod_calls_per_query']:>19.1f} "
+              f"{r['user_algo_per_query']:>12.4f} {r['relayer_algo_per_query']:>15.4f}")
+
+
+if __name__ == "__main__":
+    main()
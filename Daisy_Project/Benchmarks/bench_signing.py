@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Signatures per second: AccountTransactionSigner vs parallel_signer across process counts.
+
+Signs --txns payment transactions (in groups of 16, like the bulk sender and relayer) with the
+stock signer, then with ParallelSigner / sign_raw at 1..N worker processes. Scaling needs real
+cores: on a single-core machine the pool only adds overhead.
+
+Usage:
+  python Benchmarks/bench_signing.py [--txns 20000] [--workers 1,2,4,8] [--batch 64]
+"""
+import argparse
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algosdk import account, transaction  # noqa: E402
+from algosdk.atomic_transaction_composer import AccountTransactionSigner  # noqa: E402
+
+from parallel_signer import ParallelSigner, sign_raw, signing_pool  # noqa: E402
+
+
+def _txns(n: int, sender: str):
+    sp = transaction.SuggestedParams(1000, 1, 1001, base64.b64encode(bytes(32)).decode(), "bench-v1", True, None,
+                                     1000)
+    return [transaction.PaymentTxn(sender, sp, sender, i) for i in range(n)]
+
+
+def _rate(label: str, n: int, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    rate = n / (time.perf_counter() - t0)
+    print(f"{label:<36} {rate:>10,.0f} sig/s")
+    return rate
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--txns", type=int, default=20_000)
+    ap.add_argument("--workers", default=",".join(str(w) for w in (1, 2, 4, 8) if w <= max(2, os.cpu_count() or 1)))
+    ap.add_argument("--batch", type=int, default=64)
+    args = ap.parse_args()
+
+    sk, addr = account.generate_account()
+    txns = _txns(args.txns, addr)
+    indexes = list(range(16))
+    groups = [txns[i:i + 16] for i in range(0, len(txns), 16)]
+    print(f"{args.txns} txns, {os.cpu_count()} CPU(s)")
+
+    stock = AccountTransactionSigner(sk)
+    base = _rate("AccountTransactionSigner (per group)", args.txns,
+                 lambda: [stock.sign_transactions(g, indexes[:len(g)]) for g in groups])
+    for workers in (int(w) for w in args.workers.split(",")):
+        signing_pool(workers)  # start processes outside the timed region
+        if workers > 1:
+            sign_raw(txns[:args.batch * workers], [sk] * (args.batch * workers), workers=workers)  # warm up
+        rate = _rate(f"sign_raw, {workers} process(es)", args.txns,
+                     lambda: sign_raw(txns, [sk] * len(txns), workers=workers, batch_size=args.batch))
+        print(f"{'':<36} {rate / base:>10.1f}x stock")
+    signer = ParallelSigner(sk, batch_size=args.batch)
+    _rate(f"ParallelSigner, whole list ({signer.workers} proc)", args.txns,
+          lambda: signer.sign_transactions(txns, list(range(len(txns)))))
+
+
+if __name__ == "__main__":
+    main()
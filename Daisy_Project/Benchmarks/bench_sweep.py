@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Timeout settlement: sweeper.py's expiry-index lookup vs a full scan of the query boxes.
+
+Posts --queries questions on fake_algod spread over --buckets expiry buckets, answers
+--answered of them and accepts --accepted of the answered ones, then advances the chain past
+every accept deadline. Both ways of finding what `timeout_reclaim` can settle are timed and
+their algod requests counted: the full scan (list the boxes, read each one, keep the due
+unsettled queries) and sweeper.expired_ids (expiry box + pending-work box). The sweep itself is
+then sent, and the escrow is checked: unanswered fees back with the user, answered ones with the
+provider, nothing left in the app.
+
+Usage:
+  python Benchmarks/bench_sweep.py [--queries 1200] [--buckets 6] [--answered 0.6] [--accepted 0.5]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from algokit_utils import AlgoAmount, AssetOptInParams, CommonAppCallParams, SendParams  # noqa: E402
+
+from archiver import _QUERY, _query_id, _read_boxes  # noqa: E402
+from batch_submit import send_response_group  # noqa: E402
+from client import DecentralizedAiContractClient, Query  # noqa: E402
+from client_views import (ANSWER_WINDOW_ROUNDS, EXPIRY_BUCKET_ROUNDS, QUERY_SETTLED,  # noqa: E402
+                          REVIEW_WINDOW_ROUNDS)
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+from prompt import batch_queries, post_queries_via_prompt  # noqa: E402
+from sweeper import expired_ids, sweep  # noqa: E402
+
+MICRO = 1_000_000
+FEE = 10
+
+
+def _daisy(ledger: FakeAlgod, address: str, token_id: int) -> int:
+    return ledger.account_asset_info(address, token_id)["asset-holding"]["amount"]
+
+
+def _accept(app: DecentralizedAiContractClient, ids: list) -> None:
+    for start in range(0, len(ids), 16):
+        group = app.new_group()
+        for qid in ids[start:start + 16]:
+            group.accept_response(args=(qid,), params=CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000)))
+        group.send(SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=True))
+
+
+def _full_scan(app: DecentralizedAiContractClient, now: int) -> list:
+    """Due, unsettled query ids found by reading every query box."""
+    names = [b.name_raw for b in app.app_client.get_box_names() if _query_id(b.name_raw) is not None]
+    due = []
+    for name, raw in _read_boxes(app, names, max_workers=1).items():
+        q = Query(*_QUERY.decode(raw))
+        if q.flags & QUERY_SETTLED:
+            continue
+        if now > (q.accept_deadline if q.is_answered else q.answer_deadline):
+            due.append(_query_id(name))
+    return sorted(due)
+
+
+def _counted(ledger: FakeAlgod, fn):
+    ledger.calls.clear()
+    t = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t
+    reads = sum(n for name, n in ledger.calls.items() if "box" in name)
+    return out, elapsed, reads, sum(ledger.calls.values())
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=1200)
+    ap.add_argument("--buckets", type=int, default=6, help="expiry buckets the posts are spread over")
+    ap.add_argument("--answered", type=float, default=0.6, help="fraction of queries answered in time")
+    ap.add_argument("--accepted", type=float, default=0.5, help="fraction of answered queries the user accepts")
+    args = ap.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, governor_app = deploy_daisy(algorand, ledger, query_fee=FEE, app_algos=10_000)
+    user = new_daisy_account(algorand, ledger, deployer, token_id, daisy=args.queries * FEE, algos=1_000)
+    provider = algorand.account.random()
+    ledger.fund(provider.address, 1_000 * MICRO)
+    algorand.send.asset_opt_in(AssetOptInParams(sender=provider.address, asset_id=token_id))
+    sweeper = algorand.account.random()
+    ledger.fund(sweeper.address, 1_000 * MICRO)
+    clients = {
+        who: DecentralizedAiContractClient(algorand=algorand, app_id=governor_app.app_id,
+                                           default_sender=acct.address, default_signer=acct.signer)
+        for who, acct in (("user", user), ("provider", provider), ("sweeper", sweeper))
+    }
+
+    # post, spreading the queries evenly over the buckets
+    ids = []
+    texts = [f"What is the weather like on day {i}?" for i in range(args.queries)]
+    per_bucket = -(-args.queries // args.buckets)
+    for b in range(args.buckets):
+        if b:
+            next_bucket = (ledger.last_round // EXPIRY_BUCKET_ROUNDS + 1) * EXPIRY_BUCKET_ROUNDS
+            while ledger.last_round + 1 < next_bucket:
+                ledger.add_block()
+        for chunk in batch_queries(texts[b * per_bucket:(b + 1) * per_bucket]):
+            first = post_queries_via_prompt(algorand, clients["user"], user.address, user.signer, token_id, FEE,
+                                            chunk).abi_return
+            ids.extend(range(first, first + len(chunk)))
+    answered = ids[::max(1, round(1 / args.answered))] if args.answered else []
+    for start in range(0, len(answered), 16):
+        send_response_group(clients["provider"], [(q, f"Sunny, day {q}") for q in answered[start:start + 16]])
+    accepted = answered[::max(1, round(1 / args.accepted))] if args.accepted else []
+    _accept(clients["user"], accepted)
+
+    user_before, provider_before = _daisy(ledger, user.address, token_id), _daisy(ledger, provider.address, token_id)
+    escrow_before = _daisy(ledger, governor_app.app_address, token_id)
+    deadline = ledger.last_round + ANSWER_WINDOW_ROUNDS + REVIEW_WINDOW_ROUNDS + 1
+    while ledger.last_round < deadline:
+        ledger.add_block()
+    now = ledger.last_round
+
+    scan, scan_s, scan_reads, scan_requests = _counted(ledger, lambda: _full_scan(clients["sweeper"], now + 1))
+    found, index_s, index_reads, index_requests = _counted(
+        ledger, lambda: expired_ids(clients["sweeper"], None, now))
+    assert set(scan) <= set(found), "expiry index missed due queries"
+    result, sweep_s, _, _ = _counted(ledger, lambda: sweep(clients["sweeper"], None, now))
+    again = sweep(clients["sweeper"], None, ledger.last_round)
+
+    unanswered = len(ids) - len(answered)
+    timed_out = len(answered) - len(accepted)
+    refunded = _daisy(ledger, user.address, token_id) - user_before
+    paid = _daisy(ledger, provider.address, token_id) - provider_before
+    escrow = _daisy(ledger, governor_app.app_address, token_id)
+    print(f"queries {len(ids)} over {args.buckets} buckets | answered {len(answered)} | accepted {len(accepted)} | "
+          f"rounds {now}")
+    print(f"{'lookup':<12} {'candidates':>10} {'box reads':>10} {'requests':>9} {'ms':>9}")
+    print(f"{'full scan':<12} {len(scan):>10} {scan_reads:>10} {scan_requests:>9} {scan_s * 1000:>9.1f}")
+    print(f"{'expiry index':<12} {len(found):>10} {index_reads:>10} {index_requests:>9} {index_s * 1000:>9.1f}")
+    print(f"sweep: settled {result['settled']} in {result['groups']} group(s), {result['failed']} failed, "
+          f"{sweep_s:.2f}s | second pass settled {again['settled']}")
+    print(f"escrow {escrow_before} -> {escrow} DAISY | refunded {refunded} | paid to provider {paid}")
+    assert result["settled"] == unanswered + timed_out and again["settled"] == 0, "sweep count mismatch"
+    assert refunded == unanswered * FEE and paid == timed_out * FEE and escrow == 0, "escrow mismatch"
+
+
+if __name__ == "__main__":
+    main()
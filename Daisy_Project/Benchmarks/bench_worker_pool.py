@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compare the old serial provider loop with QueryWorkerPool using a stub LLM and a stub chain.
+
+Usage:
+  python Benchmarks/bench_worker_pool.py [--queries 200] [--llm-ms 80] [--read-ms 5] [--send-ms 40] [--workers 1,4,8,16]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import StubBackend  # noqa: E402
+from worker_pool import QueryWorkerPool  # noqa: E402
+
+
+class StubChain:
+    """Just enough of the app for the node loop: a query box per id and a submit call with latency."""
+
+    def __init__(self, n_queries: int, read_ms: float, send_ms: float):
+        self.read_s = read_ms / 1000
+        self.send_s = send_ms / 1000
+        self.next_query_id = n_queries + 1
+        self.answered = {}
+        self._lock = threading.Lock()
+
+    def get_query(self, qid: int) -> dict:
+        time.sleep(self.read_s)
+        return {"query_text": f"question {qid}", "is_answered": qid in self.answered}
+
+    def submit_response(self, qid: int, text: str) -> None:
+        time.sleep(self.send_s)
+        with self._lock:
+            if qid in self.answered:
+                raise RuntimeError("Already answered")
+            self.answered[qid] = text
+
+
+def handle(chain: StubChain, llm, qid: int) -> None:
+    query = chain.get_query(qid)
+    if query["is_answered"]:
+        return
+    chain.submit_response(qid, llm(query["query_text"]))
+
+
+def run_serial(chain: StubChain, llm) -> float:
+    t0 = time.perf_counter()
+    for qid in range(1, chain.next_query_id):
+        handle(chain, llm, qid)
+    return time.perf_counter() - t0
+
+
+def run_pool(chain: StubChain, llm, workers: int) -> float:
+    pool = QueryWorkerPool(lambda qid: handle(chain, llm, qid), max_workers=workers)
+    t0 = time.perf_counter()
+    while pool.last_processed < chain.next_query_id - 1:
+        for qid in pool.next_batch(chain.next_query_id):
+            pool.submit(qid)
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - t0
+    pool.shutdown()
+    return elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--llm-ms", type=float, default=80)
+    ap.add_argument("--read-ms", type=float, default=5)
+    ap.add_argument("--send-ms", type=float, default=40)
+    ap.add_argument("--workers", default="1,4,8,16")
+    args = ap.parse_args()
+
+    llm = StubBackend(latency_ms=args.llm_ms, max_concurrency=64).generate
+
+    chain = StubChain(args.queries, args.read_ms, args.send_ms)
+    serial = run_serial(chain, llm)
+    print(f"{'serial loop':<14} {serial:8.2f}s  {args.queries / serial:8.1f} q/s")
+
+    for w in (int(x) for x in args.workers.split(",")):
+        chain = StubChain(args.queries, args.read_ms, args.send_ms)
+        elapsed = run_pool(chain, llm, w)
+        assert len(chain.answered) == args.queries
+        print(f"{f'pool x{w}':<14} {elapsed:8.2f}s  {args.queries / elapsed:8.1f} q/s  ({serial / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 # fund_user_algo.py
 #!/usr/bin/env python3
 import os
+import sys
 from algosdk import mnemonic, account, transaction
-from algosdk.v2client import algod
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algod_cache import shared_algod  # noqa: E402
 
 from dotenv import load_dotenv
 
@@ -15,11 +18,10 @@ DEPLOYER_MNEMONIC = os.environ["DEPLOYER_MNEMONIC"]  # the account that has ALGO
 USER_ADDRESS      = os.environ["USER_ADDRESS"]       # the user to top-up
 AMOUNT_ALGO       = float(os.environ.get("AMOUNT_ALGO", "6"))  # default 0.05 ALGO
 
-client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDR)
-
 
 
 def main():
+    client = shared_algod(ALGOD_ADDR, ALGOD_TOKEN)
     sk = mnemonic.to_private_key(DEPLOYER_MNEMONIC)
     addr = account.address_from_private_key(sk)
 
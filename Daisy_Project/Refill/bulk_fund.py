@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Bulk top-ups: fund many accounts with ALGO and/or DAISY in atomic groups of 16.
+
+Recipients come from a CSV (header row) or JSONL file with the columns
+  address   account to fund (optional when mnemonic is given)
+  mnemonic  recipient key; used to sign its DAISY opt-in when it is not opted in yet
+  algo      ALGO to send (default --algo)
+  daisy     DAISY to send (default --daisy; DAISY has decimals=0)
+
+Three phases run in order: ALGO payments, opt-ins (signed by the recipients), DAISY transfers.
+Each phase signs a window of groups on the parallel_signer process pool, sends the groups
+back to back without waiting, then confirms the whole window at once. Every sent/confirmed
+group is appended to a progress file (default <recipients>.progress.jsonl), so a rerun skips
+what is done. A group algod no longer reports is looked up in the blocks of its validity window
+once that window has passed, and re-sent only if it is not there; when those blocks are no
+longer available (a non-archival node, long after the run) its rows are left for a manual check
+rather than risk paying twice.
+
+Env: DEPLOYER_MNEMONIC (holds the ALGO and DAISY), DAISY_TOKEN_ID, ALGOD_ADDR, ALGOD_TOKEN
+
+Usage:
+  python Refill/bulk_fund.py recipients.csv [--algo 1] [--daisy 0] [--window 64] [--sign-workers N]
+  python Refill/bulk_fund.py users.csv --generate 1000 --algo 1 --daisy 100   # new accounts, then fund
+"""
+import argparse
+import base64
+import csv
+import json
+import os
+from collections import defaultdict
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+import msgpack
+from algosdk import account, mnemonic, transaction
+from algosdk.error import AlgodHTTPError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algod_cache import shared_algod  # noqa: E402
+from parallel_signer import SIGN_WORKERS, sign_raw  # noqa: E402
+
+from dotenv import load_dotenv  # noqa: E402
+
+load_dotenv()
+
+GROUP_SIZE = 16
+PHASES = ("algo", "optin", "daisy")
+
+
+# ---- recipients ----
+def load_recipients(path: str, algo: float = 0.0, daisy: int = 0) -> List[dict]:
+    with open(path, newline="") as f:
+        if path.endswith(".jsonl"):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+    recipients = []
+    for i, row in enumerate(rows):
+        words = (row.get("mnemonic") or "").strip()
+        sk = mnemonic.to_private_key(words) if words else None
+        address = (row.get("address") or "").strip() or (account.address_from_private_key(sk) if sk else "")
+        if not address:
+            raise SystemExit(f"{path}: row {i + 1} has neither an address nor a mnemonic")
+        recipients.append({
+            "row": i,
+            "address": address,
+            "sk": sk,
+            "algo": int(float(row.get("algo") or algo) * 1_000_000),
+            "daisy": int(row.get("daisy") or daisy),
+        })
+    return recipients
+
+
+def generate_recipients(path: str, n: int, algo: float, daisy: int) -> None:
+    """Write `n` new accounts (address, mnemonic, algo, daisy) to `path` as CSV."""
+    with open(path, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["address", "mnemonic", "algo", "daisy"])
+        for _ in range(n):
+            sk, addr = account.generate_account()
+            out.writerow([addr, mnemonic.from_private_key(sk), algo, daisy])
+
+
+# ---- progress ----
+class Progress:
+    """Append-only JSONL log of sent / done / failed groups, replayed on start."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Dict[str, Set[int]] = {p: set() for p in PHASES}
+        self.sent: Dict[str, dict] = {}  # group txid -> "sent" record without an outcome yet
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        self._replay(json.loads(line))
+        self._file = open(path, "a")
+
+    def _replay(self, rec: dict) -> None:
+        if rec["event"] == "sent":
+            self.sent[rec["txid"]] = rec
+            return
+        self.sent.pop(rec["txid"], None)
+        if rec["event"] == "done":
+            self.done[rec["phase"]].update(rec["rows"])
+
+    def unresolved(self, phase: str) -> Set[int]:
+        """Rows of groups that were sent but whose outcome is still unknown."""
+        return {row for rec in self.sent.values() if rec["phase"] == phase for row in rec["rows"]}
+
+    def record(self, event: str, phase: str, rows: List[int], txid: str, **extra) -> None:
+        rec = {"event": event, "phase": phase, "rows": rows, "txid": txid, **extra}
+        self._replay(rec)
+        self._file.write(json.dumps(rec) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# ---- sending ----
+def _committed_groups(client, groups: List[dict]) -> Tuple[Set[str], Set[str]]:
+    """
+    Look for expired groups in the blocks of their validity windows. Returns the txids of the
+    groups found and of those whose blocks the node no longer has.
+    """
+    by_range = defaultdict(list)
+    for g in groups:
+        # progress records from before "first_valid" was logged: the window is at most 1000 rounds
+        by_range[(g.get("first_valid") or max(1, g["last_valid"] - 1000), g["last_valid"])].append(g)
+    found, unknown = set(), set()
+    for (first, last), members in by_range.items():
+        wanted = {base64.b64decode(g["group"]): g["txid"] for g in members if g.get("group")}
+        unknown.update(g["txid"] for g in members if not g.get("group"))
+        for rnd in range(first, last + 1):
+            if not wanted:
+                break
+            try:
+                raw = client.block_info(rnd, response_format="msgpack")
+            except AlgodHTTPError as e:
+                if e.code != 404:
+                    raise
+                unknown.update(wanted.values())
+                break
+            block = msgpack.unpackb(raw, raw=False, strict_map_key=False).get("block", {})
+            for entry in block.get("txns") or []:
+                txid = wanted.pop(entry.get("txn", {}).get("grp"), None)
+                if txid is not None:
+                    found.add(txid)
+    return found, unknown
+
+
+def _confirm(client, window: List[dict], progress: Progress) -> List[dict]:
+    """
+    Wait until every group in `window` is confirmed or can no longer be; returns the groups
+    that confirmed. Groups whose outcome cannot be decided stay "sent" in `progress`.
+    """
+    pending = {g["txid"]: g for g in window}
+    rnd = int(client.status()["last-round"])
+    confirmed, expired = [], []
+    while pending:
+        for txid, g in list(pending.items()):
+            try:
+                info = client.pending_transaction_info(txid)
+            except AlgodHTTPError as e:
+                if e.code != 404:
+                    raise
+                info = {}
+            if info.get("confirmed-round"):
+                progress.record("done", g["phase"], g["rows"], txid, round=info["confirmed-round"])
+                confirmed.append(g)
+                del pending[txid]
+            elif info.get("pool-error"):
+                progress.record("failed", g["phase"], g["rows"], txid, error=info["pool-error"])
+                del pending[txid]
+            elif rnd > g["last_valid"]:
+                # algod has forgotten it: it may have been dropped, or confirmed a while ago
+                expired.append(g)
+                del pending[txid]
+        if pending:
+            rnd = int(client.status_after_block(rnd)["last-round"])
+    if expired:
+        found, unknown = _committed_groups(client, expired)
+        for g in expired:
+            if g["txid"] in found:
+                progress.record("done", g["phase"], g["rows"], g["txid"], round=None)
+                confirmed.append(g)
+            elif g["txid"] not in unknown:
+                progress.record("failed", g["phase"], g["rows"], g["txid"], error="not in a block of its window")
+    return confirmed
+
+
+def _resolve_unconfirmed(client, progress: Progress) -> None:
+    """Settle groups a previous run sent but did not see confirmed, before anything is re-sent."""
+    stale = list(progress.sent.values())
+    if not stale:
+        return
+    print(f"Checking {len(stale)} group(s) sent by a previous run ...")
+    confirmed = _confirm(client, stale, progress)
+    undecided = len(progress.sent)
+    failed = len(stale) - len(confirmed) - undecided
+    if failed:
+        print(f"  {failed} of them never confirmed; their recipients will be funded again")
+    if undecided:
+        print(f"  {undecided} could not be checked (their blocks are gone); their recipients are skipped. "
+              f"Check them by txid in {progress.path} and remove those lines to retry.")
+
+
+def _build_groups(phase: str, todo: List[dict], funder: str, funder_sk: str, token_id: int, sp) -> List[dict]:
+    groups = []
+    for i in range(0, len(todo), GROUP_SIZE):
+        chunk = todo[i:i + GROUP_SIZE]
+        if phase == "algo":
+            txns = [transaction.PaymentTxn(funder, sp, r["address"], r["algo"]) for r in chunk]
+            keys = [funder_sk] * len(chunk)
+        elif phase == "optin":
+            txns = [transaction.AssetTransferTxn(r["address"], sp, r["address"], 0, token_id) for r in chunk]
+            keys = [r["sk"] for r in chunk]
+        else:
+            txns = [transaction.AssetTransferTxn(funder, sp, r["address"], r["daisy"], token_id) for r in chunk]
+            keys = [funder_sk] * len(chunk)
+        # a group id even for one transaction, so an expired group can be recognised in a block
+        transaction.assign_group_id(txns)
+        groups.append({"phase": phase, "rows": [r["row"] for r in chunk], "txns": txns, "keys": keys,
+                       "txid": txns[-1].get_txid(), "first_valid": sp.first, "last_valid": sp.last,
+                       "group": base64.b64encode(txns[0].group).decode()})
+    return groups
+
+
+def _not_opted_in(client, recipients: List[dict], token_id: int, workers: int = 16) -> List[dict]:
+    def missing(r: dict) -> bool:
+        try:
+            client.account_asset_info(r["address"], token_id)
+            return False
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return True
+            raise
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        flags = list(pool.map(missing, recipients))
+    return [r for r, f in zip(recipients, flags) if f]
+
+
+def run_phase(client, phase: str, todo: List[dict], funder: str, funder_sk: str, token_id: int,
+              progress: Progress, window: int = 64, sign_workers: int = SIGN_WORKERS) -> dict:
+    """
+    Send `todo` for one phase in windows of `window` groups. Returns throughput stats, counting
+    confirmed groups and their transactions only.
+    """
+    stats = {"phase": phase, "txns": 0, "groups": 0, "failed_groups": 0, "seconds": 0.0}
+    if not todo:
+        return stats
+    t0 = time.perf_counter()
+    for start in range(0, len(todo), window * GROUP_SIZE):
+        batch = todo[start:start + window * GROUP_SIZE]
+        groups = _build_groups(phase, batch, funder, funder_sk, token_id, client.suggested_params())
+        # One signing pass for the whole window; signed bytes go out without re-encoding
+        signed = iter(sign_raw([t for g in groups for t in g["txns"]], [k for g in groups for k in g["keys"]],
+                               workers=sign_workers))
+        sent = []
+        for group in groups:
+            raw = b"".join(next(signed) for _ in group["txns"])
+            try:
+                client.send_raw_transaction(base64.b64encode(raw))
+            except AlgodHTTPError as e:
+                progress.record("failed", phase, group["rows"], group["txid"], error=str(e))
+                stats["failed_groups"] += 1
+                continue
+            progress.record("sent", phase, group["rows"], group["txid"], first_valid=group["first_valid"],
+                            last_valid=group["last_valid"], group=group["group"])
+            sent.append(group)
+        confirmed = _confirm(client, sent, progress)
+        stats["failed_groups"] += len(sent) - len(confirmed)
+        stats["groups"] += len(confirmed)
+        stats["txns"] += sum(len(g["rows"]) for g in confirmed)
+        print(f"  {phase}: {start + len(batch)}/{len(todo)} sent, {stats['txns']} confirmed "
+              f"({stats['txns'] / (time.perf_counter() - t0):.0f} txn/s)")
+    stats["seconds"] = round(time.perf_counter() - t0, 3)
+    return stats
+
+
+def bulk_fund(client, recipients: List[dict], funder_sk: str, token_id: Optional[int], progress: Progress,
+              window: int = 64, sign_workers: int = SIGN_WORKERS) -> List[dict]:
+    """Run the ALGO, opt-in and DAISY phases for everything `progress` does not list as done."""
+    funder = account.address_from_private_key(funder_sk)
+    _resolve_unconfirmed(client, progress)
+    results = []
+
+    skip = progress.done["algo"] | progress.unresolved("algo")
+    todo = [r for r in recipients if r["algo"] > 0 and r["row"] not in skip]
+    results.append(run_phase(client, "algo", todo, funder, funder_sk, token_id, progress, window, sign_workers))
+
+    wanted = [r for r in recipients if r["daisy"] > 0]
+    if wanted and token_id is None:
+        raise SystemExit("DAISY_TOKEN_ID is required to send DAISY")
+    skip = progress.done["optin"] | progress.done["daisy"] | progress.unresolved("optin")
+    todo = [r for r in wanted if r["row"] not in skip]
+    missing = _not_opted_in(client, todo, token_id) if todo else []
+    unsignable = [r for r in missing if r["sk"] is None]
+    for r in unsignable:
+        print(f"  skipping DAISY for {r['address']}: not opted in and no mnemonic to opt it in")
+    results.append(run_phase(client, "optin", [r for r in missing if r["sk"] is not None], funder, funder_sk,
+                             token_id, progress, window, sign_workers))
+
+    skip = {r["row"] for r in unsignable} | progress.unresolved("daisy")
+    todo = [r for r in wanted if r["row"] not in progress.done["daisy"] and r["row"] not in skip]
+    results.append(run_phase(client, "daisy", todo, funder, funder_sk, token_id, progress, window, sign_workers))
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("recipients", help="CSV (with header) or .jsonl file of recipients")
+    ap.add_argument("--algo", type=float, default=0.0, help="ALGO per recipient when the file has no 'algo'")
+    ap.add_argument("--daisy", type=int, default=0, help="DAISY per recipient when the file has no 'daisy'")
+    ap.add_argument("--generate", type=int, default=0, help="first write this many new accounts to the file")
+    ap.add_argument("--window", type=int, default=64, help="groups sent before waiting for confirmations")
+    ap.add_argument("--sign-workers", type=int, default=SIGN_WORKERS, help="signing processes")
+    ap.add_argument("--progress", help="progress file (default <recipients>.progress.jsonl)")
+    args = ap.parse_args()
+
+    try:
+        funder_sk = mnemonic.to_private_key(os.environ["DEPLOYER_MNEMONIC"])
+    except KeyError:
+        raise SystemExit("Missing env var: DEPLOYER_MNEMONIC (the account holding the ALGO and DAISY)")
+    token_id = int(os.environ["DAISY_TOKEN_ID"]) if os.getenv("DAISY_TOKEN_ID") else None
+
+    if args.generate:
+        generate_recipients(args.recipients, args.generate, args.algo, args.daisy)
+        print(f"Wrote {args.generate} new accounts to {args.recipients}")
+    recipients = load_recipients(args.recipients, args.algo, args.daisy)
+    progress = Progress(args.progress or args.recipients + ".progress.jsonl")
+    client = shared_algod(os.getenv("ALGOD_ADDR", "http://localhost:4001"),
+                          os.getenv("ALGOD_TOKEN", "a" * 64))
+
+    print(f"Funding {len(recipients)} recipient(s) from {account.address_from_private_key(funder_sk)}")
+    t0 = time.perf_counter()
+    try:
+        results = bulk_fund(client, recipients, funder_sk, token_id, progress, args.window, args.sign_workers)
+    finally:
+        progress.close()
+    elapsed = time.perf_counter() - t0
+    total = sum(r["txns"] for r in results)
+    for r in results:
+        if r["txns"] or r["failed_groups"]:
+            print(f"✅ {r['phase']:<6} {r['txns']:>7} txns in {r['groups']} groups, {r['failed_groups']} failed, "
+                  f"{r['txns'] / r['seconds']:.0f} txn/s")
+    print(f"Done: {total} txns in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.0f} txn/s)")
+
+
+if __name__ == "__main__":
+    main()
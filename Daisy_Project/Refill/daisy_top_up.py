@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import os
+import sys
 from algosdk import transaction, mnemonic, account
 from algosdk.v2client import algod
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algod_cache import shared_algod  # noqa: E402
+
 # ---- Network config (env or defaults for LocalNet) ----
 ALGOD_ADDR  = os.getenv("ALGOD_ADDR",  "http://localhost:4001")
 ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa")
@@ -45,7 +49,8 @@ def main():
     AMOUNT = int(os.environ.get("AMOUNT", "2000"))
     FUND_ALGOS = float(os.environ.get("FUND_ALGOS", "0"))
 
-    client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDR)
+    # One pooled connection; suggested params are reused across the sends below
+    client = shared_algod(ALGOD_ADDR, ALGOD_TOKEN)
 
     # --- Keys + addresses ---
     deployer_sk = mnemonic.to_private_key(DEPLOYER_MNEMONIC)
@@ -1,36 +1,100 @@
 #!/usr/bin/env python3
 import os
 import time
+import threading
 import random
 import logging
-from typing import Optional
+from concurrent.futures import Future
+from typing import Callable, Optional, Union
 
 from algosdk.mnemonic import to_private_key
 from algosdk.account import address_from_private_key as get_address_from_private_key
 from algosdk.atomic_transaction_composer import AccountTransactionSigner
-from google import genai
 
-from algokit_utils import AlgorandClient, SendParams, CommonAppCallParams, AlgoAmount
+from algokit_utils import AlgorandClient
 
 # Generated client (do not modify)
 from client import DecentralizedAiContractClient, Query
-from prompt import get_query_via_prompt, submit_response_via_prompt
+from client_views import QUERY_SETTLED, PendingWork, QueryRefView, read_pending_work
+from prompt import (
+    get_query_via_prompt,
+    get_queries_via_prompt,
+    get_query_ref_via_prompt,
+    submit_response_via_prompt,
+    submit_response_ref_via_prompt,
+)
+from worker_pool import QueryWorkerPool
+from discovery import BlockDiscovery
+from sharding import ShardMap, providers_from_env
+from checkpoint import CheckpointStore
+from answer_cache import AnswerCache
+from backends import AnswerBackend, BackendError, backend_from_env
+from batch_submit import FEES_SPENT, RESPONSES_REJECTED, Response, ResponseBatcher, ResponseRef, send_response_group
+from blob_store import CachedResolver, blob_store_from_env
+import metrics
+from metrics import REGISTRY, span
 
 # ------------ Config ------------
 from dotenv import load_dotenv
 load_dotenv()
 
 POLL_SECONDS = int(os.getenv("POLL_SECONDS", "6"))
+NODE_CONCURRENCY = int(os.getenv("NODE_CONCURRENCY", "4"))  # queries answered in parallel
+BOX_READ_CONCURRENCY = int(os.getenv("BOX_READ_CONCURRENCY", "16"))  # parallel box reads when catching up
+SUBMIT_BATCH_SIZE = int(os.getenv("SUBMIT_BATCH_SIZE", "16"))  # responses per atomic group (1 = one txn per answer)
+SUBMIT_BATCH_WINDOW_MS = int(os.getenv("SUBMIT_BATCH_WINDOW_MS", "200"))  # how long a group waits to fill up
+CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", "ai_node_state.sqlite3")  # durable progress + in-flight answers
+DISCOVERY = os.getenv("DISCOVERY", "blocks")  # "blocks" (follow new blocks) or "poll" (read next_query_id every POLL_SECONDS)
+FALLBACK_POLL_SECONDS = int(os.getenv("FALLBACK_POLL_SECONDS", "60"))  # safety poll while following blocks
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))  # serve Prometheus metrics on this port (0 = off)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+# Check-before-commit: re-read the query box before the LLM call and before sending when the last
+# read is older than this (0 = always re-read, negative = never)
+RECHECK_AFTER_MS = int(os.getenv("RECHECK_AFTER_MS", "500"))
+# How long a fetched round number is reused for answer-deadline checks; the deadline is
+# ANSWER_WINDOW_ROUNDS after posting, and a late submit is refused on chain anyway
+ROUND_CACHE_MS = int(os.getenv("ROUND_CACHE_MS", "2000"))
 APP_ID_ENV = "APP_ID"               # required
 PROVIDER_MNEMONIC_ENV = "PROVIDER_MNEMONIC"  # required now to avoid version mismatches
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 log = logging.getLogger("ai_provider")
 
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
-    raise SystemExit("Set GEMINI_API_KEY in your environment or .env")
-_gemini = genai.Client(api_key=GEMINI_API_KEY)
+ANSWER_PROMPT_TEMPLATE = (
+    "You are a concise assistant. "
+    "Answer briefly (<= 400 chars). If relevant, outline steps.\n\n"
+    "User prompt:\n{prompt}"
+)
+
+# Off-box (post_query_ref) answers are not bound by ABI arg limits, only by this budget
+REF_ANSWER_MAX_CHARS = int(os.getenv("REF_ANSWER_MAX_CHARS", "4000"))
+REF_ANSWER_PROMPT_TEMPLATE = (
+    "You are a concise assistant. "
+    f"Answer in at most {REF_ANSWER_MAX_CHARS} chars. If relevant, outline steps.\n\n"
+    "User prompt:\n{prompt}"
+)
+
+# Set up by _init_answering() (from ANSWER_BACKEND=gemini|stub|local; see backends.py)
+_backend: Optional[AnswerBackend] = None
+_answer_cache: Optional[AnswerCache] = None
+# Reads/writes off-box query and response text (BLOB_STORE); set up in main(), None without a store
+_resolver: Optional[CachedResolver] = None
+
+QUERIES_ANSWERED = REGISTRY.counter("daisy_queries_answered_total", "Responses submitted by this node.")
+QUERIES_SKIPPED = REGISTRY.counter(
+    "daisy_queries_skipped_total",
+    "Query ids not answered (not_found, already_answered, expired, answered_before_llm, answered_before_send).",
+    ("reason",))
+LLM_CALLS_WASTED = REGISTRY.counter(
+    "daisy_llm_calls_wasted_total", "LLM answers generated for queries another provider answered first.")
+QUERIES_TAKEN_OVER = REGISTRY.counter(
+    "daisy_queries_taken_over_total", "Queries answered after their shard owner stayed quiet.")
+QUERY_RETRIES = REGISTRY.counter("daisy_query_retries_total", "Query handler failures; the id is retried.")
+ANSWER_CACHE_EVENTS = REGISTRY.counter(
+    "daisy_answer_cache_events_total", "Answer cache lookups by outcome (hits, disk_hits, misses, ...).", ("event",))
+ANSWER_CACHE_EVENTS.set_function(lambda: {(k,): v for k, v in (_answer_cache.stats if _answer_cache else {}).items()})
+BACKLOG = REGISTRY.gauge("daisy_backlog_queries", "Known query ids above the committed watermark.")
+IN_FLIGHT = REGISTRY.gauge("daisy_queries_in_flight", "Query ids queued or running in the worker pool.")
 
 # ------------ Helpers ------------
 def _build_algorand_client() -> AlgorandClient:
@@ -81,24 +145,353 @@ def _maybe_log_token_and_fee(app: DecentralizedAiContractClient):
     except Exception as e:
         log.warning("Could not read global state: %s", e)
 
-def _gemini_answer(prompt_text: str) -> str:
+def _init_answering(backend: Optional[AnswerBackend] = None) -> AnswerBackend:
+    """Select the answer backend and put the answer cache (memory LRU + optional SQLite tier) in front of it."""
+    global _backend, _answer_cache
+    _backend = backend or backend_from_env()
+    # Keyed on normalized text + model + template
+    _answer_cache = AnswerCache(
+        model=_backend.model_name,
+        template=ANSWER_PROMPT_TEMPLATE,
+        max_entries=int(os.getenv("ANSWER_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.getenv("ANSWER_CACHE_TTL", "86400")),
+        db_path=os.getenv("ANSWER_CACHE_DB") or None,
+    )
+    return _backend
+
+
+def _llm_answer(prompt_text: str, template: str = ANSWER_PROMPT_TEMPLATE,
+                before: Optional[Callable[[], None]] = None) -> str:
     """
-    Get an answer from Gemini. Keep short to fit ABI arg limits if needed.
+    Get an answer from the configured backend. Keep short to fit ABI arg limits if needed.
+    `before` runs right before the paid call (see AnswerBackend.generate).
     """
-    # Pick a model; flash = faster/cheaper, pro = stronger
-    model = "gemini-2.5-flash"
-    resp = _gemini.models.generate_content(
-        model=model,
-        contents=(
-            "You are a concise assistant. "
-            "Answer briefly (<= 400 chars). If relevant, outline steps.\n\n"
-            f"User prompt:\n{prompt_text}"
-        ),
-    )
-    # Fallbacks in case API returns no text
-    return (resp.text or "").strip() or "No answer produced."
+    with span("llm"):
+        return _backend.generate(template.format(prompt=prompt_text), before=before)
+
+
+def _cached_answer(prompt_text: str, template: str = ANSWER_PROMPT_TEMPLATE,
+                   before: Optional[Callable[[], None]] = None) -> str:
+    """`_llm_answer` behind the answer cache; identical (normalized) questions reuse one LLM call."""
+    answer = _answer_cache.get_or_compute(prompt_text, lambda t: _llm_answer(t, template, before),
+                                          template=template)
+    log.debug("Answer cache stats: %s", _answer_cache.stats)
+    return answer
+
+
+_NOT_FETCHED = object()
+
+
+class _AlreadyAnswered(Exception):
+    """Raised by the check-before-commit re-read to abort an LLM call."""
+
+
+_round_seen = (float("-inf"), 0)  # (monotonic time, round) of the last fetch
+
+
+def _current_round(app: DecentralizedAiContractClient) -> int:
+    global _round_seen
+    at, rnd = _round_seen
+    if (time.monotonic() - at) * 1000 >= ROUND_CACHE_MS:
+        rnd = app.algorand.client.algod.status()["last-round"]
+        _round_seen = (time.monotonic(), rnd)
+    return rnd
+
+
+def _expired(app: DecentralizedAiContractClient, record: Union[Query, QueryRefView]) -> bool:
+    """True once the query was refunded or its answer deadline has passed."""
+    return bool(record.flags & QUERY_SETTLED) or _current_round(app) > record.answer_deadline
+
+
+def _still_open(app: DecentralizedAiContractClient, qid: int, is_ref: bool, shard: Optional[ShardMap]) -> bool:
+    """Re-read query `qid`; False once it is answered, expired (or gone)."""
+    if shard is not None and shard.answered_by(qid):
+        return False
+    with span("recheck"):
+        record = get_query_ref_via_prompt(app, qid) if is_ref else get_query_via_prompt(app, qid)
+    return record is not None and not record.is_answered and not _expired(app, record)
+
+
+def _handle_query(app: DecentralizedAiContractClient, qid: int, prefetched: dict, store: CheckpointStore,
+                  submit: Callable[[int, Response], Future], shard: Optional[ShardMap] = None,
+                  pending: Optional[PendingWork] = None) -> Optional[Future]:
+    """
+    Answer one query id end to end. Raising leaves the id uncommitted so the pool retries it.
+    Once the answer is handed to `submit`, returns a Future that resolves when it was sent (or
+    the query turned out to be answered already) and fails when it should be retried.
+    """
+    # The pending-work box already says it is answered (answers are final, so an old snapshot is fine)
+    if pending is not None and pending.is_answered(qid):
+        prefetched.pop(qid, None)
+        log.info("Query %s already answered; skipping.", qid)
+        QUERIES_SKIPPED.inc(reason="already_answered")
+        return
+
+    # Another provider's answer already showed up in a block; no need to read the box
+    if shard is not None and shard.answered_by(qid):
+        prefetched.pop(qid, None)
+        log.info("Query %s already answered by %s; skipping.", qid, shard.answered_by(qid))
+        QUERIES_SKIPPED.inc(reason="already_answered")
+        return
+
+    # Use the box read from the batched catch-up fetch if there is one; retries always re-read
+    query: Optional[Query] = prefetched.pop(qid, _NOT_FETCHED)
+    ref: Optional[QueryRefView] = None
+    # When the record we decided on was read; prefetched reads may be older, so never trust them
+    read_at = float("-inf")
+    with span("box_read"):
+        if query is _NOT_FETCHED:
+            read_at = time.monotonic()
+            query = get_query_via_prompt(app, qid)
+        if query is None:
+            # Not an inline query; it may have been posted off-box with post_query_ref
+            read_at = time.monotonic()
+            ref = get_query_ref_via_prompt(app, qid)
+    if query is None and ref is None:
+        log.info("Query %s not found; skipping.", qid)
+        QUERIES_SKIPPED.inc(reason="not_found")
+        return
+
+    record = query or ref
+    if record.is_answered:
+        log.info("Query %s already answered by %s; skipping.", qid, record.provider)
+        QUERIES_SKIPPED.inc(reason="already_answered")
+        return
+    if _expired(app, record):
+        log.info("Query %s was refunded or is past its answer deadline; skipping.", qid)
+        QUERIES_SKIPPED.inc(reason="expired")
+        return
+
+    if ref is not None and _resolver is None:
+        log.info("Query %s was posted off-box and no BLOB_STORE is set; skipping.", qid)
+        QUERIES_SKIPPED.inc(reason="no_blob_store")
+        return
+
+    if shard is not None and shard.took_over(qid):
+        QUERIES_TAKEN_OVER.inc()
+
+    prompt = query.query_text if query else _resolver.text(ref.query_hash)
+    log.info("New %squery %s from %s: %s", "off-box " if ref else "", qid, record.submitter, prompt)
+
+    def answered_meanwhile() -> bool:
+        # Check-before-commit: skip the re-read when the last one is recent enough
+        nonlocal read_at
+        if RECHECK_AFTER_MS < 0 or (time.monotonic() - read_at) * 1000 < RECHECK_AFTER_MS:
+            return False
+        read_at = time.monotonic()
+        return not _still_open(app, qid, ref is not None, shard)
+
+    llm_called = False
+
+    def before_llm() -> None:
+        nonlocal llm_called
+        if answered_meanwhile():
+            raise _AlreadyAnswered(qid)
+        llm_called = True
+
+    # Build answer, reusing one generated before a crash/restart instead of paying for it again
+    ai_answer = store.get_answer(qid)
+    if ai_answer is None:
+        try:
+            ai_answer = _cached_answer(prompt, REF_ANSWER_PROMPT_TEMPLATE if ref else ANSWER_PROMPT_TEMPLATE,
+                                       before_llm)
+        except _AlreadyAnswered:
+            log.info("Query %s was answered while waiting for the LLM; skipping.", qid)
+            QUERIES_SKIPPED.inc(reason="answered_before_llm")
+            return
+        store.save_answer(qid, ai_answer)
+    else:
+        log.info("Resubmitting answer for query %s saved before restart (previous txid: %s)",
+                 qid, store.submitted_txid(qid))
+    log.info("LLM response for query %s: %s", qid, ai_answer)
+
+    # Off-box queries get off-box answers: publish the text, submit only its hash + length
+    response: Response = ai_answer
+    if ref:
+        response = ResponseRef(*_resolver.put_text(ai_answer))
+
+    def lost_race() -> None:
+        log.info("Query %s is already answered; not sending our response.", qid)
+        QUERIES_SKIPPED.inc(reason="answered_before_send")
+        if llm_called:
+            LLM_CALLS_WASTED.inc()
+
+    if answered_meanwhile():
+        return lost_race()
+
+    # Submit response (alone or grouped with other ready answers); the rest runs when it is sent
+    log.info("Submitting response for query %s ...", qid)
+    finished: Future = Future()
+
+    def on_sent(sent: Future) -> None:
+        try:
+            try:
+                txid = sent.result()
+            except Exception as e:
+                # Rejected by simulation or on send: only retry if the query is still open
+                if _still_open(app, qid, ref is not None, shard):
+                    return finished.set_exception(e)
+                lost_race()
+                return finished.set_result(None)
+            store.mark_submitted(qid, txid)
+            QUERIES_ANSWERED.inc()
+            log.info("Submitted response for query %s. The DAISY fee is paid to this provider (which must be "
+                     "opted into the ASA) once the submitter accepts, or after the review window via "
+                     "timeout_reclaim.", qid)
+            finished.set_result(txid)
+        except Exception as e:
+            finished.set_exception(e)
+
+    submit(qid, response).add_done_callback(on_sent)
+    return finished
+
 
 # ------------ Main loop ------------
+def run_node(algorand: AlgorandClient, app: DecentralizedAiContractClient, store: CheckpointStore,
+             stop: Optional[threading.Event] = None, poll_seconds: float = POLL_SECONDS,
+             shard: Optional[ShardMap] = None) -> None:
+    """
+    Discover and answer queries for `app` until `stop` is set (forever if None).
+
+    Answering must be set up first (`_init_answering`, `_resolver`); `store` is not closed.
+    With `shard`, queries owned by other providers are only answered once their takeover time passes.
+    """
+    if shard is not None and not shard.enabled:
+        shard = None
+    stop = stop or threading.Event()
+    app_id = app.app_id
+    start_after = store.last_processed()
+    log.info("Resuming after query %s (%s answer(s) pending resubmission)", start_after, len(store.pending()))
+
+    # Grouped answers are sent by the batcher's thread; workers only queue them, so a group can
+    # fill up from more answers than there are workers
+    batcher = None
+    if SUBMIT_BATCH_SIZE > 1:
+        batcher = ResponseBatcher(
+            lambda members: send_response_group(app, members),
+            max_size=SUBMIT_BATCH_SIZE,
+            window_seconds=SUBMIT_BATCH_WINDOW_MS / 1000,
+        )
+        submit = batcher.submit
+    else:
+        def submit(qid: int, response: Response) -> Future:
+            sent: Future = Future()
+            with span("send"):
+                try:
+                    if isinstance(response, ResponseRef):
+                        res = submit_response_ref_via_prompt(algorand, app, qid, response.hash, response.length)
+                    else:
+                        res = submit_response_via_prompt(algorand, app, qid, response)
+                except Exception as e:
+                    RESPONSES_REJECTED.inc(stage="send")
+                    sent.set_exception(e)
+                    return sent
+            FEES_SPENT.inc(res.transaction.raw.fee)
+            sent.set_result(res.tx_id)
+            return sent
+
+    prefetched: dict = {}
+    # Latest read of the pending-work box (None before the first post or on a pre-bitmap contract)
+    pending = {"work": None}
+
+    def count_retry(finished: Future) -> None:
+        if finished.exception() is not None:
+            QUERY_RETRIES.inc()
+
+    def handle(qid: int) -> Optional[Future]:
+        try:
+            finished = _handle_query(app, qid, prefetched, store, submit, shard, pending["work"])
+        except Exception:
+            QUERY_RETRIES.inc()
+            raise
+        if finished is not None:
+            finished.add_done_callback(count_retry)
+        return finished
+
+    def commit(qid: int) -> None:
+        store.commit(qid)
+        if shard is not None:
+            shard.forget_through(qid)
+
+    pool = QueryWorkerPool(
+        handle,
+        max_workers=NODE_CONCURRENCY,
+        start_after=start_after,
+        # room for a full group of answers waiting on the batcher next to the usual queue
+        max_pending=4 * NODE_CONCURRENCY + (SUBMIT_BATCH_SIZE if batcher else 0),
+        on_commit=commit,
+    )
+    ready = shard.ready if shard is not None else None
+
+    # Highest query id + 1 we know about, fed by block discovery and/or global-state polls
+    known = {"next_qid": start_after + 1}
+    wake = threading.Event()
+    BACKLOG.set_function(lambda: max(0, known["next_qid"] - 1 - pool.last_processed))
+    IN_FLIGHT.set_function(lambda: len(pool.in_flight()))
+
+    def _on_query(qid: int):
+        known["next_qid"] = max(known["next_qid"], qid + 1)
+        if ready is None or ready(qid):
+            pool.submit(qid)
+        wake.set()
+
+    discovery = None
+    if DISCOVERY == "blocks":
+        discovery = BlockDiscovery(
+            algorand.client.algod,
+            app_id,
+            on_query=_on_query,
+            on_fallback=wake.set,
+            fallback_seconds=poll_seconds,
+            on_answer=shard.observe_answer if shard is not None else None,
+        ).start()
+    poll_every = FALLBACK_POLL_SECONDS if discovery else poll_seconds
+    last_poll = 0.0
+
+    log.info("AI provider node started. Watching app_id=%s | concurrency=%s | discovery=%s | shard=%s",
+             app_id, NODE_CONCURRENCY, DISCOVERY,
+             f"1 of {len(shard.providers)}, takeover {shard.takeover_seconds}s" if shard else "off")
+    try:
+        while not stop.is_set():
+            try:
+                if time.monotonic() - last_poll >= poll_every:
+                    # One box read gives next_query_id and the answered/open bit of every recent id
+                    with span("box_read"):
+                        pending["work"] = read_pending_work(app)
+                    if pending["work"] is not None:
+                        known["next_qid"] = max(known["next_qid"], pending["work"].next_query_id)
+                    else:
+                        known["next_qid"] = max(known["next_qid"], app.state.global_state.next_query_id)
+                    last_poll = time.monotonic()
+
+                # Hand any new (or previously failed) query ids to the pool. A backlog (e.g. after downtime)
+                # is read with one batched, concurrent box fetch instead of one round trip per id.
+                batch = pool.next_batch(known["next_qid"], ready)
+                work = pending["work"]
+                unread = [qid for qid in batch if work is None or not work.is_answered(qid)]
+                if len(unread) > 1:
+                    with span("box_read"):
+                        prefetched.update(get_queries_via_prompt(app, unread, max_workers=BOX_READ_CONCURRENCY))
+                for qid in batch:
+                    if not pool.submit(qid):
+                        prefetched.pop(qid, None)
+
+            except Exception as e:
+                log.error("Error in provider loop: %s", e, exc_info=True)
+
+            if wake.wait(poll_seconds):
+                wake.clear()
+                # A fallback wake from discovery means algod was unreachable; poll right away
+                if discovery and discovery.last_round is None:
+                    last_poll = 0.0
+    finally:
+        if discovery:
+            discovery.stop(timeout=1)
+        pool.shutdown(wait=True)
+        if batcher:
+            batcher.close()
+
+
 def main():
     app_id_str = os.getenv(APP_ID_ENV)
     if not app_id_str:
@@ -108,64 +501,39 @@ def main():
     except ValueError:
         raise SystemExit(f"Invalid {APP_ID_ENV}={app_id_str!r}; must be an integer.")
 
+    backend = _init_answering()
+    try:
+        backend.check()
+    except BackendError as e:
+        raise SystemExit(str(e))
+    log.info("Answer backend: %s (timeout %ss, concurrency %s)",
+             backend.model_name, backend.timeout, backend.max_concurrency)
+
     algorand = _build_algorand_client()
     provider_addr, provider_signer = _get_provider_account()
     app = _init_client(algorand, app_id, provider_addr, provider_signer)
+    log.info("Provider account: %s", provider_addr)
 
     _maybe_log_token_and_fee(app)
 
-    last_processed = 0
+    global _resolver
+    blob_store = blob_store_from_env()
+    if blob_store is None:
+        log.warning("BLOB_STORE is not set; queries posted with post_query_ref will be skipped.")
+    else:
+        _resolver = CachedResolver(blob_store)
 
-    log.info("AI provider node started. Watching app_id=%s | provider=%s", app_id, provider_addr)
-    while True:
-        try:
-            gs = app.state.global_state
-            next_qid = gs.next_query_id
-
-            # Handle any new query ids since last loop
-            for qid in range(last_processed + 1, next_qid):
-                # Read stored query (readonly ABI)
-                result = type("Res", (), {"abi_return": get_query_via_prompt(app, qid)})
-                query: Optional[Query] = result.abi_return  # dataclass-like or None
-
-                if query is None:
-                    log.info("Query %s not found; skipping.", qid)
-                    last_processed = qid
-                    continue
-
-                if query.is_answered:
-                    log.info("Query %s already answered by %s; skipping.", qid, query.provider)
-                    last_processed = qid
-                    continue
-
-                log.info("New query %s from %s: %s", qid, query.submitter, query.query_text)
-
-                # Build answer
-                prompt=query.query_text
-                ai_answer = _gemini_answer(prompt)
-                log.info("LLM Response:", ai_answer)
-
-                # Submit response. Ensure we cover inner-txn fees and resource budgeting.
-                method_params = CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000))
-                send_params = SendParams(
-                    cover_app_call_inner_transaction_fees=True,
-                    populate_app_call_resources=True,
-                )
-
-                log.info("Submitting response for query %s ...", qid)
-                submit_response_via_prompt(algorand, app, qid, ai_answer)
-                log.info("Submitted response for query %s. If your provider account has opted into the DAISY ASA, "
-                         "you should now receive the reward.", qid)
-                
-
-                last_processed = qid
+    server = metrics.serve(METRICS_PORT, METRICS_HOST) if METRICS_PORT else None
 
-        except Exception as e:
-            log.error("Error in provider loop: %s", e, exc_info=True)
-
-        time.sleep(POLL_SECONDS)
+    store = CheckpointStore(CHECKPOINT_DB, app_id)
+    log.info("Checkpoint store: %s", CHECKPOINT_DB)
+    try:
+        run_node(algorand, app, store, shard=ShardMap(app_id, providers_from_env(provider_addr), provider_addr))
+    finally:
+        store.close()
+        if server:
+            server.shutdown()
 
 
 if __name__ == "__main__":
     main()
-
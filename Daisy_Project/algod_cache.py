@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Shared algod access layer for prompt.py and the Refill/ scripts.
+
+`CachedAlgod` is a drop-in AlgodClient that:
+- sends requests over one pooled keep-alive HTTP client (httpx, already an algokit-utils
+  dependency) instead of opening a connection per call;
+- caches `suggested_params()` for PARAMS_TTL seconds; when a newer round shows up in any
+  response that passes through it (status, params, confirmations) the cached params move
+  their validity window to that round locally instead of being fetched again;
+- caches `account_info()` / `account_asset_info()` for ACCOUNT_TTL seconds and applies
+  payments, asset transfers and opt-ins sent through it to the cached views, so a command
+  that sends and then re-reads an account does not need another round trip.
+
+Anything the cache cannot model (app calls, asset config, ...) drops the sender's cached view.
+`shared_algod()` returns one instance per (address, token) for the whole process.
+"""
+import base64
+import copy
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib import parse
+
+import httpx
+import msgpack
+from algosdk import constants, encoding, error
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
+
+log = logging.getLogger("algod_cache")
+
+PARAMS_TTL = float(os.getenv("ALGOD_PARAMS_TTL", "3"))
+ACCOUNT_TTL = float(os.getenv("ALGOD_ACCOUNT_TTL", "5"))
+MAX_CONNECTIONS = int(os.getenv("ALGOD_MAX_CONNECTIONS", "16"))
+
+
+class CachedAlgod(AlgodClient):
+    """
+    AlgodClient with cached suggested params and account views (see module docstring).
+
+    Parameters
+    ----------
+    algod_token, algod_address, headers: as for AlgodClient
+    params_ttl: seconds a suggested-params response is reused (0 disables the cache)
+    account_ttl: seconds an account view is reused (0 disables the cache)
+    inner: send requests through this client instead of HTTP (e.g. a fake_algod view)
+    """
+
+    def __init__(self, algod_token: str = "", algod_address: str = "", headers: Optional[dict] = None,
+                 params_ttl: float = PARAMS_TTL, account_ttl: float = ACCOUNT_TTL,
+                 max_connections: int = MAX_CONNECTIONS, inner: Optional[AlgodClient] = None):
+        super().__init__(algod_token, algod_address, headers)
+        self.params_ttl = params_ttl
+        self.account_ttl = account_ttl
+        self.inner = inner
+        self._http = None if inner else httpx.Client(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+        self._lock = threading.Lock()
+        self._round = 0
+        self._params: Optional[Tuple[float, int, dict]] = None  # (fetched at, round, response)
+        self._accounts: Dict[str, Tuple[float, dict]] = {}
+        self.stats = {"requests": 0, "params_hits": 0, "account_hits": 0}
+
+    # --- transport ---
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json",
+                      timeout=30):
+        with self._lock:
+            self.stats["requests"] += 1
+        if self.inner is not None:
+            resp = self.inner.algod_request(method, requrl, params=params, data=data, headers=headers,
+                                            response_format=response_format, timeout=timeout)
+        else:
+            resp = self._http_request(method, requrl, params, data, headers, response_format, timeout)
+        if isinstance(resp, dict):
+            self._observe_round(resp.get("last-round") or resp.get("confirmed-round") or 0)
+        return resp
+
+    def _http_request(self, method, requrl, params, data, headers, response_format, timeout):
+        # Same request shape and error mapping as AlgodClient.algod_request, on a pooled client
+        header = {"User-Agent": "py-algorand-sdk"}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+        try:
+            resp = self._http.request(method, self.algod_address + requrl, headers=header, content=data,
+                                      timeout=timeout)
+        except httpx.HTTPError as e:
+            raise error.AlgodHTTPError(str(e)) from e
+        if resp.status_code >= 400:
+            try:
+                body = resp.json()
+                raise error.AlgodHTTPError(body.get("message", resp.text), resp.status_code, body.get("data"))
+            except ValueError:
+                raise error.AlgodHTTPError(resp.text, resp.status_code) from None
+        if response_format == "json":
+            if not resp.content:
+                return {}
+            try:
+                return resp.json()
+            except ValueError as e:
+                raise error.AlgodResponseError("Failed to parse JSON response from algod") from e
+        return resp.content
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+
+    def _observe_round(self, rnd) -> None:
+        with self._lock:
+            if rnd and int(rnd) > self._round:
+                self._round = int(rnd)
+
+    # --- suggested params ---
+    def suggested_params(self, **kwargs):
+        if kwargs or self.params_ttl <= 0:
+            return super().suggested_params(**kwargs)
+        with self._lock:
+            cached = self._params
+            response = None
+            if cached and time.monotonic() - cached[0] < self.params_ttl:
+                self.stats["params_hits"] += 1
+                response = cached[2]
+                if self._round > cached[1]:
+                    # Fees and genesis do not change with the round; only the validity window does
+                    response = dict(response, **{"last-round": self._round})
+        if response is None:
+            response = self.algod_request("GET", "/transactions/params")
+            with self._lock:
+                self._params = (time.monotonic(), int(response["last-round"]), response)
+        return _suggested_params(response)
+
+    # --- account views ---
+    def account_info(self, address: str, exclude: Optional[str] = None, **kwargs):
+        if exclude or kwargs or self.account_ttl <= 0:
+            return super().account_info(address, exclude, **kwargs)
+        with self._lock:
+            cached = self._accounts.get(address)
+            if cached and time.monotonic() - cached[0] < self.account_ttl:
+                self.stats["account_hits"] += 1
+                return copy.deepcopy(cached[1])
+        info = super().account_info(address)
+        with self._lock:
+            self._accounts[address] = (time.monotonic(), copy.deepcopy(info))
+        return info
+
+    def account_asset_info(self, address: str, asset_id: int, **kwargs):
+        if not kwargs and self.account_ttl > 0:
+            with self._lock:
+                cached = self._accounts.get(address)
+                if cached and time.monotonic() - cached[0] < self.account_ttl:
+                    holding = _holding(cached[1], int(asset_id))
+                    if holding is not None:
+                        self.stats["account_hits"] += 1
+                        return {"round": cached[1].get("round", self._round), "asset-holding": dict(holding)}
+        return super().account_asset_info(address, asset_id, **kwargs)
+
+    def invalidate(self, address: Optional[str] = None) -> None:
+        """Forget the cached view of `address` (every account and the params if None)."""
+        with self._lock:
+            if address is None:
+                self._accounts.clear()
+                self._params = None
+            else:
+                self._accounts.pop(address, None)
+
+    # --- sends ---
+    def send_raw_transaction(self, txn, **kwargs) -> str:
+        txid = super().send_raw_transaction(txn, **kwargs)
+        try:
+            for stxn in _unpack_all(base64.b64decode(txn)):
+                self._apply_local(stxn.get("txn", {}))
+        except Exception as e:  # the send went through; only the cached views are unsure now
+            log.debug("Could not apply sent transactions to cached accounts: %s", e)
+            self.invalidate()
+        return txid
+
+    def _apply_local(self, txn: dict) -> None:
+        sender = encoding.encode_address(txn["snd"])
+        kind = txn.get("type")
+        with self._lock:
+            if kind == "pay" and not txn.get("close"):
+                amount = txn.get("amt", 0)
+                self._adjust(sender, -(amount + txn.get("fee", 0)))
+                self._adjust(encoding.encode_address(txn["rcv"]), amount)
+            elif kind == "axfer" and "asnd" not in txn and "aclose" not in txn:
+                asset_id, amount = txn.get("xaid", 0), txn.get("aamt", 0)
+                receiver = encoding.encode_address(txn["arcv"]) if "arcv" in txn else sender
+                self._adjust(sender, -txn.get("fee", 0))
+                if receiver == sender and not amount:
+                    self._opt_in(sender, asset_id)
+                else:
+                    self._adjust(sender, 0, asset_id, -amount)
+                    self._adjust(receiver, 0, asset_id, amount)
+            else:
+                self._accounts.pop(sender, None)
+
+    def _adjust(self, address: str, micro_algos: int, asset_id: int = 0, amount: int = 0) -> None:
+        cached = self._accounts.get(address)
+        if cached is None:
+            return
+        info = cached[1]
+        info["amount"] = info.get("amount", 0) + micro_algos
+        if asset_id:
+            holding = _holding(info, asset_id)
+            if holding is None:
+                self._accounts.pop(address, None)  # not opted in as far as we know; re-read next time
+                return
+            holding["amount"] = holding.get("amount", 0) + amount
+
+    def _opt_in(self, address: str, asset_id: int) -> None:
+        cached = self._accounts.get(address)
+        if cached is not None and _holding(cached[1], asset_id) is None:
+            cached[1].setdefault("assets", []).append({"asset-id": asset_id, "amount": 0, "is-frozen": False})
+
+
+def _holding(info: dict, asset_id: int) -> Optional[dict]:
+    for h in info.get("assets", []):
+        if h.get("asset-id") == asset_id:
+            return h
+    return None
+
+
+def _unpack_all(raw: bytes):
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    unpacker.feed(raw)
+    return list(unpacker)
+
+
+def _suggested_params(res: dict):
+    # Fresh object per call: callers mutate fee/flat_fee on what they get back
+    from algosdk import transaction
+
+    return transaction.SuggestedParams(
+        res["fee"], res["last-round"], res["last-round"] + 1000, res["genesis-hash"], res["genesis-id"],
+        False, res["consensus-version"], res["min-fee"],
+    )
+
+
+_shared: Dict[Tuple[str, str], CachedAlgod] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_algod(address: Optional[str] = None, token: Optional[str] = None) -> CachedAlgod:
+    """
+    The process-wide CachedAlgod for `address` / `token` (default: ALGOD_ADDR / ALGOD_TOKEN, or
+    LocalNet). Every caller with the same endpoint shares its connections and caches.
+    """
+    address = address or os.getenv("ALGOD_ADDR", "http://localhost:4001")
+    token = token if token is not None else os.getenv("ALGOD_TOKEN", "a" * 64)
+    with _shared_lock:
+        client = _shared.get((address, token))
+        if client is None:
+            client = _shared[(address, token)] = CachedAlgod(token, address)
+        return client
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Answer cache in front of the LLM call in ai_node.py.
+
+Entries are keyed on the normalized query text plus the model name and prompt template,
+so changing either one never serves stale answers. There is an in-memory LRU tier with a
+TTL and an optional SQLite tier that survives restarts and can be shared by nodes on one
+machine. Concurrent misses for the same key are collapsed into a single LLM call.
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+_PUNCT = re.compile(r"[^\w\s]", re.UNICODE)
+_SPACE = re.compile(r"\s+")
+_FILLER = re.compile(r"^(?:(?:please|pls|hey|hi|hello|ok|okay|so)\s+)+")
+
+
+def normalize_query(text: str) -> str:
+    """
+    Fold trivially different phrasings of the same question onto one key.
+
+    Unicode-normalizes, case-folds, drops punctuation, collapses whitespace and strips
+    leading filler words ("please", "hey", ...). Word order and content words are kept.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _PUNCT.sub(" ", text)
+    text = _SPACE.sub(" ", text).strip()
+    return _FILLER.sub("", text)
+
+
+def cache_key(text: str, model: str, template: str) -> str:
+    h = hashlib.sha256()
+    for part in (model, template, normalize_query(text)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class AnswerCache:
+    """
+    LRU + TTL answer cache with an optional on-disk tier.
+
+    Parameters
+    ----------
+    model: model name the answers come from (part of the key)
+    template: prompt template the answers were generated with (part of the key)
+    max_entries: memory-tier capacity
+    ttl_seconds: entries older than this are treated as misses (0 disables expiry)
+    db_path: optional SQLite file for the disk tier
+    """
+
+    def __init__(self, model: str, template: str, max_entries: int = 1024, ttl_seconds: float = 86400,
+                 db_path: Optional[str] = None):
+        self.model = model
+        self.template = template
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, threading.Event] = {}
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expired": 0, "coalesced": 0}
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS answers (key TEXT PRIMARY KEY, answer TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def _fresh(self, created_at: float) -> bool:
+        return not self.ttl_seconds or time.time() - created_at < self.ttl_seconds
+
+    def _put_mem(self, key: str, answer: str, created_at: float) -> None:
+        self._mem[key] = (answer, created_at)
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def get(self, text: str) -> Optional[str]:
+        """Cached answer for `text`, or None. Counts a hit or a miss."""
+        key = cache_key(text, self.model, self.template)
+        with self._lock:
+            answer = self._lookup(key)
+            self.stats["misses" if answer is None else "hits"] += 1
+            return answer
+
+    def _lookup(self, key: str) -> Optional[str]:
+        entry = self._mem.get(key)
+        if entry is not None:
+            if self._fresh(entry[1]):
+                self._mem.move_to_end(key)
+                return entry[0]
+            del self._mem[key]
+            self.stats["expired"] += 1
+        if self._db is not None:
+            row = self._db.execute("SELECT answer, created_at FROM answers WHERE key = ?", (key,)).fetchone()
+            if row is not None and self._fresh(row[1]):
+                self.stats["disk_hits"] += 1
+                self._put_mem(key, row[0], row[1])
+                return row[0]
+        return None
+
+    def put(self, text: str, answer: str) -> None:
+        key = cache_key(text, self.model, self.template)
+        with self._lock:
+            self._store(key, answer)
+
+    def _store(self, key: str, answer: str) -> None:
+        now = time.time()
+        self._put_mem(key, answer, now)
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO answers (key, answer, created_at) VALUES (?, ?, ?)", (key, answer, now)
+            )
+
+    def get_or_compute(self, text: str, compute: Callable[[str], str], template: Optional[str] = None) -> str:
+        """
+        Return the cached answer for `text`, or call `compute(text)` once and cache the result.
+
+        If another thread is already computing the same key, wait for it instead of making
+        a second LLM call. `template` overrides the cache's template for this lookup.
+        """
+        key = cache_key(text, self.model, template or self.template)
+        while True:
+            with self._lock:
+                answer = self._lookup(key)
+                if answer is not None:
+                    self.stats["hits"] += 1
+                    return answer
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    self.stats["misses"] += 1
+                    done = self._inflight[key] = threading.Event()
+                    break
+                self.stats["coalesced"] += 1
+            waiter.wait()
+            # Loop: either the leader cached an answer or it failed and we become the leader
+        try:
+            answer = compute(text)
+            with self._lock:
+                self._store(key, answer)
+            return answer
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            done.set()
+
+    def hit_rate(self) -> float:
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return self.stats["hits"] / total if total else 0.0
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
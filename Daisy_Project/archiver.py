@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Archive settled query boxes locally, then delete them on chain with `reclaim_queries`.
+
+Every post creates a `queries` (Q) or `query_refs` (R) box that used to live forever, so the
+app's minimum balance and every full-map read grew with the number of queries ever posted.
+The contract now lets the governor delete the box of a settled (paid or refunded) query once it is
+RECLAIM_AFTER_QUERIES ids old; the freed minimum balance stays with the app account and pays
+for later boxes. This script:
+
+1. lists the app's boxes and reads those of queries past the retention window (concurrently);
+2. stores the settled ones in a SQLite archive (`ARCHIVE_DB`), raw box bytes zlib-compressed,
+   committed before anything is deleted;
+3. sends `reclaim_queries` groups (up to 16 calls, each within its box I/O budget) and marks
+   the archived rows with the round they were reclaimed in.
+
+Open queries are never touched. Archived records decode back into `client.Query` /
+`client_views.QueryRefView` with `QueryArchive.record(query_id)` (`python archiver.py --show ID`).
+"""
+import argparse
+import concurrent.futures
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from algosdk import mnemonic
+from algosdk.abi import ABIType
+from algosdk.error import AlgodHTTPError
+from dotenv import load_dotenv
+
+from client import DecentralizedAiContractClient, Query
+from client_views import (MAX_RECLAIM_QUERIES, QUERY_KEY_PREFIX, QUERY_REF_KEY_PREFIX, QUERY_SETTLED,
+                          RECLAIM_AFTER_QUERIES, QueryRefView)
+
+log = logging.getLogger("archiver")
+
+ARCHIVE_DB = os.getenv("ARCHIVE_DB", "query_archive.sqlite3")
+BOX_READ_CONCURRENCY = int(os.getenv("BOX_READ_CONCURRENCY", "16"))
+MAX_GROUP_SIZE = 16  # protocol limit on transactions per atomic group
+MAX_BOX_REFS = 8  # box references per app call
+BOX_IO_BYTES = 1024  # box I/O budget granted per box reference
+ZLIB_LEVEL = 9
+
+_QUERY = ABIType.from_string("(address,string,address,string,bool,uint64,uint64,uint64,uint8)")
+_QUERY_FLAGS_AT = 93  # Query head: address, offset, address, offset, bool, 3 x uint64, then flags
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archive (
+    app_id          INTEGER NOT NULL,
+    query_id        INTEGER NOT NULL,
+    kind            TEXT NOT NULL,
+    box             BLOB NOT NULL,
+    size            INTEGER NOT NULL,
+    archived_at     REAL NOT NULL,
+    reclaimed_round INTEGER,
+    PRIMARY KEY (app_id, query_id)
+);
+"""
+
+
+class QueryArchive:
+    """SQLite archive of settled query boxes (raw ARC-4 bytes, zlib-compressed), keyed by app and query id."""
+
+    def __init__(self, path: str, app_id: int):
+        self.path = path
+        self.app_id = app_id
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def put_many(self, boxes: Iterable[Tuple[int, bytes, bytes]]) -> int:
+        """Store `(query_id, box name prefix, raw box)` rows in one transaction; returns the row count."""
+        now = time.time()
+        rows = [(self.app_id, qid, kind.decode(), zlib.compress(raw, ZLIB_LEVEL), len(raw), now)
+                for qid, kind, raw in boxes]
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT INTO archive (app_id, query_id, kind, box, size, archived_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(app_id, query_id) DO UPDATE SET kind = excluded.kind, box = excluded.box, "
+                "size = excluded.size, archived_at = excluded.archived_at",
+                rows,
+            )
+        return len(rows)
+
+    def mark_reclaimed(self, query_ids: Iterable[int], confirmed_round: int) -> None:
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "UPDATE archive SET reclaimed_round = ? WHERE app_id = ? AND query_id = ?",
+                [(confirmed_round, self.app_id, qid) for qid in query_ids],
+            )
+
+    def get(self, query_id: int) -> Optional[Tuple[bytes, bytes]]:
+        """(box name prefix, raw box bytes) for an archived query, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT kind, box FROM archive WHERE app_id = ? AND query_id = ?", (self.app_id, query_id)
+            ).fetchone()
+        return (row[0].encode(), zlib.decompress(row[1])) if row else None
+
+    def record(self, query_id: int) -> Union[Query, QueryRefView, None]:
+        """The archived record, decoded the way the live box would be."""
+        found = self.get(query_id)
+        if found is None:
+            return None
+        kind, raw = found
+        if kind == QUERY_REF_KEY_PREFIX:
+            return QueryRefView(raw)
+        return Query(*_QUERY.decode(raw))
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, raw, stored, reclaimed = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(box)), 0), COUNT(reclaimed_round) "
+                "FROM archive WHERE app_id = ?",
+                (self.app_id,),
+            ).fetchone()
+        return {"archived": count, "box_bytes": raw, "stored_bytes": stored, "reclaimed": reclaimed}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _query_id(name: bytes) -> Optional[int]:
+    if len(name) == 9 and name[:1] in (QUERY_KEY_PREFIX, QUERY_REF_KEY_PREFIX):
+        return int.from_bytes(name[1:], "big")
+    return None
+
+
+def _settled(name: bytes, raw: bytes) -> bool:
+    flags = QueryRefView(raw).flags if name[:1] == QUERY_REF_KEY_PREFIX else raw[_QUERY_FLAGS_AT]
+    return bool(flags & QUERY_SETTLED)
+
+
+def _read_boxes(app: DecentralizedAiContractClient, names: List[bytes], max_workers: int) -> Dict[bytes, Optional[bytes]]:
+    def fetch(name: bytes) -> Optional[bytes]:
+        try:
+            return app.app_client.get_box_value(name)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+
+    if len(names) <= 1 or max_workers <= 1:
+        return {name: fetch(name) for name in names}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+        return dict(zip(names, executor.map(fetch, names)))
+
+
+def reclaimable_boxes(app: DecentralizedAiContractClient, max_workers: int = BOX_READ_CONCURRENCY) -> Dict[int, Tuple[bytes, bytes]]:
+    """{query_id: (box name, raw box)} for every settled (paid or refunded) query past the retention window."""
+    last = app.state.global_state.next_query_id - RECLAIM_AFTER_QUERIES
+    ids = {b.name_raw: _query_id(b.name_raw) for b in app.app_client.get_box_names()}
+    names = sorted(name for name, qid in ids.items() if qid is not None and qid <= last)
+    found = {}
+    for name, raw in _read_boxes(app, names, max_workers).items():
+        if raw is not None and _settled(name, raw):
+            found[ids[name]] = (name, raw)
+    return found
+
+
+def reclaim_calls(boxes: Dict[int, Tuple[bytes, bytes]]) -> List[List[int]]:
+    """Split query ids into reclaim_queries calls of at most MAX_RECLAIM_QUERIES ids and MAX_BOX_REFS references of I/O budget."""
+    calls: List[List[int]] = []
+    units = 0
+    for qid in sorted(boxes):
+        name, raw = boxes[qid]
+        need = max(1, -(-(len(name) + len(raw)) // BOX_IO_BYTES))
+        if not calls or len(calls[-1]) == MAX_RECLAIM_QUERIES or units + need > MAX_BOX_REFS:
+            calls.append([])
+            units = 0
+        calls[-1].append(qid)
+        units += need
+    return calls
+
+
+def archive_and_reclaim(app: DecentralizedAiContractClient, archive: QueryArchive, reclaim: bool = True,
+                        max_workers: int = BOX_READ_CONCURRENCY) -> dict:
+    """
+    One pass: archive every reclaimable box, then (unless `reclaim` is False) delete them.
+    `app` must send as the governor. Returns counts for logging.
+    """
+    from algokit_utils import SendParams
+
+    boxes = reclaimable_boxes(app, max_workers)
+    archive.put_many((qid, name[:1], raw) for qid, (name, raw) in boxes.items())
+    result = {"archived": len(boxes), "reclaimed": 0, "groups": 0}
+    if not reclaim or not boxes:
+        return result
+    calls = reclaim_calls(boxes)
+    for start in range(0, len(calls), MAX_GROUP_SIZE):
+        chunk = calls[start:start + MAX_GROUP_SIZE]
+        group = app.new_group()
+        for ids in chunk:
+            group.reclaim_queries(args=(ids,))
+        sent = group.send(SendParams(populate_app_call_resources=True))
+        result["reclaimed"] += sum(r.value for r in sent.returns)
+        result["groups"] += 1
+        archive.mark_reclaimed((qid for ids in chunk for qid in ids), sent.confirmations[-1]["confirmed-round"])
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Archive settled DAISY query boxes and reclaim them on chain.")
+    ap.add_argument("--archive", default=ARCHIVE_DB, help="SQLite archive file")
+    ap.add_argument("--every", type=float, default=0, help="repeat every N seconds (0 = one pass)")
+    ap.add_argument("--no-reclaim", action="store_true", help="archive only; leave the boxes on chain")
+    ap.add_argument("--show", type=int, metavar="ID", help="print an archived query and exit")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+
+    app_id = os.getenv("APP_ID")
+    if not app_id:
+        raise SystemExit("Set APP_ID.")
+    try:
+        app_id = int(app_id)
+    except ValueError as e:
+        raise SystemExit(f"Invalid APP_ID: {e}")
+    archive = QueryArchive(args.archive, app_id)
+    if args.show is not None:
+        print(archive.record(args.show))
+        return
+
+    words = os.getenv("DEPLOYER_MNEMONIC")
+    if not words:
+        raise SystemExit("Set DEPLOYER_MNEMONIC (the governor account; only it may reclaim boxes).")
+    try:
+        private_key = mnemonic.to_private_key(words)
+    except Exception as e:
+        raise SystemExit(f"Invalid DEPLOYER_MNEMONIC: {e}")
+
+    from algokit_utils import AlgorandClient
+    from algosdk.account import address_from_private_key
+    from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+    from algod_cache import shared_algod
+
+    governor = address_from_private_key(private_key)
+    algorand = AlgorandClient.from_clients(algod=shared_algod())
+    app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id, default_sender=governor,
+                                        default_signer=AccountTransactionSigner(private_key))
+    try:
+        while True:
+            result = archive_and_reclaim(app, archive, reclaim=not args.no_reclaim)
+            log.info("Archived %s settled query box(es), reclaimed %s in %s group(s); archive: %s",
+                     result["archived"], result["reclaimed"], result["groups"], archive.stats())
+            if args.every <= 0:
+                break
+            time.sleep(args.every)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        archive.close()
+
+
+if __name__ == "__main__":
+    main()
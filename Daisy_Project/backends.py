@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Answer backends for ai_node.py.
+
+Every backend exposes `generate(prompt) -> str` and `agenerate(prompt) -> str`, fails a call
+with BackendError once it takes longer than its timeout (each backend hands the timeout to its
+own HTTP client, so the request ends with the call) and caps how many calls run at once; a
+call keeps its concurrency slot until its request has ended. Shipped backends:
+
+- GeminiBackend: Google Gemini via `google-genai` (imported and authenticated on first use)
+- StubBackend:   deterministic local answers with optional latency and error injection,
+                 for offline load tests and profiling
+- LocalModelBackend: a locally served model over HTTP (Ollama-style `/api/generate`)
+
+Pick one with ANSWER_BACKEND=gemini|stub|local (see `backend_from_env`).
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.request
+from typing import Callable, Optional
+
+
+class BackendError(RuntimeError):
+    """The backend failed to produce an answer (timeout, API error, injected fault)."""
+
+
+class AnswerBackend:
+    """
+    Base class: subclasses implement `_generate(prompt)`.
+
+    Parameters
+    ----------
+    timeout: seconds a single call may take before it fails with BackendError
+    max_concurrency: calls allowed in flight at once (extra callers wait)
+
+    `_generate` must not outlive `timeout`: pass it to the HTTP client (or stop waiting) and
+    raise TimeoutError or BackendError when it runs out.
+    """
+
+    model_name = "base"
+
+    def __init__(self, timeout: float = 30.0, max_concurrency: int = 8):
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def check(self) -> None:
+        """Raise BackendError if the backend cannot be used (e.g. missing credentials)."""
+
+    def _generate(self, prompt: str) -> str:
+        raise NotImplementedError
+
+    def generate(self, prompt: str, before: Optional[Callable[[], None]] = None) -> str:
+        """
+        Answer `prompt`. `before` runs once a concurrency slot is held, right before the paid
+        call; anything it raises aborts the call and propagates unchanged.
+        """
+        with self._slots:
+            if before is not None:
+                before()
+            try:
+                return self._generate(prompt)
+            except BackendError:
+                raise
+            except TimeoutError as e:
+                raise BackendError(f"{self.model_name}: timed out after {self.timeout}s") from e
+            except Exception as e:
+                raise BackendError(f"{self.model_name}: {e}") from e
+
+    async def agenerate(self, prompt: str, before: Optional[Callable[[], None]] = None) -> str:
+        # Runs generate() on a worker thread; cancelling the await does not stop the request,
+        # which keeps its slot until the backend's own timeout ends it
+        return await asyncio.to_thread(self.generate, prompt, before)
+
+
+class GeminiBackend(AnswerBackend):
+    """Google Gemini. The SDK is imported and the client built on the first call."""
+
+    def __init__(self, model: str = "gemini-2.5-flash", api_key: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.model_name = model
+        self._api_key = api_key
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def check(self) -> None:
+        if not self._api_key:
+            raise BackendError("Set GEMINI_API_KEY in your environment or .env (or pick another ANSWER_BACKEND)")
+
+    def _get_client(self):
+        with self._client_lock:
+            if self._client is None:
+                self.check()
+                from google import genai
+                from google.genai import types
+
+                self._client = genai.Client(
+                    api_key=self._api_key,
+                    http_options=types.HttpOptions(timeout=int(self.timeout * 1000)),
+                )
+            return self._client
+
+    def _generate(self, prompt: str) -> str:
+        resp = self._get_client().models.generate_content(model=self.model_name, contents=prompt)
+        # Fallbacks in case API returns no text
+        return (resp.text or "").strip() or "No answer produced."
+
+
+class StubBackend(AnswerBackend):
+    """
+    Deterministic offline backend.
+
+    The answer and whether a call fails depend only on the prompt and `seed`, so runs are
+    reproducible. `latency_ms` (+/- `jitter_ms`) is slept per call; calls slower than
+    `timeout` fail the way a client timeout would: the sleep stops at the deadline.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 seed: int = 0, max_chars: int = 400, **kwargs):
+        super().__init__(**kwargs)
+        self.model_name = "stub"
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.seed = seed
+        self.max_chars = max_chars
+        self.calls = 0
+        self._count_lock = threading.Lock()
+
+    def _generate(self, prompt: str) -> str:
+        with self._count_lock:
+            self.calls += 1
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).hexdigest()
+        rng = random.Random(digest)
+        delay = max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+        if delay > self.timeout:
+            time.sleep(self.timeout)
+            raise BackendError(f"stub: timed out after {self.timeout}s")
+        time.sleep(delay)
+        if rng.random() < self.error_rate:
+            raise BackendError("stub: injected failure")
+        return f"[stub {digest[:12]}] {prompt.strip()[-200:]}"[: self.max_chars]
+
+
+class LocalModelBackend(AnswerBackend):
+    """A model served locally over HTTP, e.g. `ollama serve` (POST {url}/api/generate)."""
+
+    def __init__(self, model: str = "llama3.2", url: str = "http://localhost:11434", **kwargs):
+        super().__init__(**kwargs)
+        self.model_name = model
+        self.url = url.rstrip("/")
+
+    def _generate(self, prompt: str) -> str:
+        body = json.dumps({"model": self.model_name, "prompt": prompt, "stream": False}).encode("utf-8")
+        req = urllib.request.Request(
+            self.url + "/api/generate", data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            data = json.load(resp)
+        return (data.get("response") or "").strip() or "No answer produced."
+
+
+def make_backend(kind: str, **kwargs) -> AnswerBackend:
+    kinds = {"gemini": GeminiBackend, "stub": StubBackend, "local": LocalModelBackend}
+    if kind not in kinds:
+        raise ValueError(f"Unknown answer backend {kind!r}; expected one of {', '.join(kinds)}")
+    return kinds[kind](**kwargs)
+
+
+def backend_from_env() -> AnswerBackend:
+    """
+    Build the backend selected by ANSWER_BACKEND (default gemini).
+
+    Common: LLM_TIMEOUT (seconds, default 30), LLM_CONCURRENCY (default 8)
+    gemini: GEMINI_API_KEY, GEMINI_MODEL
+    stub:   STUB_LATENCY_MS, STUB_JITTER_MS, STUB_ERROR_RATE, STUB_SEED
+    local:  LOCAL_MODEL, LOCAL_MODEL_URL
+    """
+    kind = os.getenv("ANSWER_BACKEND", "gemini")
+    common = {
+        "timeout": float(os.getenv("LLM_TIMEOUT", "30")),
+        "max_concurrency": int(os.getenv("LLM_CONCURRENCY", "8")),
+    }
+    if kind == "gemini":
+        return GeminiBackend(
+            model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"), api_key=os.getenv("GEMINI_API_KEY"), **common
+        )
+    if kind == "stub":
+        return StubBackend(
+            latency_ms=float(os.getenv("STUB_LATENCY_MS", "0")),
+            jitter_ms=float(os.getenv("STUB_JITTER_MS", "0")),
+            error_rate=float(os.getenv("STUB_ERROR_RATE", "0")),
+            seed=int(os.getenv("STUB_SEED", "0")),
+            **common,
+        )
+    if kind == "local":
+        return LocalModelBackend(
+            model=os.getenv("LOCAL_MODEL", "llama3.2"),
+            url=os.getenv("LOCAL_MODEL_URL", "http://localhost:11434"),
+            **common,
+        )
+    return make_backend(kind)
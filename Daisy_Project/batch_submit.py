@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Grouped `submit_response` sends for ai_node.py.
+
+Answers that are ready at about the same time are packed into one atomic group of up to
+16 `submit_response` calls: fees are pooled across the group and the node waits for one
+confirmation instead of one per answer.
+
+Because a group is all-or-nothing, it is simulated first; the member the simulate response's
+`failed-at` points at (typically 'Already answered' because another provider won the race) is
+dropped and the rest is simulated again before sending.
+
+Workers hand answers to a ResponseBatcher and get a Future back, so they move on to the next
+query while one submitter thread fills, sends and confirms the groups.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+from algosdk.transaction import SignedTransaction
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from metrics import REGISTRY, span
+
+log = logging.getLogger("ai_provider.batch")
+
+RESPONSES_REJECTED = REGISTRY.counter(
+    "daisy_responses_rejected_total",
+    "Responses that failed: dropped from a group by simulation (simulate) or rejected on send (send).", ("stage",))
+FEES_SPENT = REGISTRY.counter(
+    "daisy_fees_spent_microalgos_total", "Transaction fees paid for submitted responses (microAlgo).")
+
+MAX_GROUP_SIZE = 16  # protocol limit on transactions per atomic group
+
+
+class ResponseRef(NamedTuple):
+    """A response kept in the blob store; sent as `submit_response_ref` (hash + length)."""
+    hash: bytes
+    length: int
+
+
+Response = Union[str, ResponseRef]
+
+
+class ResponseRejected(RuntimeError):
+    """A member of a response group failed simulation and was not sent."""
+
+
+def _compose(app, members: Sequence[Tuple[int, Response]], max_fee_micro: int, preflight: bool = False):
+    group = app.new_group()
+    # Simulation checks pooled fees too, so the preflight pays the ceiling; the real send
+    # pays only what the group needs (cover_app_call_inner_transaction_fees)
+    fee = AlgoAmount.from_micro_algo(max_fee_micro)
+    params = CommonAppCallParams(static_fee=fee) if preflight else CommonAppCallParams(max_fee=fee)
+    for qid, response in members:
+        if isinstance(response, ResponseRef):
+            group.submit_response_ref(args=(qid, response.hash, response.length), params=params)
+        else:
+            group.submit_response(args=(qid, response), params=params)
+    return group
+
+
+def _simulate_failure(app, members: Sequence[Tuple[int, Response]], max_fee_micro: int) -> Optional[Tuple[int, str]]:
+    """(index of the failing member or -1 if simulation names none, failure message), or None if the group passes."""
+    built = _compose(app, members, max_fee_micro, preflight=True).composer().build()
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=[SignedTransaction(t.txn, None) for t in built.transactions])],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+    )
+    group = app.algorand.client.algod.simulate_transactions(request)["txn-groups"][0]
+    if not group.get("failure-message"):
+        return None
+    # failed-at is a path: the top-level transaction first, then any inner transaction indexes
+    failed_at = group.get("failed-at") or [-1]
+    return failed_at[0], group["failure-message"]
+
+
+def send_response_group(
+    app, members: Sequence[Tuple[int, Response]], max_fee_micro: int = 5_000
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """
+    Send up to 16 `(query_id, response)` pairs as one atomic group. A response is either the
+    answer text (`submit_response`) or a ResponseRef (`submit_response_ref`).
+
+    Returns ({query_id: txid} for members sent, {query_id: reason} for members dropped
+    after failing simulation).
+    """
+    if len(members) > MAX_GROUP_SIZE:
+        raise ValueError(f"At most {MAX_GROUP_SIZE} responses fit in one group (got {len(members)})")
+    members = list(members)
+    rejected: Dict[int, str] = {}
+    with span("build"):
+        while members:
+            failure = _simulate_failure(app, members, max_fee_micro)
+            if failure is None:
+                break
+            idx, reason = failure
+            if not 0 <= idx < len(members):
+                raise RuntimeError(f"Response group failed simulation: {reason}")
+            qid, _ = members.pop(idx)
+            rejected[qid] = reason
+            RESPONSES_REJECTED.inc(stage="simulate")
+            log.info("Dropping query %s from response group: %s", qid, reason)
+    if not members:
+        return {}, rejected
+
+    # algokit submits and waits for confirmation in one call, so "send" covers both
+    with span("send"):
+        result = _compose(app, members, max_fee_micro).send(
+            SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=True)
+        )
+    FEES_SPENT.inc(sum(t.raw.fee for t in result.transactions))
+    return {qid: txid for (qid, _), txid in zip(members, result.tx_ids)}, rejected
+
+
+class ResponseBatcher:
+    """
+    Collects answers from worker threads and sends them in groups.
+
+    `submit(query_id, response)` queues the answer and returns a Future at once; it resolves to
+    the txid once the answer's group is confirmed, or fails with ResponseRejected when
+    simulation dropped it (or with the send error). A group is flushed when it is full or
+    `window_seconds` after its first answer arrived, whichever comes first. Callbacks added to
+    the Future run on the batcher's thread.
+    """
+
+    def __init__(
+        self,
+        send_group: Callable[[List[Tuple[int, Response]]], Tuple[Dict[int, str], Dict[int, str]]],
+        max_size: int = MAX_GROUP_SIZE,
+        window_seconds: float = 0.2,
+    ):
+        self._send_group = send_group
+        self.max_size = max(1, min(max_size, MAX_GROUP_SIZE))
+        self.window_seconds = window_seconds
+        self._queue: "queue.Queue[Tuple[int, Response, Future]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="response-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, query_id: int, response: Response) -> Future:
+        fut: Future = Future()
+        self._queue.put((query_id, response, fut))
+        return fut
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self.window_seconds
+            while len(batch) < self.max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[int, Response, Future]]) -> None:
+        try:
+            sent, rejected = self._send_group([(qid, response) for qid, response, _ in batch])
+        except Exception as e:
+            for _, _, fut in batch:
+                fut.set_exception(e)
+            return
+        log.info("Sent %s response(s) in one group, %s rejected", len(sent), len(rejected))
+        for qid, _, fut in batch:
+            if qid in sent:
+                fut.set_result(sent[qid])
+            else:
+                fut.set_exception(ResponseRejected(rejected.get(qid, "not sent")))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Content-addressed blob store for query/response text kept off-box.
+
+With `post_query_ref` / `submit_response_ref` the contract stores only the SHA-256 hash and
+length of each text; the bytes live here, addressed by that hash. Two stores share one
+interface (`put(data) -> hash`, `get(hash) -> data`):
+
+- FileBlobStore: a directory on disk (`<root>/<h[:2]>/<h>`)
+- HttpBlobStore: the same store served over HTTP by `python blob_store.py serve`
+
+Readers go through CachedResolver, which verifies every blob against its hash and keeps
+recently used texts in memory.
+
+A text is only useful once every answering node can read it, so there is no default store:
+BLOB_STORE must name a `serve` URL the nodes can reach or a directory they share. `serve`
+does not authenticate writes; it answers GET from anywhere it listens on, but only accepts
+PUT from loopback clients, so posters write through a server on their own machine. Keep any
+proxy in front of it to GET.
+
+Usage:
+  python blob_store.py serve [--root ./blobs] [--port 8090]
+"""
+import argparse
+import hashlib
+import ipaddress
+import os
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Union
+
+Digest = Union[bytes, str, list]
+
+
+class BlobNotFound(KeyError):
+    """No blob with the requested hash exists in the store."""
+
+
+class BlobCorrupt(ValueError):
+    """The stored bytes do not hash to the requested digest."""
+
+
+def blob_hash(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def _hex(digest: Digest) -> str:
+    """Accept a raw 32-byte digest, a hex string, or the list of ints ABI decoding yields."""
+    if isinstance(digest, str):
+        return digest.lower()
+    return bytes(digest).hex()
+
+
+class FileBlobStore:
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, hex_digest: str) -> str:
+        if len(hex_digest) != 64 or any(c not in "0123456789abcdef" for c in hex_digest):
+            raise ValueError(f"Not a SHA-256 hex digest: {hex_digest!r}")
+        return os.path.join(self.root, hex_digest[:2], hex_digest)
+
+    def put(self, data: bytes) -> bytes:
+        digest = blob_hash(data)
+        path = self._path(digest.hex())
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write-then-rename so readers never see a partial blob
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: Digest) -> bytes:
+        try:
+            with open(self._path(_hex(digest)), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise BlobNotFound(_hex(digest)) from None
+
+
+class HttpBlobStore:
+    """Client for a store served by `python blob_store.py serve`."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def put(self, data: bytes) -> bytes:
+        req = urllib.request.Request(self.url + "/blobs", data=data, method="PUT")
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return bytes.fromhex(resp.read().decode("ascii").strip())
+
+    def get(self, digest: Digest) -> bytes:
+        try:
+            with urllib.request.urlopen(f"{self.url}/blobs/{_hex(digest)}", timeout=self.timeout) as resp:
+                return resp.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise BlobNotFound(_hex(digest)) from None
+            raise
+
+
+class CachedResolver:
+    """
+    Hash-verified, LRU-cached reads of UTF-8 text from a blob store.
+
+    Parameters
+    ----------
+    store: FileBlobStore or HttpBlobStore
+    max_entries: number of texts kept in memory
+    """
+
+    def __init__(self, store, max_entries: int = 4096):
+        self.store = store
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def text(self, digest: Digest) -> str:
+        key = _hex(digest)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return self._cache[key]
+            self.stats["misses"] += 1
+        data = self.store.get(key)
+        if blob_hash(data).hex() != key:
+            raise BlobCorrupt(key)
+        text = data.decode("utf-8")
+        with self._lock:
+            self._cache[key] = text
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return text
+
+    def put_text(self, text: str) -> "tuple[bytes, int]":
+        """Store `text`; returns (sha256 digest, length in bytes) as the contract records them."""
+        data = text.encode("utf-8")
+        digest = self.store.put(data)
+        with self._lock:
+            self._cache[digest.hex()] = text
+        return digest, len(data)
+
+
+def blob_store_from_env() -> Optional[Union[FileBlobStore, HttpBlobStore]]:
+    """
+    The store BLOB_STORE names (a directory, or an http(s):// URL of `blob_store.py serve`);
+    None when it is unset. There is deliberately no default directory: text written to a
+    store only this machine can read would leave the query unanswerable.
+    """
+    target = os.getenv("BLOB_STORE")
+    if not target:
+        return None
+    if target.startswith(("http://", "https://")):
+        return HttpBlobStore(target)
+    return FileBlobStore(target)
+
+
+def _make_handler(store: FileBlobStore, max_bytes: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = self.path.strip("/").split("/")
+            if len(parts) != 2 or parts[0] != "blobs" or len(parts[1]) != 64:
+                return self.send_error(404)
+            try:
+                data = store.get(parts[1])
+            except (BlobNotFound, ValueError):
+                return self.send_error(404)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_PUT(self):
+            if self.path.rstrip("/") != "/blobs":
+                return self.send_error(404)
+            # Writes are unauthenticated: only take them from this machine
+            if not ipaddress.ip_address(self.client_address[0]).is_loopback:
+                return self.send_error(403)
+            length = int(self.headers.get("Content-Length", "0"))
+            if length > max_bytes:
+                return self.send_error(413)
+            digest = store.put(self.rfile.read(length)).hex().encode("ascii")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(digest)))
+            self.end_headers()
+            self.wfile.write(digest)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Serve a content-addressed blob directory over HTTP.")
+    ap.add_argument("command", choices=["serve"])
+    ap.add_argument("--root", default=os.getenv("BLOB_ROOT", "./blobs"))
+    ap.add_argument("--host", default="127.0.0.1",
+                    help="address to listen on; PUT is only accepted from loopback clients either way")
+    ap.add_argument("--port", type=int, default=8090)
+    ap.add_argument("--max-bytes", type=int, default=1 << 20)
+    args = ap.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(FileBlobStore(args.root), args.max_bytes))
+    print(f"Serving blobs from {args.root} on http://{args.host}:{args.port}/blobs")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
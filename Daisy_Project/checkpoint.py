@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Durable progress for ai_node.py (SQLite).
+
+Holds, per app id:
+- the highest committed query id (`last_processed`), so a restart resumes from there
+  instead of rescanning every query ever posted;
+- answers generated for queries that are not committed yet, so an answer produced just
+  before a crash is resubmitted rather than regenerated (and paid for again);
+- the txid of each submitted response.
+"""
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    app_id         INTEGER PRIMARY KEY,
+    last_processed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS inflight (
+    app_id     INTEGER NOT NULL,
+    query_id   INTEGER NOT NULL,
+    answer     TEXT,
+    txid       TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (app_id, query_id)
+);
+"""
+
+
+class CheckpointStore:
+    """Small SQLite-backed checkpoint store; safe to share between the node's worker threads."""
+
+    def __init__(self, path: str, app_id: int):
+        self.path = path
+        self.app_id = app_id
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    # --- committed progress ---
+    def last_processed(self) -> int:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT last_processed FROM progress WHERE app_id = ?", (self.app_id,)
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def commit(self, last_processed: int) -> None:
+        """Record `last_processed` and drop in-flight rows it covers, in one transaction."""
+        with self._lock, self._db:
+            self._db.execute("BEGIN")
+            self._db.execute(
+                "INSERT INTO progress (app_id, last_processed) VALUES (?, ?) "
+                "ON CONFLICT(app_id) DO UPDATE SET last_processed = MAX(last_processed, excluded.last_processed)",
+                (self.app_id, last_processed),
+            )
+            self._db.execute(
+                "DELETE FROM inflight WHERE app_id = ? AND query_id <= ?", (self.app_id, last_processed)
+            )
+
+    # --- in-flight answers ---
+    def save_answer(self, query_id: int, answer: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO inflight (app_id, query_id, answer, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(app_id, query_id) DO UPDATE SET answer = excluded.answer, updated_at = excluded.updated_at",
+                (self.app_id, query_id, answer, time.time()),
+            )
+
+    def get_answer(self, query_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT answer FROM inflight WHERE app_id = ? AND query_id = ?", (self.app_id, query_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def mark_submitted(self, query_id: int, txid: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE inflight SET txid = ?, updated_at = ? WHERE app_id = ? AND query_id = ?",
+                (txid, time.time(), self.app_id, query_id),
+            )
+
+    def submitted_txid(self, query_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT txid FROM inflight WHERE app_id = ? AND query_id = ?", (self.app_id, query_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def pending(self) -> dict:
+        """{query_id: (answer, txid)} for everything generated but not yet committed."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT query_id, answer, txid FROM inflight WHERE app_id = ? ORDER BY query_id", (self.app_id,)
+            ).fetchall()
+        return {qid: (answer, txid) for qid, answer, txid in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
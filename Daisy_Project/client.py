@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "asset", "name": "token_id"}, {"type": "uint64", "name": "fee"}], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "new_governor"}], "name": "set_governor", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "new_fee"}], "name": "set_fee", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "opt_in_to_token", "returns": {"type": "void"}, "desc": "Opts the contract into the DAISY ASA token.\nRequired before the contract can receive/transfer DAISY.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw_asset", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "query_text"}, {"type": "axfer", "name": "payment"}], "name": "post_query", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}, {"type": "string", "name": "response_text"}], "name": "submit_response", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}], "name": "get_query", "returns": {"type": "(address,string,address,string,bool)", "struct": "Query"}, "events": [], "readonly": true, "recommendations": {}}], "name": "DecentralizedAiContract", "state": {"keys": {"box": {}, "global": {"governor": {"key": "Z292ZXJub3I=", "keyType": "AVMString", "valueType": "address"}, "token": {"key": "dG9rZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}, "query_fee": {"key": "cXVlcnlfZmVl", "keyType": "AVMString", "valueType": "AVMUint64"}, "next_query_id": {"key": "bmV4dF9xdWVyeV9pZA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"queries": {"keyType": "uint64", "valueType": "Query", "prefix": "UQ=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Query": [{"name": "submitter", "type": "address"}, {"name": "query_text", "type": "string"}, {"name": "provider", "type": "address"}, {"name": "response_text", "type": "string"}, {"name": "is_answered", "type": "bool"}]}, "byteCode": {"approval": "CiAEAAEEoAQmBwhnb3Zlcm5vcgV0b2tlbglxdWVyeV9mZWUNbmV4dF9xdWVyeV9pZAEAAVEEFR98dTEYQAANKDIDZykiZyoiZysjZzEbQQA/gggEbrJgswQIqVb3BPxLiLcEPi8uOAQQULRQBM9b2cUEPDBgWwRBnX7FNhoAjggAhwB1AGUAWQBJACoAFwACIkMxGRREMRhENhoBF4gBricGTFCwI0MxGRREMRhENhoBFzYaAogBTSNDMRkURDEYRDYaATEWIwlJOBAkEkSIANIWJwZMULAjQzEZFEQxGEQ2GgEXiACYI0MxGRREMRhEiABuI0MxGRREMRhENhoBF4gATiNDMRkURDEYRDYaARfAHIgALCNDMRkURDEYFEQ2GgEXwDA2GgIXiAACI0OKAgAoMQBnKYv+ZyqL/2crI2eJigEAMQAiKGVEEkQoi/9niYoBADEAIihlRBJEKov/Z4kxACIoZUQSRLEiKWVEMgqyFCKyErIRJLIQIrIBs4mKAQAxACIoZURMSwESRLEiKWVETLIUi/+yErIRJLIQIrIBs4mKAgGL/zgRIillRBJEi/84FDIKEkSL/zgSIiplRBJEi/84ADEAEkQiK2VEMgMxAIACAEVQi/4VgUUITE8CUEwWVwYCUCcEUIv+UIACAABQSwEWJwVMUEm8SEy/SSMIK0xniYoCAIv+FicFTFBJvkRJJVMnBCJPAlQnBBJEMQBcIkmBQlkiTFiL/1AlI1RLAbxIv7EiKWVEIiplRDEAshSyErIRJLIQIrIBs4mKAQGL/xYnBUxQvkSJ", "clear": "CoEBQw=="}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBjb250cmFjdC5EZWNlbnRyYWxpemVkQWlDb250cmFjdC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgNCA1NDQKICAgIGJ5dGVjYmxvY2sgImdvdmVybm9yIiAidG9rZW4iICJxdWVyeV9mZWUiICJuZXh0X3F1ZXJ5X2lkIiAweDAwICJRIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBjb250cmFjdC5weToyNgogICAgLy8gc2VsZi5nb3Zlcm5vciA9IEFjY291bnQoKSAgICAgICAgICAgICAgIyBjb250cmFjdCBnb3Zlcm5vciAobWFuYWdlcyBjb25maWcgKyBvcHQtaW4pCiAgICBieXRlY18wIC8vICJnb3Zlcm5vciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5OjI3CiAgICAvLyBzZWxmLnRva2VuID0gQXNzZXQoMCkgICAgICAgICAgICAgICAgICAjIEFTQSB1c2VkIGZvciBwYXltZW50cyAoREFJU1kgdG9rZW4pCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MjgKICAgIC8vIHNlbGYucXVlcnlfZmVlID0gVUludDY0KDApICAgICAgICAgICAgICMgZmVlIHJlcXVpcmVkIHRvIHBvc3QgYSBxdWVyeQogICAgYnl0ZWNfMiAvLyAicXVlcnlfZmVlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weToyOQogICAgLy8gc2VsZi5uZXh0X3F1ZXJ5X2lkID0gVUludDY0KDEpICAgICAgICAgIyBpbmNyZW1lbnRhbCBxdWVyeSBjb3VudGVyCiAgICBieXRlY18zIC8vICJuZXh0X3F1ZXJ5X2lkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIGNvbnRyYWN0LnB5OjI0CiAgICAvLyBjbGFzcyBEZWNlbnRyYWxpemVkQWlDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYWZ0ZXJfaWZfZWxzZUAxMwogICAgcHVzaGJ5dGVzcyAweDZlYjI2MGIzIDB4MDhhOTU2ZjcgMHhmYzRiODhiNyAweDNlMmYyZTM4IDB4MTA1MGI0NTAgMHhjZjViZDljNSAweDNjMzA2MDViIDB4NDE5ZDdlYzUgLy8gbWV0aG9kICJjcmVhdGUoYXNzZXQsdWludDY0KXZvaWQiLCBtZXRob2QgInNldF9nb3Zlcm5vcihhY2NvdW50KXZvaWQiLCBtZXRob2QgInNldF9mZWUodWludDY0KXZvaWQiLCBtZXRob2QgIm9wdF9pbl90b190b2tlbigpdm9pZCIsIG1ldGhvZCAid2l0aGRyYXdfYXNzZXQodWludDY0KXZvaWQiLCBtZXRob2QgInBvc3RfcXVlcnkoc3RyaW5nLGF4ZmVyKXVpbnQ2NCIsIG1ldGhvZCAic3VibWl0X3Jlc3BvbnNlKHVpbnQ2NCxzdHJpbmcpdm9pZCIsIG1ldGhvZCAiZ2V0X3F1ZXJ5KHVpbnQ2NCkoYWRkcmVzcyxzdHJpbmcsYWRkcmVzcyxzdHJpbmcsYm9vbCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9yb3V0ZUA1IG1haW5fc2V0X2dvdmVybm9yX3JvdXRlQDYgbWFpbl9zZXRfZmVlX3JvdXRlQDcgbWFpbl9vcHRfaW5fdG9fdG9rZW5fcm91dGVAOCBtYWluX3dpdGhkcmF3X2Fzc2V0X3JvdXRlQDkgbWFpbl9wb3N0X3F1ZXJ5X3JvdXRlQDEwIG1haW5fc3VibWl0X3Jlc3BvbnNlX3JvdXRlQDExIG1haW5fZ2V0X3F1ZXJ5X3JvdXRlQDEyCgptYWluX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X3F1ZXJ5X3JvdXRlQDEyOgogICAgLy8gY29udHJhY3QucHk6MTIwLTEyMQogICAgLy8gIyBSZWFkLW9ubHkgbWV0aG9kOiByZXR1cm5zIGEgcXVlcnkgYnkgSUQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjEyMC0xMjEKICAgIC8vICMgUmVhZC1vbmx5IG1ldGhvZDogcmV0dXJucyBhIHF1ZXJ5IGJ5IElECiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3F1ZXJ5CiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3N1Ym1pdF9yZXNwb25zZV9yb3V0ZUAxMToKICAgIC8vIGNvbnRyYWN0LnB5OjEwMS0xMDIKICAgIC8vICMgUHJvdmlkZXIgc3VibWl0cyBhIHJlc3BvbnNlIGFuZCBnZXRzIHJld2FyZGVkIGluIERBSVNZCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MjQKICAgIC8vIGNsYXNzIERlY2VudHJhbGl6ZWRBaUNvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBjb250cmFjdC5weToxMDEtMTAyCiAgICAvLyAjIFByb3ZpZGVyIHN1Ym1pdHMgYSByZXNwb25zZSBhbmQgZ2V0cyByZXdhcmRlZCBpbiBEQUlTWQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHN1Ym1pdF9yZXNwb25zZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9wb3N0X3F1ZXJ5X3JvdXRlQDEwOgogICAgLy8gY29udHJhY3QucHk6NzctNzgKICAgIC8vICMgVXNlciBwb3N0cyBhIHF1ZXJ5IHdpdGggYSBEQUlTWSB0b2tlbiBwYXltZW50CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MjQKICAgIC8vIGNsYXNzIERlY2VudHJhbGl6ZWRBaUNvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMiAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBjb250cmFjdC5weTo3Ny03OAogICAgLy8gIyBVc2VyIHBvc3RzIGEgcXVlcnkgd2l0aCBhIERBSVNZIHRva2VuIHBheW1lbnQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwb3N0X3F1ZXJ5CiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X2Fzc2V0X3JvdXRlQDk6CiAgICAvLyBjb250cmFjdC5weTo2Ni02NwogICAgLy8gIyBHb3Zlcm5vciBjYW4gd2l0aGRyYXcgREFJU1kgdG9rZW5zIGZyb20gY29udHJhY3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjY2LTY3CiAgICAvLyAjIEdvdmVybm9yIGNhbiB3aXRoZHJhdyBEQUlTWSB0b2tlbnMgZnJvbSBjb250cmFjdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHdpdGhkcmF3X2Fzc2V0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX29wdF9pbl90b190b2tlbl9yb3V0ZUA4OgogICAgLy8gY29udHJhY3QucHk6NTItNTMKICAgIC8vICMgR292ZXJub3Igb3B0cyB0aGUgY29udHJhY3QgaW50byB0aGUgREFJU1kgdG9rZW4gQVNBCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBvcHRfaW5fdG9fdG9rZW4KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0X2ZlZV9yb3V0ZUA3OgogICAgLy8gY29udHJhY3QucHk6NDYtNDcKICAgIC8vICMgR292ZXJub3IgY2FuIGNoYW5nZSBmZWUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjQ2LTQ3CiAgICAvLyAjIEdvdmVybm9yIGNhbiBjaGFuZ2UgZmVlCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2ZlZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXRfZ292ZXJub3Jfcm91dGVANjoKICAgIC8vIGNvbnRyYWN0LnB5OjQwLTQxCiAgICAvLyAjIEdvdmVybm9yIGNhbiBjaGFuZ2UgZ292ZXJub3IKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBjb250cmFjdC5weTo0MC00MQogICAgLy8gIyBHb3Zlcm5vciBjYW4gY2hhbmdlIGdvdmVybm9yCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2dvdmVybm9yCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9yb3V0ZUA1OgogICAgLy8gY29udHJhY3QucHk6MzItMzMKICAgIC8vICMgSW5pdGlhbGl6ZSBjb250cmFjdCB3aXRoIERBSVNZIHRva2VuIEFTQSBJRCArIHBvc3RpbmcgZmVlCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gY29udHJhY3QucHk6MzItMzMKICAgIC8vICMgSW5pdGlhbGl6ZSBjb250cmFjdCB3aXRoIERBSVNZIHRva2VuIEFTQSBJRCArIHBvc3RpbmcgZmVlCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGNhbGxzdWIgY3JlYXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3QuY3JlYXRlKHRva2VuX2lkOiB1aW50NjQsIGZlZTogdWludDY0KSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBjb250cmFjdC5weTozMi0zNAogICAgLy8gIyBJbml0aWFsaXplIGNvbnRyYWN0IHdpdGggREFJU1kgdG9rZW4gQVNBIElEICsgcG9zdGluZyBmZWUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIGNyZWF0ZShzZWxmLCB0b2tlbl9pZDogQXNzZXQsIGZlZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBjb250cmFjdC5weTozNQogICAgLy8gc2VsZi5nb3Zlcm5vciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzAgLy8gImdvdmVybm9yIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5OjM2CiAgICAvLyBzZWxmLnRva2VuID0gdG9rZW5faWQKICAgIGJ5dGVjXzEgLy8gInRva2VuIgogICAgZnJhbWVfZGlnIC0yCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MzcKICAgIC8vIHNlbGYucXVlcnlfZmVlID0gZmVlCiAgICBieXRlY18yIC8vICJxdWVyeV9mZWUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTozOAogICAgLy8gc2VsZi5uZXh0X3F1ZXJ5X2lkID0gVUludDY0KDEpCiAgICBieXRlY18zIC8vICJuZXh0X3F1ZXJ5X2lkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5EZWNlbnRyYWxpemVkQWlDb250cmFjdC5zZXRfZ292ZXJub3IobmV3X2dvdmVybm9yOiBieXRlcykgLT4gdm9pZDoKc2V0X2dvdmVybm9yOgogICAgLy8gY29udHJhY3QucHk6NDAtNDIKICAgIC8vICMgR292ZXJub3IgY2FuIGNoYW5nZSBnb3Zlcm5vcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X2dvdmVybm9yKHNlbGYsIG5ld19nb3Zlcm5vcjogQWNjb3VudCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gY29udHJhY3QucHk6NDMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZ292ZXJub3IsICJPbmx5IGdvdmVybm9yIGNhbiBjaGFuZ2UgZ292ZXJub3IiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ292ZXJub3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJub3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgZ292ZXJub3IgY2FuIGNoYW5nZSBnb3Zlcm5vcgogICAgLy8gY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuZ292ZXJub3IgPSBuZXdfZ292ZXJub3IKICAgIGJ5dGVjXzAgLy8gImdvdmVybm9yIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3Quc2V0X2ZlZShuZXdfZmVlOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9mZWU6CiAgICAvLyBjb250cmFjdC5weTo0Ni00OAogICAgLy8gIyBHb3Zlcm5vciBjYW4gY2hhbmdlIGZlZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X2ZlZShzZWxmLCBuZXdfZmVlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjQ5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmdvdmVybm9yLCAiT25seSBnb3Zlcm5vciBjYW4gc2V0IGZlZSIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJnb3Zlcm5vciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb3Zlcm5vciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBnb3Zlcm5vciBjYW4gc2V0IGZlZQogICAgLy8gY29udHJhY3QucHk6NTAKICAgIC8vIHNlbGYucXVlcnlfZmVlID0gbmV3X2ZlZQogICAgYnl0ZWNfMiAvLyAicXVlcnlfZmVlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3Qub3B0X2luX3RvX3Rva2VuKCkgLT4gdm9pZDoKb3B0X2luX3RvX3Rva2VuOgogICAgLy8gY29udHJhY3QucHk6NTkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZ292ZXJub3IsICJPbmx5IGdvdmVybm9yIGNhbiBvcHQtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ292ZXJub3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJub3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgZ292ZXJub3IgY2FuIG9wdC1pbgogICAgLy8gY29udHJhY3QucHk6NjAtNjQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwgICAgICAgICAgICAgICAgICAgICAgICAgICMgb3B0LWluIHJlcXVpcmVzIDAgdHJhbnNmZXIKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6NjEKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgIC8vIGNvbnRyYWN0LnB5OjYzCiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gY29udHJhY3QucHk6NjIKICAgIC8vIGFzc2V0X2Ftb3VudD1VSW50NjQoMCksICAgICAgICAgICAgICAgICAgICAgICAgICAjIG9wdC1pbiByZXF1aXJlcyAwIHRyYW5zZmVyCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIGNvbnRyYWN0LnB5OjYwCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzIgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gY29udHJhY3QucHk6NjAtNjQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwgICAgICAgICAgICAgICAgICAgICAgICAgICMgb3B0LWluIHJlcXVpcmVzIDAgdHJhbnNmZXIKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LkRlY2VudHJhbGl6ZWRBaUNvbnRyYWN0LndpdGhkcmF3X2Fzc2V0KGFtb3VudDogdWludDY0KSAtPiB2b2lkOgp3aXRoZHJhd19hc3NldDoKICAgIC8vIGNvbnRyYWN0LnB5OjY2LTY4CiAgICAvLyAjIEdvdmVybm9yIGNhbiB3aXRoZHJhdyBEQUlTWSB0b2tlbnMgZnJvbSBjb250cmFjdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgd2l0aGRyYXdfYXNzZXQoc2VsZiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjY5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmdvdmVybm9yLCAiT25seSBnb3Zlcm5vciBjYW4gd2l0aGRyYXciCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ292ZXJub3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJub3IgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGdvdmVybm9yIGNhbiB3aXRoZHJhdwogICAgLy8gY29udHJhY3QucHk6NzAtNzUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLmdvdmVybm9yLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6NzEKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gY29udHJhY3QucHk6NzAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMiAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gY29udHJhY3QucHk6NzQKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weTo3MC03NQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYuZ292ZXJub3IsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3QucG9zdF9xdWVyeShxdWVyeV90ZXh0OiBieXRlcywgcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CnBvc3RfcXVlcnk6CiAgICAvLyBjb250cmFjdC5weTo3Ny03OQogICAgLy8gIyBVc2VyIHBvc3RzIGEgcXVlcnkgd2l0aCBhIERBSVNZIHRva2VuIHBheW1lbnQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBvc3RfcXVlcnkoc2VsZiwgcXVlcnlfdGV4dDogYXJjNC5TdHJpbmcsIHBheW1lbnQ6IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIGNvbnRyYWN0LnB5OjgwLTgxCiAgICAvLyAjIFZhbGlkYXRlIHBheW1lbnQKICAgIC8vIGFzc2VydCBwYXltZW50LnhmZXJfYXNzZXQgPT0gc2VsZi50b2tlbiwgIldyb25nIHRva2VuIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgdG9rZW4KICAgIC8vIGNvbnRyYWN0LnB5OjgyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiUGF5bWVudCBtdXN0IGdvIHRvIGNvbnRyYWN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgZ28gdG8gY29udHJhY3QKICAgIC8vIGNvbnRyYWN0LnB5OjgzCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hc3NldF9hbW91bnQgPT0gc2VsZi5xdWVyeV9mZWUsICJXcm9uZyBmZWUgYW1vdW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInF1ZXJ5X2ZlZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdWVyeV9mZWUgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIGZlZSBhbW91bnQKICAgIC8vIGNvbnRyYWN0LnB5Ojg0CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIlBheW1lbnQgbXVzdCBiZSBmcm9tIGNhbGxlciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSBmcm9tIGNhbGxlcgogICAgLy8gY29udHJhY3QucHk6ODYKICAgIC8vIHF1ZXJ5X2lkID0gc2VsZi5uZXh0X3F1ZXJ5X2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAibmV4dF9xdWVyeV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5uZXh0X3F1ZXJ5X2lkIGV4aXN0cwogICAgLy8gY29udHJhY3QucHk6OTEKICAgIC8vIHByb3ZpZGVyPWFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gY29udHJhY3QucHk6ODkKICAgIC8vIHN1Ym1pdHRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlci5ieXRlcyksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBjb250cmFjdC5weTo4OC05NAogICAgLy8gbmV3X3F1ZXJ5ID0gUXVlcnkoCiAgICAvLyAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyLmJ5dGVzKSwKICAgIC8vICAgICBxdWVyeV90ZXh0PXF1ZXJ5X3RleHQsCiAgICAvLyAgICAgcHJvdmlkZXI9YXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpLAogICAgLy8gICAgIHJlc3BvbnNlX3RleHQ9YXJjNC5TdHJpbmcoIiIpLAogICAgLy8gICAgIGlzX2Fuc3dlcmVkPWFyYzQuQm9vbChGYWxzZSksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDQ1CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBwdXNoaW50IDY5IC8vIDY5CiAgICArCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3QucHk6OTMKICAgIC8vIGlzX2Fuc3dlcmVkPWFyYzQuQm9vbChGYWxzZSksCiAgICBieXRlYyA0IC8vIDB4MDAKICAgIC8vIGNvbnRyYWN0LnB5Ojg4LTk0CiAgICAvLyBuZXdfcXVlcnkgPSBRdWVyeSgKICAgIC8vICAgICBzdWJtaXR0ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpLAogICAgLy8gICAgIHF1ZXJ5X3RleHQ9cXVlcnlfdGV4dCwKICAgIC8vICAgICBwcm92aWRlcj1hcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgcmVzcG9uc2VfdGV4dD1hcmM0LlN0cmluZygiIiksCiAgICAvLyAgICAgaXNfYW5zd2VyZWQ9YXJjNC5Cb29sKEZhbHNlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0LnB5OjkyCiAgICAvLyByZXNwb25zZV90ZXh0PWFyYzQuU3RyaW5nKCIiKSwKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIC8vIGNvbnRyYWN0LnB5Ojg4LTk0CiAgICAvLyBuZXdfcXVlcnkgPSBRdWVyeSgKICAgIC8vICAgICBzdWJtaXR0ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpLAogICAgLy8gICAgIHF1ZXJ5X3RleHQ9cXVlcnlfdGV4dCwKICAgIC8vICAgICBwcm92aWRlcj1hcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgcmVzcG9uc2VfdGV4dD1hcmM0LlN0cmluZygiIiksCiAgICAvLyAgICAgaXNfYW5zd2VyZWQ9YXJjNC5Cb29sKEZhbHNlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3QucHk6OTYKICAgIC8vIHNlbGYucXVlcmllc1txdWVyeV9pZF0gPSBuZXdfcXVlcnkuY29weSgpCiAgICBkaWcgMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiUSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLm5leHRfcXVlcnlfaWQgKz0gVUludDY0KDEpCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJuZXh0X3F1ZXJ5X2lkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5Ojk5CiAgICAvLyByZXR1cm4gcXVlcnlfaWQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LkRlY2VudHJhbGl6ZWRBaUNvbnRyYWN0LnN1Ym1pdF9yZXNwb25zZShxdWVyeV9pZDogdWludDY0LCByZXNwb25zZV90ZXh0OiBieXRlcykgLT4gdm9pZDoKc3VibWl0X3Jlc3BvbnNlOgogICAgLy8gY29udHJhY3QucHk6MTAxLTEwMwogICAgLy8gIyBQcm92aWRlciBzdWJtaXRzIGEgcmVzcG9uc2UgYW5kIGdldHMgcmV3YXJkZWQgaW4gREFJU1kKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHN1Ym1pdF9yZXNwb25zZShzZWxmLCBxdWVyeV9pZDogVUludDY0LCByZXNwb25zZV90ZXh0OiBhcmM0LlN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gY29udHJhY3QucHk6MTA0CiAgICAvLyBxdWVyeSA9IHNlbGYucXVlcmllc1txdWVyeV9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gIlEiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVlcmllcyBlbnRyeSBleGlzdHMKICAgIC8vIGNvbnRyYWN0LnB5OjEwNQogICAgLy8gYXNzZXJ0IHF1ZXJ5LmlzX2Fuc3dlcmVkID09IGFyYzQuQm9vbChGYWxzZSksICJBbHJlYWR5IGFuc3dlcmVkIgogICAgZHVwCiAgICBpbnRjXzMgLy8gNTQ0CiAgICBnZXRiaXQKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgID09CiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhbnN3ZXJlZAogICAgLy8gY29udHJhY3QucHk6MTA3CiAgICAvLyBxdWVyeS5wcm92aWRlciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyLmJ5dGVzKQogICAgdHhuIFNlbmRlcgogICAgcmVwbGFjZTIgMzQKICAgIC8vIGNvbnRyYWN0LnB5OjEwOAogICAgLy8gcXVlcnkucmVzcG9uc2VfdGV4dCA9IHJlc3BvbnNlX3RleHQKICAgIGR1cAogICAgcHVzaGludCA2NiAvLyA2NgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBleHRyYWN0MwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0LnB5OjEwOQogICAgLy8gcXVlcnkuaXNfYW5zd2VyZWQgPSBhcmM0LkJvb2woVHJ1ZSkKICAgIGludGNfMyAvLyA1NDQKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIC8vIGNvbnRyYWN0LnB5OjExMAogICAgLy8gc2VsZi5xdWVyaWVzW3F1ZXJ5X2lkXSA9IHF1ZXJ5LmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAogICAgLy8gY29udHJhY3QucHk6MTEyLTExOAogICAgLy8gIyBQYXkgcHJvdmlkZXIgaW4gREFJU1kKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYucXVlcnlfZmVlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBjb250cmFjdC5weToxMTQKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgIC8vIGNvbnRyYWN0LnB5OjExNQogICAgLy8gYXNzZXRfYW1vdW50PXNlbGYucXVlcnlfZmVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInF1ZXJ5X2ZlZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdWVyeV9mZWUgZXhpc3RzCiAgICAvLyBjb250cmFjdC5weToxMTYKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBjb250cmFjdC5weToxMTItMTEzCiAgICAvLyAjIFBheSBwcm92aWRlciBpbiBEQUlTWQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18yIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBjb250cmFjdC5weToxMTcKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weToxMTItMTE4CiAgICAvLyAjIFBheSBwcm92aWRlciBpbiBEQUlTWQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5xdWVyeV9mZWUsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5EZWNlbnRyYWxpemVkQWlDb250cmFjdC5nZXRfcXVlcnkocXVlcnlfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9xdWVyeToKICAgIC8vIGNvbnRyYWN0LnB5OjEyMC0xMjIKICAgIC8vICMgUmVhZC1vbmx5IG1ldGhvZDogcmV0dXJucyBhIHF1ZXJ5IGJ5IElECiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcXVlcnkoc2VsZiwgcXVlcnlfaWQ6IFVJbnQ2NCkgLT4gUXVlcnk6CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0LnB5OjEyMwogICAgLy8gcmV0dXJuIHNlbGYucXVlcmllc1txdWVyeV9pZF0KICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiUSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVlcmllcyBlbnRyeSBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [542], "errorMessage": "Already answered"}, {"pc": [149, 170, 189, 220, 236, 248, 264, 282], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [331], "errorMessage": "Only governor can change governor"}, {"pc": [360], "errorMessage": "Only governor can opt-in"}, {"pc": [347], "errorMessage": "Only governor can set fee"}, {"pc": [396], "errorMessage": "Only governor can withdraw"}, {"pc": [457], "errorMessage": "Payment must be from caller"}, {"pc": [439], "errorMessage": "Payment must go to contract"}, {"pc": [449], "errorMessage": "Wrong fee amount"}, {"pc": [431], "errorMessage": "Wrong token"}, {"pc": [286], "errorMessage": "can only call when creating"}, {"pc": [152, 173, 192, 223, 239, 251, 267], "errorMessage": "can only call when not creating"}, {"pc": [329, 345, 358, 391], "errorMessage": "check self.governor exists"}, {"pc": [461], "errorMessage": "check self.next_query_id exists"}, {"pc": [529, 601], "errorMessage": "check self.queries entry exists"}, {"pc": [447, 573], "errorMessage": "check self.query_fee exists"}, {"pc": [365, 401, 429, 569], "errorMessage": "check self.token exists"}, {"pc": [205], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "asset", "name": "token_id"}, {"type": "uint64", "name": "fee"}], "name": "create", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "new_governor"}], "name": "set_governor", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "new_fee"}], "name": "set_fee", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "opt_in_to_token", "returns": {"type": "void"}, "desc": "Opts the contract into the DAISY ASA token.\nRequired before the contract can receive/transfer DAISY.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw_asset", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "query_text"}, {"type": "axfer", "name": "payment"}], "name": "post_query", "returns": {"type": "uint64"}, "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "submitter"}, {"type": "uint64", "name": "fee"}, {"type": "uint64", "name": "text_len"}, {"type": "byte[32]", "name": "text_hash"}], "name": "QueryCreated", "desc": "A query was posted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}, {"type": "string", "name": "response_text"}], "name": "submit_response", "returns": {"type": "void"}, "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "provider"}, {"type": "uint64", "name": "payout"}, {"type": "uint64", "name": "response_len"}, {"type": "byte[32]", "name": "response_hash"}], "name": "ResponseSubmitted", "desc": "A query was answered; payout is its escrowed fee, released to the provider on acceptance or timeout"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}], "name": "get_query", "returns": {"type": "(address,string,address,string,bool,uint64,uint64,uint64,uint8)", "struct": "Query"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "byte[32]", "name": "query_hash"}, {"type": "uint64", "name": "query_len"}, {"type": "axfer", "name": "payment"}], "name": "post_query_ref", "returns": {"type": "uint64"}, "desc": "Like post_query, but only the SHA-256 hash and length of the query text are stored;\nthe text itself is published to the off-chain blob store under that hash.", "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "submitter"}, {"type": "uint64", "name": "fee"}, {"type": "uint64", "name": "text_len"}, {"type": "byte[32]", "name": "text_hash"}], "name": "QueryCreated", "desc": "A query was posted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}, {"type": "byte[32]", "name": "response_hash"}, {"type": "uint64", "name": "response_len"}], "name": "submit_response_ref", "returns": {"type": "void"}, "desc": "Answers a query created with post_query_ref by recording the hash and length of\nthe response published to the blob store; the fee stays in escrow as for submit_response.", "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "provider"}, {"type": "uint64", "name": "payout"}, {"type": "uint64", "name": "response_len"}, {"type": "byte[32]", "name": "response_hash"}], "name": "ResponseSubmitted", "desc": "A query was answered; payout is its escrowed fee, released to the provider on acceptance or timeout"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}], "name": "get_query_ref", "returns": {"type": "(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)", "struct": "QueryRef"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "query_text"}, {"type": "axfer", "name": "payment"}], "name": "post_query_for", "returns": {"type": "uint64"}, "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "submitter"}, {"type": "uint64", "name": "fee"}, {"type": "uint64", "name": "text_len"}, {"type": "byte[32]", "name": "text_hash"}], "name": "QueryCreated", "desc": "A query was posted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string[]", "name": "query_texts"}, {"type": "axfer", "name": "payment"}], "name": "post_queries", "returns": {"type": "uint64"}, "desc": "Posts several queries under one DAISY transfer of len(query_texts) * query_fee; returns the first of their contiguous ids.", "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "submitter"}, {"type": "uint64", "name": "fee"}, {"type": "uint64", "name": "text_len"}, {"type": "byte[32]", "name": "text_hash"}], "name": "QueryCreated", "desc": "A query was posted"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "query_ids"}], "name": "reclaim_queries", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "query_id"}], "name": "accept_response", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "query_ids"}], "name": "timeout_reclaim", "returns": {"type": "uint64"}, "events": [], "readonly": false, "recommendations": {}}], "name": "DecentralizedAiContract", "state": {"keys": {"box": {"pending": {"key": "UA==", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "next_query_id (uint64) + ring bitmap of open query ids"}, "expiry": {"key": "WA==", "keyType": "AVMString", "valueType": "AVMBytes", "desc": "ring of (round bucket, first query id posted in it)"}}, "global": {"governor": {"key": "Z292ZXJub3I=", "keyType": "AVMString", "valueType": "address"}, "token": {"key": "dG9rZW4=", "keyType": "AVMString", "valueType": "AVMUint64"}, "query_fee": {"key": "cXVlcnlfZmVl", "keyType": "AVMString", "valueType": "AVMUint64"}, "next_query_id": {"key": "bmV4dF9xdWVyeV9pZA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"queries": {"keyType": "uint64", "valueType": "Query", "prefix": "UQ=="}, "query_refs": {"keyType": "uint64", "valueType": "QueryRef", "prefix": "Ug=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"Query": [{"name": "submitter", "type": "address"}, {"name": "query_text", "type": "string"}, {"name": "provider", "type": "address"}, {"name": "response_text", "type": "string"}, {"name": "is_answered", "type": "bool"}, {"name": "fee_paid", "type": "uint64"}, {"name": "answer_deadline", "type": "uint64"}, {"name": "accept_deadline", "type": "uint64"}, {"name": "flags", "type": "uint8"}], "QueryRef": [{"name": "submitter", "type": "address"}, {"name": "provider", "type": "address"}, {"name": "fee_paid", "type": "uint64"}, {"name": "posted_at", "type": "uint64"}, {"name": "answered_at", "type": "uint64"}, {"name": "query_len", "type": "uint32"}, {"name": "response_len", "type": "uint32"}, {"name": "flags", "type": "uint8"}, {"name": "query_hash", "type": "byte[32]"}, {"name": "response_hash", "type": "byte[32]"}, {"name": "answer_deadline", "type": "uint64"}, {"name": "accept_deadline", "type": "uint64"}]}, "byteCode": {"approval": "CiAEAAEEoAQmBwhnb3Zlcm5vcgV0b2tlbglxdWVyeV9mZWUNbmV4dF9xdWVyeV9pZAEAAVEEFR98dTEYQAANKDIDZykiZyoiZysjZzEbQQA/gggEbrJgswQIqVb3BPxLiLcEPi8uOAQQULRQBM9b2cUEPDBgWwRBnX7FNhoAjggAhwB1AGUAWQBJACoAFwACIkMxGRREMRhENhoBF4gBricGTFCwI0MxGRREMRhENhoBFzYaAogBTSNDMRkURDEYRDYaATEWIwlJOBAkEkSIANIWJwZMULAjQzEZFEQxGEQ2GgEXiACYI0MxGRREMRhEiABuI0MxGRREMRhENhoBF4gATiNDMRkURDEYRDYaARfAHIgALCNDMRkURDEYFEQ2GgEXwDA2GgIXiAACI0OKAgAoMQBnKYv+ZyqL/2crI2eJigEAMQAiKGVEEkQoi/9niYoBADEAIihlRBJEKov/Z4kxACIoZUQSRLEiKWVEMgqyFCKyErIRJLIQIrIBs4mKAQAxACIoZURMSwESRLEiKWVETLIUi/+yErIRJLIQIrIBs4mKAgGL/zgRIillRBJEi/84FDIKEkSL/zgSIiplRBJEi/84ADEAEkQiK2VEMgMxAIACAEVQi/4VgUUITE8CUEwWVwYCUCcEUIv+UIACAABQSwEWJwVMUEm8SEy/SSMIK0xniYoCAIv+FicFTFBJvkRJJVMnBCJPAlQnBBJEMQBcIkmBQlkiTFiL/1AlI1RLAbxIv7EiKWVEIiplRDEAshSyErIRJLIQIrIBs4mKAQGL/xYnBUxQvkSJ", "clear": "CoEBQw=="}, "events": [{"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "submitter"}, {"type": "uint64", "name": "fee"}, {"type": "uint64", "name": "text_len"}, {"type": "byte[32]", "name": "text_hash"}], "name": "QueryCreated", "desc": "A query was posted"}, {"args": [{"type": "uint64", "name": "query_id"}, {"type": "address", "name": "provider"}, {"type": "uint64", "name": "payout"}, {"type": "uint64", "name": "response_len"}, {"type": "byte[32]", "name": "response_hash"}], "name": "ResponseSubmitted", "desc": "A query was answered; payout is its escrowed fee, released to the provider on acceptance or timeout"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBjb250cmFjdC5EZWNlbnRyYWxpemVkQWlDb250cmFjdC5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgNCA1NDQKICAgIGJ5dGVjYmxvY2sgImdvdmVybm9yIiAidG9rZW4iICJxdWVyeV9mZWUiICJuZXh0X3F1ZXJ5X2lkIiAweDAwICJRIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBjb250cmFjdC5weToyNgogICAgLy8gc2VsZi5nb3Zlcm5vciA9IEFjY291bnQoKSAgICAgICAgICAgICAgIyBjb250cmFjdCBnb3Zlcm5vciAobWFuYWdlcyBjb25maWcgKyBvcHQtaW4pCiAgICBieXRlY18wIC8vICJnb3Zlcm5vciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5OjI3CiAgICAvLyBzZWxmLnRva2VuID0gQXNzZXQoMCkgICAgICAgICAgICAgICAgICAjIEFTQSB1c2VkIGZvciBwYXltZW50cyAoREFJU1kgdG9rZW4pCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MjgKICAgIC8vIHNlbGYucXVlcnlfZmVlID0gVUludDY0KDApICAgICAgICAgICAgICMgZmVlIHJlcXVpcmVkIHRvIHBvc3QgYSBxdWVyeQogICAgYnl0ZWNfMiAvLyAicXVlcnlfZmVlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weToyOQogICAgLy8gc2VsZi5uZXh0X3F1ZXJ5X2lkID0gVUludDY0KDEpICAgICAgICAgIyBpbmNyZW1lbnRhbCBxdWVyeSBjb3VudGVyCiAgICBieXRlY18zIC8vICJuZXh0X3F1ZXJ5X2lkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIGNvbnRyYWN0LnB5OjI0CiAgICAvLyBjbGFzcyBEZWNlbnRyYWxpemVkQWlDb250cmFjdChBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYWZ0ZXJfaWZfZWxzZUAxMwogICAgcHVzaGJ5dGVzcyAweDZlYjI2MGIzIDB4MDhhOTU2ZjcgMHhmYzRiODhiNyAweDNlMmYyZTM4IDB4MTA1MGI0NTAgMHhjZjViZDljNSAweDNjMzA2MDViIDB4NDE5ZDdlYzUgLy8gbWV0aG9kICJjcmVhdGUoYXNzZXQsdWludDY0KXZvaWQiLCBtZXRob2QgInNldF9nb3Zlcm5vcihhY2NvdW50KXZvaWQiLCBtZXRob2QgInNldF9mZWUodWludDY0KXZvaWQiLCBtZXRob2QgIm9wdF9pbl90b190b2tlbigpdm9pZCIsIG1ldGhvZCAid2l0aGRyYXdfYXNzZXQodWludDY0KXZvaWQiLCBtZXRob2QgInBvc3RfcXVlcnkoc3RyaW5nLGF4ZmVyKXVpbnQ2NCIsIG1ldGhvZCAic3VibWl0X3Jlc3BvbnNlKHVpbnQ2NCxzdHJpbmcpdm9pZCIsIG1ldGhvZCAiZ2V0X3F1ZXJ5KHVpbnQ2NCkoYWRkcmVzcyxzdHJpbmcsYWRkcmVzcyxzdHJpbmcsYm9vbCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9yb3V0ZUA1IG1haW5fc2V0X2dvdmVybm9yX3JvdXRlQDYgbWFpbl9zZXRfZmVlX3JvdXRlQDcgbWFpbl9vcHRfaW5fdG9fdG9rZW5fcm91dGVAOCBtYWluX3dpdGhkcmF3X2Fzc2V0X3JvdXRlQDkgbWFpbl9wb3N0X3F1ZXJ5X3JvdXRlQDEwIG1haW5fc3VibWl0X3Jlc3BvbnNlX3JvdXRlQDExIG1haW5fZ2V0X3F1ZXJ5X3JvdXRlQDEyCgptYWluX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X3F1ZXJ5X3JvdXRlQDEyOgogICAgLy8gY29udHJhY3QucHk6MTIwLTEyMQogICAgLy8gIyBSZWFkLW9ubHkgbWV0aG9kOiByZXR1cm5zIGEgcXVlcnkgYnkgSUQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjEyMC0xMjEKICAgIC8vICMgUmVhZC1vbmx5IG1ldGhvZDogcmV0dXJucyBhIHF1ZXJ5IGJ5IElECiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3F1ZXJ5CiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3N1Ym1pdF9yZXNwb25zZV9yb3V0ZUAxMToKICAgIC8vIGNvbnRyYWN0LnB5OjEwMS0xMDIKICAgIC8vICMgUHJvdmlkZXIgc3VibWl0cyBhIHJlc3BvbnNlIGFuZCBnZXRzIHJld2FyZGVkIGluIERBSVNZCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MjQKICAgIC8vIGNsYXNzIERlY2VudHJhbGl6ZWRBaUNvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBjb250cmFjdC5weToxMDEtMTAyCiAgICAvLyAjIFByb3ZpZGVyIHN1Ym1pdHMgYSByZXNwb25zZSBhbmQgZ2V0cyByZXdhcmRlZCBpbiBEQUlTWQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHN1Ym1pdF9yZXNwb25zZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9wb3N0X3F1ZXJ5X3JvdXRlQDEwOgogICAgLy8gY29udHJhY3QucHk6NzctNzgKICAgIC8vICMgVXNlciBwb3N0cyBhIHF1ZXJ5IHdpdGggYSBEQUlTWSB0b2tlbiBwYXltZW50CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gY29udHJhY3QucHk6MjQKICAgIC8vIGNsYXNzIERlY2VudHJhbGl6ZWRBaUNvbnRyYWN0KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMiAvLyBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBjb250cmFjdC5weTo3Ny03OAogICAgLy8gIyBVc2VyIHBvc3RzIGEgcXVlcnkgd2l0aCBhIERBSVNZIHRva2VuIHBheW1lbnQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBwb3N0X3F1ZXJ5CiAgICBpdG9iCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X2Fzc2V0X3JvdXRlQDk6CiAgICAvLyBjb250cmFjdC5weTo2Ni02NwogICAgLy8gIyBHb3Zlcm5vciBjYW4gd2l0aGRyYXcgREFJU1kgdG9rZW5zIGZyb20gY29udHJhY3QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjY2LTY3CiAgICAvLyAjIEdvdmVybm9yIGNhbiB3aXRoZHJhdyBEQUlTWSB0b2tlbnMgZnJvbSBjb250cmFjdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHdpdGhkcmF3X2Fzc2V0CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX29wdF9pbl90b190b2tlbl9yb3V0ZUA4OgogICAgLy8gY29udHJhY3QucHk6NTItNTMKICAgIC8vICMgR292ZXJub3Igb3B0cyB0aGUgY29udHJhY3QgaW50byB0aGUgREFJU1kgdG9rZW4gQVNBCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBvcHRfaW5fdG9fdG9rZW4KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0X2ZlZV9yb3V0ZUA3OgogICAgLy8gY29udHJhY3QucHk6NDYtNDcKICAgIC8vICMgR292ZXJub3IgY2FuIGNoYW5nZSBmZWUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIGNvbnRyYWN0LnB5OjQ2LTQ3CiAgICAvLyAjIEdvdmVybm9yIGNhbiBjaGFuZ2UgZmVlCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2ZlZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXRfZ292ZXJub3Jfcm91dGVANjoKICAgIC8vIGNvbnRyYWN0LnB5OjQwLTQxCiAgICAvLyAjIEdvdmVybm9yIGNhbiBjaGFuZ2UgZ292ZXJub3IKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBjb250cmFjdC5weTo0MC00MQogICAgLy8gIyBHb3Zlcm5vciBjYW4gY2hhbmdlIGdvdmVybm9yCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgc2V0X2dvdmVybm9yCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9yb3V0ZUA1OgogICAgLy8gY29udHJhY3QucHk6MzItMzMKICAgIC8vICMgSW5pdGlhbGl6ZSBjb250cmFjdCB3aXRoIERBSVNZIHRva2VuIEFTQSBJRCArIHBvc3RpbmcgZmVlCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICAvLyBjb250cmFjdC5weToyNAogICAgLy8gY2xhc3MgRGVjZW50cmFsaXplZEFpQ29udHJhY3QoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gY29udHJhY3QucHk6MzItMzMKICAgIC8vICMgSW5pdGlhbGl6ZSBjb250cmFjdCB3aXRoIERBSVNZIHRva2VuIEFTQSBJRCArIHBvc3RpbmcgZmVlCiAgICAvLyBAYXJjNC5hYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGNhbGxzdWIgY3JlYXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3QuY3JlYXRlKHRva2VuX2lkOiB1aW50NjQsIGZlZTogdWludDY0KSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBjb250cmFjdC5weTozMi0zNAogICAgLy8gIyBJbml0aWFsaXplIGNvbnRyYWN0IHdpdGggREFJU1kgdG9rZW4gQVNBIElEICsgcG9zdGluZyBmZWUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgLy8gZGVmIGNyZWF0ZShzZWxmLCB0b2tlbl9pZDogQXNzZXQsIGZlZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBjb250cmFjdC5weTozNQogICAgLy8gc2VsZi5nb3Zlcm5vciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzAgLy8gImdvdmVybm9yIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5OjM2CiAgICAvLyBzZWxmLnRva2VuID0gdG9rZW5faWQKICAgIGJ5dGVjXzEgLy8gInRva2VuIgogICAgZnJhbWVfZGlnIC0yCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gY29udHJhY3QucHk6MzcKICAgIC8vIHNlbGYucXVlcnlfZmVlID0gZmVlCiAgICBieXRlY18yIC8vICJxdWVyeV9mZWUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBjb250cmFjdC5weTozOAogICAgLy8gc2VsZi5uZXh0X3F1ZXJ5X2lkID0gVUludDY0KDEpCiAgICBieXRlY18zIC8vICJuZXh0X3F1ZXJ5X2lkIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5EZWNlbnRyYWxpemVkQWlDb250cmFjdC5zZXRfZ292ZXJub3IobmV3X2dvdmVybm9yOiBieXRlcykgLT4gdm9pZDoKc2V0X2dvdmVybm9yOgogICAgLy8gY29udHJhY3QucHk6NDAtNDIKICAgIC8vICMgR292ZXJub3IgY2FuIGNoYW5nZSBnb3Zlcm5vcgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X2dvdmVybm9yKHNlbGYsIG5ld19nb3Zlcm5vcjogQWNjb3VudCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gY29udHJhY3QucHk6NDMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZ292ZXJub3IsICJPbmx5IGdvdmVybm9yIGNhbiBjaGFuZ2UgZ292ZXJub3IiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ292ZXJub3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJub3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgZ292ZXJub3IgY2FuIGNoYW5nZSBnb3Zlcm5vcgogICAgLy8gY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuZ292ZXJub3IgPSBuZXdfZ292ZXJub3IKICAgIGJ5dGVjXzAgLy8gImdvdmVybm9yIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3Quc2V0X2ZlZShuZXdfZmVlOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9mZWU6CiAgICAvLyBjb250cmFjdC5weTo0Ni00OAogICAgLy8gIyBHb3Zlcm5vciBjYW4gY2hhbmdlIGZlZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgc2V0X2ZlZShzZWxmLCBuZXdfZmVlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjQ5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmdvdmVybm9yLCAiT25seSBnb3Zlcm5vciBjYW4gc2V0IGZlZSIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJnb3Zlcm5vciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5nb3Zlcm5vciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBnb3Zlcm5vciBjYW4gc2V0IGZlZQogICAgLy8gY29udHJhY3QucHk6NTAKICAgIC8vIHNlbGYucXVlcnlfZmVlID0gbmV3X2ZlZQogICAgYnl0ZWNfMiAvLyAicXVlcnlfZmVlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3Qub3B0X2luX3RvX3Rva2VuKCkgLT4gdm9pZDoKb3B0X2luX3RvX3Rva2VuOgogICAgLy8gY29udHJhY3QucHk6NTkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuZ292ZXJub3IsICJPbmx5IGdvdmVybm9yIGNhbiBvcHQtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ292ZXJub3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJub3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgZ292ZXJub3IgY2FuIG9wdC1pbgogICAgLy8gY29udHJhY3QucHk6NjAtNjQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwgICAgICAgICAgICAgICAgICAgICAgICAgICMgb3B0LWluIHJlcXVpcmVzIDAgdHJhbnNmZXIKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6NjEKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgIC8vIGNvbnRyYWN0LnB5OjYzCiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gY29udHJhY3QucHk6NjIKICAgIC8vIGFzc2V0X2Ftb3VudD1VSW50NjQoMCksICAgICAgICAgICAgICAgICAgICAgICAgICAjIG9wdC1pbiByZXF1aXJlcyAwIHRyYW5zZmVyCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIGNvbnRyYWN0LnB5OjYwCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzIgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gY29udHJhY3QucHk6NjAtNjQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PVVJbnQ2NCgwKSwgICAgICAgICAgICAgICAgICAgICAgICAgICMgb3B0LWluIHJlcXVpcmVzIDAgdHJhbnNmZXIKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LkRlY2VudHJhbGl6ZWRBaUNvbnRyYWN0LndpdGhkcmF3X2Fzc2V0KGFtb3VudDogdWludDY0KSAtPiB2b2lkOgp3aXRoZHJhd19hc3NldDoKICAgIC8vIGNvbnRyYWN0LnB5OjY2LTY4CiAgICAvLyAjIEdvdmVybm9yIGNhbiB3aXRoZHJhdyBEQUlTWSB0b2tlbnMgZnJvbSBjb250cmFjdAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgd2l0aGRyYXdfYXNzZXQoc2VsZiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIGNvbnRyYWN0LnB5OjY5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmdvdmVybm9yLCAiT25seSBnb3Zlcm5vciBjYW4gd2l0aGRyYXciCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiZ292ZXJub3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZ292ZXJub3IgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IGdvdmVybm9yIGNhbiB3aXRoZHJhdwogICAgLy8gY29udHJhY3QucHk6NzAtNzUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLmdvdmVybm9yLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gY29udHJhY3QucHk6NzEKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gY29udHJhY3QucHk6NzAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMiAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gY29udHJhY3QucHk6NzQKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weTo3MC03NQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YW1vdW50LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYuZ292ZXJub3IsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gY29udHJhY3QuRGVjZW50cmFsaXplZEFpQ29udHJhY3QucG9zdF9xdWVyeShxdWVyeV90ZXh0OiBieXRlcywgcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CnBvc3RfcXVlcnk6CiAgICAvLyBjb250cmFjdC5weTo3Ny03OQogICAgLy8gIyBVc2VyIHBvc3RzIGEgcXVlcnkgd2l0aCBhIERBSVNZIHRva2VuIHBheW1lbnQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHBvc3RfcXVlcnkoc2VsZiwgcXVlcnlfdGV4dDogYXJjNC5TdHJpbmcsIHBheW1lbnQ6IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIGNvbnRyYWN0LnB5OjgwLTgxCiAgICAvLyAjIFZhbGlkYXRlIHBheW1lbnQKICAgIC8vIGFzc2VydCBwYXltZW50LnhmZXJfYXNzZXQgPT0gc2VsZi50b2tlbiwgIldyb25nIHRva2VuIgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgdG9rZW4KICAgIC8vIGNvbnRyYWN0LnB5OjgyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAiUGF5bWVudCBtdXN0IGdvIHRvIGNvbnRyYWN0IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgZ28gdG8gY29udHJhY3QKICAgIC8vIGNvbnRyYWN0LnB5OjgzCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hc3NldF9hbW91bnQgPT0gc2VsZi5xdWVyeV9mZWUsICJXcm9uZyBmZWUgYW1vdW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInF1ZXJ5X2ZlZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdWVyeV9mZWUgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIFdyb25nIGZlZSBhbW91bnQKICAgIC8vIGNvbnRyYWN0LnB5Ojg0CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIlBheW1lbnQgbXVzdCBiZSBmcm9tIGNhbGxlciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIFBheW1lbnQgbXVzdCBiZSBmcm9tIGNhbGxlcgogICAgLy8gY29udHJhY3QucHk6ODYKICAgIC8vIHF1ZXJ5X2lkID0gc2VsZi5uZXh0X3F1ZXJ5X2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAibmV4dF9xdWVyeV9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5uZXh0X3F1ZXJ5X2lkIGV4aXN0cwogICAgLy8gY29udHJhY3QucHk6OTEKICAgIC8vIHByb3ZpZGVyPWFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgLy8gY29udHJhY3QucHk6ODkKICAgIC8vIHN1Ym1pdHRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlci5ieXRlcyksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBjb250cmFjdC5weTo4OC05NAogICAgLy8gbmV3X3F1ZXJ5ID0gUXVlcnkoCiAgICAvLyAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyLmJ5dGVzKSwKICAgIC8vICAgICBxdWVyeV90ZXh0PXF1ZXJ5X3RleHQsCiAgICAvLyAgICAgcHJvdmlkZXI9YXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpLAogICAgLy8gICAgIHJlc3BvbnNlX3RleHQ9YXJjNC5TdHJpbmcoIiIpLAogICAgLy8gICAgIGlzX2Fuc3dlcmVkPWFyYzQuQm9vbChGYWxzZSksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwMDQ1CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBwdXNoaW50IDY5IC8vIDY5CiAgICArCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3QucHk6OTMKICAgIC8vIGlzX2Fuc3dlcmVkPWFyYzQuQm9vbChGYWxzZSksCiAgICBieXRlYyA0IC8vIDB4MDAKICAgIC8vIGNvbnRyYWN0LnB5Ojg4LTk0CiAgICAvLyBuZXdfcXVlcnkgPSBRdWVyeSgKICAgIC8vICAgICBzdWJtaXR0ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpLAogICAgLy8gICAgIHF1ZXJ5X3RleHQ9cXVlcnlfdGV4dCwKICAgIC8vICAgICBwcm92aWRlcj1hcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgcmVzcG9uc2VfdGV4dD1hcmM0LlN0cmluZygiIiksCiAgICAvLyAgICAgaXNfYW5zd2VyZWQ9YXJjNC5Cb29sKEZhbHNlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0LnB5OjkyCiAgICAvLyByZXNwb25zZV90ZXh0PWFyYzQuU3RyaW5nKCIiKSwKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIC8vIGNvbnRyYWN0LnB5Ojg4LTk0CiAgICAvLyBuZXdfcXVlcnkgPSBRdWVyeSgKICAgIC8vICAgICBzdWJtaXR0ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIuYnl0ZXMpLAogICAgLy8gICAgIHF1ZXJ5X3RleHQ9cXVlcnlfdGV4dCwKICAgIC8vICAgICBwcm92aWRlcj1hcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgcmVzcG9uc2VfdGV4dD1hcmM0LlN0cmluZygiIiksCiAgICAvLyAgICAgaXNfYW5zd2VyZWQ9YXJjNC5Cb29sKEZhbHNlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gY29udHJhY3QucHk6OTYKICAgIC8vIHNlbGYucXVlcmllc1txdWVyeV9pZF0gPSBuZXdfcXVlcnkuY29weSgpCiAgICBkaWcgMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiUSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5Ojk3CiAgICAvLyBzZWxmLm5leHRfcXVlcnlfaWQgKz0gVUludDY0KDEpCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlY18zIC8vICJuZXh0X3F1ZXJ5X2lkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIGNvbnRyYWN0LnB5Ojk5CiAgICAvLyByZXR1cm4gcXVlcnlfaWQKICAgIHJldHN1YgoKCi8vIGNvbnRyYWN0LkRlY2VudHJhbGl6ZWRBaUNvbnRyYWN0LnN1Ym1pdF9yZXNwb25zZShxdWVyeV9pZDogdWludDY0LCByZXNwb25zZV90ZXh0OiBieXRlcykgLT4gdm9pZDoKc3VibWl0X3Jlc3BvbnNlOgogICAgLy8gY29udHJhY3QucHk6MTAxLTEwMwogICAgLy8gIyBQcm92aWRlciBzdWJtaXRzIGEgcmVzcG9uc2UgYW5kIGdldHMgcmV3YXJkZWQgaW4gREFJU1kKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHN1Ym1pdF9yZXNwb25zZShzZWxmLCBxdWVyeV9pZDogVUludDY0LCByZXNwb25zZV90ZXh0OiBhcmM0LlN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gY29udHJhY3QucHk6MTA0CiAgICAvLyBxdWVyeSA9IHNlbGYucXVlcmllc1txdWVyeV9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDUgLy8gIlEiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVlcmllcyBlbnRyeSBleGlzdHMKICAgIC8vIGNvbnRyYWN0LnB5OjEwNQogICAgLy8gYXNzZXJ0IHF1ZXJ5LmlzX2Fuc3dlcmVkID09IGFyYzQuQm9vbChGYWxzZSksICJBbHJlYWR5IGFuc3dlcmVkIgogICAgZHVwCiAgICBpbnRjXzMgLy8gNTQ0CiAgICBnZXRiaXQKICAgIGJ5dGVjIDQgLy8gMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlYyA0IC8vIDB4MDAKICAgID09CiAgICBhc3NlcnQgLy8gQWxyZWFkeSBhbnN3ZXJlZAogICAgLy8gY29udHJhY3QucHk6MTA3CiAgICAvLyBxdWVyeS5wcm92aWRlciA9IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyLmJ5dGVzKQogICAgdHhuIFNlbmRlcgogICAgcmVwbGFjZTIgMzQKICAgIC8vIGNvbnRyYWN0LnB5OjEwOAogICAgLy8gcXVlcnkucmVzcG9uc2VfdGV4dCA9IHJlc3BvbnNlX3RleHQKICAgIGR1cAogICAgcHVzaGludCA2NiAvLyA2NgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBleHRyYWN0MwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIGNvbnRyYWN0LnB5OjEwOQogICAgLy8gcXVlcnkuaXNfYW5zd2VyZWQgPSBhcmM0LkJvb2woVHJ1ZSkKICAgIGludGNfMyAvLyA1NDQKICAgIGludGNfMSAvLyAxCiAgICBzZXRiaXQKICAgIC8vIGNvbnRyYWN0LnB5OjExMAogICAgLy8gc2VsZi5xdWVyaWVzW3F1ZXJ5X2lkXSA9IHF1ZXJ5LmNvcHkoKQogICAgZGlnIDEKICAgIGJveF9kZWwKICAgIHBvcAogICAgYm94X3B1dAogICAgLy8gY29udHJhY3QucHk6MTEyLTExOAogICAgLy8gIyBQYXkgcHJvdmlkZXIgaW4gREFJU1kKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYudG9rZW4sCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYucXVlcnlfZmVlLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBjb250cmFjdC5weToxMTQKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJ0b2tlbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b2tlbiBleGlzdHMKICAgIC8vIGNvbnRyYWN0LnB5OjExNQogICAgLy8gYXNzZXRfYW1vdW50PXNlbGYucXVlcnlfZmVlLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInF1ZXJ5X2ZlZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5xdWVyeV9mZWUgZXhpc3RzCiAgICAvLyBjb250cmFjdC5weToxMTYKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBjb250cmFjdC5weToxMTItMTEzCiAgICAvLyAjIFBheSBwcm92aWRlciBpbiBEQUlTWQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18yIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBjb250cmFjdC5weToxMTcKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBjb250cmFjdC5weToxMTItMTE4CiAgICAvLyAjIFBheSBwcm92aWRlciBpbiBEQUlTWQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi50b2tlbiwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5xdWVyeV9mZWUsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBjb250cmFjdC5EZWNlbnRyYWxpemVkQWlDb250cmFjdC5nZXRfcXVlcnkocXVlcnlfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9xdWVyeToKICAgIC8vIGNvbnRyYWN0LnB5OjEyMC0xMjIKICAgIC8vICMgUmVhZC1vbmx5IG1ldGhvZDogcmV0dXJucyBhIHF1ZXJ5IGJ5IElECiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfcXVlcnkoc2VsZiwgcXVlcnlfaWQ6IFVJbnQ2NCkgLT4gUXVlcnk6CiAgICBwcm90byAxIDEKICAgIC8vIGNvbnRyYWN0LnB5OjEyMwogICAgLy8gcmV0dXJuIHNlbGYucXVlcmllc1txdWVyeV9pZF0KICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgNSAvLyAiUSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucXVlcmllcyBlbnRyeSBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [542], "errorMessage": "Already answered"}, {"pc": [149, 170, 189, 220, 236, 248, 264, 282], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [331], "errorMessage": "Only governor can change governor"}, {"pc": [360], "errorMessage": "Only governor can opt-in"}, {"pc": [347], "errorMessage": "Only governor can set fee"}, {"pc": [396], "errorMessage": "Only governor can withdraw"}, {"pc": [457], "errorMessage": "Payment must be from caller"}, {"pc": [439], "errorMessage": "Payment must go to contract"}, {"pc": [449], "errorMessage": "Wrong fee amount"}, {"pc": [431], "errorMessage": "Wrong token"}, {"pc": [286], "errorMessage": "can only call when creating"}, {"pc": [152, 173, 192, 223, 239, 251, 267], "errorMessage": "can only call when not creating"}, {"pc": [329, 345, 358, 391], "errorMessage": "check self.governor exists"}, {"pc": [461], "errorMessage": "check self.next_query_id exists"}, {"pc": [529, 601], "errorMessage": "check self.queries entry exists"}, {"pc": [447, 573], "errorMessage": "check self.query_fee exists"}, {"pc": [365, 401, 429, 569], "errorMessage": "check self.token exists"}, {"pc": [205], "errorMessage": "transaction type is axfer"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -72,6 +72,26 @@ class Query:
     provider: str
     response_text: str
     is_answered: bool
+    fee_paid: int
+    answer_deadline: int
+    accept_deadline: int
+    flags: int
+
+@dataclasses.dataclass(frozen=True)
+class QueryRef:
+    """Struct for QueryRef"""
+    submitter: str
+    provider: str
+    fee_paid: int
+    posted_at: int
+    answered_at: int
+    query_len: int
+    response_len: int
+    flags: int
+    query_hash: bytes
+    response_hash: bytes
+    answer_deadline: int
+    accept_deadline: int
 
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
@@ -128,7 +148,85 @@ class GetQueryArgs:
 
     @property
     def abi_method_signature(self) -> str:
-        return "get_query(uint64)(address,string,address,string,bool)"
+        return "get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PostQueryRefArgs:
+    """Dataclass for post_query_ref arguments"""
+    query_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    query_len: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "post_query_ref(byte[32],uint64,axfer)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SubmitResponseRefArgs:
+    """Dataclass for submit_response_ref arguments"""
+    query_id: int
+    response_hash: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    response_len: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "submit_response_ref(uint64,byte[32],uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetQueryRefArgs:
+    """Dataclass for get_query_ref arguments"""
+    query_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PostQueryForArgs:
+    """Dataclass for post_query_for arguments"""
+    query_text: str
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "post_query_for(string,axfer)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PostQueriesArgs:
+    """Dataclass for post_queries arguments"""
+    query_texts: list[str]
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "post_queries(string[],axfer)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReclaimQueriesArgs:
+    """Dataclass for reclaim_queries arguments"""
+    query_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "reclaim_queries(uint64[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AcceptResponseArgs:
+    """Dataclass for accept_response arguments"""
+    query_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "accept_response(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TimeoutReclaimArgs:
+    """Dataclass for timeout_reclaim arguments"""
+    query_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "timeout_reclaim(uint64[])uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateArgs:
@@ -230,7 +328,111 @@ class DecentralizedAiContractParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_query(uint64)(address,string,address,string,bool)",
+            "method": "get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)",
+            "args": method_args,
+        }))
+
+    def post_query_ref(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | PostQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_query_ref(byte[32],uint64,axfer)uint64",
+            "args": method_args,
+        }))
+
+    def submit_response_ref(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | SubmitResponseRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit_response_ref(uint64,byte[32],uint64)void",
+            "args": method_args,
+        }))
+
+    def get_query_ref(
+        self,
+        args: tuple[int] | GetQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def post_query_for(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | PostQueryForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_query_for(string,axfer)uint64",
+            "args": method_args,
+        }))
+
+    def post_queries(
+        self,
+        args: tuple[list[str], algokit_utils.AppMethodCallTransactionArgument] | PostQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_queries(string[],axfer)uint64",
+            "args": method_args,
+        }))
+
+    def reclaim_queries(
+        self,
+        args: tuple[list[int]] | ReclaimQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reclaim_queries(uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def accept_response(
+        self,
+        args: tuple[int] | AcceptResponseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "accept_response(uint64)void",
+            "args": method_args,
+        }))
+
+    def timeout_reclaim(
+        self,
+        args: tuple[list[int]] | TimeoutReclaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "timeout_reclaim(uint64[])uint64",
             "args": method_args,
         }))
 
@@ -347,7 +549,111 @@ class DecentralizedAiContractCreateTransactionParams:
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_query(uint64)(address,string,address,string,bool)",
+            "method": "get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)",
+            "args": method_args,
+        }))
+
+    def post_query_ref(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | PostQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_query_ref(byte[32],uint64,axfer)uint64",
+            "args": method_args,
+        }))
+
+    def submit_response_ref(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | SubmitResponseRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit_response_ref(uint64,byte[32],uint64)void",
+            "args": method_args,
+        }))
+
+    def get_query_ref(
+        self,
+        args: tuple[int] | GetQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def post_query_for(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | PostQueryForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_query_for(string,axfer)uint64",
+            "args": method_args,
+        }))
+
+    def post_queries(
+        self,
+        args: tuple[list[str], algokit_utils.AppMethodCallTransactionArgument] | PostQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_queries(string[],axfer)uint64",
+            "args": method_args,
+        }))
+
+    def reclaim_queries(
+        self,
+        args: tuple[list[int]] | ReclaimQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reclaim_queries(uint64[])uint64",
+            "args": method_args,
+        }))
+
+    def accept_response(
+        self,
+        args: tuple[int] | AcceptResponseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "accept_response(uint64)void",
+            "args": method_args,
+        }))
+
+    def timeout_reclaim(
+        self,
+        args: tuple[list[int]] | TimeoutReclaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "timeout_reclaim(uint64[])uint64",
             "args": method_args,
         }))
 
@@ -483,12 +789,140 @@ class DecentralizedAiContractSend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_query(uint64)(address,string,address,string,bool)",
+            "method": "get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(Query, typing.cast(dict, response.abi_return))) # type: ignore
         return typing.cast(algokit_utils.SendAppTransactionResult[Query], parsed_response)
 
+    def post_query_ref(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | PostQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_query_ref(byte[32],uint64,axfer)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def submit_response_ref(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | SubmitResponseRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit_response_ref(uint64,byte[32],uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_query_ref(
+        self,
+        args: tuple[int] | GetQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[QueryRef]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(QueryRef, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[QueryRef], parsed_response)
+
+    def post_query_for(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | PostQueryForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_query_for(string,axfer)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def post_queries(
+        self,
+        args: tuple[list[str], algokit_utils.AppMethodCallTransactionArgument] | PostQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "post_queries(string[],axfer)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def reclaim_queries(
+        self,
+        args: tuple[list[int]] | ReclaimQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reclaim_queries(uint64[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def accept_response(
+        self,
+        args: tuple[int] | AcceptResponseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "accept_response(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def timeout_reclaim(
+        self,
+        args: tuple[list[int]] | TimeoutReclaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "timeout_reclaim(uint64[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def create(
         self,
         args: tuple[int, int] | CreateArgs,
@@ -523,6 +957,11 @@ class GlobalStateValue(typing.TypedDict):
     query_fee: int
     next_query_id: int
 
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    pending: bytes
+    expiry: bytes
+
 class DecentralizedAiContractState:
     """Methods to access state for the current DecentralizedAiContract app"""
 
@@ -604,14 +1043,15 @@ class _BoxState:
         
         # Pre-generated mapping of value types to their struct classes
         self._struct_classes: dict[str, typing.Type[typing.Any]] = {
-            "Query": Query
+            "Query": Query,
+            "QueryRef": QueryRef
         }
 
-    def get_all(self) -> dict[str, typing.Any]:
+    def get_all(self) -> BoxStateValue:
         """Get all current keyed values from box state"""
         result = self.app_client.state.box.get_all()
         if not result:
-            return {}
+            return typing.cast(BoxStateValue, {})
 
         converted = {}
         for key, value in result.items():
@@ -621,7 +1061,23 @@ class _BoxState:
                 _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
                 else value
             )
-        return converted
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def pending(self) -> bytes:
+        """Get the current value of the pending key in box state"""
+        value = self.app_client.state.box.get_value("pending")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
+
+    @property
+    def expiry(self) -> bytes:
+        """Get the current value of the expiry key in box state"""
+        value = self.app_client.state.box.get_value("expiry")
+        if isinstance(value, dict) and "AVMBytes" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMBytes"], value)  # type: ignore
+        return typing.cast(bytes, value)
 
     @property
     def queries(self) -> "_MapState[int, Query]":
@@ -632,6 +1088,15 @@ class _BoxState:
             self._struct_classes.get("Query")
         )
 
+    @property
+    def query_refs(self) -> "_MapState[int, QueryRef]":
+        """Get values from the query_refs map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "query_refs",
+            self._struct_classes.get("QueryRef")
+        )
+
 _KeyType = typing.TypeVar("_KeyType")
 _ValueType = typing.TypeVar("_ValueType")
 
@@ -813,45 +1278,93 @@ class DecentralizedAiContractClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["set_governor(account)void"],
+        method: typing.Literal["set_governor(account)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_fee(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["opt_in_to_token()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw_asset(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["post_query(string,axfer)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["submit_response(uint64,string)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> Query | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["post_query_ref(byte[32],uint64,axfer)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["submit_response_ref(uint64,byte[32],uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["set_fee(uint64)void"],
+        method: typing.Literal["get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
+    ) -> QueryRef | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["opt_in_to_token()void"],
+        method: typing.Literal["post_query_for(string,axfer)uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["withdraw_asset(uint64)void"],
+        method: typing.Literal["post_queries(string[],axfer)uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["post_query(string,axfer)uint64"],
+        method: typing.Literal["reclaim_queries(uint64[])uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["submit_response(uint64,string)void"],
+        method: typing.Literal["accept_response(uint64)void"],
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_query(uint64)(address,string,address,string,bool)"],
+        method: typing.Literal["timeout_reclaim(uint64[])uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> Query | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -869,7 +1382,7 @@ class DecentralizedAiContractClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | Query | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | Query | QueryRef | int:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -1179,13 +1692,173 @@ class DecentralizedAiContractFactoryCreateParams:
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_query(uint64)(address,string,address,string,bool) ABI method"""
+        """Creates a new instance using the get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def post_query_ref(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | PostQueryRefArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the post_query_ref(byte[32],uint64,axfer)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "post_query_ref(byte[32],uint64,axfer)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def submit_response_ref(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | SubmitResponseRefArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the submit_response_ref(uint64,byte[32],uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "submit_response_ref(uint64,byte[32],uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_query_ref(
+        self,
+        args: tuple[int] | GetQueryRefArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def post_query_for(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | PostQueryForArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the post_query_for(string,axfer)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "post_query_for(string,axfer)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def post_queries(
+        self,
+        args: tuple[list[str], algokit_utils.AppMethodCallTransactionArgument] | PostQueriesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the post_queries(string[],axfer)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "post_queries(string[],axfer)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def reclaim_queries(
+        self,
+        args: tuple[list[int]] | ReclaimQueriesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the reclaim_queries(uint64[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "reclaim_queries(uint64[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def accept_response(
+        self,
+        args: tuple[int] | AcceptResponseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the accept_response(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_query(uint64)(address,string,address,string,bool)",
+                "method": "accept_response(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def timeout_reclaim(
+        self,
+        args: tuple[list[int]] | TimeoutReclaimArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the timeout_reclaim(uint64[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "timeout_reclaim(uint64[])uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -1471,7 +2144,151 @@ class DecentralizedAiContractComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_query(uint64)(address,string,address,string,bool)", v
+                "get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)", v
+            )
+        )
+        return self
+
+    def post_query_ref(
+        self,
+        args: tuple[bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int, algokit_utils.AppMethodCallTransactionArgument] | PostQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.post_query_ref(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "post_query_ref(byte[32],uint64,axfer)uint64", v
+            )
+        )
+        return self
+
+    def submit_response_ref(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | SubmitResponseRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.submit_response_ref(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "submit_response_ref(uint64,byte[32],uint64)void", v
+            )
+        )
+        return self
+
+    def get_query_ref(
+        self,
+        args: tuple[int] | GetQueryRefArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_query_ref(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)", v
+            )
+        )
+        return self
+
+    def post_query_for(
+        self,
+        args: tuple[str, algokit_utils.AppMethodCallTransactionArgument] | PostQueryForArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.post_query_for(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "post_query_for(string,axfer)uint64", v
+            )
+        )
+        return self
+
+    def post_queries(
+        self,
+        args: tuple[list[str], algokit_utils.AppMethodCallTransactionArgument] | PostQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.post_queries(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "post_queries(string[],axfer)uint64", v
+            )
+        )
+        return self
+
+    def reclaim_queries(
+        self,
+        args: tuple[list[int]] | ReclaimQueriesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.reclaim_queries(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "reclaim_queries(uint64[])uint64", v
+            )
+        )
+        return self
+
+    def accept_response(
+        self,
+        args: tuple[int] | AcceptResponseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.accept_response(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "accept_response(uint64)void", v
+            )
+        )
+        return self
+
+    def timeout_reclaim(
+        self,
+        args: tuple[list[int]] | TimeoutReclaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "DecentralizedAiContractComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.timeout_reclaim(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "timeout_reclaim(uint64[])uint64", v
             )
         )
         return self
@@ -1546,4 +2363,4 @@ class DecentralizedAiContractComposer:
         self,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAtomicTransactionComposerResults:
-        return self._composer.send(send_params)
\ No newline at end of file
+        return self._composer.send(send_params)
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Hand-written companions to the generated client.py, which is regenerated from
+Misc_Contract/DecentralizedAiContract.arc56.json and must stay untouched.
+
+- the fixed layouts of the P (pending work), X (expiry index), Q and R boxes, with read-only
+  views that decode them in place (`PendingWork`, `ExpiryIndex`, `QueryRefView`);
+- the ARC-28 `QueryCreated` / `ResponseSubmitted` events and their log decoder;
+- box reads for a typed client: `read_pending_work`, `read_expiry_index`,
+  `read_query_ref_views`, and `read_values` for bounded concurrent reads from a box map.
+
+Importing it is cheap: algosdk and the generated client are imported where they are used, so
+relayer.py and the prompt.py paths that only need the layouts start without them.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import functools
+import struct
+import typing
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from client import DecentralizedAiContractClient, QueryRef
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Raw (zero-copy) decoding of query_refs boxes. QueryRef is all static ARC-4 fields, so its
+# encoding is a plain big-endian record with constant offsets that `struct` can read in place.
+QUERY_REF_ANSWERED = 1  # QueryRef.flags bit
+QUERY_REF_LAYOUT = struct.Struct(">32s32sQQQIIB32s32sQQ")
+QUERY_REF_KEY_PREFIX = b"R"
+
+
+class QueryRefView:
+    """Read-only view over the raw bytes of one query_refs box.
+
+    Integer fields are unpacked straight from the underlying buffer; the two addresses (which
+    need a checksum to encode) and the hashes are only materialised when accessed.
+    """
+
+    __slots__ = ("_buf",)
+    size = QUERY_REF_LAYOUT.size
+
+    def __init__(self, raw: bytes | bytearray | memoryview, offset: int = 0):
+        buf = memoryview(raw)[offset:offset + self.size]
+        if len(buf) != self.size:
+            raise ValueError(f"QueryRef record must be {self.size} bytes, got {len(buf)}")
+        self._buf = buf
+
+    def _u(self, fmt: str, offset: int) -> int:
+        return struct.unpack_from(fmt, self._buf, offset)[0]
+
+    @property
+    def submitter(self) -> str:
+        from algosdk import encoding
+
+        return encoding.encode_address(bytes(self._buf[0:32]))
+
+    @property
+    def provider(self) -> str:
+        from algosdk import encoding
+
+        return encoding.encode_address(bytes(self._buf[32:64]))
+
+    @property
+    def fee_paid(self) -> int:
+        return self._u(">Q", 64)
+
+    @property
+    def posted_at(self) -> int:
+        return self._u(">Q", 72)
+
+    @property
+    def answered_at(self) -> int:
+        return self._u(">Q", 80)
+
+    @property
+    def query_len(self) -> int:
+        return self._u(">I", 88)
+
+    @property
+    def response_len(self) -> int:
+        return self._u(">I", 92)
+
+    @property
+    def flags(self) -> int:
+        return self._buf[96]
+
+    @property
+    def is_answered(self) -> bool:
+        return bool(self._buf[96] & QUERY_REF_ANSWERED)
+
+    @property
+    def query_hash(self) -> bytes:
+        return bytes(self._buf[97:129])
+
+    @property
+    def response_hash(self) -> bytes:
+        return bytes(self._buf[129:161])
+
+    @property
+    def answer_deadline(self) -> int:
+        return self._u(">Q", 161)
+
+    @property
+    def accept_deadline(self) -> int:
+        return self._u(">Q", 169)
+
+    def to_struct(self) -> QueryRef:
+        from algosdk import encoding
+
+        from client import QueryRef
+
+        sub, prov, fee, posted, answered, qlen, rlen, flags, qh, rh, answer_by, accept_by = \
+            QUERY_REF_LAYOUT.unpack_from(self._buf)
+        return QueryRef(
+            submitter=encoding.encode_address(sub),
+            provider=encoding.encode_address(prov),
+            fee_paid=fee, posted_at=posted, answered_at=answered,
+            query_len=qlen, response_len=rlen, flags=flags,
+            query_hash=qh, response_hash=rh,
+            answer_deadline=answer_by, accept_deadline=accept_by,
+        )
+
+
+def query_ref_box_name(query_id: int) -> bytes:
+    return QUERY_REF_KEY_PREFIX + query_id.to_bytes(8, "big")
+
+
+# Pending-work box: next_query_id followed by a ring bitmap of the most recent PENDING_CAPACITY
+# ids (bit id % PENDING_CAPACITY, most significant bit first; 1 = open, 0 = answered or refunded).
+# One read gives the whole open set, consistent with the header.
+PENDING_BOX_NAME = b"P"
+PENDING_HEADER_BYTES = 8
+PENDING_CAPACITY = 8128
+
+
+class PendingWork:
+    """Snapshot of the pending-work box.
+
+    Ids in [first_tracked, next_query_id) are tracked; `is_open` / `is_answered` are only
+    definite for those, and both return False for older (or not yet posted) ids. A query
+    refunded by timeout_reclaim counts as answered here: either way it takes no more answers.
+    """
+
+    __slots__ = ("next_query_id", "_bits")
+
+    def __init__(self, raw: bytes | bytearray | memoryview):
+        raw = bytes(raw)
+        if len(raw) != PENDING_HEADER_BYTES + PENDING_CAPACITY // 8:
+            raise ValueError(f"pending box must be {PENDING_HEADER_BYTES + PENDING_CAPACITY // 8} bytes, got {len(raw)}")
+        self.next_query_id = int.from_bytes(raw[:PENDING_HEADER_BYTES], "big")
+        self._bits = raw[PENDING_HEADER_BYTES:]
+
+    @property
+    def first_tracked(self) -> int:
+        return max(1, self.next_query_id - PENDING_CAPACITY)
+
+    def tracks(self, query_id: int) -> bool:
+        return self.first_tracked <= query_id < self.next_query_id
+
+    def _bit(self, query_id: int) -> bool:
+        slot = query_id % PENDING_CAPACITY
+        return bool(self._bits[slot // 8] & (0x80 >> (slot % 8)))
+
+    def is_open(self, query_id: int) -> bool:
+        return self.tracks(query_id) and self._bit(query_id)
+
+    def is_answered(self, query_id: int) -> bool:
+        return self.tracks(query_id) and not self._bit(query_id)
+
+    def open_ids(self) -> list[int]:
+        """Every unanswered tracked id, ascending"""
+        found = []
+        last = self.next_query_id - 1
+        for index, byte in enumerate(self._bits):
+            while byte:
+                top = byte.bit_length() - 1
+                byte ^= 1 << top
+                slot = index * 8 + (7 - top)
+                # the tracked id that maps to this slot
+                query_id = last - (last - slot) % PENDING_CAPACITY
+                if query_id >= self.first_tracked:
+                    found.append(query_id)
+        return sorted(found)
+
+
+# reclaim_queries: the boxes of settled queries may be deleted once they are RECLAIM_AFTER_QUERIES
+# ids old (i.e. outside the pending-work window), at most MAX_RECLAIM_QUERIES per call
+RECLAIM_AFTER_QUERIES = PENDING_CAPACITY
+MAX_RECLAIM_QUERIES = 8
+QUERY_KEY_PREFIX = b"Q"
+
+
+def query_box_name(query_id: int) -> bytes:
+    return QUERY_KEY_PREFIX + query_id.to_bytes(8, "big")
+
+
+# Escrow: Query.flags / QueryRef.flags bits on top of QUERY_REF_ANSWERED, and the deadlines the
+# contract sets from the posting round (answer_deadline, then accept_deadline after the review window)
+QUERY_PAID = 2
+QUERY_REFUNDED = 4
+QUERY_SETTLED = QUERY_PAID | QUERY_REFUNDED
+ANSWER_WINDOW_ROUNDS = 1000
+REVIEW_WINDOW_ROUNDS = 1000
+MAX_TIMEOUT_QUERIES = 3  # query box + payee per id, P and the asset: 8 references
+
+# Expiry index box: a ring of EXPIRY_SLOTS (round bucket, first query id posted in it) uint64 pairs
+EXPIRY_BOX_NAME = b"X"
+EXPIRY_BUCKET_ROUNDS = 100
+EXPIRY_SLOTS = 64
+EXPIRY_SLOT = struct.Struct(">QQ")
+
+
+class ExpiryIndex:
+    """Snapshot of the expiry index box.
+
+    Deadlines are fixed offsets from the posting round, so the queries posted in a round
+    range (and hence expiring in the matching shifted range) hold a contiguous id range. The
+    ring covers the last EXPIRY_SLOTS * EXPIRY_BUCKET_ROUNDS rounds of posting.
+    """
+
+    __slots__ = ("next_query_id", "_first")
+
+    def __init__(self, raw: bytes | bytearray | memoryview, next_query_id: int):
+        raw = bytes(raw)
+        if len(raw) != EXPIRY_SLOTS * EXPIRY_SLOT.size:
+            raise ValueError(f"expiry box must be {EXPIRY_SLOTS * EXPIRY_SLOT.size} bytes, got {len(raw)}")
+        self.next_query_id = next_query_id
+        # bucket -> first id posted in it, for the buckets still in the ring
+        self._first = {bucket: first for bucket, first in EXPIRY_SLOT.iter_unpack(raw) if first}
+
+    @property
+    def oldest_round(self) -> int:
+        """First posting round the ring still covers (0 if nothing was posted yet)"""
+        return min(self._first, default=0) * EXPIRY_BUCKET_ROUNDS
+
+    @property
+    def full(self) -> bool:
+        """True once every slot is in use, so posts before oldest_round may have been overwritten"""
+        return len(self._first) == EXPIRY_SLOTS
+
+    def posted_between(self, first_round: int, last_round: int) -> range:
+        """Ids posted in buckets overlapping [first_round, last_round] (whole buckets, so a superset)."""
+        first_bucket, last_bucket = first_round // EXPIRY_BUCKET_ROUNDS, last_round // EXPIRY_BUCKET_ROUNDS
+        inside = sorted(b for b in self._first if first_bucket <= b <= last_bucket)
+        if not inside:
+            return range(0)
+        later = [b for b in self._first if b > last_bucket]
+        end = self._first[min(later)] if later else self.next_query_id
+        return range(self._first[inside[0]], end)
+
+    def expiring_between(self, first_round: int, last_round: int) -> "tuple[range, range]":
+        """(ids whose answer_deadline, ids whose accept_deadline) may fall in [first_round, last_round]"""
+        answer = self.posted_between(first_round - ANSWER_WINDOW_ROUNDS, last_round - ANSWER_WINDOW_ROUNDS)
+        window = ANSWER_WINDOW_ROUNDS + REVIEW_WINDOW_ROUNDS
+        accept = self.posted_between(first_round - window, last_round - window)
+        return answer, accept
+
+
+# ARC-28 events. Every post_query* call logs QueryCreated and every submit_response* call logs
+# ResponseSubmitted, ahead of the ABI return. Each log is the 4-byte event selector followed by
+# a static ARC-4 record, so both decode with one `struct` layout.
+EVENT_LAYOUT = struct.Struct(">Q32sQQ32s")
+
+
+@dataclasses.dataclass(frozen=True)
+class QueryCreated:
+    """Event for a new query (text summarised by SHA-256 and byte length)"""
+    query_id: int
+    submitter: str
+    fee: int
+    text_len: int
+    text_hash: bytes
+
+
+@dataclasses.dataclass(frozen=True)
+class ResponseSubmitted:
+    """Event for an answered query; `payout` is the escrowed fee, paid on acceptance or timeout"""
+    query_id: int
+    provider: str
+    payout: int
+    response_len: int
+    response_hash: bytes
+
+
+EVENT_SIGNATURES: dict[type, str] = {
+    QueryCreated: "QueryCreated(uint64,address,uint64,uint64,byte[32])",
+    ResponseSubmitted: "ResponseSubmitted(uint64,address,uint64,uint64,byte[32])",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _event_classes() -> dict[bytes, type]:
+    # ARC-28 selector: the first 4 bytes of SHA-512/256 of the event signature
+    from algosdk import encoding
+
+    return {encoding.checksum(sig.encode())[:4]: cls for cls, sig in EVENT_SIGNATURES.items()}
+
+
+def event_selector(cls: type) -> bytes:
+    """The 4-byte log prefix of `QueryCreated` or `ResponseSubmitted`"""
+    return next(sel for sel, c in _event_classes().items() if c is cls)
+
+
+def decode_event(log: bytes) -> QueryCreated | ResponseSubmitted | None:
+    """Decode one app log; None for logs that are not one of this contract's events"""
+    cls = _event_classes().get(bytes(log[:4]))
+    if cls is None or len(log) != 4 + EVENT_LAYOUT.size:
+        return None
+    from algosdk import encoding
+
+    query_id, address, amount, length, digest = EVENT_LAYOUT.unpack_from(log, 4)
+    return cls(query_id, encoding.encode_address(address), amount, length, digest)
+
+
+def decode_events(logs: typing.Iterable[bytes]) -> list[QueryCreated | ResponseSubmitted]:
+    """Decode the events among an app call's logs, in log order"""
+    return [event for event in map(decode_event, logs) if event is not None]
+
+
+# ---- box reads ----
+def _missing_as_none(read: typing.Callable[[], V]) -> Optional[V]:
+    from algosdk.error import AlgodHTTPError
+
+    try:
+        return read()
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+
+
+def read_values(values, keys: Iterable[K], max_workers: int = 8) -> Dict[K, Optional[V]]:
+    """
+    Read several keys of a box map (e.g. `app.state.box.queries`) with at most `max_workers`
+    box reads in flight. Keys whose box does not exist map to None; results keep the order of `keys`.
+    """
+    keys = list(keys)
+
+    def fetch(key: K) -> Optional[V]:
+        return _missing_as_none(lambda: values.get_value(key))
+
+    if len(keys) <= 1 or max_workers <= 1:
+        return {key: fetch(key) for key in keys}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        return dict(zip(keys, executor.map(fetch, keys)))
+
+
+def read_range(values, first: int, end: int, max_workers: int = 8) -> Dict[int, Optional[V]]:
+    """`read_values` for the integer keys in [first, end)"""
+    return read_values(values, range(first, end), max_workers=max_workers)
+
+
+def read_query_ref_views(app: DecentralizedAiContractClient, keys: Iterable[int],
+                         max_workers: int = 8) -> Dict[int, Optional[QueryRefView]]:
+    """Read query_refs boxes as raw bytes wrapped in QueryRefView (no ABI decoding); missing boxes map to None."""
+    keys = list(keys)
+
+    def fetch(key: int) -> Optional[QueryRefView]:
+        return _missing_as_none(lambda: QueryRefView(app.app_client.get_box_value(query_ref_box_name(key))))
+
+    if len(keys) <= 1 or max_workers <= 1:
+        return {key: fetch(key) for key in keys}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+        return dict(zip(keys, executor.map(fetch, keys)))
+
+
+def read_pending_work(app: DecentralizedAiContractClient) -> Optional[PendingWork]:
+    """Read the pending-work box (one read for the whole open set); None until the first post"""
+    return _missing_as_none(lambda: PendingWork(app.app_client.get_box_value(PENDING_BOX_NAME)))
+
+
+def read_expiry_index(app: DecentralizedAiContractClient) -> Optional[ExpiryIndex]:
+    """Read the expiry index box (with next_query_id from global state); None until the first post"""
+    raw = _missing_as_none(lambda: app.app_client.get_box_value(EXPIRY_BOX_NAME))
+    if raw is None:
+        return None
+    return ExpiryIndex(raw, app.app_client.state.global_state.get_value("next_query_id"))
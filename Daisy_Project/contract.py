@@ -11,7 +11,13 @@ Notes
 - See README.md for system architecture and end-to-end flow.
 """'''
 
-from algopy import ARC4Contract, Account, Asset, BoxMap, Global, UInt64, Txn, arc4, itxn, gtxn, log, op
+import typing
+
+from algopy import (ARC4Contract, Account, Asset, BoxMap, BoxRef, Global, OpUpFeeSource, UInt64, Txn, arc4, ensure_budget,
+                    itxn, gtxn, log, op, subroutine, uenumerate)
+
+# 32-byte content hash (SHA-256) of text kept off-chain
+Hash32 = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
 
 
 # ABI-compatible struct for queries
@@ -21,6 +27,94 @@ class Query(arc4.Struct):
     provider: arc4.Address
     response_text: arc4.String
     is_answered: arc4.Bool
+    fee_paid: arc4.UInt64
+    answer_deadline: arc4.UInt64
+    accept_deadline: arc4.UInt64
+    flags: arc4.UInt8
+
+
+# Bit flags for Query.flags / QueryRef.flags. The fee stays in escrow until the query is settled:
+# paid to the provider (accept_response, or timeout_reclaim once the review window has passed)
+# or refunded to the submitter (timeout_reclaim when nobody answered in time).
+QUERY_ANSWERED = 1
+QUERY_PAID = 2
+QUERY_REFUNDED = 4
+QUERY_SETTLED = QUERY_PAID | QUERY_REFUNDED
+
+# Deadlines (rounds) are fixed offsets from the posting round: answers are accepted until
+# answer_deadline, and the submitter has until accept_deadline to accept before the provider
+# can be paid without it
+ANSWER_WINDOW_ROUNDS = 1000
+REVIEW_WINDOW_ROUNDS = 1000
+# Each settled id needs its query box and may need its payee's account, next to the pending-work
+# box and the asset: 3 ids fill the 8 references one app call can make
+MAX_TIMEOUT_QUERIES = 3
+
+# Expiry index box: a ring of EXPIRY_SLOTS (bucket, first query id posted in that bucket) uint64
+# pairs, one per EXPIRY_BUCKET_ROUNDS rounds. Since deadlines are a fixed offset from the posting
+# round, ids expire in id order and one read of this 1 KB box maps a round range to an id range.
+EXPIRY_BUCKET_ROUNDS = 100
+EXPIRY_SLOTS = 64
+EXPIRY_SLOT_BYTES = 16
+
+# Pending-work box: next_query_id (uint64) followed by a ring bitmap with one bit per query id
+# (bit (id % PENDING_CAPACITY), most significant bit first; 1 = open, i.e. neither answered nor
+# refunded). The whole box is 1 KB, so one box reference covers its I/O budget, and it tracks
+# the most recent PENDING_CAPACITY ids: posting id n reuses the bit of id n - PENDING_CAPACITY.
+PENDING_HEADER_BYTES = 8
+PENDING_CAPACITY = 8128
+
+# post_queries: one new query box per reference an app call can carry (8, less the pending-work
+# and expiry boxes), and a rough opcode cost per query (box writes, SHA-256, event) for topping
+# up the budget
+MAX_BATCH_QUERIES = 6
+BATCH_OPS_PER_QUERY = 200
+
+# reclaim_queries: settled queries keep their box until they are this many ids old (i.e. until
+# they have left the pending-work window), so at most this many settled boxes stay on chain.
+# Each call deletes up to one box per box reference.
+RECLAIM_AFTER_QUERIES = PENDING_CAPACITY
+MAX_RECLAIM_QUERIES = 8
+
+
+# Fixed-width record for queries whose text lives in an off-chain content-addressed blob store.
+# Every field is static, so the ARC-4 encoding has no offset headers: each box is exactly
+# 177 bytes, field offsets are constants, and updates never change the box size. The hashes
+# double as pointers (CIDs) into the store.
+class QueryRef(arc4.Struct):
+    submitter: arc4.Address
+    provider: arc4.Address
+    fee_paid: arc4.UInt64
+    posted_at: arc4.UInt64
+    answered_at: arc4.UInt64
+    query_len: arc4.UInt32
+    response_len: arc4.UInt32
+    flags: arc4.UInt8
+    query_hash: Hash32
+    response_hash: Hash32
+    answer_deadline: arc4.UInt64
+    accept_deadline: arc4.UInt64
+
+
+# ARC-28 events (logged as selector || ARC-4 encoding), so indexers and nodes can follow new
+# queries and answers from block logs alone. Texts are summarised by SHA-256 and byte length;
+# post_query_ref / submit_response_ref pass through the hash and length they were given.
+# ResponseSubmitted.payout is the fee held in escrow for the answer; it is only paid out by
+# accept_response or timeout_reclaim.
+class QueryCreated(arc4.Struct):
+    query_id: arc4.UInt64
+    submitter: arc4.Address
+    fee: arc4.UInt64
+    text_len: arc4.UInt64
+    text_hash: Hash32
+
+
+class ResponseSubmitted(arc4.Struct):
+    query_id: arc4.UInt64
+    provider: arc4.Address
+    payout: arc4.UInt64
+    response_len: arc4.UInt64
+    response_hash: Hash32
 
 
 class DecentralizedAiContract(ARC4Contract):
@@ -50,6 +144,10 @@ class DecentralizedAiContract(ARC4Contract):
         self.token = Asset(0)
         self.query_fee = UInt64(0)
         self.next_query_id = UInt64(1)
+        self.queries = BoxMap(UInt64, Query, key_prefix=b"Q")
+        self.query_refs = BoxMap(UInt64, QueryRef, key_prefix=b"R")
+        self.pending = BoxRef(key=b"P")
+        self.expiry = BoxRef(key=b"X")
 
     @arc4.abimethod(create='require')
     def create(self, token_id: Asset, fee: UInt64) -> None:
@@ -146,21 +244,72 @@ class DecentralizedAiContract(ARC4Contract):
         Any
             Description of the return value.
         """
+        self._check_query_payment(payment)
+        return self._create_query(arc4.Address(Txn.sender.bytes), query_text)
+
+    @arc4.abimethod
+    def post_query_for(self, query_text: arc4.String, payment: gtxn.AssetTransferTransaction) -> UInt64:
+        """
+        post_query_for function.
+
+        Relayed post_query: the app call can come from any account (a relayer that pays the
+        ALGO fees for the group), and the query is recorded for the sender of the DAISY
+        payment. The payment is signed by that user for this exact group, so the relayer
+        cannot reuse it with different query text.
+
+        Parameters
+        ----------
+        query_text: the query
+        payment: DAISY fee transfer to the contract, sent by the querying user
+
+        Returns
+        -------
+        UInt64
+            The new query id (shared id space with post_query).
+        """
+        self._check_fee_transfer(payment)
+        return self._create_query(arc4.Address(payment.sender.bytes), query_text)
+
+    @arc4.abimethod
+    def post_queries(self, query_texts: arc4.DynamicArray[arc4.String], payment: gtxn.AssetTransferTransaction) -> UInt64:
+        """
+        post_queries function.
+
+        Posts several queries under one DAISY transfer of len(query_texts) * query_fee. The
+        queries get the contiguous ids [first, first + len(query_texts)), in array order, and
+        each one logs its own QueryCreated event.
+
+        Parameters
+        ----------
+        query_texts: the queries (1 to MAX_BATCH_QUERIES; the call must reference each new box)
+        payment: DAISY fee transfer to the contract from the caller, covering every query
+
+        Returns
+        -------
+        UInt64
+            The id of the first query (shared id space with post_query).
+        """
+        count = query_texts.length
+        assert count > 0, 'No queries'
+        assert count <= MAX_BATCH_QUERIES, 'Too many queries'
         assert payment.xfer_asset == self.token, 'Wrong token'
         assert payment.asset_receiver == Global.current_application_address, 'Payment must go to contract'
-        assert payment.asset_amount == self.query_fee, 'Wrong fee amount'
+        assert payment.asset_amount == self.query_fee * count, 'Wrong fee amount'
         assert payment.sender == Txn.sender, 'Payment must be from caller'
-        query_id = self.next_query_id
-        new_query = Query(submitter=arc4.Address(Txn.sender.bytes), query_text=query_text, provider=arc4.Address(Global.zero_address), response_text=arc4.String(''), is_answered=arc4.Bool(False))
-        self.queries[query_id] = new_query.copy()
-        self.next_query_id += UInt64(1)
-        return query_id
+        ensure_budget(BATCH_OPS_PER_QUERY * count, OpUpFeeSource.GroupCredit)
+        first_id = self.next_query_id
+        for _i, query_text in uenumerate(query_texts):
+            self._create_query(arc4.Address(Txn.sender.bytes), query_text)
+        return first_id
 
     @arc4.abimethod
     def submit_response(self, query_id: UInt64, response_text: arc4.String) -> None:
         """
         submit_response function.
 
+        Records the answer; the fee stays in escrow until the submitter accepts it (or the
+        review window passes, see timeout_reclaim).
+
         Parameters
         ----------
         query_id: description
@@ -173,11 +322,20 @@ class DecentralizedAiContract(ARC4Contract):
         """
         query = self.queries[query_id].copy()
         assert query.is_answered == arc4.Bool(False), 'Already answered'
+        self._check_answer_window(query.flags.native, query.answer_deadline.native)
         query.provider = arc4.Address(Txn.sender.bytes)
         query.response_text = response_text
         query.is_answered = arc4.Bool(True)
+        query.flags = arc4.UInt8(query.flags.native | QUERY_ANSWERED)
         self.queries[query_id] = query.copy()
-        itxn.AssetTransfer(xfer_asset=self.token, asset_amount=self.query_fee, asset_receiver=Txn.sender, fee=0).submit()
+        self._mark_pending(query_id, False)
+        arc4.emit(ResponseSubmitted(
+            query_id=arc4.UInt64(query_id),
+            provider=arc4.Address(Txn.sender.bytes),
+            payout=query.fee_paid,
+            response_len=arc4.UInt64(response_text.native.bytes.length),
+            response_hash=Hash32.from_bytes(op.sha256(response_text.native.bytes)),
+        ))
 
     @arc4.abimethod(readonly=True)
     def get_query(self, query_id: UInt64) -> Query:
@@ -194,3 +352,286 @@ class DecentralizedAiContract(ARC4Contract):
         Description of the return value.
         """'''
         return self.queries[query_id]
+
+    @arc4.abimethod
+    def post_query_ref(self, query_hash: Hash32, query_len: UInt64, payment: gtxn.AssetTransferTransaction) -> UInt64:
+        """
+        post_query_ref function.
+
+        Like post_query, but only the SHA-256 hash and length of the query text are stored;
+        the text itself is published to the off-chain blob store under that hash.
+
+        Parameters
+        ----------
+        query_hash: SHA-256 of the UTF-8 query text
+        query_len: length of the query text in bytes (must fit in uint32)
+        payment: DAISY fee transfer to the contract
+
+        Returns
+        -------
+        UInt64
+            The new query id (shared id space with post_query).
+        """
+        self._check_query_payment(payment)
+        query_id = self.next_query_id
+        self.query_refs[query_id] = QueryRef(
+            submitter=arc4.Address(Txn.sender.bytes),
+            provider=arc4.Address(Global.zero_address),
+            fee_paid=arc4.UInt64(payment.asset_amount),
+            posted_at=arc4.UInt64(Global.latest_timestamp),
+            answered_at=arc4.UInt64(0),
+            query_len=arc4.UInt32(query_len),
+            response_len=arc4.UInt32(0),
+            flags=arc4.UInt8(0),
+            query_hash=query_hash.copy(),
+            response_hash=Hash32.from_bytes(op.bzero(32)),
+            answer_deadline=arc4.UInt64(Global.round + ANSWER_WINDOW_ROUNDS),
+            accept_deadline=arc4.UInt64(Global.round + ANSWER_WINDOW_ROUNDS + REVIEW_WINDOW_ROUNDS),
+        )
+        self.next_query_id += UInt64(1)
+        self._mark_pending(query_id, True)
+        self._index_expiry(query_id)
+        arc4.emit(QueryCreated(
+            query_id=arc4.UInt64(query_id),
+            submitter=arc4.Address(Txn.sender.bytes),
+            fee=arc4.UInt64(payment.asset_amount),
+            text_len=arc4.UInt64(query_len),
+            text_hash=query_hash.copy(),
+        ))
+        return query_id
+
+    @arc4.abimethod
+    def submit_response_ref(self, query_id: UInt64, response_hash: Hash32, response_len: UInt64) -> None:
+        """
+        submit_response_ref function.
+
+        Answers a query created with post_query_ref by recording the hash and length of
+        the response published to the blob store; the fee stays in escrow as for submit_response.
+
+        Parameters
+        ----------
+        query_id: id returned by post_query_ref
+        response_hash: SHA-256 of the UTF-8 response text
+        response_len: length of the response text in bytes (must fit in uint32)
+        """
+        ref = self.query_refs[query_id].copy()
+        assert not (ref.flags.native & QUERY_ANSWERED), 'Already answered'
+        self._check_answer_window(ref.flags.native, ref.answer_deadline.native)
+        ref.provider = arc4.Address(Txn.sender.bytes)
+        ref.answered_at = arc4.UInt64(Global.latest_timestamp)
+        ref.response_len = arc4.UInt32(response_len)
+        ref.flags = arc4.UInt8(ref.flags.native | QUERY_ANSWERED)
+        ref.response_hash = response_hash.copy()
+        self.query_refs[query_id] = ref.copy()
+        self._mark_pending(query_id, False)
+        arc4.emit(ResponseSubmitted(
+            query_id=arc4.UInt64(query_id),
+            provider=arc4.Address(Txn.sender.bytes),
+            payout=ref.fee_paid,
+            response_len=arc4.UInt64(response_len),
+            response_hash=response_hash.copy(),
+        ))
+
+    @arc4.abimethod(readonly=True)
+    def get_query_ref(self, query_id: UInt64) -> QueryRef:
+        """
+        get_query_ref function.
+
+        Parameters
+        ----------
+        query_id: id returned by post_query_ref
+
+        Returns
+        -------
+        QueryRef
+            The fixed-size record for the query.
+        """
+        return self.query_refs[query_id]
+
+    @arc4.abimethod
+    def accept_response(self, query_id: UInt64) -> None:
+        """
+        accept_response function.
+
+        The submitter accepts the answer to their query, releasing the escrowed fee to the
+        provider.
+
+        Parameters
+        ----------
+        query_id: an answered query posted by the caller
+        """
+        if query_id in self.queries:
+            query = self.queries[query_id].copy()
+            query.flags = arc4.UInt8(self._accept(query.flags.native, query.submitter.native, query.provider.native,
+                                                  query.fee_paid.native))
+            self.queries[query_id] = query.copy()
+        else:
+            ref = self.query_refs[query_id].copy()
+            ref.flags = arc4.UInt8(self._accept(ref.flags.native, ref.submitter.native, ref.provider.native,
+                                                ref.fee_paid.native))
+            self.query_refs[query_id] = ref.copy()
+
+    @arc4.abimethod
+    def timeout_reclaim(self, query_ids: arc4.DynamicArray[arc4.UInt64]) -> UInt64:
+        """
+        timeout_reclaim function.
+
+        Settles queries whose deadline has passed; anyone may call it. An unanswered query
+        past answer_deadline is refunded to its submitter, and an answered one past
+        accept_deadline is paid to its provider. Ids that are settled, not yet due or gone
+        are skipped, so a sweeper can pass every id the expiry index lists for a round range.
+
+        Parameters
+        ----------
+        query_ids: ids to settle (at most MAX_TIMEOUT_QUERIES; the call must reference each box)
+
+        Returns
+        -------
+        UInt64
+            The number of queries settled.
+        """
+        assert query_ids.length <= MAX_TIMEOUT_QUERIES, 'Too many queries'
+        settled = UInt64(0)
+        for _i, item in uenumerate(query_ids):
+            query_id = item.native
+            if query_id in self.queries:
+                query = self.queries[query_id].copy()
+                flags = self._timeout(query_id, query.flags.native, query.answer_deadline.native,
+                                      query.accept_deadline.native, query.submitter.native, query.provider.native,
+                                      query.fee_paid.native)
+                if flags != query.flags.native:
+                    query.flags = arc4.UInt8(flags)
+                    self.queries[query_id] = query.copy()
+                    settled += UInt64(1)
+            elif query_id in self.query_refs:
+                ref = self.query_refs[query_id].copy()
+                flags = self._timeout(query_id, ref.flags.native, ref.answer_deadline.native,
+                                      ref.accept_deadline.native, ref.submitter.native, ref.provider.native,
+                                      ref.fee_paid.native)
+                if flags != ref.flags.native:
+                    ref.flags = arc4.UInt8(flags)
+                    self.query_refs[query_id] = ref.copy()
+                    settled += UInt64(1)
+        return settled
+
+    @arc4.abimethod
+    def reclaim_queries(self, query_ids: arc4.DynamicArray[arc4.UInt64]) -> UInt64:
+        """
+        reclaim_queries function.
+
+        Deletes the boxes of settled (paid or refunded) queries once they are RECLAIM_AFTER_QUERIES
+        ids old. The freed minimum balance stays with the app account and pays for the boxes
+        of later queries. Ids whose box is already gone are skipped.
+
+        Parameters
+        ----------
+        query_ids: ids to reclaim (at most MAX_RECLAIM_QUERIES; the call must reference each box)
+
+        Returns
+        -------
+        UInt64
+            The number of boxes deleted.
+        """
+        assert Txn.sender == self.governor, 'Only governor can reclaim'
+        assert query_ids.length <= MAX_RECLAIM_QUERIES, 'Too many queries'
+        reclaimed = UInt64(0)
+        for _i, item in uenumerate(query_ids):
+            query_id = item.native
+            assert query_id + RECLAIM_AFTER_QUERIES <= self.next_query_id, 'Query inside retention window'
+            if query_id in self.queries:
+                assert self.queries[query_id].flags.native & QUERY_SETTLED, 'Query not settled'
+                del self.queries[query_id]
+                reclaimed += UInt64(1)
+            elif query_id in self.query_refs:
+                assert self.query_refs[query_id].flags.native & QUERY_SETTLED, 'Query not settled'
+                del self.query_refs[query_id]
+                reclaimed += UInt64(1)
+        return reclaimed
+
+    @subroutine
+    def _check_query_payment(self, payment: gtxn.AssetTransferTransaction) -> None:
+        self._check_fee_transfer(payment)
+        assert payment.sender == Txn.sender, 'Payment must be from caller'
+
+    @subroutine
+    def _check_fee_transfer(self, payment: gtxn.AssetTransferTransaction) -> None:
+        assert payment.xfer_asset == self.token, 'Wrong token'
+        assert payment.asset_receiver == Global.current_application_address, 'Payment must go to contract'
+        assert payment.asset_amount == self.query_fee, 'Wrong fee amount'
+
+    @subroutine
+    def _create_query(self, submitter: arc4.Address, query_text: arc4.String) -> UInt64:
+        query_id = self.next_query_id
+        new_query = Query(submitter=submitter, query_text=query_text, provider=arc4.Address(Global.zero_address), response_text=arc4.String(''), is_answered=arc4.Bool(False),
+                          fee_paid=arc4.UInt64(self.query_fee), answer_deadline=arc4.UInt64(Global.round + ANSWER_WINDOW_ROUNDS),
+                          accept_deadline=arc4.UInt64(Global.round + ANSWER_WINDOW_ROUNDS + REVIEW_WINDOW_ROUNDS), flags=arc4.UInt8(0))
+        self.queries[query_id] = new_query.copy()
+        self.next_query_id += UInt64(1)
+        self._mark_pending(query_id, True)
+        self._index_expiry(query_id)
+        arc4.emit(QueryCreated(
+            query_id=arc4.UInt64(query_id),
+            submitter=submitter,
+            fee=arc4.UInt64(self.query_fee),
+            text_len=arc4.UInt64(query_text.native.bytes.length),
+            text_hash=Hash32.from_bytes(op.sha256(query_text.native.bytes)),
+        ))
+        return query_id
+
+    @subroutine
+    def _mark_pending(self, query_id: UInt64, is_open: bool) -> None:
+        # Created on first use (the app account pays its MBR); the header is refreshed on every
+        # write so a single box read gives a consistent next_query_id + bitmap snapshot. Ids that
+        # have left the window no longer own their slot (a newer id does), so they are ignored.
+        if query_id + PENDING_CAPACITY < self.next_query_id:
+            return
+        if not self.pending:
+            self.pending.create(size=PENDING_HEADER_BYTES + PENDING_CAPACITY // 8)
+        slot = query_id % PENDING_CAPACITY
+        offset = PENDING_HEADER_BYTES + slot // 8
+        self.pending.replace(offset, op.setbit_bytes(self.pending.extract(offset, 1), slot % 8, is_open))
+        self.pending.replace(0, op.itob(self.next_query_id))
+
+    @subroutine
+    def _index_expiry(self, query_id: UInt64) -> None:
+        # Record the first id posted in the current round bucket (the ring slot still holds an
+        # older bucket, or nothing, until then)
+        if not self.expiry:
+            self.expiry.create(size=EXPIRY_SLOTS * EXPIRY_SLOT_BYTES)
+        bucket = Global.round // EXPIRY_BUCKET_ROUNDS
+        offset = (bucket % EXPIRY_SLOTS) * EXPIRY_SLOT_BYTES
+        if op.btoi(self.expiry.extract(offset, 8)) != bucket or op.btoi(self.expiry.extract(offset + 8, 8)) == 0:
+            self.expiry.replace(offset, op.itob(bucket) + op.itob(query_id))
+
+    @subroutine
+    def _check_answer_window(self, flags: UInt64, answer_deadline: UInt64) -> None:
+        assert not (flags & QUERY_SETTLED), 'Query closed'
+        assert Global.round <= answer_deadline, 'Answer window closed'
+
+    @subroutine
+    def _accept(self, flags: UInt64, submitter: Account, provider: Account, amount: UInt64) -> UInt64:
+        assert Txn.sender == submitter, 'Only the submitter can accept'
+        assert flags & QUERY_ANSWERED, 'Not answered'
+        assert not (flags & QUERY_SETTLED), 'Query closed'
+        self._pay(provider, amount)
+        return flags | QUERY_PAID
+
+    @subroutine
+    def _timeout(self, query_id: UInt64, flags: UInt64, answer_deadline: UInt64, accept_deadline: UInt64,
+                 submitter: Account, provider: Account, amount: UInt64) -> UInt64:
+        # New flags once a deadline has passed; unchanged when nothing is due yet
+        if flags & QUERY_SETTLED:
+            return flags
+        if not (flags & QUERY_ANSWERED):
+            if Global.round > answer_deadline:
+                self._pay(submitter, amount)
+                self._mark_pending(query_id, False)
+                return flags | QUERY_REFUNDED
+        elif Global.round > accept_deadline:
+            self._pay(provider, amount)
+            return flags | QUERY_PAID
+        return flags
+
+    @subroutine
+    def _pay(self, receiver: Account, amount: UInt64) -> None:
+        itxn.AssetTransfer(xfer_asset=self.token, asset_amount=amount, asset_receiver=receiver, fee=0).submit()
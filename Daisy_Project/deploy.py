@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import argparse
+import base64
 import logging
 import os
 
@@ -16,6 +18,7 @@ from algokit_utils.transactions import (
 )
 
 import client as client_mod
+import client_views
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
@@ -60,10 +63,40 @@ def create_daisy_asa(algorand: AlgorandClient, deployer):
     return asset_id
 
 
-def deploy_app_via_factory(algorand: AlgorandClient, deployer, token_id: int, query_fee_tokens: int):
+def unrouted_methods(app_spec) -> list:
+    """
+    ABI methods the app spec declares but its compiled approval program does not route.
+
+    client.py is generated from the ARC-56 spec, which embeds both the method list and the
+    program; when contract.py gains methods the program must be recompiled too, otherwise the
+    factory would deploy the old contract.
+    """
+    if app_spec.byte_code and app_spec.byte_code.approval:
+        program = base64.b64decode(app_spec.byte_code.approval)
+        return [m.to_abi_method().get_signature() for m in app_spec.methods
+                if m.to_abi_method().get_selector() not in program]
+    teal = base64.b64decode(app_spec.source.approval).decode() if app_spec.source else ""
+    return [sig for sig in (m.to_abi_method().get_signature() for m in app_spec.methods)
+            if f'method "{sig}"' not in teal]
+
+
+def deploy_app_via_factory(algorand: AlgorandClient, deployer, token_id: int, query_fee_tokens: int,
+                           check_program: bool = True):
     """
     Use your generated Factory to deploy and get (app_client, app_id).
+    Refuses (SystemExit) to deploy a compiled program that is older than the app spec, unless
+    `check_program` is False.
     """
+    if check_program:
+        missing = unrouted_methods(client_mod.APP_SPEC)
+        if missing:
+            raise SystemExit(
+                "The compiled program in client.py is stale: it does not route "
+                f"{', '.join(missing)}. Recompile with `algokit compile py contract.py --out-dir "
+                "../Misc_Contract --output-arc56` and regenerate client.py with `algokitgen-py -a "
+                "../Misc_Contract/DecentralizedAiContract.arc56.json -o client.py` before deploying."
+            )
+
     Factory = getattr(client_mod, "DecentralizedAiContractFactory")
     CreateArgs = getattr(client_mod, "CreateArgs")
 
@@ -86,18 +119,50 @@ def deploy_app_via_factory(algorand: AlgorandClient, deployer, token_id: int, qu
     return app_client, app_id
 
 
-def fund_app_account_for_asa_opt_in(algorand: AlgorandClient, deployer, app_id: int):
+# Minimum balance (micro-ALGO) the app account has to hold before posts can create boxes
+ACCOUNT_MBR = 100_000
+ASSET_MBR = 100_000  # DAISY opt-in
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+QUERY_BOX_BYTES = 8 + 98  # key (after the 1-byte prefix) + Query record without its two texts
+QUERY_REF_BOX_BYTES = 8 + client_views.QUERY_REF_LAYOUT.size
+APP_FUNDED_QUERIES = int(os.getenv("APP_FUNDED_QUERIES", "20"))
+APP_QUERY_TEXT_BYTES = int(os.getenv("APP_QUERY_TEXT_BYTES", "512"))  # query + response, per query
+
+
+def _box_mbr(name_len: int, size: int) -> int:
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (name_len + size)
+
+
+def app_funding(queries: int = APP_FUNDED_QUERIES, text_bytes: int = APP_QUERY_TEXT_BYTES) -> int:
+    """
+    micro-ALGO the app account needs for `queries` inline queries of `text_bytes` query plus
+    response text: its own and the DAISY opt-in minimum balance, the pending-work (P) and
+    expiry index (X) boxes the first post creates (~0.41 ALGO each) and one query box per query.
+    A `post_query_ref` box needs less (QUERY_REF_BOX_BYTES, no text).
+    """
+    shared = (_box_mbr(len(client_views.PENDING_BOX_NAME),
+                       client_views.PENDING_HEADER_BYTES + client_views.PENDING_CAPACITY // 8)
+              + _box_mbr(len(client_views.EXPIRY_BOX_NAME), client_views.EXPIRY_SLOTS * client_views.EXPIRY_SLOT.size))
+    per_query = _box_mbr(len(client_views.QUERY_KEY_PREFIX), QUERY_BOX_BYTES + text_bytes)
+    return ACCOUNT_MBR + ASSET_MBR + shared + queries * per_query
+
+
+def fund_app_account(algorand: AlgorandClient, deployer, app_id: int, queries: int = APP_FUNDED_QUERIES):
     """
-    Fund the app account to cover MBR increase from ASA opt-in.
+    Fund the app account for the DAISY opt-in, the P and X boxes and `queries` query boxes
+    (see app_funding). Without the boxes' share the first post fails its minimum balance check.
     """
     app_addr = get_application_address(app_id)
+    amount = app_funding(queries)
     pay = PaymentParams(
         sender=deployer.address,
         receiver=app_addr,
-        amount=AlgoAmount.from_algo(0.30),  # safe headroom
+        amount=AlgoAmount.from_micro_algo(amount),
     )
     algorand.send.payment(pay)
-    log.info("Funded app account %s with 0.30 ALGO", app_addr)
+    log.info("Funded app account %s with %.6f ALGO (opt-in, P/X boxes, %s queries)",
+             app_addr, amount / 1_000_000, queries)
 
 
 def opt_in_app_to_asa(app_client, *, cover_inner_fees: bool = True):
@@ -116,7 +181,28 @@ def opt_in_app_to_asa(app_client, *, cover_inner_fees: bool = True):
     log.info("Opt-in inner transaction submitted successfully.")
 
 
+def check_program() -> int:
+    """`--check`: report whether client.py's compiled program routes every method; returns the exit code."""
+    missing = unrouted_methods(client_mod.APP_SPEC)
+    if not missing:
+        print(f"The compiled program routes all {len(client_mod.APP_SPEC.methods)} methods of the app spec.")
+        return 0
+    print(f"The compiled program in client.py does not route {len(missing)} of the app spec's methods:")
+    for sig in missing:
+        print(f"  {sig}")
+    print("Recompile contract.py (`algokit compile py contract.py --out-dir ../Misc_Contract --output-arc56`) "
+          "and regenerate client.py from the new arc56 before deploying.")
+    return 1
+
+
 def main():
+    ap = argparse.ArgumentParser(description="Create the DAISY ASA, deploy the contract and fund its account.")
+    ap.add_argument("--check", action="store_true",
+                    help="only check that the compiled program routes every method in the app spec")
+    args = ap.parse_args()
+    if args.check:
+        raise SystemExit(check_program())
+
     # Choose network from environment (LOCAL: set ALGOD host/token via Algokit)
     algorand = AlgorandClient.from_environment()
     deployer = get_deployer(algorand)
@@ -129,8 +215,8 @@ def main():
         algorand, deployer, token_id=asa_id, query_fee_tokens=1_000
     )
 
-    # 3) Fund app address for ASA opt-in
-    fund_app_account_for_asa_opt_in(algorand, deployer, app_id)
+    # 3) Fund app address for ASA opt-in, the shared boxes and the first APP_FUNDED_QUERIES queries
+    fund_app_account(algorand, deployer, app_id)
 
     # 4) Inner opt-in to DAISY
     opt_in_app_to_asa(app_client, cover_inner_fees=True)
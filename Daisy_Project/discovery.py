@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Event-driven query discovery for ai_node.py.
+
+Instead of sleeping POLL_SECONDS between reads of `next_query_id`, the node long-polls
+algod (`/v2/status/wait-for-block-after/{round}`), fetches each new block and pulls the
+calls to our APP_ID out of it. New queries and answers come from the contract's ARC-28
+QueryCreated / ResponseSubmitted logs, whichever method (or outer app) made the call, so no
+box or global-state read is needed to learn about new work. Blocks from a deployment that
+predates the events fall back to the post_query* ABI return and the submit_response* args.
+"""
+import logging
+import threading
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import msgpack
+from algosdk import encoding
+from algosdk.abi import Method
+
+from client_views import QueryCreated, ResponseSubmitted, decode_events
+from metrics import span
+
+log = logging.getLogger("ai_provider.discovery")
+
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+POST_QUERY_SIGNATURES = (
+    "post_query(string,axfer)uint64",
+    "post_query_for(string,axfer)uint64",
+    "post_query_ref(byte[32],uint64,axfer)uint64",
+)
+
+ANSWER_SIGNATURES = ("submit_response(uint64,string)void", "submit_response_ref(uint64,byte[32],uint64)void")
+
+
+def _selectors(signatures: Iterable[str]) -> set:
+    return {Method.from_signature(sig).get_selector() for sig in signatures}
+
+
+def _iter_app_calls(entries: list):
+    """Yield (txn, apply_data) for every app call in a block, including inner transactions."""
+    for entry in entries or []:
+        txn = entry.get("txn", {})
+        dt = entry.get("dt", {})
+        if txn.get("type") == "appl":
+            yield txn, dt
+        yield from _iter_app_calls(dt.get("itx", []))
+
+
+def events_from_block(block: dict, app_id: int) -> list:
+    """Return every QueryCreated / ResponseSubmitted event `app_id` logged in `block`, in order."""
+    found = []
+    for txn, dt in _iter_app_calls(block.get("txns", [])):
+        if txn.get("apid") == app_id:
+            found.extend(decode_events(dt.get("lg") or []))
+    return found
+
+
+def query_ids_from_block(block: dict, app_id: int, selectors: set) -> List[int]:
+    """
+    Return the ids of queries created in `block` by calls to `app_id`: from their QueryCreated
+    events, or for calls without events, from the ABI return of methods whose selector is in `selectors`.
+    """
+    found = []
+    for txn, dt in _iter_app_calls(block.get("txns", [])):
+        if txn.get("apid") != app_id:
+            continue
+        created = [e.query_id for e in decode_events(dt.get("lg") or []) if isinstance(e, QueryCreated)]
+        if created:
+            found.extend(created)
+            continue
+        args = txn.get("apaa") or []
+        if not args or args[0] not in selectors:
+            continue
+        logs = dt.get("lg") or []
+        ret = logs[-1] if logs else b""
+        if ret[:4] != ABI_RETURN_PREFIX or len(ret) < 12:
+            log.warning("post_query call without an ABI return log in block; skipping")
+            continue
+        found.append(int.from_bytes(ret[4:12], "big"))
+    return found
+
+
+def answers_from_block(block: dict, app_id: int, selectors: set) -> List[Tuple[int, str]]:
+    """
+    Return (query id, provider address) for every answer to `app_id` in `block`: from ResponseSubmitted
+    events, or for calls without events, from the args of methods whose selector is in `selectors`.
+    """
+    found = []
+    for txn, dt in _iter_app_calls(block.get("txns", [])):
+        if txn.get("apid") != app_id:
+            continue
+        answered = [(e.query_id, e.provider) for e in decode_events(dt.get("lg") or [])
+                    if isinstance(e, ResponseSubmitted)]
+        if answered:
+            found.extend(answered)
+            continue
+        args = txn.get("apaa") or []
+        if len(args) < 2 or args[0] not in selectors or len(args[1]) != 8:
+            continue
+        found.append((int.from_bytes(args[1], "big"), encoding.encode_address(txn["snd"])))
+    return found
+
+
+class BlockDiscovery:
+    """
+    Follow new blocks and report query ids as soon as the round containing them is committed.
+
+    Parameters
+    ----------
+    algod: algosdk AlgodClient (or anything with status / status_after_block / block_info)
+    app_id: application to watch
+    on_query: called with each new query id, in block order
+    on_fallback: called periodically when block following fails (the node's plain poll)
+    on_answer: called with (query id, provider address) for each answer seen (e.g. sharding.ShardMap)
+    fallback_seconds: how long to wait between fallback polls while algod is unhealthy
+    """
+
+    def __init__(
+        self,
+        algod,
+        app_id: int,
+        on_query: Callable[[int], None],
+        on_fallback: Optional[Callable[[], None]] = None,
+        fallback_seconds: float = 6.0,
+        start_round: Optional[int] = None,
+        signatures: Iterable[str] = POST_QUERY_SIGNATURES,
+        on_answer: Optional[Callable[[int, str], None]] = None,
+    ):
+        self.algod = algod
+        self.app_id = app_id
+        self.on_query = on_query
+        self.on_fallback = on_fallback
+        self.fallback_seconds = fallback_seconds
+        self.last_round = start_round
+        self._selectors = _selectors(signatures)
+        self.on_answer = on_answer
+        self._answer_selectors = _selectors(ANSWER_SIGNATURES)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def scan_round(self, rnd: int) -> List[int]:
+        with span("discovery"):
+            raw = self.algod.block_info(rnd, response_format="msgpack")
+            block = msgpack.unpackb(raw, raw=False, strict_map_key=False).get("block", {})
+            if self.on_answer is not None:
+                for qid, provider in answers_from_block(block, self.app_id, self._answer_selectors):
+                    self.on_answer(qid, provider)
+            return query_ids_from_block(block, self.app_id, self._selectors)
+
+    def step(self) -> List[int]:
+        """Wait for the next round(s) and scan them. Returns the query ids found."""
+        if self.last_round is None:
+            self.last_round = int(self.algod.status()["last-round"])
+        status = self.algod.status_after_block(self.last_round)
+        latest = int(status["last-round"])
+        found = []
+        for rnd in range(self.last_round + 1, latest + 1):
+            qids = self.scan_round(rnd)
+            for qid in qids:
+                self.on_query(qid)
+            found.extend(qids)
+            self.last_round = rnd
+        return found
+
+    def run(self) -> None:
+        log.info("Following blocks for app_id=%s from round %s", self.app_id, self.last_round)
+        while not self._stop.is_set():
+            try:
+                self.step()
+            except Exception as e:
+                log.warning("Block following failed (%s); falling back to polling for %ss", e, self.fallback_seconds)
+                if self.on_fallback is not None:
+                    try:
+                        self.on_fallback()
+                    except Exception as fe:
+                        log.error("Fallback poll failed: %s", fe)
+                # Re-sync to the tip after an outage; the fallback poll covers the gap
+                self.last_round = None
+                self._stop.wait(self.fallback_seconds)
+
+    def start(self) -> "BlockDiscovery":
+        self._thread = threading.Thread(target=self.run, name="discovery", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
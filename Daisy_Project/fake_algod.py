@@ -0,0 +1,1012 @@
+#!/usr/bin/env python3
+"""
+In-process fake algod with a model of the DAISY contract.
+
+FakeAlgod is an `algosdk` AlgodClient whose HTTP layer is replaced by an in-memory ledger,
+so `AlgorandClient.from_clients(algod=FakeAlgod())`, the generated client, deploy.py and
+the Refill/ scripts run unchanged without a LocalNet. Implemented endpoints:
+
+- suggested params, versions, status, wait-for-block-after, blocks (msgpack)
+- send transactions (every accepted group is committed as its own block), pending info
+- account / account asset / asset / application info, box reads and box listing
+- simulate (with failed-at / failure-message), TEAL compile (returns placeholder bytes)
+
+Payments, ASA create/opt-in/transfer, fees pooled across groups, minimum balances (accounts,
+assets, apps, boxes) and atomic rollback are modelled. Every app runs DaisyApp, a Python
+port of contract.py; the approval program itself is never executed and signatures are not
+verified.
+
+Synthetic blocks can still be appended directly with `add_block` / `produce_blocks` to
+exercise discovery.py.
+"""
+import base64
+import functools
+import hashlib
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import msgpack
+from algosdk import encoding
+from algosdk.abi import ABIType, Method
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+from algosdk.transaction import OnComplete, Transaction
+from algosdk.v2client.algod import AlgodClient
+
+from discovery import ABI_RETURN_PREFIX
+
+MIN_FEE = 1_000
+MAX_GROUP_SIZE = 16
+ACCOUNT_MBR = 100_000
+ASSET_MBR = 100_000
+APP_MBR = 100_000
+APP_UINT_MBR = 28_500
+APP_BYTES_MBR = 50_000
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+
+_ADDRESS_FIELDS = {"snd", "rcv", "arcv", "asnd", "close", "aclose", "rekey"}
+_MISSING = object()
+
+
+class _Journal:
+    """Undo log: every ledger write goes through here so a failed group can be rolled back."""
+
+    def __init__(self):
+        self._entries = []
+
+    def set(self, d: dict, key, value) -> None:
+        self._entries.append((d, key, d.get(key, _MISSING)))
+        d[key] = value
+
+    def delete(self, d: dict, key) -> None:
+        if key in d:
+            self._entries.append((d, key, d[key]))
+            del d[key]
+
+    def rollback(self) -> None:
+        for d, key, old in reversed(self._entries):
+            if old is _MISSING:
+                d.pop(key, None)
+            else:
+                d[key] = old
+        self._entries.clear()
+
+
+class _Reject(Exception):
+    """A transaction in the group failed; `index` is its position in the group."""
+
+    def __init__(self, message: str, index: int = 0):
+        super().__init__(message)
+        self.index = index
+
+
+# Address <-> public key conversions hash a checksum each time; the same few accounts recur
+_encode_address = functools.lru_cache(maxsize=4096)(encoding.encode_address)
+_decode_address = functools.lru_cache(maxsize=4096)(encoding.decode_address)
+
+
+def _jsonable(obj, key: str = ""):
+    """Render a msgpack transaction dict the way algod's JSON API does (addresses, base64)."""
+    if isinstance(obj, dict):
+        return {k: _jsonable(v, k) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_jsonable(v, key) for v in obj]
+    if isinstance(obj, bytes):
+        if key in _ADDRESS_FIELDS and len(obj) == 32:
+            return _encode_address(obj)
+        return base64.b64encode(obj).decode()
+    return obj
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def _txid(raw_txn: dict) -> str:
+    """Transaction id straight from the wire dict (already canonical), skipping a re-encode."""
+    digest = hashlib.new("sha512_256", b"TX" + msgpack.packb(raw_txn, use_bin_type=True)).digest()
+    return base64.b32encode(digest).decode().rstrip("=")
+
+
+# ------------ DAISY contract model ------------
+
+_QUERY = ABIType.from_string("(address,string,address,string,bool,uint64,uint64,uint64,uint8)")
+_QUERY_REF = ABIType.from_string(
+    "(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)")
+# Positions of the escrow fields in each decoded record, by box name prefix
+_ESCROW_FIELDS = {
+    b"Q": (_QUERY, {"submitter": 0, "provider": 2, "fee": 5, "answer_by": 6, "accept_by": 7, "flags": 8}),
+    b"R": (_QUERY_REF, {"submitter": 0, "provider": 1, "fee": 2, "flags": 7, "answer_by": 10, "accept_by": 11}),
+}
+_QUERY_ANSWERED = 1
+_QUERY_PAID = 2
+_QUERY_REFUNDED = 4
+_QUERY_SETTLED = _QUERY_PAID | _QUERY_REFUNDED
+_ANSWER_WINDOW_ROUNDS = 1000
+_REVIEW_WINDOW_ROUNDS = 1000
+_MAX_TIMEOUT_QUERIES = 3
+_EXPIRY_BOX = b"X"
+_EXPIRY_BUCKET_ROUNDS = 100
+_EXPIRY_SLOTS = 64
+_MAX_BATCH_QUERIES = 6
+_MAX_RECLAIM_QUERIES = 8
+_PENDING_BOX = b"P"
+_PENDING_HEADER_BYTES = 8
+_PENDING_CAPACITY = 8128
+_RECLAIM_AFTER_QUERIES = _PENDING_CAPACITY
+
+
+def _event(signature: str):
+    """(log prefix, ABI tuple type) of an ARC-28 event such as "QueryCreated(uint64,address)"."""
+    return encoding.checksum(signature.encode())[:4], ABIType.from_string(signature[signature.index("("):])
+
+
+_QUERY_CREATED = _event("QueryCreated(uint64,address,uint64,uint64,byte[32])")
+_RESPONSE_SUBMITTED = _event("ResponseSubmitted(uint64,address,uint64,uint64,byte[32])")
+
+
+def _abimethod(signature: str):
+    def register(fn):
+        fn.abi_method = Method.from_signature(signature)
+        return fn
+    return register
+
+
+class DaisyApp:
+    """
+    Python port of DecentralizedAiContract (contract.py), operating on ledger state through
+    an _AppCall context. Box values use the same ARC-4 encodings as the real contract.
+    """
+
+    def __init__(self):
+        self.methods: Dict[bytes, Callable] = {}
+        for name in dir(self):
+            fn = getattr(self, name)
+            if hasattr(fn, "abi_method"):
+                self.methods[fn.abi_method.get_selector()] = fn
+
+    @staticmethod
+    def _check_fee_transfer(call: "_AppCall", payment) -> None:
+        call.require(payment.index == call.global_get(b"token"), "Wrong token")
+        call.require(payment.receiver == call.app_address, "Payment must go to contract")
+        call.require(payment.amount == call.global_get(b"query_fee"), "Wrong fee amount")
+
+    @classmethod
+    def _check_query_payment(cls, call: "_AppCall", payment) -> None:
+        cls._check_fee_transfer(call, payment)
+        call.require(payment.sender == call.sender, "Payment must be from caller")
+
+    @staticmethod
+    def _pay(call: "_AppCall", receiver: str, amount: int) -> None:
+        call.inner_axfer(call.global_get(b"token"), amount, receiver)
+
+    @staticmethod
+    def _load(call: "_AppCall", query_id: int):
+        """(box name, ABI type, decoded values, escrow field positions) of a query, or None."""
+        for prefix, (abi_type, fields) in _ESCROW_FIELDS.items():
+            name = prefix + query_id.to_bytes(8, "big")
+            if name in call.app["boxes"]:
+                return name, abi_type, abi_type.decode(call.box_get(name)), fields
+        return None
+
+    @staticmethod
+    def _check_answer_window(call: "_AppCall", flags: int, answer_deadline: int) -> None:
+        call.require(not flags & _QUERY_SETTLED, "Query closed")
+        call.require(call.round <= answer_deadline, "Answer window closed")
+
+    @staticmethod
+    def _index_expiry(call: "_AppCall", query_id: int) -> None:
+        box = call.app["boxes"].get(_EXPIRY_BOX)
+        box = bytearray(box if box is not None else bytes(_EXPIRY_SLOTS * 16))
+        bucket = call.round // _EXPIRY_BUCKET_ROUNDS
+        offset = (bucket % _EXPIRY_SLOTS) * 16
+        if int.from_bytes(box[offset:offset + 8], "big") != bucket or not any(box[offset + 8:offset + 16]):
+            box[offset:offset + 16] = bucket.to_bytes(8, "big") + query_id.to_bytes(8, "big")
+        call.box_put(_EXPIRY_BOX, bytes(box))
+
+    @staticmethod
+    def _emit(call: "_AppCall", event, *values) -> None:
+        prefix, abi_type = event
+        call.logs.append(prefix + abi_type.encode(list(values)))
+
+    @classmethod
+    def _create_query(cls, call: "_AppCall", submitter: str, query_text: str) -> int:
+        query_id = cls._next_id(call)
+        call.box_put(b"Q" + query_id.to_bytes(8, "big"), _QUERY.encode([
+            _decode_address(submitter), query_text, bytes(32), "", False, call.global_get(b"query_fee"),
+            call.round + _ANSWER_WINDOW_ROUNDS, call.round + _ANSWER_WINDOW_ROUNDS + _REVIEW_WINDOW_ROUNDS, 0,
+        ]))
+        cls._mark_pending(call, query_id, True)
+        cls._index_expiry(call, query_id)
+        data = query_text.encode()
+        cls._emit(call, _QUERY_CREATED, query_id, submitter, call.global_get(b"query_fee"), len(data),
+                  hashlib.sha256(data).digest())
+        return query_id
+
+    @classmethod
+    def _response_submitted(cls, call: "_AppCall", query_id: int, payout: int, length: int, digest) -> None:
+        cls._emit(call, _RESPONSE_SUBMITTED, query_id, call.sender, payout, length, digest)
+
+    @staticmethod
+    def _mark_pending(call: "_AppCall", query_id: int, is_open: bool) -> None:
+        if query_id + _PENDING_CAPACITY < call.global_get(b"next_query_id"):
+            return  # out of the window: its slot belongs to a newer id
+        box = call.app["boxes"].get(_PENDING_BOX)
+        box = bytearray(box if box is not None else bytes(_PENDING_HEADER_BYTES + _PENDING_CAPACITY // 8))
+        slot = query_id % _PENDING_CAPACITY
+        mask = 0x80 >> (slot % 8)
+        offset = _PENDING_HEADER_BYTES + slot // 8
+        box[offset] = box[offset] | mask if is_open else box[offset] & ~mask
+        box[:_PENDING_HEADER_BYTES] = call.global_get(b"next_query_id").to_bytes(8, "big")
+        call.box_put(_PENDING_BOX, bytes(box))
+
+    @staticmethod
+    def _next_id(call: "_AppCall") -> int:
+        query_id = call.global_get(b"next_query_id")
+        call.global_put(b"next_query_id", query_id + 1)
+        return query_id
+
+    @_abimethod("create(asset,uint64)void")
+    def create(self, call: "_AppCall", token_id: int, fee: int) -> None:
+        call.require(call.creating, "can only call when creating")
+        call.global_put(b"governor", _decode_address(call.sender))
+        call.global_put(b"token", token_id)
+        call.global_put(b"query_fee", fee)
+        call.global_put(b"next_query_id", 1)
+
+    @_abimethod("set_governor(account)void")
+    def set_governor(self, call: "_AppCall", new_governor: str) -> None:
+        call.require(call.is_governor(), "Only governor can change governor")
+        call.global_put(b"governor", _decode_address(new_governor))
+
+    @_abimethod("set_fee(uint64)void")
+    def set_fee(self, call: "_AppCall", new_fee: int) -> None:
+        call.require(call.is_governor(), "Only governor can set fee")
+        call.global_put(b"query_fee", new_fee)
+
+    @_abimethod("opt_in_to_token()void")
+    def opt_in_to_token(self, call: "_AppCall") -> None:
+        call.require(call.is_governor(), "Only governor can opt-in")
+        call.inner_axfer(call.global_get(b"token"), 0, call.app_address)
+
+    @_abimethod("withdraw_asset(uint64)void")
+    def withdraw_asset(self, call: "_AppCall", amount: int) -> None:
+        call.require(call.is_governor(), "Only governor can withdraw")
+        call.inner_axfer(call.global_get(b"token"), amount, _encode_address(call.global_get(b"governor")))
+
+    @_abimethod("post_query(string,axfer)uint64")
+    def post_query(self, call: "_AppCall", query_text: str, payment) -> int:
+        self._check_query_payment(call, payment)
+        return self._create_query(call, call.sender, query_text)
+
+    @_abimethod("post_query_for(string,axfer)uint64")
+    def post_query_for(self, call: "_AppCall", query_text: str, payment) -> int:
+        self._check_fee_transfer(call, payment)
+        return self._create_query(call, payment.sender, query_text)
+
+    @_abimethod("post_queries(string[],axfer)uint64")
+    def post_queries(self, call: "_AppCall", query_texts: list, payment) -> int:
+        call.require(query_texts, "No queries")
+        call.require(len(query_texts) <= _MAX_BATCH_QUERIES, "Too many queries")
+        call.require(payment.index == call.global_get(b"token"), "Wrong token")
+        call.require(payment.receiver == call.app_address, "Payment must go to contract")
+        call.require(payment.amount == call.global_get(b"query_fee") * len(query_texts), "Wrong fee amount")
+        call.require(payment.sender == call.sender, "Payment must be from caller")
+        first_id = call.global_get(b"next_query_id")
+        for query_text in query_texts:
+            self._create_query(call, call.sender, query_text)
+        return first_id
+
+    @_abimethod("submit_response(uint64,string)void")
+    def submit_response(self, call: "_AppCall", query_id: int, response_text: str) -> None:
+        key = b"Q" + query_id.to_bytes(8, "big")
+        submitter, query_text, _, _, answered, fee, answer_by, accept_by, flags = _QUERY.decode(call.box_get(key))
+        call.require(not answered, "Already answered")
+        self._check_answer_window(call, flags, answer_by)
+        call.box_put(key, _QUERY.encode([_decode_address(submitter), query_text, _decode_address(call.sender),
+                                          response_text, True, fee, answer_by, accept_by, flags | _QUERY_ANSWERED]))
+        self._mark_pending(call, query_id, False)
+        data = response_text.encode()
+        self._response_submitted(call, query_id, fee, len(data), hashlib.sha256(data).digest())
+
+    @_abimethod("get_query(uint64)(address,string,address,string,bool,uint64,uint64,uint64,uint8)")
+    def get_query(self, call: "_AppCall", query_id: int) -> bytes:
+        return call.box_get(b"Q" + query_id.to_bytes(8, "big"))
+
+    @_abimethod("post_query_ref(byte[32],uint64,axfer)uint64")
+    def post_query_ref(self, call: "_AppCall", query_hash: list, query_len: int, payment) -> int:
+        self._check_query_payment(call, payment)
+        call.require(query_len < 2 ** 32, "overflow")
+        query_id = self._next_id(call)
+        call.box_put(b"R" + query_id.to_bytes(8, "big"), _QUERY_REF.encode([
+            _decode_address(call.sender), bytes(32), payment.amount, call.latest_timestamp, 0,
+            query_len, 0, 0, query_hash, [0] * 32,
+            call.round + _ANSWER_WINDOW_ROUNDS, call.round + _ANSWER_WINDOW_ROUNDS + _REVIEW_WINDOW_ROUNDS,
+        ]))
+        self._mark_pending(call, query_id, True)
+        self._index_expiry(call, query_id)
+        self._emit(call, _QUERY_CREATED, query_id, call.sender, payment.amount, query_len, query_hash)
+        return query_id
+
+    @_abimethod("submit_response_ref(uint64,byte[32],uint64)void")
+    def submit_response_ref(self, call: "_AppCall", query_id: int, response_hash: list, response_len: int) -> None:
+        key = b"R" + query_id.to_bytes(8, "big")
+        sub, _, fee, posted, _, qlen, _, flags, qhash, _, answer_by, accept_by = _QUERY_REF.decode(call.box_get(key))
+        call.require(not flags & _QUERY_ANSWERED, "Already answered")
+        self._check_answer_window(call, flags, answer_by)
+        call.require(response_len < 2 ** 32, "overflow")
+        call.box_put(key, _QUERY_REF.encode([
+            _decode_address(sub), _decode_address(call.sender), fee, posted, call.latest_timestamp,
+            qlen, response_len, flags | _QUERY_ANSWERED, qhash, response_hash, answer_by, accept_by,
+        ]))
+        self._mark_pending(call, query_id, False)
+        self._response_submitted(call, query_id, fee, response_len, response_hash)
+
+    @_abimethod("accept_response(uint64)void")
+    def accept_response(self, call: "_AppCall", query_id: int) -> None:
+        found = self._load(call, query_id)
+        call.require(found, "box not found")
+        name, abi_type, values, f = found
+        call.require(call.sender == values[f["submitter"]], "Only the submitter can accept")
+        call.require(values[f["flags"]] & _QUERY_ANSWERED, "Not answered")
+        call.require(not values[f["flags"]] & _QUERY_SETTLED, "Query closed")
+        self._pay(call, values[f["provider"]], values[f["fee"]])
+        values[f["flags"]] |= _QUERY_PAID
+        call.box_put(name, abi_type.encode(values))
+
+    @_abimethod("timeout_reclaim(uint64[])uint64")
+    def timeout_reclaim(self, call: "_AppCall", query_ids: list) -> int:
+        call.require(len(query_ids) <= _MAX_TIMEOUT_QUERIES, "Too many queries")
+        settled = 0
+        for query_id in query_ids:
+            found = self._load(call, query_id)
+            if found is None:
+                continue
+            name, abi_type, values, f = found
+            flags = values[f["flags"]]
+            if flags & _QUERY_SETTLED:
+                continue
+            if not flags & _QUERY_ANSWERED:
+                if call.round <= values[f["answer_by"]]:
+                    continue
+                self._pay(call, values[f["submitter"]], values[f["fee"]])
+                self._mark_pending(call, query_id, False)
+                values[f["flags"]] = flags | _QUERY_REFUNDED
+            else:
+                if call.round <= values[f["accept_by"]]:
+                    continue
+                self._pay(call, values[f["provider"]], values[f["fee"]])
+                values[f["flags"]] = flags | _QUERY_PAID
+            call.box_put(name, abi_type.encode(values))
+            settled += 1
+        return settled
+
+    @_abimethod("reclaim_queries(uint64[])uint64")
+    def reclaim_queries(self, call: "_AppCall", query_ids: list) -> int:
+        call.require(call.is_governor(), "Only governor can reclaim")
+        call.require(len(query_ids) <= _MAX_RECLAIM_QUERIES, "Too many queries")
+        reclaimed = 0
+        for query_id in query_ids:
+            call.require(query_id + _RECLAIM_AFTER_QUERIES <= call.global_get(b"next_query_id"),
+                         "Query inside retention window")
+            found = self._load(call, query_id)
+            if found is not None:
+                name, _, values, f = found
+                call.require(values[f["flags"]] & _QUERY_SETTLED, "Query not settled")
+                call.box_delete(name)
+                reclaimed += 1
+        return reclaimed
+
+    @_abimethod("get_query_ref(uint64)(address,address,uint64,uint64,uint64,uint32,uint32,uint8,byte[32],byte[32],uint64,uint64)")
+    def get_query_ref(self, call: "_AppCall", query_id: int) -> bytes:
+        return call.box_get(b"R" + query_id.to_bytes(8, "big"))
+
+
+class _AppCall:
+    """Execution context handed to DaisyApp methods for one app call."""
+
+    def __init__(self, ledger: "FakeAlgod", journal: _Journal, group: List[Transaction], index: int, app_id: int):
+        self.ledger = ledger
+        self.journal = journal
+        self.group = group
+        self.index = index
+        self.txn = group[index]
+        self.app_id = app_id
+        self.app = ledger._apps[app_id]
+        self.app_address = get_application_address(app_id)
+        self.sender = self.txn.sender
+        self.creating = not self.txn.index
+        self.latest_timestamp = ledger._blocks[-1].get("ts", 0)
+        self.round = ledger.last_round + 1  # the block this group lands in
+        self.logs: List[bytes] = []
+        self.inner: List[dict] = []
+
+    def require(self, cond, message: str) -> None:
+        if not cond:
+            raise _Reject(f"logic eval error: assert failed. Details: app={self.app_id} // {message}", self.index)
+
+    def is_governor(self) -> bool:
+        return _decode_address(self.sender) == self.global_get(b"governor")
+
+    def global_get(self, key: bytes):
+        return self.app["global"].get(key, 0)
+
+    def global_put(self, key: bytes, value) -> None:
+        self.journal.set(self.app["global"], key, value)
+
+    def box_get(self, name: bytes) -> bytes:
+        value = self.app["boxes"].get(name)
+        self.require(value is not None, "box not found")
+        return value
+
+    def box_put(self, name: bytes, value: bytes) -> None:
+        old = self.app["boxes"].get(name)
+        delta = BOX_BYTE_MBR * (len(value) - len(old)) if old is not None else \
+            BOX_FLAT_MBR + BOX_BYTE_MBR * (len(name) + len(value))
+        self.journal.set(self.app, "box_mbr", self.app["box_mbr"] + delta)
+        self.journal.set(self.app["boxes"], name, value)
+        self.ledger._touched.add(self.app_address)
+
+    def box_delete(self, name: bytes) -> None:
+        value = self.box_get(name)
+        self.journal.set(self.app, "box_mbr", self.app["box_mbr"] - BOX_FLAT_MBR - BOX_BYTE_MBR * (len(name) + len(value)))
+        self.journal.delete(self.app["boxes"], name)
+        self.ledger._touched.add(self.app_address)
+
+    def inner_axfer(self, asset_id: int, amount: int, receiver: str) -> None:
+        self.ledger._asset_transfer(self.journal, self.app_address, receiver, asset_id, amount, self.index)
+        self.ledger._touched.update((self.app_address, receiver))
+        txn = {"type": "axfer", "snd": _decode_address(self.app_address), "xaid": asset_id,
+               "arcv": _decode_address(receiver), "fv": self.txn.first_valid_round,
+               "lv": self.txn.last_valid_round}
+        if amount:
+            txn["aamt"] = amount
+        self.inner.append(txn)
+
+
+# ------------ Fake algod ------------
+
+class FakeAlgod(AlgodClient):
+    """
+    In-memory algod. Construct, fund accounts with `fund`, then wrap in an AlgorandClient
+    (`fake_algorand(algod)`) or pass it anywhere an AlgodClient is expected.
+
+    `status_after_block` blocks like the real endpoint until a later round exists or
+    `wait_timeout` seconds pass, whichever comes first. `calls` counts requests per endpoint;
+    `view()` gives another client on the same ledger with its own count (one per simulated party).
+    Each callable in `block_listeners` gets every new block dict as it is appended.
+    """
+
+    def __init__(self, wait_timeout: float = 5.0, genesis_id: str = "fake-v1"):
+        super().__init__("", "http://fake-algod")
+        self.wait_timeout = wait_timeout
+        self.genesis_id = genesis_id
+        self.genesis_hash = _b64(hashlib.sha256(genesis_id.encode()).digest())
+        self._blocks: List[dict] = [{"rnd": 0, "ts": int(time.time()), "txns": []}]
+        self._cond = threading.Condition(threading.RLock())
+        self._accounts: Dict[str, dict] = {}
+        self._assets: Dict[int, dict] = {}
+        self._apps: Dict[int, dict] = {}
+        self._app_by_address: Dict[str, int] = {}
+        self._pending: Dict[str, tuple] = {}  # txid -> (raw signed txn, apply result, round)
+        self._counters = {"next_id": 1001}
+        self._touched: set = set()
+        self.daisy = DaisyApp()
+        self.calls: Dict[str, int] = {}
+        self.block_listeners: List[Callable[[dict], None]] = []
+
+    def view(self) -> "FakeAlgodView":
+        return FakeAlgodView(self)
+
+    @property
+    def last_round(self) -> int:
+        with self._cond:
+            return len(self._blocks) - 1
+
+    def add_block(self, txns: Optional[list] = None) -> int:
+        with self._cond:
+            rnd = len(self._blocks)
+            block = {"rnd": rnd, "ts": int(time.time()), "txns": txns or []}
+            self._blocks.append(block)
+            for listener in self.block_listeners:
+                listener(block)
+            self._cond.notify_all()
+            return rnd
+
+    def fund(self, address: str, micro_algos: int) -> None:
+        """Credit `address` out of thin air (the dispenser)."""
+        with self._cond:
+            self._account(address)["amount"] += micro_algos
+
+    # --- HTTP layer replacement ---
+    _ROUTES = [
+        ("GET", re.compile(r"/transactions/params$"), "_suggested_params"),
+        ("GET", re.compile(r"/versions$"), "_versions"),
+        ("GET", re.compile(r"/status$"), "_status"),
+        ("GET", re.compile(r"/status/wait-for-block-after/(\d+)$"), "_status_after"),
+        ("GET", re.compile(r"/blocks/(\d+)$"), "_block"),
+        ("POST", re.compile(r"/transactions$"), "_send"),
+        ("GET", re.compile(r"/transactions/pending/(\w+)$"), "_pending_info"),
+        ("POST", re.compile(r"/transactions/simulate$"), "_simulate"),
+        ("POST", re.compile(r"/teal/compile$"), "_compile"),
+        ("GET", re.compile(r"/accounts/(\w+)$"), "_account_info"),
+        ("GET", re.compile(r"/accounts/(\w+)/assets/(\d+)$"), "_account_asset_info"),
+        ("GET", re.compile(r"/assets/(\d+)$"), "_asset_info"),
+        ("GET", re.compile(r"/applications/(\d+)$"), "_application_info"),
+        ("GET", re.compile(r"/applications/(\d+)/box$"), "_box"),
+        ("GET", re.compile(r"/applications/(\d+)/boxes$"), "_boxes"),
+    ]
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json",
+                      timeout=30):
+        return self._dispatch(method, requrl, params, data, response_format)
+
+    def _dispatch(self, method, requrl, params, data, response_format, calls: Optional[Dict[str, int]] = None):
+        for verb, pattern, handler in self._ROUTES:
+            m = pattern.match(requrl)
+            if verb == method and m:
+                name = handler.lstrip("_")
+                self.calls[name] = self.calls.get(name, 0) + 1
+                if calls is not None:
+                    calls[name] = calls.get(name, 0) + 1
+                return getattr(self, handler)(*m.groups(), params=params or {}, data=data,
+                                              response_format=response_format)
+        raise AlgodHTTPError(f"fake algod does not implement {method} {requrl}", 501)
+
+    # --- read endpoints ---
+    def _suggested_params(self, **_) -> dict:
+        return {"fee": 0, "min-fee": MIN_FEE, "last-round": self.last_round, "genesis-id": self.genesis_id,
+                "genesis-hash": self.genesis_hash, "consensus-version": "future"}
+
+    def _versions(self, **_) -> dict:
+        return {"genesis_id": self.genesis_id, "genesis_hash_b64": self.genesis_hash,
+                "versions": ["v2"], "build": {"major": 0, "minor": 0, "build_number": 0}}
+
+    def _status(self, **_) -> dict:
+        return {"last-round": self.last_round, "time-since-last-round": 0, "catchup-time": 0,
+                "last-version": "future"}
+
+    def _status_after(self, rnd: str, **_) -> dict:
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._blocks) - 1 > int(rnd), timeout=self.wait_timeout)
+        return self._status()
+
+    def _block(self, rnd: str, response_format: str = "json", **_):
+        with self._cond:
+            if int(rnd) >= len(self._blocks):
+                raise AlgodHTTPError("ledger does not have entry", 404)
+            payload = {"block": self._blocks[int(rnd)]}
+        if response_format == "msgpack":
+            return msgpack.packb(payload, use_bin_type=True)
+        return payload
+
+    def _pending_info(self, txid: str, **_) -> dict:
+        with self._cond:
+            entry = self._pending.get(txid)
+        if entry is None:
+            raise AlgodHTTPError("txn does not exist", 404)
+        return self._txn_info(*entry)
+
+    def _account(self, address: str) -> dict:
+        acct = self._accounts.get(address)
+        if acct is None:
+            acct = self._accounts[address] = {"amount": 0, "assets": {}, "apps": set(), "created_assets": set()}
+        return acct
+
+    def _min_balance(self, address: str) -> int:
+        acct = self._accounts.get(address)
+        if acct is None:
+            return 0
+        mbr = ACCOUNT_MBR + ASSET_MBR * len(acct["assets"])
+        for app_id in acct["apps"]:
+            schema = self._apps[app_id]["schema"]
+            mbr += APP_MBR + APP_UINT_MBR * schema[0] + APP_BYTES_MBR * schema[1]
+        app_id = self._app_by_address.get(address)
+        if app_id is not None:
+            mbr += self._apps[app_id]["box_mbr"]
+        return mbr
+
+    def _account_info(self, address: str, **_) -> dict:
+        with self._cond:
+            acct = self._accounts.get(address) or {"amount": 0, "assets": {}, "apps": set(), "created_assets": set()}
+            return {
+                "address": address, "amount": acct["amount"], "min-balance": self._min_balance(address),
+                "round": self.last_round, "status": "Offline",
+                "assets": [{"asset-id": a, "amount": n, "is-frozen": False} for a, n in acct["assets"].items()],
+                "created-apps": [{"id": a} for a in sorted(acct["apps"])],
+                "created-assets": [{"index": a} for a in sorted(acct["created_assets"])],
+                "total-apps-opted-in": 0, "total-assets-opted-in": len(acct["assets"]),
+                "total-created-apps": len(acct["apps"]), "total-created-assets": len(acct["created_assets"]),
+                "total-box-bytes": 0, "total-boxes": 0,
+            }
+
+    def _account_asset_info(self, address: str, asset_id: str, **_) -> dict:
+        with self._cond:
+            acct = self._accounts.get(address)
+            if acct is None or int(asset_id) not in acct["assets"]:
+                raise AlgodHTTPError("account asset info not found", 404)
+            holding = {"asset-id": int(asset_id), "amount": acct["assets"][int(asset_id)], "is-frozen": False}
+            return {"round": self.last_round, "asset-holding": holding}
+
+    def _asset_info(self, asset_id: str, **_) -> dict:
+        with self._cond:
+            asset = self._assets.get(int(asset_id))
+            if asset is None:
+                raise AlgodHTTPError("asset does not exist", 404)
+            return {"index": int(asset_id), "params": dict(asset)}
+
+    def _app(self, app_id) -> dict:
+        app = self._apps.get(int(app_id))
+        if app is None:
+            raise AlgodHTTPError("application does not exist", 404)
+        return app
+
+    def _application_info(self, app_id: str, **_) -> dict:
+        with self._cond:
+            app = self._app(app_id)
+            state = [{"key": _b64(k), "value": {"type": 1, "bytes": _b64(v), "uint": 0} if isinstance(v, bytes)
+                      else {"type": 2, "bytes": "", "uint": v}} for k, v in app["global"].items()]
+            return {"id": int(app_id), "params": {
+                "creator": app["creator"], "approval-program": _b64(app["approval"]),
+                "clear-state-program": _b64(app["clear"]), "global-state": state,
+                "global-state-schema": {"num-uint": app["schema"][0], "num-byte-slice": app["schema"][1]},
+                "local-state-schema": {"num-uint": 0, "num-byte-slice": 0},
+            }}
+
+    def _box(self, app_id: str, params: dict, **_) -> dict:
+        name = base64.b64decode(params["name"].split(":", 1)[1])
+        with self._cond:
+            value = self._app(app_id)["boxes"].get(name)
+        if value is None:
+            raise AlgodHTTPError("box not found", 404)
+        return {"name": _b64(name), "value": _b64(value), "round": self.last_round}
+
+    def _boxes(self, app_id: str, **_) -> dict:
+        with self._cond:
+            return {"boxes": [{"name": _b64(n)} for n in self._app(app_id)["boxes"]]}
+
+    def _compile(self, params: dict, data: bytes, **_) -> dict:
+        program = b"\x0a" + hashlib.sha256(data).digest()
+        compiled = {"hash": encoding.encode_address(hashlib.sha256(b"Program" + program).digest()),
+                    "result": _b64(program)}
+        if str(params.get("sourcemap")).lower() == "true":
+            compiled["sourcemap"] = {"version": 3, "sources": [], "names": [], "mappings": ""}
+        return compiled
+
+    # --- write endpoints ---
+    @staticmethod
+    def _decode_group(raw_txns: List[dict]) -> List[Transaction]:
+        return [Transaction.undictify(d["txn"]) for d in raw_txns]
+
+    def _send(self, data: bytes, **_) -> dict:
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(data)
+        raw_txns = list(unpacker)
+        txns = self._decode_group(raw_txns)
+        txids = [_txid(d["txn"]) for d in raw_txns]
+        with self._cond:
+            try:
+                results = self._apply(txns, txids)
+            except _Reject as e:
+                raise AlgodHTTPError(f"TransactionPool.Remember: transaction {txids[e.index]}: {e}", 400) from None
+            self._commit(raw_txns, txids, results)
+        return {"txId": txids[0]}
+
+    def _simulate(self, data: bytes, **_) -> dict:
+        request = msgpack.unpackb(data, raw=False)
+        groups = []
+        with self._cond:
+            for group in request.get("txn-groups", []):
+                raw_txns = group["txns"]
+                txns = self._decode_group(raw_txns)
+                txids = [_txid(d["txn"]) for d in raw_txns]
+                entry: dict = {}
+                try:
+                    results = self._apply(txns, txids, dry_run=True)
+                except _Reject as e:
+                    entry["failure-message"] = f"transaction {txids[e.index]}: {e}"
+                    entry["failed-at"] = [e.index]
+                    results = [{} for _ in txns]
+                entry["txn-results"] = [{"txn-result": self._txn_info(raw, res, 0)}
+                                        for raw, res in zip(raw_txns, results)]
+                groups.append(entry)
+        return {"version": 2, "last-round": self.last_round, "txn-groups": groups}
+
+    def _apply(self, txns: List[Transaction], txids: List[str], dry_run: bool = False) -> List[dict]:
+        if len(txns) > MAX_GROUP_SIZE:
+            raise _Reject(f"group size {len(txns)} exceeds maximum {MAX_GROUP_SIZE}")
+        journal = _Journal()
+        results = []
+        try:
+            next_round = self.last_round + 1
+            for i, txn in enumerate(txns):
+                if not txn.first_valid_round <= next_round <= txn.last_valid_round:
+                    raise _Reject(f"txn dead: round {next_round} outside of {txn.first_valid_round}"
+                                  f"--{txn.last_valid_round}", i)
+                if not dry_run and txids[i] in self._pending:
+                    raise _Reject("transaction already in ledger", i)
+                self._touched = {txn.sender}
+                self._debit(journal, txn.sender, txn.fee, i)
+                results.append(getattr(self, "_apply_" + txn.type)(journal, txns, i))
+                for address in self._touched:
+                    acct = self._accounts.get(address)
+                    if acct is not None and acct["amount"] < self._min_balance(address):
+                        raise _Reject(f"account {address} balance {acct['amount']} below min "
+                                      f"{self._min_balance(address)}", i)
+            paid = sum(t.fee for t in txns)
+            needed = MIN_FEE * (len(txns) + sum(len(r.get("inner", ())) for r in results))
+            if paid < needed:
+                raise _Reject(f"fee too small: group paid {paid}, needs {needed}")
+        except _Reject:
+            journal.rollback()
+            raise
+        if dry_run:
+            journal.rollback()
+        return results
+
+    def _debit(self, journal: _Journal, address: str, amount: int, index: int) -> None:
+        acct = self._account(address)
+        if acct["amount"] < amount:
+            raise _Reject(f"overspend (account {address}, data {{amount {acct['amount']}}}, tried to spend "
+                          f"{amount})", index)
+        journal.set(acct, "amount", acct["amount"] - amount)
+
+    def _credit(self, journal: _Journal, address: str, amount: int) -> None:
+        if address not in self._accounts:
+            journal.set(self._accounts, address, {"amount": 0, "assets": {}, "apps": set(),
+                                                  "created_assets": set()})
+        acct = self._accounts[address]
+        journal.set(acct, "amount", acct["amount"] + amount)
+
+    def _asset_transfer(self, journal: _Journal, sender: str, receiver: str, asset_id: int, amount: int,
+                        index: int) -> None:
+        if asset_id not in self._assets:
+            raise _Reject(f"asset {asset_id} does not exist", index)
+        src = self._account(sender)
+        if sender == receiver and amount == 0 and asset_id not in src["assets"]:
+            journal.set(src["assets"], asset_id, 0)  # opt-in
+            return
+        if asset_id not in src["assets"]:
+            raise _Reject(f"asset {asset_id} missing from {sender}", index)
+        dst = self._accounts.get(receiver)
+        if dst is None or asset_id not in dst["assets"]:
+            raise _Reject(f"receiver error: must optin, asset {asset_id} missing from {receiver}", index)
+        if src["assets"][asset_id] < amount:
+            raise _Reject(f"underflow on subtracting {amount} from sender amount {src['assets'][asset_id]}", index)
+        journal.set(src["assets"], asset_id, src["assets"][asset_id] - amount)
+        journal.set(dst["assets"], asset_id, dst["assets"][asset_id] + amount)
+
+    def _new_id(self, journal: _Journal) -> int:
+        new_id = self._counters["next_id"]
+        journal.set(self._counters, "next_id", new_id + 1)
+        return new_id
+
+    def _apply_pay(self, journal: _Journal, txns: List[Transaction], i: int) -> dict:
+        txn = txns[i]
+        self._debit(journal, txn.sender, txn.amt, i)
+        self._credit(journal, txn.receiver, txn.amt)
+        self._touched.add(txn.receiver)
+        if txn.close_remainder_to:
+            rest = self._accounts[txn.sender]["amount"]
+            self._debit(journal, txn.sender, rest, i)
+            self._credit(journal, txn.close_remainder_to, rest)
+            journal.delete(self._accounts, txn.sender)
+        return {}
+
+    def _apply_axfer(self, journal: _Journal, txns: List[Transaction], i: int) -> dict:
+        txn = txns[i]
+        self._asset_transfer(journal, txn.sender, txn.receiver, txn.index, txn.amount, i)
+        self._touched.add(txn.receiver)
+        return {}
+
+    def _apply_acfg(self, journal: _Journal, txns: List[Transaction], i: int) -> dict:
+        txn = txns[i]
+        if txn.index:
+            raise _Reject("fake algod only supports asset creation", i)
+        asset_id = self._new_id(journal)
+        journal.set(self._assets, asset_id, {
+            "creator": txn.sender, "total": txn.total, "decimals": txn.decimals,
+            "default-frozen": bool(txn.default_frozen), "unit-name": txn.unit_name, "name": txn.asset_name,
+        })
+        journal.set(self._account(txn.sender)["assets"], asset_id, txn.total)
+        created = set(self._account(txn.sender)["created_assets"]) | {asset_id}
+        journal.set(self._account(txn.sender), "created_assets", created)
+        return {"asset-index": asset_id}
+
+    def _apply_appl(self, journal: _Journal, txns: List[Transaction], i: int) -> dict:
+        txn = txns[i]
+        result: dict = {}
+        app_id = txn.index
+        if not app_id:
+            app_id = self._new_id(journal)
+            schema = txn.global_schema
+            journal.set(self._apps, app_id, {
+                "creator": txn.sender, "address": get_application_address(app_id), "global": {}, "boxes": {},
+                "box_mbr": 0,
+                "approval": txn.approval_program or b"", "clear": txn.clear_program or b"",
+                "schema": (schema.num_uints, schema.num_byte_slices) if schema else (0, 0),
+            })
+            journal.set(self._account(txn.sender), "apps", set(self._account(txn.sender)["apps"]) | {app_id})
+            journal.set(self._app_by_address, self._apps[app_id]["address"], app_id)
+            result["application-index"] = app_id
+        elif app_id not in self._apps:
+            raise _Reject(f"application {app_id} does not exist", i)
+        if txn.on_complete != OnComplete.NoOpOC:
+            raise _Reject("fake algod only supports NoOp app calls", i)
+
+        call = _AppCall(self, journal, txns, i, app_id)
+        args = txn.app_args or []
+        fn = self.daisy.methods.get(args[0] if args else b"")
+        call.require(fn is not None, "err (no matching ABI method)")
+        method = fn.abi_method
+        txn_args = [a for a in method.args if a.type in ("txn", "pay", "axfer", "acfg", "appl")]
+        gtxn_index = i - len(txn_args)
+        values = []
+        for k, arg in enumerate(method.args):
+            if arg.type in ("txn", "pay", "axfer", "acfg", "appl"):
+                values.append(txns[gtxn_index])
+                gtxn_index += 1
+            elif arg.type == "account":
+                ref = args[k + 1][0]
+                values.append(txn.sender if ref == 0 else txn.accounts[ref - 1])
+            elif arg.type == "asset":
+                values.append(txn.foreign_assets[args[k + 1][0]])
+            elif arg.type == "application":
+                ref = args[k + 1][0]
+                values.append(app_id if ref == 0 else txn.foreign_apps[ref - 1])
+            else:
+                values.append(arg.type.decode(args[k + 1]))
+        ret = fn(call, *values)
+        if method.returns.type != "void":
+            encoded = ret if isinstance(ret, bytes) else method.returns.type.encode(ret)
+            call.logs.append(ABI_RETURN_PREFIX + encoded)
+        result.update({"logs": call.logs, "inner": call.inner})
+        return result
+
+    # --- block production ---
+    def _txn_info(self, raw: dict, result: dict, confirmed_round: int) -> dict:
+        info = {"txn": _jsonable(raw), "pool-error": "", "confirmed-round": confirmed_round}
+        if result.get("logs"):
+            info["logs"] = [_b64(log) for log in result["logs"]]
+        if result.get("inner"):
+            info["inner-txns"] = [{"txn": {"txn": _jsonable(t)}, "pool-error": ""} for t in result["inner"]]
+        for key in ("asset-index", "application-index"):
+            if key in result:
+                info[key] = result[key]
+        return info
+
+    def _commit(self, raw_txns: List[dict], txids: List[str], results: List[dict]) -> None:
+        rnd = len(self._blocks)
+        entries = []
+        for raw, txid, result in zip(raw_txns, txids, results):
+            self._pending[txid] = (raw, result, rnd)
+            dt = {}
+            if result.get("logs"):
+                dt["lg"] = result["logs"]
+            if result.get("inner"):
+                dt["itx"] = [{"txn": t} for t in result["inner"]]
+            entry = {"txn": raw["txn"], "hgi": True}
+            if "sig" in raw:
+                entry["sig"] = raw["sig"]
+            if dt:
+                entry["dt"] = dt
+            entries.append(entry)
+        self.add_block(entries)
+
+
+class FakeAlgodView(AlgodClient):
+    """A client on a shared FakeAlgod ledger that counts its own requests in `calls`."""
+
+    def __init__(self, ledger: FakeAlgod):
+        super().__init__("", "http://fake-algod")
+        self.ledger = ledger
+        self.calls: Dict[str, int] = {}
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json",
+                      timeout=30):
+        return self.ledger._dispatch(method, requrl, params, data, response_format, self.calls)
+
+
+def fake_algorand(algod: Optional[AlgodClient] = None):
+    """
+    An AlgorandClient backed by `algod` (a new FakeAlgod by default).
+
+    Every group is its own block here, so rounds advance far faster than on a real network:
+    suggested params are not cached and transactions get LocalNet's 1000-round validity window.
+    """
+    from algokit_utils import AlgorandClient
+
+    algorand = AlgorandClient.from_clients(algod=algod or FakeAlgod())
+    algorand.set_suggested_params_cache_timeout(0)
+    return algorand.set_default_validity_window(1000)
+
+
+def deploy_daisy(algorand, algod: FakeAlgod, query_fee: int = 10, app_algos: int = 1_000):
+    """
+    Deploy DAISY on `algod` the way deploy.py does (ASA, factory create, funding, opt-in) and
+    give the app account `app_algos` ALGO of box MBR on top of what deploy.py funds (0 leaves
+    it as deploy.py does). Returns (deployer, token_id, app_client).
+    """
+    import deploy
+
+    deployer = algorand.account.random()
+    algod.fund(deployer.address, 10_000_000_000)
+    token_id = deploy.create_daisy_asa(algorand, deployer)
+    # the fake runs its Python model of contract.py, not the compiled program in the app spec
+    app_client, app_id = deploy.deploy_app_via_factory(algorand, deployer, token_id, query_fee,
+                                                       check_program=False)
+    deploy.fund_app_account(algorand, deployer, app_id)
+    deploy.opt_in_app_to_asa(app_client)
+    if app_algos:
+        algod.fund(app_client.app_address, app_algos * 1_000_000)
+    return deployer, token_id, app_client
+
+
+def new_daisy_account(algorand, algod: FakeAlgod, deployer, token_id: int, daisy: int = 0, algos: int = 100):
+    """A random account funded with `algos` ALGO, opted into DAISY and holding `daisy` tokens."""
+    from algokit_utils import AssetOptInParams, AssetTransferParams
+
+    acct = algorand.account.random()
+    algod.fund(acct.address, algos * 1_000_000)
+    algorand.send.asset_opt_in(AssetOptInParams(sender=acct.address, asset_id=token_id))
+    if daisy:
+        algorand.send.asset_transfer(AssetTransferParams(
+            sender=deployer.address, receiver=acct.address, asset_id=token_id, amount=daisy))
+    return acct
+
+
+def post_query_entry(app_id: int, query_id: int, sender: bytes = bytes(32),
+                     signature: str = "post_query(string,axfer)uint64") -> dict:
+    """A block transaction entry that looks like a confirmed `post_query` call returning `query_id`."""
+    selector = Method.from_signature(signature).get_selector()
+    return {
+        "txn": {"type": "appl", "snd": sender, "apid": app_id, "apaa": [selector, b"\x00\x00", b"\x00"]},
+        "dt": {"lg": [_QUERY_CREATED[0] + _QUERY_CREATED[1].encode([query_id, sender, 0, 0, bytes(32)]),
+                      ABI_RETURN_PREFIX + query_id.to_bytes(8, "big")]},
+        "hgi": True,
+    }
+
+
+def produce_blocks(algod: FakeAlgod, app_id: int, block_seconds: float, queries_per_block: int,
+                   rounds: int, first_query_id: int = 1, stamp: Optional[dict] = None) -> None:
+    """Append `rounds` blocks, each carrying `queries_per_block` post_query calls. Records creation time per id in `stamp`."""
+    qid = first_query_id
+    for _ in range(rounds):
+        time.sleep(block_seconds)
+        entries = []
+        for _ in range(queries_per_block):
+            entries.append(post_query_entry(app_id, qid))
+            if stamp is not None:
+                stamp[qid] = time.perf_counter()
+            qid += 1
+        algod.add_block(entries)
+
+
+def abi_call(sender: str, sp, app_id: int, signature: str, *args) -> Transaction:
+    """A NoOp call of ABI method `signature`; `args` are its non-transaction arguments, ABI-encoded into app args."""
+    from algosdk.transaction import ApplicationCallTxn
+
+    method = Method.from_signature(signature)
+    types = [arg.type for arg in method.args if isinstance(arg.type, ABIType)]
+    return ApplicationCallTxn(sender, sp, app_id, OnComplete.NoOpOC,
+                              app_args=[method.get_selector()] + [t.encode(v) for t, v in zip(types, args)])
+
+
+def send_group(algod: FakeAlgod, acct, txns: list) -> List[dict]:
+    """Sign `txns` as one group with `acct`'s key and send it (one block); returns each transaction's confirmed info."""
+    from algosdk.atomic_transaction_composer import AccountTransactionSigner
+    from algosdk.transaction import assign_group_id
+
+    if len(txns) > 1:
+        assign_group_id(txns)
+    signed = AccountTransactionSigner(acct.private_key).sign_transactions(txns, list(range(len(txns))))
+    algod.send_transactions(signed)
+    return [algod.pending_transaction_info(t.get_txid()) for t in txns]
+
+
+def abi_return(info: dict) -> bytes:
+    """The encoded ABI return value logged by a confirmed app call."""
+    return base64.b64decode(info["logs"][-1])[len(ABI_RETURN_PREFIX):]
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Process-pool transaction signing for high-volume senders (relayer, Refill/bulk_fund.py).
+
+Signing a transaction is msgpack encoding plus one ed25519 signature, both CPU-bound and both
+run under the GIL in `AccountTransactionSigner`, so threads do not help. Here transactions are
+shipped to worker processes in batches; each worker encodes and signs the whole batch with a
+signing key it built once, and returns the signatures plus the ready-to-send signed bytes.
+
+- `ParallelSigner(private_key)` is an algosdk `TransactionSigner`, so it drops in wherever
+  `AccountTransactionSigner` is used (AtomicTransactionComposer, algokit `signer=`).
+- `sign_raw(txns, keys)` signs with a key per transaction and returns msgpack bytes that can be
+  concatenated straight into `send_raw_transaction`, skipping a second encode.
+
+With `workers <= 1` everything runs inline (still with the cached key and single encode).
+"""
+import base64
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import msgpack
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.transaction import SignedTransaction, Transaction
+from nacl.signing import SigningKey
+
+SIGN_WORKERS = int(os.getenv("SIGN_WORKERS", str(os.cpu_count() or 1)))
+SIGN_BATCH = int(os.getenv("SIGN_BATCH", "64"))  # transactions per task sent to a worker
+
+# Per process: private key (base64) -> (nacl SigningKey, raw public key), decoded once per worker
+_keys: Dict[str, Tuple[SigningKey, bytes]] = {}
+
+
+def _signing_key(private_key: str) -> Tuple[SigningKey, bytes]:
+    entry = _keys.get(private_key)
+    if entry is None:
+        key = SigningKey(base64.b64decode(private_key)[:32])
+        entry = _keys[private_key] = (key, key.verify_key.encode())
+    return entry
+
+
+def _pack(obj: dict) -> bytes:
+    # Canonical encoding, same as algosdk.encoding.msgpack_encode minus the base64 round trip
+    return msgpack.packb(encoding._sort_dict(obj), use_bin_type=True)
+
+
+def _sign_batch(batch: Sequence[Tuple[Transaction, str]]) -> List[Tuple[bytes, bytes]]:
+    """Encode and sign each (txn, private_key); returns (signature, signed txn msgpack) pairs."""
+    out = []
+    for txn, private_key in batch:
+        key, public = _signing_key(private_key)
+        txn_dict = txn.dictify()
+        signature = key.sign(b"TX" + _pack(txn_dict)).signature
+        stxn = {"sig": signature, "txn": txn_dict}
+        if encoding.decode_address(txn.sender) != public:  # rekeyed sender
+            stxn["sgnr"] = public
+        out.append((signature, _pack(stxn)))
+    return out
+
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def signing_pool(workers: int = SIGN_WORKERS) -> Optional[ProcessPoolExecutor]:
+    """The process-wide pool with `workers` processes (None when signing inline)."""
+    if workers <= 1:
+        return None
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+def _run(pairs: List[Tuple[Transaction, str]], workers: int, batch_size: int) -> List[Tuple[bytes, bytes]]:
+    pool = signing_pool(workers)
+    if pool is None or len(pairs) <= batch_size:
+        return _sign_batch(pairs)
+    batches = [pairs[i:i + batch_size] for i in range(0, len(pairs), batch_size)]
+    return [signed for chunk in pool.map(_sign_batch, batches) for signed in chunk]
+
+
+def sign_raw(txns: Sequence[Transaction], keys: Sequence[str], workers: int = SIGN_WORKERS,
+             batch_size: int = SIGN_BATCH) -> List[bytes]:
+    """Sign `txns[i]` with `keys[i]`; returns each signed transaction as msgpack bytes."""
+    if len(txns) != len(keys):
+        raise ValueError("Need one key per transaction")
+    return [raw for _, raw in _run(list(zip(txns, keys)), workers, batch_size)]
+
+
+class ParallelSigner(TransactionSigner):
+    """`AccountTransactionSigner` replacement that signs on the shared process pool."""
+
+    def __init__(self, private_key: str, workers: int = SIGN_WORKERS, batch_size: int = SIGN_BATCH):
+        super().__init__()
+        self.private_key = private_key
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ParallelSigner) and self.private_key == other.private_key
+
+    def __hash__(self) -> int:
+        return hash(self.private_key)
+
+    def sign_transactions(self, txn_group: List[Transaction], indexes: List[int]) -> List[SignedTransaction]:
+        txns = [txn_group[i] for i in indexes]
+        signed = _run([(txn, self.private_key) for txn in txns], self.workers, self.batch_size)
+        authorizing = encoding.encode_address(_signing_key(self.private_key)[1])
+        return [
+            SignedTransaction(txn, base64.b64encode(sig).decode(),
+                              authorizing if txn.sender != authorizing else None)
+            for txn, (sig, _) in zip(txns, signed)
+        ]
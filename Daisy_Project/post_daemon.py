@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+Resident query-posting daemon: prompt.py's post path, kept warm for frontends that post a lot.
+
+prompt.py pays its whole start-up for every query: imports, AlgorandClient, the key derived from
+the mnemonic, a global-state read for token and fee, and an opt-in check. The daemon does that
+once and then takes queries over a local HTTP port or Unix socket:
+
+- the USER key, app client, token, fee and suggested params stay cached (state and params are
+  refreshed once per round by the confirmer, the DAISY balance is tracked locally);
+- a sender thread builds the fee transfer + `post_query` pairs itself, signs them in batches on
+  the parallel_signer pool and sends groups back to back without waiting for confirmation;
+- a confirmer thread follows rounds, reads each query id from the ABI return and then watches
+  the query boxes until they are answered.
+
+Every step is published as an event: queued, sent, confirmed (query id, round), answered
+(provider, response), failed, or answer_timeout.
+
+Endpoints (HTTP on --port, the same API on --socket):
+  GET  /info                        sender, app, token, fee, queue sizes
+  POST /queries                     {"text": ...} or {"texts": [...]} -> ticket view(s)
+  GET  /queries/<ticket>            {"status", "query_id", "round", "response", ...}
+  GET  /events[?after=N][&ticket=T] newline-delimited JSON events as they happen; with a ticket
+                                    the stream ends once that query is answered or has failed
+  GET  /metrics                     Prometheus text format
+
+Env: USER_MNEMONIC (pays fees and DAISY), APP_ID_2, ALGOD_ADDR, ALGOD_TOKEN, POST_DAEMON_PORT,
+POST_DAEMON_SOCKET, POST_DAEMON_MAX_QUEUE, POST_DAEMON_SEND_BATCH, ANSWER_WATCH_SECONDS
+
+Usage:
+  python post_daemon.py [--host 127.0.0.1] [--port 8403] [--socket /tmp/daisy-post.sock]
+
+`PostDaemonClient("http://127.0.0.1:8403")` or `PostDaemonClient("unix:/tmp/daisy-post.sock")`
+is the frontend side; `python prompt.py --daemon ADDR "question"` posts through it.
+"""
+import argparse
+import base64
+import http.client
+import itertools
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from algosdk import abi, account, mnemonic, transaction
+from algosdk.error import AlgodHTTPError
+
+from algod_cache import shared_algod
+from client import DecentralizedAiContractClient
+from client_views import EXPIRY_BOX_NAME, PENDING_BOX_NAME, read_values
+from metrics import REGISTRY, span
+from parallel_signer import SIGN_WORKERS, sign_raw
+from relayer import ABI_RETURN_PREFIX, BOX_REF_WINDOW
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+log = logging.getLogger("post_daemon")
+
+POST_QUERY = abi.Method.from_signature("post_query(string,axfer)uint64")
+EVENT_BACKLOG = 10_000  # events kept for /events?after=N replays
+FINISHED_TICKETS = 100_000
+TERMINAL = ("answered", "failed", "answer_timeout")
+
+MAX_QUEUE = int(os.getenv("POST_DAEMON_MAX_QUEUE", "4096"))
+SEND_BATCH = int(os.getenv("POST_DAEMON_SEND_BATCH", "64"))  # groups signed per pool round trip
+ANSWER_WATCH_SECONDS = float(os.getenv("ANSWER_WATCH_SECONDS", "600"))  # 0 = stop at confirmation
+
+POSTED = REGISTRY.counter("daisy_post_daemon_queries_total", "Queries handled by the posting daemon, by outcome",
+                          ["status"])
+DAEMON_QUEUED = REGISTRY.gauge("daisy_post_daemon_queued", "Queries waiting to be sent")
+DAEMON_IN_FLIGHT = REGISTRY.gauge("daisy_post_daemon_in_flight", "Queries sent and not yet confirmed")
+DAEMON_AWAITING = REGISTRY.gauge("daisy_post_daemon_awaiting_answer", "Confirmed queries not yet answered")
+
+
+class PostRefused(ValueError):
+    """The daemon will not take the query (queue full, not enough DAISY, bad input)."""
+
+
+@dataclass
+class Ticket:
+    ticket: int
+    text: str
+    status: str = "queued"
+    txid: Optional[str] = None
+    last_valid: int = 0
+    query_id: Optional[int] = None
+    round: Optional[int] = None
+    confirmed_at: float = 0.0
+    provider: Optional[str] = None
+    response: Optional[str] = None
+    error: Optional[str] = None
+
+    def view(self) -> dict:
+        return {"ticket": self.ticket, "status": self.status, "txid": self.txid, "query_id": self.query_id,
+                "round": self.round, "provider": self.provider, "response": self.response, "error": self.error}
+
+
+class PostDaemon:
+    """
+    Posts queries for one USER account, pipelined, and tracks them until they are answered.
+
+    Parameters
+    ----------
+    algod: AlgodClient to send through (normally `shared_algod()`)
+    app_id: DAISY application
+    private_key: the USER account paying the DAISY query fee and the ALGO transaction fees
+    answer_watch_seconds: how long a confirmed query is watched for an answer (0 = not at all)
+    """
+
+    def __init__(self, algod, app_id: int, private_key: str, max_queue: int = MAX_QUEUE,
+                 send_batch: int = SEND_BATCH, sign_workers: int = SIGN_WORKERS,
+                 answer_watch_seconds: float = ANSWER_WATCH_SECONDS):
+        from algokit_utils import AlgorandClient
+
+        self.algod = algod
+        self.app_id = app_id
+        self.private_key = private_key
+        self.address = account.address_from_private_key(private_key)
+        self.max_queue = max_queue
+        self.send_batch = send_batch
+        self.sign_workers = sign_workers
+        self.answer_watch_seconds = answer_watch_seconds
+        self.algorand = AlgorandClient.from_clients(algod=algod)
+        self.app = DecentralizedAiContractClient(algorand=self.algorand, app_id=app_id, default_sender=self.address)
+
+        self._cond = threading.Condition()
+        self._chain_next_id = 0
+        self._queue: deque = deque()
+        self._unconfirmed: Dict[int, Ticket] = {}  # queued or sent
+        self._in_flight: Dict[int, Ticket] = {}
+        self._awaiting: Dict[int, Ticket] = {}  # by query id
+        self._tickets: Dict[int, Ticket] = {}
+        self._next_ticket = 1
+        self._events: deque = deque(maxlen=EVENT_BACKLOG)
+        self._event_seq = 0
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.refresh_state()
+        self._ensure_opted_in()
+        DAEMON_QUEUED.set_function(lambda: len(self._queue))
+        DAEMON_IN_FLIGHT.set_function(lambda: len(self._in_flight))
+        DAEMON_AWAITING.set_function(lambda: len(self._awaiting))
+
+    # --- warm state ---
+    def refresh_state(self) -> None:
+        """Re-read token, fee, next query id, suggested params and the DAISY balance."""
+        gs = self.app.state.global_state
+        sp = self.algod.suggested_params()
+        with self._cond:
+            self.token = int(gs.token)
+            self.query_fee = int(gs.query_fee)
+            # never step back behind ids already seen in our own confirmations
+            self._chain_next_id = max(self._chain_next_id, int(gs.next_query_id))
+            self._sp = sp
+        self._daisy = self._read_balance()
+
+    def _read_balance(self) -> Optional[int]:
+        for holding in self.algod.account_info(self.address).get("assets", []):
+            if holding.get("asset-id") == self.token:
+                return int(holding.get("amount", 0))
+        return None
+
+    def _ensure_opted_in(self) -> None:
+        # once per daemon instead of once per query
+        from prompt import _ensure_user_opted_in_and_funded
+
+        _ensure_user_opted_in_and_funded(self.algorand, self.address, self.private_key, self.token, self.query_fee)
+        self._daisy = self._read_balance()
+
+    def info(self) -> dict:
+        with self._cond:
+            return {"sender": self.address, "app_id": self.app_id, "token": self.token, "query_fee": self.query_fee,
+                    "daisy": self._daisy, "queued": len(self._queue), "in_flight": len(self._in_flight),
+                    "awaiting_answer": len(self._awaiting), "last_event": self._event_seq}
+
+    # --- events ---
+    def _publish(self, ticket: Ticket, event: str) -> None:
+        # caller holds self._cond
+        self._event_seq += 1
+        self._events.append({"seq": self._event_seq, "event": event, **ticket.view()})
+        self._cond.notify_all()
+
+    def events(self, after: int = 0, ticket: Optional[int] = None, timeout: float = 15.0) -> List[dict]:
+        """Events with seq > `after` (only `ticket`'s when given), waiting up to `timeout` for one."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                # seqs are contiguous, so the first new event's position follows from the oldest kept
+                start = max(0, after - self._events[0]["seq"] + 1) if self._events else 0
+                found = [e for e in itertools.islice(self._events, start, None)
+                         if ticket is None or e["ticket"] == ticket]
+                remaining = deadline - time.monotonic()
+                if found or remaining <= 0 or self._stop.is_set():
+                    return found
+                self._cond.wait(remaining)
+
+    # --- intake ---
+    def submit(self, texts: List[str]) -> List[Ticket]:
+        """Queue queries for posting; refused as a whole if the queue or the DAISY balance is short."""
+        for text in texts:
+            if not isinstance(text, str) or not text:
+                raise PostRefused("queries must be non-empty strings")
+        with self._cond:
+            if len(self._queue) + len(texts) > self.max_queue:
+                raise PostRefused("posting queue is full, retry later")
+            needed = self.query_fee * (len(self._unconfirmed) + len(texts))
+            if self._daisy is not None and self._daisy < needed:
+                raise PostRefused(f"{self.address} holds {self._daisy} DAISY, {needed} needed for the pending posts")
+            tickets = []
+            for text in texts:
+                ticket = Ticket(self._next_ticket, text)
+                self._next_ticket += 1
+                self._tickets[ticket.ticket] = ticket
+                self._unconfirmed[ticket.ticket] = ticket
+                self._queue.append(ticket)
+                self._publish(ticket, "queued")
+                tickets.append(ticket)
+        POSTED.inc(len(texts), status="queued")
+        return tickets
+
+    def status(self, ticket: int) -> Optional[dict]:
+        with self._cond:
+            found = self._tickets.get(ticket)
+            return found.view() if found else None
+
+    def _settle(self, ticket: Ticket, status: str, **fields) -> None:
+        with self._cond:
+            ticket.status = status
+            for k, v in fields.items():
+                setattr(ticket, k, v)
+            self._in_flight.pop(ticket.ticket, None)
+            self._unconfirmed.pop(ticket.ticket, None)
+            if status == "confirmed" and ticket.query_id is not None:
+                self._chain_next_id = max(self._chain_next_id, ticket.query_id + 1)
+                if self.answer_watch_seconds > 0:
+                    self._awaiting[ticket.query_id] = ticket
+            elif ticket.query_id is not None:
+                self._awaiting.pop(ticket.query_id, None)
+            while len(self._tickets) > FINISHED_TICKETS:
+                oldest = next(iter(self._tickets))
+                if self._tickets[oldest].status not in TERMINAL:
+                    break
+                del self._tickets[oldest]
+            self._publish(ticket, status)
+        POSTED.inc(status=status)
+
+    # --- sending ---
+    def _take(self, timeout: float) -> List[Ticket]:
+        with self._cond:
+            if not self._queue:
+                self._cond.wait(timeout)
+            batch = []
+            while self._queue and len(batch) < self.send_batch:
+                batch.append(self._queue.popleft())
+            return batch
+
+    def _build(self, batch: List[Ticket]) -> List[transaction.Transaction]:
+        with self._cond:
+            sp = self._sp
+            # our own unconfirmed posts land first (in send order); BOX_REF_WINDOW absorbs others'
+            next_id = self._chain_next_id + len(self._in_flight)
+            app_address = self.app.app_address
+        txns = []
+        for i, ticket in enumerate(batch):
+            first_id = next_id + i
+            payment = transaction.AssetTransferTxn(self.address, sp, app_address, self.query_fee, self.token)
+            boxes = [(0, b"Q" + (first_id + k).to_bytes(8, "big")) for k in range(BOX_REF_WINDOW)]
+            boxes += [(0, PENDING_BOX_NAME), (0, EXPIRY_BOX_NAME)]
+            call = transaction.ApplicationCallTxn(
+                self.address, sp, self.app_id, transaction.OnComplete.NoOpOC,
+                app_args=[POST_QUERY.get_selector(), abi.StringType().encode(ticket.text)], boxes=boxes,
+            )
+            txns.extend(transaction.assign_group_id([payment, call]))
+            ticket.txid = call.get_txid()
+            ticket.last_valid = call.last_valid_round
+        return txns
+
+    def send_pending(self, timeout: float = 0.5) -> int:
+        """Build, sign and send up to `send_batch` queued queries without waiting. Returns how many."""
+        batch = self._take(timeout)
+        if not batch:
+            return 0
+        with span("build"):
+            txns = self._build(batch)
+            signed = sign_raw(txns, [self.private_key] * len(txns), self.sign_workers)
+        with span("send"):
+            for i, ticket in enumerate(batch):
+                with self._cond:
+                    self._in_flight[ticket.ticket] = ticket
+                    ticket.status = "sent"
+                    self._publish(ticket, "sent")
+                try:
+                    self.algod.send_raw_transaction(base64.b64encode(signed[2 * i] + signed[2 * i + 1]))
+                except AlgodHTTPError as e:
+                    log.info("Query group %s rejected: %s", ticket.txid, e)
+                    self._settle(ticket, "failed", error=str(e))
+        return len(batch)
+
+    # --- confirming and answers ---
+    def confirm_round(self, rnd: int) -> int:
+        """Settle every in-flight query that confirmed or expired by `rnd`; returns how many settled."""
+        with self._cond:
+            in_flight = list(self._in_flight.values())
+        settled = 0
+        for ticket in in_flight:
+            try:
+                info = self.algod.pending_transaction_info(ticket.txid)
+            except AlgodHTTPError as e:
+                if e.code != 404:
+                    raise
+                info = {}
+            if info.get("confirmed-round"):
+                logs = [base64.b64decode(x) for x in info.get("logs", [])]
+                ret = logs[-1] if logs else b""
+                query_id = int.from_bytes(ret[4:12], "big") if ret[:4] == ABI_RETURN_PREFIX else None
+                self._settle(ticket, "confirmed", query_id=query_id, round=info["confirmed-round"],
+                             confirmed_at=time.monotonic())
+            elif info.get("pool-error") or rnd > ticket.last_valid:
+                self._settle(ticket, "failed", error=info.get("pool-error") or "validity window passed")
+            else:
+                continue
+            settled += 1
+        return settled
+
+    def check_answers(self) -> int:
+        """Read the boxes of confirmed, unanswered queries in one batch; returns how many were answered."""
+        with self._cond:
+            awaiting = dict(self._awaiting)
+        if not awaiting:
+            return 0
+        with span("box_read"):
+            queries = read_values(self.app.state.box.queries, list(awaiting))
+        answered = 0
+        now = time.monotonic()
+        for query_id, ticket in awaiting.items():
+            query = queries.get(query_id)
+            if query is not None and query.is_answered:
+                self._settle(ticket, "answered", provider=query.provider, response=query.response_text)
+                answered += 1
+            elif now - ticket.confirmed_at > self.answer_watch_seconds:
+                self._settle(ticket, "answer_timeout")
+        return answered
+
+    def _confirm_loop(self) -> None:
+        rnd = int(self.algod.status()["last-round"])
+        while not self._stop.is_set():
+            with self._cond:
+                if not self._in_flight and not self._awaiting:
+                    self._cond.wait(0.5)
+                    continue
+            try:
+                if not self.confirm_round(rnd):
+                    rnd = int(self.algod.status_after_block(rnd)["last-round"])
+                    self.check_answers()
+                self.refresh_state()
+            except Exception as e:
+                log.warning("Confirmation pass failed: %s", e)
+                self._stop.wait(1.0)
+
+    def _send_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.send_pending()
+            except Exception as e:
+                log.error("Sending queries failed: %s", e)
+                self._stop.wait(1.0)
+
+    def start(self) -> "PostDaemon":
+        for target, name in ((self._send_loop, "post-daemon-send"), (self._confirm_loop, "post-daemon-confirm")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+
+def _make_handler(daemon: PostDaemon, max_bytes: int = 1 << 20):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code: int, body, content_type: str = "application/json"):
+            data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _stream_events(self, params: dict):
+            try:
+                after = int(params.get("after", ["0"])[0])
+                ticket = int(params["ticket"][0]) if "ticket" in params else None
+            except ValueError:
+                return self._reply(400, {"error": "after and ticket must be integers"})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            try:
+                while not daemon._stop.is_set():
+                    events = daemon.events(after, ticket)
+                    # an empty line when idle keeps the connection alive and notices closed clients
+                    self.wfile.write(b"".join(json.dumps(e).encode() + b"\n" for e in events) or b"\n")
+                    self.wfile.flush()
+                    if events:
+                        after = events[-1]["seq"]
+                    if ticket is not None and any(e["status"] in TERMINAL for e in events):
+                        return
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            parts = url.path.strip("/").split("/")
+            if parts == ["info"]:
+                return self._reply(200, daemon.info())
+            if parts == ["metrics"]:
+                return self._reply(200, REGISTRY.render(), "text/plain; version=0.0.4")
+            if parts == ["events"]:
+                return self._stream_events(parse_qs(url.query))
+            if len(parts) == 2 and parts[0] == "queries" and parts[1].isdigit():
+                view = daemon.status(int(parts[1]))
+                return self._reply(200, view) if view else self.send_error(404)
+            self.send_error(404)
+
+        def do_POST(self):
+            if self.path.rstrip("/") != "/queries":
+                return self.send_error(404)
+            length = int(self.headers.get("Content-Length", "0"))
+            if length > max_bytes:
+                return self.send_error(413)
+            try:
+                body = json.loads(self.rfile.read(length))
+                texts = [body["text"]] if "text" in body else list(body["texts"])
+                tickets = daemon.submit(texts)
+            except PostRefused as e:
+                return self._reply(503, {"error": str(e)})
+            except (ValueError, KeyError, TypeError):
+                return self._reply(400, {"error": 'body must be {"text": ...} or {"texts": [...]}'})
+            views = [t.view() for t in tickets]
+            self._reply(202, views[0] if "text" in body else views)
+
+        def address_string(self):
+            # Unix-socket peers have no (host, port)
+            return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(daemon: PostDaemon, port: Optional[int] = None, host: str = "127.0.0.1",
+          unix_path: Optional[str] = None) -> list:
+    """Start the API on a TCP port and/or a Unix socket, on daemon threads; returns the servers."""
+    servers = []
+    if port is not None:
+        servers.append(ThreadingHTTPServer((host, port), _make_handler(daemon)))
+    if unix_path:
+        if os.path.exists(unix_path):
+            os.unlink(unix_path)
+        servers.append(_UnixHTTPServer(unix_path, _make_handler(daemon)))
+        os.chmod(unix_path, 0o600)  # the daemon spends the USER's funds
+    for server in servers:
+        threading.Thread(target=server.serve_forever, name="post-daemon-http", daemon=True).start()
+    return servers
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+class PostDaemonClient:
+    """Frontend side: `address` is http://host:port or unix:/path/to/socket."""
+
+    def __init__(self, address: str, timeout: float = 30.0):
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self.address.startswith("unix:"):
+            return _UnixConnection(self.address[len("unix:"):], self.timeout)
+        url = urlparse(self.address)
+        return http.client.HTTPConnection(url.hostname, url.port or 80, timeout=self.timeout)
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None):
+        conn = self._connection()
+        conn.request(method, path, json.dumps(body) if body is not None else None,
+                     {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        if resp.status >= 400:
+            data = resp.read()
+            conn.close()
+            try:
+                message = json.loads(data).get("error", resp.reason)
+            except ValueError:
+                message = resp.reason
+            raise PostRefused(f"posting daemon returned {resp.status}: {message}")
+        return conn, resp
+
+    def _json(self, method: str, path: str, body: Optional[dict] = None):
+        conn, resp = self._request(method, path, body)
+        try:
+            return json.loads(resp.read())
+        finally:
+            conn.close()
+
+    def info(self) -> dict:
+        return self._json("GET", "/info")
+
+    def post(self, text: str) -> dict:
+        return self._json("POST", "/queries", {"text": text})
+
+    def post_many(self, texts: List[str]) -> List[dict]:
+        return self._json("POST", "/queries", {"texts": list(texts)})
+
+    def status(self, ticket: int) -> dict:
+        return self._json("GET", f"/queries/{ticket}")
+
+    def events(self, after: int = 0, ticket: Optional[int] = None) -> Iterator[dict]:
+        """Yield events as the daemon publishes them; with `ticket`, ends when that query settles."""
+        path = f"/events?after={after}" + (f"&ticket={ticket}" if ticket is not None else "")
+        conn, resp = self._request("GET", path)
+        try:
+            for line in resp:
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            conn.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Keep a warm posting client and take queries over HTTP / a Unix socket.")
+    ap.add_argument("--host", default=os.getenv("POST_DAEMON_HOST", "127.0.0.1"))
+    ap.add_argument("--port", type=int, default=int(os.getenv("POST_DAEMON_PORT", "8403")))
+    ap.add_argument("--socket", default=os.getenv("POST_DAEMON_SOCKET"), help="also listen on this Unix socket")
+    ap.add_argument("--no-http", action="store_true", help="only listen on --socket")
+    ap.add_argument("--sign-workers", type=int, default=SIGN_WORKERS)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    words = os.getenv("USER_MNEMONIC")
+    app_id = os.getenv("APP_ID_2")
+    if not words or not app_id:
+        raise SystemExit("Set USER_MNEMONIC (payer of the DAISY fee) and APP_ID_2.")
+    if args.no_http and not args.socket:
+        raise SystemExit("--no-http needs --socket.")
+    try:
+        private_key = mnemonic.to_private_key(words)
+        app_id = int(app_id)
+    except Exception as e:
+        raise SystemExit(f"Invalid USER_MNEMONIC or APP_ID_2: {e}")
+
+    daemon = PostDaemon(shared_algod(), app_id, private_key, sign_workers=args.sign_workers).start()
+    servers = serve(daemon, None if args.no_http else args.port, args.host, args.socket)
+    log.info("Posting to app %s as %s%s%s", app_id, daemon.address,
+             "" if args.no_http else f" on http://{args.host}:{args.port}",
+             f" and unix:{args.socket}" if args.socket else "")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+        daemon.stop(5)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,37 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import os
 import sys
 import logging
-from typing import Optional
-
-from algosdk import transaction
-from algosdk.mnemonic import to_private_key
-from algosdk.account import address_from_private_key
-from algosdk.atomic_transaction_composer import AccountTransactionSigner, TransactionWithSigner
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 
-from algokit_utils import AlgorandClient, SendParams, CommonAppCallParams
-from client import DecentralizedAiContractClient  # generated client
+# algosdk, algokit_utils and the generated client (and what pulls them in) are imported where
+# they are used, so the usage path starts without them and --relayer without algokit_utils
+if TYPE_CHECKING:
+    from algokit_utils import AlgorandClient
+    from blob_store import CachedResolver
+    from client import DecentralizedAiContractClient, Query
+    from client_views import QueryRefView
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("post_query_manual")
 
+BATCH_MAX_QUERIES = 6  # post_queries: one new box per query, 8 box refs per call less the pending and expiry boxes
+MAX_APP_ARGS_BYTES = 2048  # all app args of one call, method selector included
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
 def _client_for_env() -> AlgorandClient:
-    return AlgorandClient.from_environment()
+    """AlgorandClient for ALGOD_SERVER/ALGOD_TOKEN (or LocalNet) on the shared caching algod."""
+    from algokit_utils import AlgorandClient, ClientManager
+    from algod_cache import shared_algod
+
+    config = ClientManager.get_config_from_environment_or_localnet().algod_config
+    return AlgorandClient.from_clients(algod=shared_algod(config.full_url(), config.token or ""))
 
 
 def _get_asset_holding(acct_info: dict, asset_id: int) -> Optional[dict]:
@@ -33,6 +43,8 @@ def _get_asset_holding(acct_info: dict, asset_id: int) -> Optional[dict]:
 
 def _ensure_user_opted_in_and_funded(algorand: AlgorandClient, addr: str, sk: str, token_id: int, needed: int):
     """Opt-in USER to ASA if missing; verify balance >= needed."""
+    from algosdk import transaction
+
     algod = algorand.client.algod
     acct_info = algod.account_info(addr)
 
@@ -56,11 +68,228 @@ def _ensure_user_opted_in_and_funded(algorand: AlgorandClient, addr: str, sk: st
         )
 
 
+def get_query_via_prompt(app: DecentralizedAiContractClient, query_id: int) -> Optional[Query]:
+    """Read query `query_id` from the `queries` box map; None if the box does not exist."""
+    from algosdk.error import AlgodHTTPError
+
+    try:
+        return app.state.box.queries.get_value(query_id)
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+
+
+def get_queries_via_prompt(app: DecentralizedAiContractClient, query_ids, max_workers: int = 8) -> Dict[int, Optional[Query]]:
+    """Read many queries at once (bounded concurrent box reads); missing boxes map to None."""
+    from client_views import read_values
+
+    return read_values(app.state.box.queries, query_ids, max_workers=max_workers)
+
+
+def get_query_ref_via_prompt(app: DecentralizedAiContractClient, query_id: int) -> Optional[QueryRefView]:
+    """Read the fixed-size record of a query posted with post_query_ref; None if the box does not exist."""
+    from client_views import read_query_ref_views
+
+    return read_query_ref_views(app, [query_id])[query_id]
+
+
+def submit_response_via_prompt(algorand: AlgorandClient, app: DecentralizedAiContractClient, query_id: int, response_text: str):
+    """Send `submit_response` for `query_id`; the fee is paid out once the submitter accepts (or the review window passes)."""
+    from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+
+    params = CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000))
+    send_params = SendParams(
+        cover_app_call_inner_transaction_fees=True,
+        populate_app_call_resources=True,
+    )
+    return app.send.submit_response(
+        args=(query_id, response_text),
+        params=params,
+        send_params=send_params,
+    )
+
+
+def submit_response_ref_via_prompt(algorand: AlgorandClient, app: DecentralizedAiContractClient, query_id: int,
+                                   response_hash: bytes, response_len: int):
+    """Send `submit_response_ref` (hash + length of a response already put in the blob store)."""
+    from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+
+    params = CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000))
+    send_params = SendParams(
+        cover_app_call_inner_transaction_fees=True,
+        populate_app_call_resources=True,
+    )
+    return app.send.submit_response_ref(
+        args=(query_id, response_hash, response_len),
+        params=params,
+        send_params=send_params,
+    )
+
+
+def accept_response_via_prompt(algorand: AlgorandClient, app: DecentralizedAiContractClient, query_id: int):
+    """Send `accept_response` for one of our answered queries; the outer call covers the inner DAISY payout fee."""
+    from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+
+    return app.send.accept_response(
+        args=(query_id,),
+        params=CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000)),
+        send_params=SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=True),
+    )
+
+
+def post_query_via_prompt(algorand: AlgorandClient, app: DecentralizedAiContractClient, addr: str, signer,
+                          token_id: int, fee: int, query_text: str, resolver: Optional[CachedResolver] = None):
+    """
+    Send the DAISY fee transfer grouped with `post_query` (or `post_query_ref`, storing the text
+    through `resolver`, when one is given). The returned result's `abi_return` is the query id.
+    """
+    from algokit_utils import CommonAppCallParams, SendParams
+    from algosdk import transaction
+    from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+    axfer_txn = transaction.AssetTransferTxn(
+        sender=addr,
+        sp=algorand.client.algod.suggested_params(),
+        receiver=app.app_address,
+        amt=fee,
+        index=token_id,
+    )
+    axfer_tws = TransactionWithSigner(axfer_txn, signer)
+
+    params = CommonAppCallParams()  # no inner fees in post_query
+    send_params = SendParams(populate_app_call_resources=True)
+
+    if resolver is not None:
+        query_hash, query_len = resolver.put_text(query_text)
+        log.info("Stored query text off-box as %s (%s bytes)", query_hash.hex(), query_len)
+        return app.send.post_query_ref(
+            args=(query_hash, query_len, axfer_tws),
+            params=params,
+            send_params=send_params,
+        )
+    return app.send.post_query(
+        args=(query_text, axfer_tws),
+        params=params,
+        send_params=send_params,
+    )
+
+
+def batch_queries(query_texts: Iterable[str], max_queries: int = BATCH_MAX_QUERIES,
+                  max_bytes: int = MAX_APP_ARGS_BYTES) -> List[List[str]]:
+    """Split `query_texts` (in order) into chunks that each fit one post_queries call."""
+    empty = 4 + 2  # selector + string[] length prefix
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    size = empty
+    for text in query_texts:
+        cost = 2 + 2 + len(text.encode())  # head offset + string length prefix + bytes
+        if empty + cost > max_bytes:
+            raise ValueError(f"Query of {len(text.encode())} bytes does not fit in one app call")
+        if chunk and (len(chunk) == max_queries or size + cost > max_bytes):
+            chunks.append(chunk)
+            chunk, size = [], empty
+        chunk.append(text)
+        size += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def post_queries_via_prompt(algorand: AlgorandClient, app: DecentralizedAiContractClient, addr: str, signer,
+                            token_id: int, fee: int, query_texts: List[str]):
+    """
+    Send one DAISY transfer of len(query_texts) * fee grouped with `post_queries` (use
+    `batch_queries` to size the chunks). The returned result's `abi_return` is the first query
+    id; the queries hold the consecutive ids from there, in order.
+    """
+    from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+    from algosdk import transaction
+    from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+    axfer_txn = transaction.AssetTransferTxn(
+        sender=addr,
+        sp=algorand.client.algod.suggested_params(),
+        receiver=app.app_address,
+        amt=fee * len(query_texts),
+        index=token_id,
+    )
+    # the contract may top up its opcode budget with inner calls paid from the group's fees
+    params = CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000))
+    send_params = SendParams(
+        cover_app_call_inner_transaction_fees=True,
+        populate_app_call_resources=True,
+    )
+    return app.send.post_queries(
+        args=(list(query_texts), TransactionWithSigner(axfer_txn, signer)),
+        params=params,
+        send_params=send_params,
+    )
+
+
+def _read_batch(path: str) -> List[str]:
+    """One query per non-empty line of `path` ("-" = stdin)."""
+    lines = sys.stdin.readlines() if path == "-" else open(path, encoding="utf-8").readlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
 def main():
-    if len(sys.argv) < 2:
-        print('Usage: python post_query.py "your question here"')
+    argv = sys.argv[1:]
+    # --ref: keep the text in the blob store (BLOB_STORE) and post only its hash + length
+    use_ref = "--ref" in argv
+    argv = [a for a in argv if a != "--ref"]
+    # --relayer URL: let relayer.py pay the ALGO fees (defaults to RELAYER_URL when set)
+    relayer_url = os.environ.get("RELAYER_URL")
+    if "--relayer" in argv:
+        i = argv.index("--relayer")
+        relayer_url = argv[i + 1] if i + 1 < len(argv) else None
+        argv = argv[:i] + argv[i + 2:]
+    # --daemon ADDR: hand the query to a running post_daemon.py (http://host:port or unix:/path)
+    daemon_addr = os.environ.get("POST_DAEMON")
+    if "--daemon" in argv:
+        i = argv.index("--daemon")
+        daemon_addr = argv[i + 1] if i + 1 < len(argv) else None
+        argv = argv[:i] + argv[i + 2:]
+    # --accept ID: release the escrowed fee of an answered query to its provider
+    accept_id = None
+    if "--accept" in argv:
+        i = argv.index("--accept")
+        try:
+            accept_id = int(argv[i + 1])
+        except (IndexError, ValueError):
+            raise SystemExit("--accept needs a query id.")
+        argv = argv[:i] + argv[i + 2:]
+    # --batch FILE: post every line of FILE (or stdin for "-") with post_queries, 6 per call
+    batch_path = None
+    if "--batch" in argv:
+        i = argv.index("--batch")
+        batch_path = argv[i + 1] if i + 1 < len(argv) else "-"
+        argv = argv[:i] + argv[i + 2:]
+    if not argv and batch_path is None and accept_id is None:
+        print('Usage: python post_query.py [--ref] [--relayer URL | --daemon ADDR] "your question here"')
+        print('       python post_query.py --batch FILE|-   (one question per line)')
+        print('       python post_query.py --accept QUERY_ID')
         sys.exit(1)
-    query_text = sys.argv[1]
+    query_text = argv[0] if argv else None
+    if batch_path is not None and (use_ref or relayer_url or daemon_addr):
+        raise SystemExit("--batch cannot be combined with --ref, --relayer or --daemon.")
+
+    if daemon_addr:
+        if use_ref or relayer_url:
+            raise SystemExit("--daemon cannot be combined with --ref or --relayer.")
+        from post_daemon import PostDaemonClient
+
+        daemon = PostDaemonClient(daemon_addr)
+        ticket = daemon.post(query_text)["ticket"]
+        print("✅ Query handed to the posting daemon, ticket:", ticket)
+        for event in daemon.events(ticket=ticket):
+            if event["event"] == "confirmed":
+                print("   query id:", event["query_id"], "confirmed round:", event["round"])
+            elif event["event"] == "answered":
+                print("   answered by", event["provider"] + ":", event["response"])
+            elif event["event"] in ("failed", "answer_timeout"):
+                raise SystemExit(f"Query {event['event']}: {event.get('error') or 'no answer yet'}")
+        return
 
     APP_ID = os.environ.get("APP_ID_2")
     USER_MNEMONIC = os.environ.get("USER_MNEMONIC")
@@ -70,11 +299,45 @@ def main():
         print('  export USER_MNEMONIC="your 25-word mnemonic (payer of DAISY fee)"')
         sys.exit(1)
 
+    from algosdk import transaction
+    from algosdk.account import address_from_private_key
+    from algosdk.atomic_transaction_composer import AccountTransactionSigner
+    from algosdk.mnemonic import to_private_key
+
     app_id = int(APP_ID)
     sk = to_private_key(USER_MNEMONIC)
     addr = address_from_private_key(sk)
     signer = AccountTransactionSigner(sk)
 
+    if relayer_url:
+        if use_ref:
+            raise SystemExit("--ref is not supported through the relayer yet.")
+        from relayer import RelayerClient
+
+        relayer = RelayerClient(relayer_url)
+        if relayer.info()["app_id"] != app_id:
+            raise SystemExit(f"Relayer at {relayer_url} serves app {relayer.info()['app_id']}, not {app_id}.")
+        ticket = relayer.post_query(addr, signer, query_text)
+        print("✅ Query handed to relayer, ticket:", ticket["ticket"])
+        result = relayer.wait(ticket["ticket"])
+        if result["status"] != "confirmed":
+            raise SystemExit(f"Relayed query {result['status']}: {result.get('error')}")
+        print("   query id:", result["query_id"])
+        print("   confirmed round:", result["round"])
+        return
+
+    resolver = None
+    if use_ref:
+        from blob_store import CachedResolver, blob_store_from_env
+
+        store = blob_store_from_env()
+        if store is None:
+            raise SystemExit("--ref needs BLOB_STORE: the URL of a `blob_store.py serve` the answering nodes can "
+                             "read, or a directory they share. Nodes cannot answer text kept on this machine only.")
+        resolver = CachedResolver(store)
+
+    from client import DecentralizedAiContractClient  # generated client
+
     algorand = _client_for_env()
 
     # Client for deployed app
@@ -85,36 +348,39 @@ def main():
         default_signer=signer,
     )
 
+    if accept_id is not None:
+        res = accept_response_via_prompt(algorand, app, accept_id)
+        print(f"✅ Accepted the answer to query {accept_id}; the provider has been paid")
+        print("   tx id:", res.tx_id)
+        return
+
     # Read token + fee from chain
     gs = app.state.global_state
     token = int(gs.token)       # DAISY ASA id
     fee = int(gs.query_fee)     # whole tokens (ASA decimals=0)
 
+    if batch_path is not None:
+        texts = _read_batch(batch_path)
+        if not texts:
+            raise SystemExit("No queries to post.")
+        try:
+            chunks = batch_queries(texts)
+        except ValueError as e:
+            raise SystemExit(str(e))
+        _ensure_user_opted_in_and_funded(algorand, addr, sk, token, fee * len(texts))
+        log.info("Posting %s queries in %s post_queries call(s)...", len(texts), len(chunks))
+        for chunk in chunks:
+            res = post_queries_via_prompt(algorand, app, addr, signer, token, fee, chunk)
+            first = int(res.abi_return)
+            print(f"✅ Posted queries {first}..{first + len(chunk) - 1}")
+            print("   tx id:", res.tx_id)
+        return
+
     # Ensure USER is opted in and has enough DAISY to cover the fee
     _ensure_user_opted_in_and_funded(algorand, addr, sk, token, fee)
 
-    # Build the grouped axfer (DAISY fee -> app) + app call post_query
-    sp = algorand.client.algod.suggested_params()
-    app_addr = app.app_address
-
-    axfer_txn = transaction.AssetTransferTxn(
-        sender=addr,
-        sp=sp,
-        receiver=app_addr,
-        amt=fee,
-        index=token,
-    )
-    axfer_tws = TransactionWithSigner(axfer_txn, signer)
-
-    params = CommonAppCallParams()  # no inner fees in post_query
-    send_params = SendParams(populate_app_call_resources=True)
-
     log.info("Posting query with grouped DAISY payment...")
-    res = app.send.post_query(
-        args=(query_text, axfer_tws),
-        params=params,
-        send_params=send_params,
-    )
+    res = post_query_via_prompt(algorand, app, addr, signer, token, fee, query_text, resolver)
 
     print("✅ Posted query")
     print("   tx id:", res.tx_id)
@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+DAISY-only gas relayer: users post queries without holding ALGO for transaction fees.
+
+A user builds a small atomic group and signs only their own DAISY transfers:
+
+  [tip axfer user -> relayer        (only when the relayer charges RELAY_FEE),]
+   payment axfer user -> app        (the query fee, transaction fee 0)
+   post_query_for(query_text, payment) from the relayer, fee covering the whole group
+
+and POSTs it to `/queries` with the app call left unsigned. The relayer checks the group has
+exactly that shape, queues it and returns a ticket (the app call's txid). A sender thread signs
+queued calls in batches on the parallel_signer pool and sends the groups back to back without
+waiting; a confirmer thread follows rounds and settles every in-flight ticket once per round,
+reading the query id from the ABI return.
+
+Group ids are part of what each user signs, so transfers already signed by different users
+cannot be merged into one shared group afterwards: every user keeps a 2-3 transaction group whose
+fees the relayer pools, and throughput comes from pipelining the sends.
+
+`post_query_for` must reference the box of the query it creates, and that id depends on how many
+posts land first. `/info` returns the relayer's predicted `next_query_id` (chain state plus the
+tickets it has not settled yet) and clients reference BOX_REF_WINDOW ids from there, plus the
+pending-work and expiry boxes every post updates.
+
+Endpoints:
+  GET  /info              relayer address, app, token, fees, suggested params, next_query_id
+  POST /queries           {"txns": [base64 msgpack, ...]} -> {"ticket": <txid>}
+  GET  /queries/<ticket>  {"status": "queued" | "sent" | "confirmed" | "failed", "query_id", ...}
+  GET  /metrics           Prometheus text format
+
+Env: RELAYER_MNEMONIC (pays the ALGO fees), APP_ID, ALGOD_ADDR, ALGOD_TOKEN, RELAY_FEE (DAISY per
+query, default 0), RELAYER_MAX_QUEUE, RELAYER_MAX_PER_SENDER, RELAYER_SEND_BATCH
+
+Usage:
+  python relayer.py [--host 127.0.0.1] [--port 8402]
+
+`RelayerClient(url).post_query(address, signer, text)` is the user side.
+"""
+import argparse
+import base64
+import copy
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from algosdk import abi, account, encoding, mnemonic, transaction
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+from nacl.exceptions import BadSignatureError
+from nacl.signing import VerifyKey
+
+from algod_cache import CachedAlgod, shared_algod
+from client_views import EXPIRY_BOX_NAME, PENDING_BOX_NAME
+from metrics import REGISTRY, span
+from parallel_signer import SIGN_WORKERS, sign_raw
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+log = logging.getLogger("relayer")
+
+POST_QUERY_FOR = abi.Method.from_signature("post_query_for(string,axfer)uint64")
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+MAX_APP_ARGS_BYTES = 2048
+BOX_REF_WINDOW = 6  # query boxes a relayed call may reference (8 per call, less the pending-work and expiry boxes)
+FINISHED_TICKETS = 100_000  # settled tickets kept for status lookups
+
+RELAY_FEE = int(os.getenv("RELAY_FEE", "0"))  # DAISY the relayer charges per query (0 = free)
+MAX_QUEUE = int(os.getenv("RELAYER_MAX_QUEUE", "4096"))
+MAX_PER_SENDER = int(os.getenv("RELAYER_MAX_PER_SENDER", "64"))  # unsettled tickets per user
+SEND_BATCH = int(os.getenv("RELAYER_SEND_BATCH", "64"))  # calls signed per pool round trip
+
+RELAYED = REGISTRY.counter("daisy_relayer_queries_total", "Relayed queries by outcome", ["status"])
+REFUSED = REGISTRY.counter("daisy_relayer_refused_total", "Submissions refused before queueing", ["reason"])
+RELAYER_FEES = REGISTRY.counter("daisy_relayer_fees_microalgos_total", "ALGO fees paid for relayed groups")
+QUEUED = REGISTRY.gauge("daisy_relayer_queued", "Tickets waiting to be sent")
+IN_FLIGHT = REGISTRY.gauge("daisy_relayer_in_flight", "Tickets sent and not yet confirmed")
+
+
+class RelayRefused(ValueError):
+    """The submitted group is not one the relayer will sign; `reason` labels the metric."""
+
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+@dataclass
+class Ticket:
+    txid: str  # the relayer's app call, also the ticket id
+    sender: str
+    user_txns: bytes  # the user's signed transfers, msgpack, in group order
+    call: transaction.ApplicationCallTxn
+    status: str = "queued"
+    sends: int = 0  # send attempts; more than one after a network error
+    query_id: Optional[int] = None
+    round: Optional[int] = None
+    error: Optional[str] = None
+
+    def view(self) -> dict:
+        return {"ticket": self.txid, "sender": self.sender, "status": self.status, "query_id": self.query_id,
+                "round": self.round, "error": self.error}
+
+
+def _group_id(txns: List[transaction.Transaction]) -> bytes:
+    bare = []
+    for txn in txns:
+        txn = copy.copy(txn)
+        txn.group = None
+        bare.append(txn)
+    return transaction.calculate_group_id(bare)
+
+
+def _verify_signature(stxn: transaction.SignedTransaction) -> None:
+    if not stxn.signature:
+        raise RelayRefused("only single-signature transfers can be relayed", "signature")
+    signer = stxn.authorizing_address or stxn.transaction.sender
+    message = b"TX" + base64.b64decode(encoding.msgpack_encode(stxn.transaction))
+    try:
+        VerifyKey(encoding.decode_address(signer)).verify(message, base64.b64decode(stxn.signature))
+    except BadSignatureError:
+        raise RelayRefused("bad signature", "signature") from None
+
+
+class Relayer:
+    """
+    Validates, queues, signs and submits relayed post_query_for groups.
+
+    Parameters
+    ----------
+    algod: AlgodClient the relayer sends through (normally `shared_algod()`; any other client is
+        wrapped in a CachedAlgod so /info and intake share one cached suggested-params read)
+    app_id: DAISY application
+    private_key: the relayer account, which pays every group's ALGO fees
+    relay_fee: DAISY tip required per query (0 = none)
+    """
+
+    def __init__(self, algod, app_id: int, private_key: str, relay_fee: int = RELAY_FEE,
+                 max_queue: int = MAX_QUEUE, max_per_sender: int = MAX_PER_SENDER, send_batch: int = SEND_BATCH,
+                 sign_workers: int = SIGN_WORKERS):
+        self.algod = algod if isinstance(algod, CachedAlgod) else CachedAlgod(inner=algod)
+        self.app_id = app_id
+        self.app_address = get_application_address(app_id)
+        self.private_key = private_key
+        self.address = account.address_from_private_key(private_key)
+        self.relay_fee = relay_fee
+        self.max_queue = max_queue
+        self.max_per_sender = max_per_sender
+        self.send_batch = send_batch
+        self.sign_workers = sign_workers
+        # algokit_utils and the generated client are only needed on the server side; RelayerClient
+        # users never load them
+        from algokit_utils import AlgorandClient
+
+        from client import DecentralizedAiContractClient
+
+        self.app = DecentralizedAiContractClient(algorand=AlgorandClient.from_clients(algod=algod), app_id=app_id)
+
+        self._cond = threading.Condition()
+        self._queue: deque = deque()
+        self._in_flight: Dict[str, Ticket] = {}
+        self._tickets: Dict[str, Ticket] = {}  # unsettled
+        self._finished: "OrderedDict[str, Ticket]" = OrderedDict()
+        self._per_sender: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.refresh_state()
+        QUEUED.set_function(lambda: len(self._queue))
+        IN_FLIGHT.set_function(lambda: len(self._in_flight))
+
+    # --- chain state ---
+    def refresh_state(self) -> None:
+        gs = self.app.state.global_state
+        with self._cond:
+            self.token = int(gs.token)
+            self.query_fee = int(gs.query_fee)
+            self._chain_next_id = int(gs.next_query_id)
+
+    def info(self) -> dict:
+        sp = self.algod.suggested_params()
+        with self._cond:
+            next_id = self._chain_next_id + len(self._tickets)
+            return {
+                "relayer": self.address, "app_id": self.app_id, "app_address": self.app_address,
+                "token": self.token, "query_fee": self.query_fee, "relay_fee": self.relay_fee,
+                "method": POST_QUERY_FOR.get_signature(), "next_query_id": next_id,
+                "box_ref_window": BOX_REF_WINDOW, "min_fee": sp.min_fee,
+                "params": {"first": sp.first, "last": sp.last, "gh": sp.gh, "gen": sp.gen},
+            }
+
+    # --- intake ---
+    def submit(self, encoded: List[str]) -> Ticket:
+        """Validate a group (user transfers signed, app call last and unsigned) and queue it."""
+        try:
+            decoded = [encoding.msgpack_decode(s) for s in encoded]
+        except Exception:
+            raise RelayRefused("transactions must be base64 msgpack", "decode") from None
+        *stxns, call = decoded or [None]
+        self._validate(stxns, call)
+        sender = stxns[0].transaction.sender
+        ticket = Ticket(call.get_txid(), sender, b"".join(base64.b64decode(encoding.msgpack_encode(s))
+                                                          for s in stxns), call)
+        with self._cond:
+            if ticket.txid in self._tickets or ticket.txid in self._finished:
+                return self._tickets.get(ticket.txid) or self._finished[ticket.txid]
+            if len(self._queue) >= self.max_queue:
+                raise RelayRefused("relayer queue is full, retry later", "busy")
+            if self._per_sender.get(sender, 0) >= self.max_per_sender:
+                raise RelayRefused(f"{sender} already has {self.max_per_sender} queries pending", "busy")
+            self._per_sender[sender] = self._per_sender.get(sender, 0) + 1
+            self._tickets[ticket.txid] = ticket
+            self._queue.append(ticket)
+            self._cond.notify_all()
+        return ticket
+
+    def _validate(self, stxns: list, call) -> None:
+        shape = 2 if self.relay_fee else 1
+        if len(stxns) != shape or not all(isinstance(s, transaction.SignedTransaction) for s in stxns):
+            raise RelayRefused(f"expected {shape} signed DAISY transfer(s) followed by the unsigned app call",
+                               "shape")
+        if not isinstance(call, transaction.ApplicationCallTxn):
+            raise RelayRefused("last transaction must be the unsigned post_query_for call", "shape")
+        sender = stxns[0].transaction.sender
+        for stxn in stxns:
+            txn = stxn.transaction
+            if not isinstance(txn, transaction.AssetTransferTxn) or txn.sender != sender:
+                raise RelayRefused("transfers must be DAISY asset transfers from one sender", "shape")
+            if txn.fee or txn.close_assets_to or txn.revocation_target or txn.rekey_to:
+                raise RelayRefused("transfers must have fee 0 and no close-to, clawback or rekey", "transfer")
+            if txn.index != self.token:
+                raise RelayRefused(f"transfers must be in DAISY (asset {self.token})", "transfer")
+            _verify_signature(stxn)
+        payment = stxns[-1].transaction
+        if payment.receiver != self.app_address or payment.amount != self.query_fee:
+            raise RelayRefused(f"payment must send {self.query_fee} DAISY to {self.app_address}", "transfer")
+        if self.relay_fee:
+            tip = stxns[0].transaction
+            if tip.receiver != self.address or tip.amount < self.relay_fee:
+                raise RelayRefused(f"tip must send at least {self.relay_fee} DAISY to {self.address}", "transfer")
+
+        sp = self.algod.suggested_params()
+        args = call.app_args or []
+        if (call.sender != self.address or call.index != self.app_id
+                or call.on_complete != transaction.OnComplete.NoOpOC or len(args) != 2
+                or args[0] != POST_QUERY_FOR.get_selector()):
+            raise RelayRefused("app call must be post_query_for on this app, sent by the relayer", "call")
+        if (call.accounts or call.foreign_apps or call.foreign_assets or call.rekey_to or call.note
+                or call.approval_program or call.clear_program or call.extra_pages):
+            raise RelayRefused("app call may only reference query boxes", "call")
+        if sum(len(a) for a in args) > MAX_APP_ARGS_BYTES:
+            raise RelayRefused("query text is too long for an app argument", "call")
+        boxes = [b for b in call.boxes or []
+                 if not (b.app_index in (0, self.app_id) and b.name in (PENDING_BOX_NAME, EXPIRY_BOX_NAME))]
+        if len(boxes) > BOX_REF_WINDOW or any(b.app_index not in (0, self.app_id) or len(b.name) != 9
+                                              or b.name[:1] != b"Q" for b in boxes):
+            raise RelayRefused(f"app call may reference at most {BOX_REF_WINDOW} query boxes", "call")
+        group = [s.transaction for s in stxns] + [call]
+        if call.fee != sp.min_fee * len(group):
+            raise RelayRefused(f"app call fee must be {sp.min_fee * len(group)} (flat, covering the group)", "fee")
+        if call.genesis_hash != sp.gh or call.last_valid_round < sp.first or \
+                call.last_valid_round - call.first_valid_round > 1000:
+            raise RelayRefused("app call validity window is expired or not on this network", "params")
+        gid = _group_id(group)
+        if any(t.group != gid for t in group):
+            raise RelayRefused("transactions are not one atomic group", "group")
+
+    def status(self, txid: str) -> Optional[dict]:
+        with self._cond:
+            ticket = self._tickets.get(txid) or self._finished.get(txid)
+            return ticket.view() if ticket else None
+
+    def _settle(self, ticket: Ticket, status: str, **fields) -> None:
+        with self._cond:
+            ticket.status = status
+            for k, v in fields.items():
+                setattr(ticket, k, v)
+            self._in_flight.pop(ticket.txid, None)
+            if self._tickets.pop(ticket.txid, None) is not None:
+                self._per_sender[ticket.sender] -= 1
+                if not self._per_sender[ticket.sender]:
+                    del self._per_sender[ticket.sender]
+            if ticket.query_id is not None:
+                self._chain_next_id = max(self._chain_next_id, ticket.query_id + 1)
+            self._finished[ticket.txid] = ticket
+            while len(self._finished) > FINISHED_TICKETS:
+                self._finished.popitem(last=False)
+            self._cond.notify_all()
+        RELAYED.inc(status=status)
+
+    # --- sending ---
+    def _take(self, timeout: float) -> List[Ticket]:
+        with self._cond:
+            if not self._queue:
+                self._cond.wait(timeout)
+            batch = []
+            while self._queue and len(batch) < self.send_batch:
+                batch.append(self._queue.popleft())
+            return batch
+
+    def send_pending(self, timeout: float = 0.5) -> int:
+        """Sign and send up to `send_batch` queued groups without waiting for them. Returns how many."""
+        batch = self._take(timeout)
+        if not batch:
+            return 0
+        try:
+            with span("build"):
+                signed = sign_raw([t.call for t in batch], [self.private_key] * len(batch), self.sign_workers)
+        except Exception:
+            self._requeue(batch)
+            raise
+        with span("send"):
+            for i, (ticket, call_raw) in enumerate(zip(batch, signed)):
+                with self._cond:
+                    self._in_flight[ticket.txid] = ticket
+                    ticket.status = "sent"
+                    ticket.sends += 1
+                try:
+                    self.algod.send_raw_transaction(base64.b64encode(ticket.user_txns + call_raw))
+                except AlgodHTTPError as e:
+                    if ticket.sends > 1 and "already in ledger" in str(e):
+                        # An earlier send that errored on the network did reach algod; confirm_round settles it
+                        continue
+                    log.info("Relayed group %s rejected: %s", ticket.txid, e)
+                    self._settle(ticket, "failed", error=str(e))
+                except Exception:
+                    # Network error: algod may or may not have this group. Resending the same signed
+                    # bytes cannot post it twice, so it goes back in the queue with the unsent rest
+                    self._requeue(batch[i:])
+                    raise
+        with self._cond:
+            self._cond.notify_all()
+        return len(batch)
+
+    def _requeue(self, tickets: List[Ticket]) -> None:
+        """Put unsent tickets back at the front of the queue, in their original order."""
+        with self._cond:
+            for ticket in reversed(tickets):
+                ticket.status = "queued"
+                self._in_flight.pop(ticket.txid, None)
+                self._queue.appendleft(ticket)
+            self._cond.notify_all()
+
+    # --- confirming ---
+    def confirm_round(self, rnd: int) -> int:
+        """Settle every in-flight ticket that confirmed or expired by `rnd`; returns how many settled."""
+        with self._cond:
+            in_flight = list(self._in_flight.values())
+        settled = 0
+        for ticket in in_flight:
+            try:
+                info = self.algod.pending_transaction_info(ticket.txid)
+            except AlgodHTTPError as e:
+                if e.code != 404:
+                    raise
+                info = {}
+            if info.get("confirmed-round"):
+                logs = [base64.b64decode(x) for x in info.get("logs", [])]
+                ret = logs[-1] if logs else b""
+                query_id = int.from_bytes(ret[4:12], "big") if ret[:4] == ABI_RETURN_PREFIX else None
+                RELAYER_FEES.inc(ticket.call.fee)
+                self._settle(ticket, "confirmed", query_id=query_id, round=info["confirmed-round"])
+            elif info.get("pool-error") or rnd > ticket.call.last_valid_round:
+                self._settle(ticket, "failed", error=info.get("pool-error") or "validity window passed")
+            else:
+                continue
+            settled += 1
+        return settled
+
+    def _confirm_loop(self) -> None:
+        rnd = int(self.algod.status()["last-round"])
+        while not self._stop.is_set():
+            with self._cond:
+                if not self._in_flight:
+                    self._cond.wait(0.5)
+                    continue
+            try:
+                if not self.confirm_round(rnd):
+                    rnd = int(self.algod.status_after_block(rnd)["last-round"])
+                self.refresh_state()
+            except Exception as e:
+                log.warning("Confirmation pass failed: %s", e)
+                self._stop.wait(1.0)
+
+    def _send_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.send_pending()
+            except Exception as e:
+                log.error("Sending relayed groups failed: %s", e)
+                self._stop.wait(1.0)
+
+    def start(self) -> "Relayer":
+        for target, name in ((self._send_loop, "relayer-send"), (self._confirm_loop, "relayer-confirm")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+
+def _make_handler(relayer: Relayer, max_bytes: int = 64 << 10):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code: int, body, content_type: str = "application/json"):
+            data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            parts = self.path.strip("/").split("/")
+            if parts == ["info"]:
+                return self._reply(200, relayer.info())
+            if parts == ["metrics"]:
+                return self._reply(200, REGISTRY.render(), "text/plain; version=0.0.4")
+            if len(parts) == 2 and parts[0] == "queries":
+                view = relayer.status(parts[1])
+                return self._reply(200, view) if view else self.send_error(404)
+            self.send_error(404)
+
+        def do_POST(self):
+            if self.path.rstrip("/") != "/queries":
+                return self.send_error(404)
+            length = int(self.headers.get("Content-Length", "0"))
+            if length > max_bytes:
+                return self.send_error(413)
+            try:
+                body = json.loads(self.rfile.read(length))
+                ticket = relayer.submit(list(body["txns"]))
+            except RelayRefused as e:
+                REFUSED.inc(reason=e.reason)
+                code = 503 if e.reason == "busy" else 400
+                return self._reply(code, {"error": str(e), "reason": e.reason})
+            except (ValueError, KeyError, TypeError):
+                return self._reply(400, {"error": 'body must be {"txns": [...]}', "reason": "decode"})
+            self._reply(202, ticket.view())
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # many users connect at once; with the default listen backlog of 5 the rest get reset
+    request_queue_size = 128
+
+
+def serve(relayer: Relayer, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Start the relayer's HTTP API on a daemon thread; returns the server (call shutdown() to stop)."""
+    server = _HTTPServer((host, port), _make_handler(relayer))
+    threading.Thread(target=server.serve_forever, name="relayer-http", daemon=True).start()
+    return server
+
+
+class RelayerClient:
+    """User side of the relayer: builds the group, signs the DAISY transfers and submits it."""
+
+    def __init__(self, url: str, timeout: float = 10.0, info_ttl: float = 2.0):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.info_ttl = info_ttl
+        self._info: Optional[dict] = None
+        self._info_at = 0.0
+
+    def _request(self, path: str, body: Optional[dict] = None) -> dict:
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(self.url + path, data=data, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get("error", e.reason)
+            except ValueError:
+                message = e.reason
+            raise RelayRefused(f"relayer returned {e.code}: {message}", "busy" if e.code == 503 else "http") from None
+
+    def info(self) -> dict:
+        if self._info is None or time.monotonic() - self._info_at > self.info_ttl:
+            self._info = self._request("/info")
+            self._info_at = time.monotonic()
+        return self._info
+
+    def build_group(self, address: str, query_text: str) -> List[transaction.Transaction]:
+        info = self.info()
+        p = info["params"]
+        sp = transaction.SuggestedParams(0, p["first"], p["last"], p["gh"], p["gen"], flat_fee=True,
+                                         min_fee=info["min_fee"])
+        txns = []
+        if info["relay_fee"]:
+            txns.append(transaction.AssetTransferTxn(address, sp, info["relayer"], info["relay_fee"], info["token"]))
+        txns.append(transaction.AssetTransferTxn(address, sp, info["app_address"], info["query_fee"], info["token"]))
+        call_sp = copy.copy(sp)
+        call_sp.fee = info["min_fee"] * (len(txns) + 1)
+        first_id = info["next_query_id"]
+        boxes = [(0, b"Q" + (first_id + i).to_bytes(8, "big")) for i in range(info["box_ref_window"])]
+        boxes += [(0, PENDING_BOX_NAME), (0, EXPIRY_BOX_NAME)]
+        txns.append(transaction.ApplicationCallTxn(
+            info["relayer"], call_sp, info["app_id"], transaction.OnComplete.NoOpOC,
+            app_args=[POST_QUERY_FOR.get_selector(), abi.StringType().encode(query_text)], boxes=boxes,
+        ))
+        return transaction.assign_group_id(txns)
+
+    def post_query(self, address: str, signer, query_text: str) -> dict:
+        """Sign the user's transfers with `signer` (an algosdk TransactionSigner) and submit; returns the ticket."""
+        txns = self.build_group(address, query_text)
+        signed = signer.sign_transactions(txns, list(range(len(txns) - 1)))
+        encoded = [encoding.msgpack_encode(s) for s in signed] + [encoding.msgpack_encode(txns[-1])]
+        return self._request("/queries", {"txns": encoded})
+
+    def status(self, ticket: str) -> dict:
+        return self._request(f"/queries/{ticket}")
+
+    def wait(self, ticket: str, timeout: float = 30.0, interval: float = 0.25) -> dict:
+        """Poll until the ticket is confirmed or failed (or `timeout` passes); returns its last status."""
+        deadline = time.monotonic() + timeout
+        view = self.status(ticket)
+        while view["status"] not in ("confirmed", "failed") and time.monotonic() < deadline:
+            time.sleep(interval)
+            view = self.status(ticket)
+        return view
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Relay DAISY-paid post_query groups, paying their ALGO fees.")
+    ap.add_argument("--host", default=os.getenv("RELAYER_HOST", "127.0.0.1"))
+    ap.add_argument("--port", type=int, default=int(os.getenv("RELAYER_PORT", "8402")))
+    ap.add_argument("--sign-workers", type=int, default=SIGN_WORKERS)
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    words = os.getenv("RELAYER_MNEMONIC")
+    app_id = os.getenv("APP_ID")
+    if not words or not app_id:
+        raise SystemExit("Set RELAYER_MNEMONIC (account paying the ALGO fees) and APP_ID.")
+    try:
+        private_key = mnemonic.to_private_key(words)
+        app_id = int(app_id)
+    except Exception as e:
+        raise SystemExit(f"Invalid RELAYER_MNEMONIC or APP_ID: {e}")
+
+    relayer = Relayer(shared_algod(), app_id, private_key, sign_workers=args.sign_workers).start()
+    server = serve(relayer, args.port, args.host)
+    log.info("Relaying for app %s as %s on http://%s:%s (relay fee %s DAISY)", app_id, relayer.address,
+             args.host, args.port, relayer.relay_fee)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        relayer.stop(5)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Deterministic query sharding for a fleet of ai_node.py providers watching one APP_ID.
+
+Every node ranks the provider set for each query id by rendezvous (highest-random-weight)
+hashing: score = SHA-256(app id || query id || provider address). The top-ranked provider owns
+the query and answers it at once; the provider ranked k-th only takes it over after
+k * TAKEOVER_SECONDS, and only if it is still unanswered then. All nodes compute the same
+ranking from the same inputs, so there is no coordination traffic, and adding or removing a
+provider only moves the queries that provider owned.
+
+A provider whose query had to be taken over is treated as quiet and dropped from the ranking,
+so its later queries are answered by the next provider without waiting; it rejoins as soon as
+one of its answers is seen on chain.
+
+Env: PROVIDERS (comma-separated provider addresses of the fleet; unset = answer everything),
+TAKEOVER_SECONDS (default 30)
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from algosdk import encoding
+
+log = logging.getLogger("ai_provider.sharding")
+
+TAKEOVER_SECONDS = float(os.getenv("TAKEOVER_SECONDS", "30"))
+
+
+def providers_from_env(own_address: str) -> List[str]:
+    """The fleet from PROVIDERS (always including `own_address`); just this node when unset."""
+    listed = [p.strip() for p in os.getenv("PROVIDERS", "").split(",") if p.strip()]
+    for address in listed:
+        if not encoding.is_valid_address(address):
+            raise SystemExit(f"Invalid address in PROVIDERS: {address!r}")
+    return sorted(set(listed) | {own_address})
+
+
+class ShardMap:
+    """
+    Which queries this node answers now, which later, and which it leaves to others.
+
+    Parameters
+    ----------
+    app_id: the DAISY application (part of the hash seed)
+    providers: addresses of every provider in the fleet
+    own_address: this node's provider address (added to `providers` if missing)
+    takeover_seconds: how long each rank waits for the providers ranked above it
+    """
+
+    def __init__(self, app_id: int, providers: Iterable[str], own_address: str,
+                 takeover_seconds: float = TAKEOVER_SECONDS):
+        self.app_id = app_id
+        self.own_address = own_address
+        self.providers = sorted(set(providers) | {own_address})
+        self.takeover_seconds = takeover_seconds
+        self._keys = {p: encoding.decode_address(p) for p in self.providers}
+        self._lock = threading.Lock()
+        self._quiet: Set[str] = set()
+        self._first_seen: Dict[int, float] = {}
+        self._answered: Dict[int, str] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return len(self.providers) > 1
+
+    def ranking(self, query_id: int) -> List[str]:
+        """Providers in takeover order for `query_id` (owner first), quiet ones excluded."""
+        seed = self.app_id.to_bytes(8, "big") + query_id.to_bytes(8, "big")
+        with self._lock:
+            live = [p for p in self.providers if p not in self._quiet or p == self.own_address]
+        return sorted(live, key=lambda p: hashlib.sha256(seed + self._keys[p]).digest(), reverse=True)
+
+    def owner(self, query_id: int) -> str:
+        return self.ranking(query_id)[0]
+
+    def delay(self, query_id: int) -> float:
+        """Seconds after first seeing `query_id` before this node should answer it."""
+        return self.ranking(query_id).index(self.own_address) * self.takeover_seconds
+
+    def ready(self, query_id: int, now: Optional[float] = None) -> bool:
+        """
+        True once this node should handle `query_id`: immediately for its own shard, at its
+        takeover time for others, and as soon as anyone's answer to it has been seen.
+        """
+        if not self.enabled or self.answered_by(query_id):
+            return True
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            first_seen = self._first_seen.setdefault(query_id, now)
+        return now - first_seen >= self.delay(query_id)
+
+    def took_over(self, query_id: int) -> List[str]:
+        """
+        Record that this node is answering `query_id` after its turn came up; every provider
+        ranked above it is marked quiet. Returns those providers (empty when we own it).
+        """
+        ranking = self.ranking(query_id)
+        skipped = ranking[:ranking.index(self.own_address)]
+        if skipped:
+            with self._lock:
+                newly = [p for p in skipped if p not in self._quiet]
+                self._quiet.update(skipped)
+            for provider in newly:
+                log.warning("Provider %s did not answer query %s in time; taking over its shard", provider,
+                            query_id)
+        return skipped
+
+    def answered_by(self, query_id: int) -> Optional[str]:
+        """The provider seen answering `query_id` on chain, if any."""
+        with self._lock:
+            return self._answered.get(query_id)
+
+    def observe_answer(self, query_id: int, provider: str) -> None:
+        """Feed an on-chain answer (from block discovery); a quiet provider rejoins the ranking."""
+        with self._lock:
+            self._answered[query_id] = provider
+            if provider in self._quiet:
+                self._quiet.discard(provider)
+                log.info("Provider %s is answering again; restoring its shard", provider)
+
+    def forget_through(self, query_id: int) -> None:
+        """Drop bookkeeping for ids up to `query_id` (called as the node commits progress)."""
+        with self._lock:
+            for d in (self._first_seen, self._answered):
+                for qid in [q for q in d if q <= query_id]:
+                    del d[qid]
+
+    def quiet(self) -> Set[str]:
+        with self._lock:
+            return set(self._quiet)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Settle expired queries with `timeout_reclaim`, found through the on-chain expiry index.
+
+Query fees stay in the app's escrow until the submitter accepts the answer. Past a query's
+answer_deadline an unanswered query can be refunded, and past its accept_deadline an answered
+one can be paid to its provider; anyone may send the `timeout_reclaim` call that does it. The
+deadlines are fixed offsets from the posting round, so the expiry index box (X) maps each
+bucket of EXPIRY_BUCKET_ROUNDS posting rounds to the first id posted in it. A pass therefore
+reads two boxes (X, plus the pending-work box P to drop ids that were answered in time) instead
+of every query box, and sends the resulting id ranges; the contract skips ids that are not due
+or already settled.
+
+Run it from any funded account (`SWEEPER_MNEMONIC`); it pays the transaction fees and gets
+nothing back, so the submitter or provider waiting on the funds is the natural sweeper.
+"""
+import argparse
+import logging
+import os
+import time
+from typing import List, Optional
+
+from algosdk import mnemonic
+from dotenv import load_dotenv
+
+from client import DecentralizedAiContractClient
+from client_views import (ANSWER_WINDOW_ROUNDS, EXPIRY_BUCKET_ROUNDS, EXPIRY_SLOTS, MAX_TIMEOUT_QUERIES,
+                          REVIEW_WINDOW_ROUNDS, read_expiry_index, read_pending_work)
+
+log = logging.getLogger("sweeper")
+
+MAX_GROUP_SIZE = 16  # protocol limit on transactions per atomic group
+TIMEOUT_MAX_FEE = 5_000  # one outer call plus an inner transfer per settled id
+
+
+def current_round(app: DecentralizedAiContractClient) -> int:
+    return app.algorand.client.algod.status()["last-round"]
+
+
+def expired_ids(app: DecentralizedAiContractClient, first_round: Optional[int], last_round: int) -> List[int]:
+    """
+    Ids whose answer or accept deadline may fall in [first_round, last_round], ascending;
+    `first_round=None` starts at the oldest deadline the index still covers.
+
+    Answer-deadline ids the pending-work box shows as answered (or already refunded) are
+    dropped; accept-deadline ids are kept, since acceptance is only visible in the query box.
+    """
+    index = read_expiry_index(app)
+    if index is None:
+        return []
+    window = ANSWER_WINDOW_ROUNDS + REVIEW_WINDOW_ROUNDS
+    if first_round is None:
+        first_round = index.oldest_round + ANSWER_WINDOW_ROUNDS
+    elif index.full and first_round - window < index.oldest_round:
+        log.warning("Expiry index only covers posts from round %s (%s rounds); deadlines before round %s "
+                    "need an explicit id list", index.oldest_round, EXPIRY_SLOTS * EXPIRY_BUCKET_ROUNDS,
+                    index.oldest_round + window)
+    answer, accept = index.expiring_between(first_round, last_round)
+    pending = read_pending_work(app) if answer else None
+    ids = set(accept)
+    ids.update(qid for qid in answer if pending is None or not pending.is_answered(qid))
+    return sorted(ids)
+
+
+def sweep_calls(query_ids: List[int]) -> List[List[int]]:
+    """Split ids into timeout_reclaim calls of MAX_TIMEOUT_QUERIES ids."""
+    return [query_ids[i:i + MAX_TIMEOUT_QUERIES] for i in range(0, len(query_ids), MAX_TIMEOUT_QUERIES)]
+
+
+def _send(app: DecentralizedAiContractClient, calls: List[List[int]]) -> int:
+    from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+
+    group = app.new_group()
+    for ids in calls:
+        group.timeout_reclaim(args=(ids,), params=CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(TIMEOUT_MAX_FEE)))
+    sent = group.send(SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=True))
+    return sum(r.value for r in sent.returns)
+
+
+def sweep(app: DecentralizedAiContractClient, first_round: Optional[int], last_round: int,
+          query_ids: Optional[List[int]] = None) -> dict:
+    """
+    One pass over deadlines in [first_round, last_round] (or over `query_ids` when given).
+    A group that fails is retried one call at a time so one bad id only costs its own call.
+    Returns counts for logging.
+    """
+    ids = expired_ids(app, first_round, last_round) if query_ids is None else sorted(query_ids)
+    calls = sweep_calls(ids)
+    result = {"candidates": len(ids), "settled": 0, "groups": 0, "failed": 0}
+    for start in range(0, len(calls), MAX_GROUP_SIZE):
+        chunk = calls[start:start + MAX_GROUP_SIZE]
+        try:
+            result["settled"] += _send(app, chunk)
+            result["groups"] += 1
+            continue
+        except Exception as e:
+            if len(chunk) == 1:
+                log.warning("timeout_reclaim%s failed: %s", tuple(chunk[0]), e)
+                result["failed"] += len(chunk[0])
+                continue
+            log.warning("Sweep group failed (%s); retrying its %s calls one by one", e, len(chunk))
+        for ids in chunk:
+            try:
+                result["settled"] += _send(app, [ids])
+                result["groups"] += 1
+            except Exception as e:
+                log.warning("timeout_reclaim%s failed: %s", tuple(ids), e)
+                result["failed"] += len(ids)
+    return result
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Refund or pay out DAISY queries whose deadlines have passed.")
+    ap.add_argument("--from-round", type=int,
+                    help="first deadline round to sweep (default: everything the expiry index covers)")
+    ap.add_argument("--to-round", type=int, help="last deadline round to sweep (default: the last round)")
+    ap.add_argument("--ids", help="comma-separated query ids to settle instead of an index lookup")
+    ap.add_argument("--every", type=float, default=0,
+                    help="repeat every N seconds, continuing from the previous pass (0 = one pass)")
+    args = ap.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    load_dotenv()
+
+    app_id = os.getenv("APP_ID")
+    if not app_id:
+        raise SystemExit("Set APP_ID.")
+    try:
+        app_id = int(app_id)
+    except ValueError as e:
+        raise SystemExit(f"Invalid APP_ID: {e}")
+    words = os.getenv("SWEEPER_MNEMONIC")
+    if not words:
+        raise SystemExit("Set SWEEPER_MNEMONIC (any funded account; it pays the transaction fees).")
+    try:
+        private_key = mnemonic.to_private_key(words)
+    except Exception as e:
+        raise SystemExit(f"Invalid SWEEPER_MNEMONIC: {e}")
+    try:
+        query_ids = [int(x) for x in args.ids.split(",") if x.strip()] if args.ids else None
+    except ValueError as e:
+        raise SystemExit(f"Invalid --ids: {e}")
+
+    from algokit_utils import AlgorandClient
+    from algosdk.account import address_from_private_key
+    from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+    from algod_cache import shared_algod
+
+    algorand = AlgorandClient.from_clients(algod=shared_algod())
+    app = DecentralizedAiContractClient(algorand=algorand, app_id=app_id,
+                                        default_sender=address_from_private_key(private_key),
+                                        default_signer=AccountTransactionSigner(private_key))
+    first_round = args.from_round
+    try:
+        while True:
+            last_round = args.to_round if args.to_round is not None else current_round(app)
+            result = sweep(app, first_round, last_round, query_ids)
+            log.info("Rounds %s-%s: %s candidate id(s), settled %s in %s group(s), %s failed",
+                     "start" if first_round is None else first_round, last_round, result["candidates"],
+                     result["settled"], result["groups"], result["failed"])
+            if args.every <= 0 or query_ids is not None or args.to_round is not None:
+                break
+            first_round = last_round + 1
+            time.sleep(args.every)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
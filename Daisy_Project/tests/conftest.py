@@ -0,0 +1,58 @@
+"""
+Shared fixtures: every test runs against fake_algod.py's in-process ledger, so the suite needs
+no LocalNet or network access.
+"""
+import logging
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client import DecentralizedAiContractClient  # noqa: E402
+from fake_algod import FakeAlgod, deploy_daisy, fake_algorand, new_daisy_account  # noqa: E402
+
+FEE = 10
+
+
+@pytest.fixture
+def chain():
+    """A deployed DAISY app on a fresh FakeAlgod, with a user holding DAISY and two providers."""
+    logging.getLogger().setLevel(logging.WARNING)
+    ledger = FakeAlgod()
+    algorand = fake_algorand(ledger)
+    deployer, token_id, app = deploy_daisy(algorand, ledger, query_fee=FEE)
+    accounts = {
+        "user": new_daisy_account(algorand, ledger, deployer, token_id, daisy=100 * FEE),
+        "provider": new_daisy_account(algorand, ledger, deployer, token_id),
+        "rival": new_daisy_account(algorand, ledger, deployer, token_id),
+    }
+    clients = {
+        who: DecentralizedAiContractClient(algorand=algorand, app_id=app.app_id, default_sender=acct.address,
+                                           default_signer=acct.signer)
+        for who, acct in accounts.items()
+    }
+    return SimpleNamespace(ledger=ledger, algorand=algorand, deployer=deployer, token_id=token_id, app=app,
+                           accounts=accounts, clients=clients)
+
+
+def daisy(chain, address: str) -> int:
+    return chain.ledger.account_asset_info(address, chain.token_id)["asset-holding"]["amount"]
+
+
+def post(chain, *texts: str) -> list:
+    """Post `texts` from the user with post_queries; returns their query ids."""
+    from prompt import post_queries_via_prompt
+
+    user = chain.accounts["user"]
+    first = post_queries_via_prompt(chain.algorand, chain.clients["user"], user.address, user.signer,
+                                    chain.token_id, FEE, list(texts)).abi_return
+    return list(range(first, first + len(texts)))
+
+
+def advance(chain, rounds: int) -> None:
+    target = chain.ledger.last_round + rounds
+    while chain.ledger.last_round < target:
+        chain.ledger.add_block()
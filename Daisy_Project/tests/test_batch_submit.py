@@ -0,0 +1,51 @@
+from functools import partial
+
+import pytest
+
+from batch_submit import ResponseBatcher, ResponseRejected, send_response_group
+from client_views import read_values
+from conftest import post
+
+
+def test_group_drops_an_already_answered_member(chain):
+    ids = post(chain, "a?", "b?", "c?")
+    send_response_group(chain.clients["rival"], [(ids[1], "rival was faster")])
+
+    sent, rejected = send_response_group(chain.clients["provider"], [(qid, f"answer {qid}") for qid in ids])
+
+    assert set(sent) == {ids[0], ids[2]}
+    assert list(rejected) == [ids[1]]
+    queries = read_values(chain.clients["user"].state.box.queries, ids, max_workers=1)
+    assert queries[ids[0]].provider == queries[ids[2]].provider == chain.accounts["provider"].address
+    assert queries[ids[1]].provider == chain.accounts["rival"].address
+    assert queries[ids[1]].response_text == "rival was faster"
+
+
+def test_batcher_futures_report_each_member(chain):
+    ids = post(chain, "a?", "b?", "c?")
+    send_response_group(chain.clients["rival"], [(ids[0], "rival was faster")])
+    batcher = ResponseBatcher(partial(send_response_group, chain.clients["provider"]), max_size=3,
+                              window_seconds=5)
+    try:
+        futures = {qid: batcher.submit(qid, f"answer {qid}") for qid in ids}
+        with pytest.raises(ResponseRejected):
+            futures[ids[0]].result(timeout=10)
+        txids = [futures[qid].result(timeout=10) for qid in ids[1:]]
+    finally:
+        batcher.close()
+    assert len(set(txids)) == 2
+    assert all(chain.ledger.pending_transaction_info(txid)["confirmed-round"] for txid in txids)
+
+
+def test_batcher_fails_every_future_when_the_send_raises():
+    def broken(members):
+        raise ConnectionError("algod unreachable")
+
+    batcher = ResponseBatcher(broken, max_size=2, window_seconds=0.05)
+    try:
+        futures = [batcher.submit(qid, "x") for qid in (1, 2)]
+        for fut in futures:
+            with pytest.raises(ConnectionError):
+                fut.result(timeout=5)
+    finally:
+        batcher.close()
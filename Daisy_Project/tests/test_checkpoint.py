@@ -0,0 +1,50 @@
+import pytest
+
+from checkpoint import CheckpointStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = CheckpointStore(str(tmp_path / "node.db"), app_id=7)
+    yield s
+    s.close()
+
+
+def test_answers_survive_a_restart_until_committed(tmp_path, store):
+    store.save_answer(4, "first draft")
+    store.save_answer(4, "final")
+    store.mark_submitted(4, "TXID4")
+    store.save_answer(5, "unsent")
+    store.close()
+
+    reopened = CheckpointStore(store.path, app_id=7)
+    try:
+        assert reopened.get_answer(4) == "final"
+        assert reopened.submitted_txid(4) == "TXID4"
+        assert reopened.submitted_txid(5) is None
+        assert reopened.pending() == {4: ("final", "TXID4"), 5: ("unsent", None)}
+    finally:
+        reopened.close()
+
+
+def test_commit_drops_covered_rows_and_never_goes_back(store):
+    for qid in (3, 4, 5):
+        store.save_answer(qid, f"answer {qid}")
+    store.commit(4)
+    assert store.last_processed() == 4
+    assert list(store.pending()) == [5]
+
+    store.commit(2)  # a late, lower commit from another worker
+    assert store.last_processed() == 4
+
+
+def test_apps_are_kept_apart(tmp_path, store):
+    store.save_answer(1, "for app 7")
+    store.commit(9)
+    other = CheckpointStore(store.path, app_id=8)
+    try:
+        assert other.last_processed() == 0
+        assert other.get_answer(1) is None
+        assert other.pending() == {}
+    finally:
+        other.close()
@@ -0,0 +1,58 @@
+import pytest
+from algokit_utils import AlgoAmount, CommonAppCallParams, SendParams
+
+from batch_submit import send_response_group
+from client_views import QUERY_PAID, QUERY_REFUNDED, read_values
+from conftest import FEE, advance, daisy, post
+from sweeper import sweep
+
+SEND = SendParams(cover_app_call_inner_transaction_fees=True, populate_app_call_resources=True)
+MAX_FEE = CommonAppCallParams(max_fee=AlgoAmount.from_micro_algo(5_000))
+
+
+def _accept(app, qid: int) -> None:
+    app.new_group().accept_response(args=(qid,), params=MAX_FEE).send(SEND)
+
+
+def _flags(chain, ids):
+    queries = read_values(chain.clients["user"].state.box.queries, ids, max_workers=1)
+    return {qid: queries[qid].flags & (QUERY_PAID | QUERY_REFUNDED) for qid in ids}
+
+
+def test_fees_leave_escrow_once_and_only_to_the_right_account(chain):
+    user, provider = chain.accounts["user"].address, chain.accounts["provider"].address
+    escrow = chain.app.app_address
+    escrow_start, user_start = daisy(chain, escrow), daisy(chain, user)
+    accepted, answered, unanswered = ids = post(chain, "accepted?", "answered?", "ignored?")
+    send_response_group(chain.clients["provider"], [(accepted, "yes"), (answered, "also yes")])
+    assert daisy(chain, escrow) == escrow_start + 3 * FEE
+
+    _accept(chain.clients["user"], accepted)
+    assert daisy(chain, provider) == FEE
+    with pytest.raises(Exception, match="Query closed"):
+        _accept(chain.clients["user"], accepted)
+    with pytest.raises(Exception, match="Only the submitter can accept"):
+        _accept(chain.clients["rival"], answered)
+    with pytest.raises(Exception, match="Not answered"):
+        _accept(chain.clients["user"], unanswered)
+
+    # nothing is due yet: the contract skips every id
+    assert sweep(chain.clients["rival"], None, chain.ledger.last_round, ids)["settled"] == 0
+
+    query = read_values(chain.clients["user"].state.box.queries, [answered], max_workers=1)[answered]
+    advance(chain, query.answer_deadline - chain.ledger.last_round)
+    result = sweep(chain.clients["rival"], None, chain.ledger.last_round)
+    assert result["settled"] == 1 and result["failed"] == 0
+    assert daisy(chain, user) == user_start - 2 * FEE
+    assert _flags(chain, ids) == {accepted: QUERY_PAID, answered: 0, unanswered: QUERY_REFUNDED}
+
+    advance(chain, query.accept_deadline - chain.ledger.last_round)
+    result = sweep(chain.clients["rival"], None, chain.ledger.last_round)
+    assert result["settled"] == 1 and result["failed"] == 0
+    assert _flags(chain, ids) == {accepted: QUERY_PAID, answered: QUERY_PAID, unanswered: QUERY_REFUNDED}
+    assert daisy(chain, provider) == 2 * FEE
+    assert daisy(chain, escrow) == escrow_start
+
+    # settled ids are skipped, so a repeated sweep pays nothing twice
+    assert sweep(chain.clients["rival"], None, chain.ledger.last_round, ids)["settled"] == 0
+    assert daisy(chain, escrow) == escrow_start
@@ -0,0 +1,70 @@
+from algosdk import transaction
+
+from client_views import (ANSWER_WINDOW_ROUNDS, PENDING_CAPACITY, PENDING_HEADER_BYTES, PendingWork, read_pending_work,
+                          read_values)
+from conftest import FEE
+from fake_algod import abi_call, new_daisy_account, send_group
+from prompt import BATCH_MAX_QUERIES
+
+EXTRA = 4
+
+
+def _post_many(chain, user, count: int) -> None:
+    """Post `count` queries in one group of post_queries calls (up to 8 calls of BATCH_MAX_QUERIES)."""
+    sp = chain.ledger.suggested_params()
+    txns = []
+    for start in range(0, count, BATCH_MAX_QUERIES):
+        texts = [f"question {start + i}" for i in range(min(BATCH_MAX_QUERIES, count - start))]
+        txns.append(transaction.AssetTransferTxn(user.address, sp, chain.app.app_address, FEE * len(texts),
+                                                 chain.token_id))
+        txns.append(abi_call(user.address, sp, chain.app.app_id, "post_queries(string[],axfer)uint64", texts))
+    send_group(chain.ledger, user, txns)
+
+
+def _answer(chain, ids) -> None:
+    provider = chain.accounts["provider"]
+    sp = chain.ledger.suggested_params()
+    send_group(chain.ledger, provider, [abi_call(provider.address, sp, chain.app.app_id,
+                                                 "submit_response(uint64,string)void", qid, f"answer {qid}")
+                                        for qid in ids])
+
+
+def test_late_answer_leaves_the_newer_id_in_its_slot_open(chain):
+    total = PENDING_CAPACITY + EXTRA
+    user = new_daisy_account(chain.algorand, chain.ledger, chain.deployer, chain.token_id, daisy=total * FEE,
+                             algos=1_000)
+    first_round = chain.ledger.last_round + 1
+    per_group = 8 * BATCH_MAX_QUERIES
+    for start in range(0, total, per_group):
+        _post_many(chain, user, min(per_group, total - start))
+    assert chain.ledger.last_round - first_round < ANSWER_WINDOW_ROUNDS
+
+    old = list(range(1, EXTRA + 1))
+    new = [qid + PENDING_CAPACITY for qid in old]
+    _answer(chain, old)
+
+    reader = chain.clients["provider"]
+    pending = read_pending_work(reader)
+    queries = read_values(reader.state.box.queries, old + new, max_workers=1)
+    assert all(queries[qid].is_answered for qid in old)
+    assert all(pending.is_open(qid) and not queries[qid].is_answered for qid in new)
+
+    _answer(chain, new)
+    pending = read_pending_work(reader)
+    assert all(pending.is_answered(qid) for qid in new)
+
+
+def test_pending_work_only_answers_for_tracked_ids():
+    next_id = PENDING_CAPACITY + 3  # ids 3 .. PENDING_CAPACITY + 2 are tracked
+    bits = bytearray(PENDING_CAPACITY // 8)
+    for qid in (3, PENDING_CAPACITY + 1):
+        slot = qid % PENDING_CAPACITY
+        bits[slot // 8] |= 0x80 >> (slot % 8)
+    pending = PendingWork(next_id.to_bytes(PENDING_HEADER_BYTES, "big") + bytes(bits))
+
+    assert pending.first_tracked == 3
+    assert pending.open_ids() == [3, PENDING_CAPACITY + 1]
+    assert pending.is_answered(4) and pending.is_answered(PENDING_CAPACITY + 2)
+    # id 1 shares its slot with PENDING_CAPACITY + 1 but is no longer tracked
+    assert not pending.is_open(1) and not pending.is_answered(1)
+    assert not pending.is_open(next_id) and not pending.is_answered(next_id)
@@ -0,0 +1,66 @@
+from algosdk import account
+
+from batch_submit import send_response_group
+from conftest import post
+from discovery import BlockDiscovery
+from sharding import ShardMap
+
+
+def _addresses(n):
+    return [account.address_from_private_key(account.generate_account()[0]) for _ in range(n)]
+
+
+def _id_ranked(shards: ShardMap, rank: int) -> int:
+    """The first query id for which this node is `rank` in the takeover order."""
+    return next(qid for qid in range(1, 1000) if shards.ranking(qid).index(shards.own_address) == rank)
+
+
+def test_ranking_is_the_same_on_every_node():
+    fleet = _addresses(3)
+    maps = [ShardMap(5, fleet, own, takeover_seconds=10) for own in fleet]
+    for qid in range(1, 50):
+        rankings = {tuple(m.ranking(qid)) for m in maps}
+        assert len(rankings) == 1
+        assert sorted(next(iter(rankings))) == sorted(fleet)
+    owners = {maps[0].owner(qid) for qid in range(1, 50)}
+    assert owners == set(fleet)
+
+
+def test_takeover_waits_its_turn_and_quiets_the_skipped_providers():
+    fleet = _addresses(3)
+    shards = ShardMap(5, fleet, fleet[0], takeover_seconds=10)
+    mine, third = _id_ranked(shards, 0), _id_ranked(shards, 2)
+
+    assert shards.ready(mine, now=100.0)
+    assert not shards.ready(third, now=100.0)
+    assert not shards.ready(third, now=119.0)
+    assert shards.ready(third, now=120.0)
+
+    skipped = shards.took_over(third)
+    assert len(skipped) == 2 and shards.quiet() == set(skipped)
+    assert shards.took_over(mine) == []
+    # with the others quiet this node owns everything, so new ids are ready at once
+    assert all(shards.owner(qid) == fleet[0] for qid in range(1, 50))
+
+    shards.observe_answer(third + 1, skipped[0])
+    assert shards.quiet() == {skipped[1]}
+    assert shards.answered_by(third + 1) == skipped[0]
+    shards.forget_through(third + 1)
+    assert shards.answered_by(third + 1) is None
+
+
+def test_an_answer_seen_on_chain_restores_a_quiet_provider(chain):
+    me, rival = chain.accounts["provider"].address, chain.accounts["rival"].address
+    shards = ShardMap(chain.app.app_id, [me, rival], me, takeover_seconds=10)
+    (qid,) = post(chain, "who answers?")
+    shards.took_over(_id_ranked(shards, 1))
+    assert shards.quiet() == {rival}
+
+    send_response_group(chain.clients["rival"], [(qid, "still here")])
+    discovery = BlockDiscovery(chain.ledger, chain.app.app_id, on_query=lambda q: None,
+                               on_answer=shards.observe_answer)
+    discovery.scan_round(chain.ledger.last_round)
+
+    assert shards.answered_by(qid) == rival
+    assert shards.quiet() == set()
+    assert shards.ready(qid, now=0.0)
@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import Future
+
+from worker_pool import QueryWorkerPool
+
+
+def _drain(pool: QueryWorkerPool, ids) -> None:
+    for qid in ids:
+        assert pool.submit(qid)
+    pool.wait_idle(timeout=5)
+
+
+def test_failed_id_holds_back_the_watermark_until_retried():
+    failing = {3}
+    commits = []
+
+    def handler(qid):
+        if qid in failing:
+            raise RuntimeError("llm down")
+
+    pool = QueryWorkerPool(handler, max_workers=4, on_commit=commits.append)
+    try:
+        _drain(pool, range(1, 7))
+        assert pool.last_processed == 2
+        assert pool.next_batch(10) == [3, 7, 8, 9]
+
+        failing.clear()
+        _drain(pool, [3])
+        assert pool.last_processed == 6
+        assert commits == sorted(commits) and commits[-1] == 6
+    finally:
+        pool.shutdown()
+
+
+def test_returned_future_keeps_the_id_in_flight_but_frees_the_worker():
+    futures = {}
+    both_started = threading.Event()
+
+    def handler(qid):
+        futures[qid] = Future()
+        if len(futures) == 2:
+            both_started.set()
+        return futures[qid]
+
+    pool = QueryWorkerPool(handler, max_workers=1)
+    try:
+        # one worker thread, yet both handlers run because neither waits on its Future
+        assert pool.submit(1) and pool.submit(2)
+        assert both_started.wait(5)
+        assert pool.in_flight() == {1, 2}
+
+        futures[2].set_result("tx2")
+        futures[1].set_exception(RuntimeError("rejected"))
+        pool.wait_idle(timeout=5)
+        assert pool.in_flight() == set()
+        assert pool.last_processed == 0  # 1 failed, so 2 cannot be committed past it
+        assert pool.next_batch(3) == [1]
+    finally:
+        pool.shutdown()
+
+
+def test_submit_reports_a_full_pool():
+    release = threading.Event()
+    pool = QueryWorkerPool(lambda qid: release.wait(5), max_workers=1, max_pending=2)
+    try:
+        assert pool.submit(1) and pool.submit(2)
+        assert not pool.submit(3)
+        assert pool.submit(1)  # already in flight: accepted without queueing it twice
+        assert pool.next_batch(10) == []
+        release.set()
+        pool.wait_idle(timeout=5)
+        assert pool.last_processed == 2
+    finally:
+        pool.shutdown()
+
+
+def test_start_after_skips_committed_ids():
+    seen = []
+    pool = QueryWorkerPool(seen.append, max_workers=2, start_after=5)
+    try:
+        assert pool.next_batch(9) == [6, 7, 8]
+        _drain(pool, [4, 5, 6])
+        assert seen == [6]
+        assert pool.last_processed == 6
+    finally:
+        pool.shutdown()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Bounded worker pool used by ai_node.py to answer queries concurrently.
+
+Queries are handed out by id. Each id is tracked while it is in flight, and
+`last_processed` only moves forward over a contiguous run of finished ids, so a
+crash or a failed handler never lets the node skip past unanswered work. A handler
+may return a Future for work it handed to another thread (a grouped send): the id
+stays in flight until that resolves, but the worker thread is free at once.
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+log = logging.getLogger("ai_provider.pool")
+
+
+class QueryWorkerPool:
+    """
+    Run `handler(query_id)` on a fixed number of threads.
+
+    Parameters
+    ----------
+    handler: called once per query id; raising marks the id as failed so it is retried. If it
+        returns a Future the id finishes (or fails, if the Future does) when that resolves
+    max_workers: concurrency limit (number of handlers running at the same time)
+    start_after: last query id already committed (work starts at start_after + 1)
+    max_pending: cap on queued, running and not yet resolved ids; defaults to 4 * max_workers
+    on_commit: called with the new `last_processed` each time it advances (e.g. to persist it)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[int], Any],
+        max_workers: int = 4,
+        start_after: int = 0,
+        max_pending: Optional[int] = None,
+        on_commit: Optional[Callable[[int], None]] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._handler = handler
+        self._on_commit = on_commit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="query")
+        self._lock = threading.Lock()
+        self._max_pending = max_pending or 4 * max_workers
+        self._last_processed = start_after
+        self._in_flight: Dict[int, Future] = {}
+        self._done: Set[int] = set()
+
+    @property
+    def last_processed(self) -> int:
+        """Highest query id such that it and every id before it has been handled."""
+        with self._lock:
+            return self._last_processed
+
+    def in_flight(self) -> Set[int]:
+        """Snapshot of query ids currently queued, running or waiting on a returned Future."""
+        with self._lock:
+            return set(self._in_flight)
+
+    def submit(self, query_id: int) -> bool:
+        """
+        Queue `query_id` unless it is committed, finished or already in flight.
+
+        Returns False when the pool is full; callers should stop feeding ids for
+        this cycle and try again later.
+        """
+        with self._lock:
+            if query_id <= self._last_processed or query_id in self._done or query_id in self._in_flight:
+                return True
+            if len(self._in_flight) >= self._max_pending:
+                return False
+            self._executor.submit(self._run, query_id)
+            self._in_flight[query_id] = Future()
+            return True
+
+    def next_batch(self, end: int, ready: Optional[Callable[[int], bool]] = None) -> List[int]:
+        """
+        Ids below `end` that `submit` would accept right now, in order, limited by free capacity.
+        Ids for which `ready(id)` is False are left out without using up capacity.
+        """
+        with self._lock:
+            room = self._max_pending - len(self._in_flight)
+            batch = []
+            qid = self._last_processed + 1
+            while qid < end and len(batch) < room:
+                if qid not in self._done and qid not in self._in_flight and (ready is None or ready(qid)):
+                    batch.append(qid)
+                qid += 1
+            return batch
+
+    def wait_idle(self, timeout: Optional[float] = None) -> None:
+        """Block until everything currently in flight has finished."""
+        with self._lock:
+            futures = list(self._in_flight.values())
+        for fut in futures:
+            try:
+                fut.result(timeout=timeout)
+            except Exception:
+                pass
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; with `wait`, also wait for Futures the handlers returned."""
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+        if wait:
+            self.wait_idle()
+
+    def _run(self, query_id: int) -> None:
+        try:
+            result = self._handler(query_id)
+        except Exception as e:
+            log.error("Query %s failed; it will be retried: %s", query_id, e, exc_info=True)
+            return self._finish(query_id, False)
+        if isinstance(result, Future):
+            result.add_done_callback(lambda fut: self._finish(query_id, self._resolved(query_id, fut)))
+        else:
+            self._finish(query_id, True)
+
+    @staticmethod
+    def _resolved(query_id: int, fut: Future) -> bool:
+        if fut.cancelled() or fut.exception() is not None:
+            log.error("Query %s failed; it will be retried: %s", query_id,
+                      "cancelled" if fut.cancelled() else fut.exception())
+            return False
+        return True
+
+    def _finish(self, query_id: int, ok: bool) -> None:
+        with self._lock:
+            done = self._in_flight.pop(query_id, None)
+            try:
+                if ok:
+                    self._done.add(query_id)
+                    advanced = self._advance()
+                    # Persist under the lock so checkpoints are written in increasing order
+                    if advanced and self._on_commit is not None:
+                        try:
+                            self._on_commit(self._last_processed)
+                        except Exception as e:
+                            log.error("Could not record progress at query %s: %s", self._last_processed, e)
+            finally:
+                if done is not None:
+                    done.set_result(ok)
+
+    def _advance(self) -> bool:
+        # Commit strictly in id order so a failed id holds back the watermark.
+        start = self._last_processed
+        while self._last_processed + 1 in self._done:
+            self._last_processed += 1
+            self._done.discard(self._last_processed)
+        return self._last_processed != start